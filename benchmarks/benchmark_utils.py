@@ -0,0 +1,52 @@
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class StatementRecorder:
+    """
+    Records the SQL statements (and their parameters) issued against an engine while
+    the context is active, so they can be explained afterwards.
+
+    Usage:
+        with StatementRecorder(engine=repository_utils.engine) as recorder:
+            await repository.get_animals(session=session, limit=20)
+
+        recorder.statements
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.engine = engine.sync_engine
+        self.statements: list[tuple[str, Any]] = []
+
+    def __enter__(self) -> "StatementRecorder":
+        event.listen(self.engine, "before_cursor_execute", self.__on_execute)
+        return self
+
+    def __exit__(self, *_) -> None:
+        event.remove(self.engine, "before_cursor_execute", self.__on_execute)
+
+    def __on_execute(self, _conn, _cursor, statement, parameters, *_) -> None:
+        self.statements.append((statement, parameters))
+
+
+async def explain(
+    engine: AsyncEngine, statement: str, parameters: Any, analyze: bool = True
+) -> str:
+    options: str = "ANALYZE, BUFFERS" if analyze else "COSTS"
+
+    async with engine.connect() as conn:
+        result = await conn.exec_driver_sql(
+            f"EXPLAIN ({options}) {statement}", parameters
+        )
+        return "\n".join(row[0] for row in result)
+
+
+@asynccontextmanager
+async def timed(label: str) -> AsyncIterator[None]:
+    start: float = time.perf_counter()
+    yield
+    print(f"{label}: {(time.perf_counter() - start) * 1000:.1f} ms")
@@ -0,0 +1,76 @@
+"""
+Pet sight email renders per second, before and after the shared template environment.
+
+Renders the pet sight email with a per module environment that looks the template up
+(and stats its file) on every render, as the template modules did, with the shared
+precompiled environment, and from the memoized fragments as text and as bytes.
+
+Usage:
+    python -m benchmarks.email_templates --renders 20000 > bench_output.txt
+"""
+
+import argparse
+import time
+from typing import Callable
+
+from jinja2 import Environment, FileSystemLoader
+
+from bounded_contexts import initialize_contexts
+from bounded_contexts.pets_domain.email.pet_email_templates import (
+    PET_TEMPLATE_PATH,
+    PetEmailTemplates,
+    pet_sight_template,
+)
+from common.dependencies import DependencyContainer
+from common.email_templates import COMMON_TEMPLATE_PATH, get_template
+from config import ProjectConfig, YamlConfigFileName
+
+VALUES: dict[str, str] = {
+    "profile_name": "Benchmark",
+    "sightings": "3",
+    "last_location_url": "https://www.google.com/maps/search/?api=1&query=-34.6,-58.4",
+    "lost_pets_url": "https://petconnect.icu/lost-pets?petId=benchmark_pet",
+}
+
+
+def renders_per_second(renders: int, render: Callable[[], object]) -> float:
+    start: float = time.perf_counter()
+
+    for _ in range(renders):
+        render()
+
+    return renders / (time.perf_counter() - start)
+
+
+def main(renders: int) -> None:
+    dependencies: DependencyContainer = DependencyContainer()
+    config: ProjectConfig = ProjectConfig(YamlConfigFileName.TESTING)
+    # Production settings: no file checks on render
+    config.templates.auto_reload = False
+    dependencies.register(ProjectConfig, config)
+    initialize_contexts(dependencies)
+
+    module_env = Environment(
+        loader=FileSystemLoader([str(COMMON_TEMPLATE_PATH), str(PET_TEMPLATE_PATH)])
+    )
+    name: str = PetEmailTemplates.PET_SIGHT_TEMPLATE.value
+
+    paths: dict[str, Callable[[], object]] = {
+        "per module environment": lambda: module_env.get_template(name).render(
+            **VALUES
+        ),
+        "shared environment": lambda: get_template(name).render(**VALUES),
+        "fragments": lambda: pet_sight_template.render(**VALUES),
+        "fragments, bytes": lambda: pet_sight_template.render_bytes(**VALUES),
+    }
+
+    for path, render in paths.items():
+        print(f"{path}: {renders_per_second(renders, render):,.0f} renders/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.email_templates")
+    parser.add_argument("--renders", type=int, default=20_000)
+    arguments = parser.parse_args()
+
+    main(arguments.renders)
@@ -0,0 +1,140 @@
+"""
+Query plans of the animal list queries before and after the list query indexes.
+
+Seeds the testing database with a large animals table (half pets, half adoption
+animals), reverts the list query indexes migration and explains the queries issued
+by AlchemyAdoptionAnimalsRepository and AlchemyPetsRepository, then applies it again
+and explains the same queries. The other migrations are left as they are.
+
+Usage:
+    python -m benchmarks.list_query_indexes --animals 1000000 > bench_output.txt
+"""
+
+import argparse
+import asyncio
+from typing import Awaitable, Callable, Any
+
+from sqlalchemy import text
+
+from benchmarks.benchmark_utils import StatementRecorder, explain, timed
+from bounded_contexts import initialize_contexts
+from bounded_contexts.adoptions_domain.repositories.alchemy.alchemy_animals_repository import (
+    AlchemyAdoptionAnimalsRepository,
+)
+from bounded_contexts.pets_domain.repositories.alchemy.alchemy_pets_repository import (
+    AlchemyPetsRepository,
+)
+from common.dependencies import DependencyContainer
+from config import ProjectConfig, YamlConfigFileName
+from infrastructure.database import RepositoryUtils
+from infrastructure.database.migrations import MigrationRunner
+from infrastructure.database.migrations.versions import m0001_list_query_indexes
+from infrastructure.uow_abstraction.unit_of_work_module import Session
+
+PAGE_SIZE = 20
+
+SEED_STATEMENTS: list[str] = [
+    "INSERT INTO accounts (entity_id, email, password, verified) "
+    "VALUES ('benchmark_account', 'benchmark@petconnect.icu', '', true)",
+    "INSERT INTO profiles "
+    "(entity_id, first_name, surname, phone_number, account_id, profile_type) "
+    "VALUES ('benchmark_profile', 'Bench', 'Mark', '0', 'benchmark_account', "
+    "'PERSONAL_PROFILE')",
+    # Even rows are pets (1 in 20 lost), odd rows adoption animals (1 in 20 deleted)
+    "INSERT INTO animals (entity_id, animal_name, birth_year, species, gender, size, "
+    "sterilized, vaccinated, picture, animal_type, profile_id, state, lost, deleted) "
+    "SELECT 'benchmark_animal_' || i, md5(i::text), 2010 + i % 14, "
+    "(ARRAY['DOG', 'CAT', 'OTHER'])[1 + i % 3]::animalspecies, "
+    "(ARRAY['MALE', 'FEMALE'])[1 + i % 2]::animalgender, "
+    "(ARRAY['SMALL', 'MEDIUM', 'BIG'])[1 + i % 3]::animalsize, "
+    "i % 2 = 0, i % 3 = 0, 'picture', "
+    "CASE WHEN i % 2 = 0 THEN 'PET' ELSE 'ANIMAL_FOR_ADOPTION' END::animaltypes, "
+    "'benchmark_profile', "
+    "CASE WHEN i % 2 = 0 THEN NULL ELSE 'FOR_ADOPTION' END::adoptionanimalstates, "
+    "CASE WHEN i % 2 = 0 THEN i % 40 = 0 ELSE NULL END, "
+    "CASE WHEN i % 2 = 0 THEN NULL ELSE i % 40 = 1 END "
+    "FROM generate_series(1, :animals) AS i",
+]
+
+
+def list_queries() -> dict[str, Callable[[Session], Awaitable[Any]]]:
+    adoption_animals_repository = AlchemyAdoptionAnimalsRepository()
+    pets_repository = AlchemyPetsRepository()
+
+    return {
+        "adoption animals, first page": lambda session: (
+            adoption_animals_repository.get_animals(session=session, limit=PAGE_SIZE)
+        ),
+        "adoption animals, page 500": lambda session: (
+            adoption_animals_repository.get_animals(
+                session=session, limit=PAGE_SIZE, offset=PAGE_SIZE * 500
+            )
+        ),
+        "adoption animals, first page with count": lambda session: (
+            adoption_animals_repository.get_animals_page(
+                session=session, limit=PAGE_SIZE
+            )
+        ),
+        "lost pets, first page": lambda session: (
+            pets_repository.get_pets(session=session, limit=PAGE_SIZE, lost=True)
+        ),
+        "lost pets, first page with count": lambda session: (
+            pets_repository.get_pets_page(session=session, limit=PAGE_SIZE, lost=True)
+        ),
+    }
+
+
+async def explain_list_queries(repository_utils: RepositoryUtils, title: str) -> None:
+    print(f"\n{'=' * 30} {title} {'=' * 30}")
+
+    for name, query in list_queries().items():
+        with StatementRecorder(engine=repository_utils.engine) as recorder:
+            async with repository_utils.sessionmaker() as session:
+                async with timed(f"\n--- {name}"):
+                    await query(session)
+
+        for statement, parameters in recorder.statements:
+            print(await explain(repository_utils.engine, statement, parameters))
+
+
+async def main(animals: int) -> None:
+    dependencies: DependencyContainer = DependencyContainer()
+    dependencies.register(ProjectConfig, ProjectConfig(YamlConfigFileName.TESTING))
+    initialize_contexts(dependencies)
+
+    repository_utils: RepositoryUtils = dependencies.resolve(RepositoryUtils)
+    # Only the indexes being measured are dropped and recreated, reverting every
+    # migration would also undo the later column changes and backfills
+    runner: MigrationRunner = MigrationRunner(
+        engine=repository_utils.engine, migrations=[m0001_list_query_indexes]
+    )
+
+    try:
+        await repository_utils.create_metadata()
+        await repository_utils.clear_database()
+        await runner.downgrade(target_version=0)
+
+        async with timed(f"Seeding {animals} animals"):
+            async with repository_utils.engine.begin() as conn:
+                for statement in SEED_STATEMENTS:
+                    await conn.execute(text(statement), {"animals": animals})
+
+                await conn.execute(text("ANALYZE accounts, profiles, animals"))
+
+        await explain_list_queries(repository_utils, "Before the list indexes")
+
+        async with timed("Applying the list indexes migration"):
+            await runner.upgrade()
+
+        await explain_list_queries(repository_utils, "After the list indexes")
+    finally:
+        await repository_utils.clear_database()
+        await repository_utils.dispose_engine()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.list_query_indexes")
+    parser.add_argument("--animals", type=int, default=1_000_000)
+    arguments = parser.parse_args()
+
+    asyncio.run(main(arguments.animals))
@@ -0,0 +1,167 @@
+"""
+Concurrent donations in one worker: the previous blocking MercadoPago client against
+the pooled payment gateway.
+
+Serves the fake MercadoPago API over HTTP, answering after --latency seconds, and
+pays --donations card payments at once: with a blocking call inside the coroutine,
+as the SDK made them, and through MercadoPagoService and its async gateway. Meanwhile
+a probe stands in for the other requests of the worker, waking up every 10 ms.
+Reports how long the payments took and the longest the probe waited for the loop.
+
+Usage:
+    python -m benchmarks.mercado_pago_payments --donations 50 --latency 0.2 > bench_output.txt
+"""
+
+import argparse
+import asyncio
+import socket
+import threading
+import time
+from typing import Awaitable, Callable
+
+import httpx
+import uvicorn
+
+from bounded_contexts import initialize_contexts
+from bounded_contexts.donations_domain.entities import MercadoPagoRequest, PayerInfo
+from bounded_contexts.donations_domain.services.mercado_pago_service import (
+    MercadoPagoService,
+)
+from common.dependencies import DependencyContainer
+from config import ProjectConfig, YamlConfigFileName
+from infrastructure.payment_gateway import PaymentGateway, create_fake_mercado_pago_app
+
+ACCESS_TOKEN: str = "benchmark_access_token"
+PROBE_INTERVAL_SECONDS: float = 0.01
+
+
+def serve_fake_api(latency: float) -> str:
+    with socket.socket() as free_port:
+        free_port.bind(("127.0.0.1", 0))
+        port: int = free_port.getsockname()[1]
+
+    server = uvicorn.Server(
+        uvicorn.Config(
+            create_fake_mercado_pago_app(latency=latency),
+            host="127.0.0.1",
+            port=port,
+            log_level="warning",
+        )
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+
+    while not server.started:
+        time.sleep(0.01)
+
+    return f"http://127.0.0.1:{port}"
+
+
+def payment_request(donation: int) -> MercadoPagoRequest:
+    return MercadoPagoRequest(
+        transaction_amount=1000,
+        token=f"benchmark_card_token_{donation}_{time.time_ns()}",
+        description="Benchmark donation",
+        installments=1,
+        payment_method_id="visa",
+        payer=PayerInfo(
+            email="donor@petconnect.icu",
+            identification_type="DNI",
+            identification_number="22222222",
+            name="Benchmark",
+        ),
+        application_fee=100,
+    )
+
+
+async def longest_stall(stop: asyncio.Event) -> float:
+    longest: float = 0
+
+    while not stop.is_set():
+        start: float = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL_SECONDS)
+        longest = max(longest, time.perf_counter() - start - PROBE_INTERVAL_SECONDS)
+
+    return longest
+
+
+async def run_donations(
+    donations: int, pay: Callable[[int], Awaitable[object]]
+) -> tuple[float, float]:
+    stop: asyncio.Event = asyncio.Event()
+    probe: asyncio.Task = asyncio.create_task(longest_stall(stop))
+    # Lets the probe take its first measure before the payments start
+    await asyncio.sleep(0)
+
+    start: float = time.perf_counter()
+    await asyncio.gather(*(pay(donation) for donation in range(donations)))
+    elapsed: float = time.perf_counter() - start
+
+    stop.set()
+
+    return elapsed, await probe
+
+
+async def main(donations: int, latency: float) -> None:
+    api_url: str = serve_fake_api(latency)
+
+    config: ProjectConfig = ProjectConfig(YamlConfigFileName.TESTING)
+    config.mp_config.fake = False
+    config.mp_config.api_url = api_url
+    config.mp_config.max_connections = donations
+
+    dependencies: DependencyContainer = DependencyContainer()
+    dependencies.register(ProjectConfig, config)
+    initialize_contexts(dependencies)
+
+    mercado_pago_service: MercadoPagoService = dependencies.resolve(MercadoPagoService)
+    blocking_client: httpx.Client = httpx.Client(base_url=api_url)
+
+    async def blocking_pay(donation: int) -> object:
+        # What the SDK did: a blocking HTTP call in the middle of the coroutine
+        request: MercadoPagoRequest = payment_request(donation)
+
+        return blocking_client.post(
+            "/v1/payments",
+            headers={"Authorization": f"Bearer {ACCESS_TOKEN}"},
+            json={
+                "transaction_amount": request.transaction_amount,
+                "token": request.token,
+                "description": request.description,
+                "installments": request.installments,
+                "payment_method_id": request.payment_method_id,
+                "application_fee": request.application_fee,
+            },
+        ).json()
+
+    async def gateway_pay(donation: int) -> object:
+        return await mercado_pago_service.pay_with_card(
+            merchant_access_token=ACCESS_TOKEN, request=payment_request(donation)
+        )
+
+    paths: dict[str, Callable[[int], Awaitable[object]]] = {
+        "blocking client": blocking_pay,
+        "async gateway": gateway_pay,
+    }
+
+    print(f"{donations} concurrent donations, {latency * 1000:.0f} ms API latency")
+
+    try:
+        for name, pay in paths.items():
+            elapsed, stall = await run_donations(donations, pay)
+
+            print(
+                f"{name}: {elapsed:.2f} s, {donations / elapsed:.1f} donations/s, "
+                f"other requests waited up to {stall * 1000:.0f} ms"
+            )
+    finally:
+        blocking_client.close()
+        await dependencies.resolve(PaymentGateway).stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.mercado_pago_payments")
+    parser.add_argument("--donations", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.2)
+    arguments = parser.parse_args()
+
+    asyncio.run(main(arguments.donations, arguments.latency))
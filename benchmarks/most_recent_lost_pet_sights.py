@@ -0,0 +1,198 @@
+"""
+Query plans of the "most recent sighting of each lost pet" page (the lost pets map).
+
+Seeds the testing database with pets (1 in 20 lost) and a large pets_sight table,
+then explains the GROUP BY query and the LATERAL top-1 query, without and with the
+(pet_id, created_at DESC) index of migration 2. Once migration 3 has backfilled the
+pets_last_sight projection it also explains the query AlchemyPetsSightRepository
+runs now, which reads the projection.
+
+Usage:
+    python -m benchmarks.most_recent_lost_pet_sights --sightings 10000000 > bench_output.txt
+"""
+
+import argparse
+import asyncio
+from typing import Awaitable, Callable, Any
+
+from sqlalchemy import func, join, select, text, true, tuple_
+from sqlalchemy.orm import aliased
+
+from benchmarks.benchmark_utils import StatementRecorder, explain, timed
+from bounded_contexts import initialize_contexts
+from bounded_contexts.pets_domain.entities import Pet, PetSight
+from bounded_contexts.pets_domain.repositories.alchemy.alchemy_pets_sight_repository import (
+    AlchemyPetsSightRepository,
+)
+from common.dependencies import DependencyContainer
+from config import ProjectConfig, YamlConfigFileName
+from infrastructure.database import RepositoryUtils
+from infrastructure.database.migrations import MigrationRunner
+from infrastructure.uow_abstraction.unit_of_work_module import Session
+
+PAGE_SIZE = 20
+
+SEED_STATEMENTS: list[str] = [
+    "INSERT INTO accounts (entity_id, email, password, verified) "
+    "VALUES ('benchmark_account', 'benchmark@petconnect.icu', '', true)",
+    "INSERT INTO profiles "
+    "(entity_id, first_name, surname, phone_number, account_id, profile_type) "
+    "VALUES ('benchmark_profile', 'Bench', 'Mark', '0', 'benchmark_account', "
+    "'PERSONAL_PROFILE')",
+    "INSERT INTO animals (entity_id, animal_name, birth_year, species, gender, size, "
+    "sterilized, vaccinated, picture, animal_type, profile_id, lost) "
+    "SELECT 'benchmark_pet_' || i, md5(i::text), 2010 + i % 14, 'DOG', 'MALE', "
+    "'SMALL', true, true, 'picture', 'PET', 'benchmark_profile', i % 20 = 0 "
+    "FROM generate_series(1, :pets) AS i",
+    # Added by migration 4, PetSight maps it so the baseline queries need it too
+    'ALTER TABLE pets_sight ADD COLUMN IF NOT EXISTS geohash VARCHAR(12) COLLATE "C"',
+    "INSERT INTO pets_sight (entity_id, pet_id, latitude, longitude, created_at) "
+    "SELECT 'benchmark_sight_' || i, 'benchmark_pet_' || (1 + i % :pets), "
+    "-34.6 + random() / 10, -58.4 + random() / 10, "
+    "now() - (i || ' seconds')::interval "
+    "FROM generate_series(1, :sightings) AS i",
+]
+
+
+async def get_most_recent_lost_pet_sights_group_by(session: Session) -> Any:
+    # The query before the LATERAL rewrite, kept here as the baseline
+    subquery = select(
+        PetSight.pet_id,  # type: ignore
+        func.max(PetSight.created_at),  # type: ignore
+    ).group_by(
+        PetSight.pet_id  # type: ignore
+    )
+
+    query = (
+        select(PetSight)
+        .select_from(
+            join(PetSight, Pet, PetSight.pet_id == Pet.entity_id)  # type: ignore
+        )
+        .where(
+            tuple_(PetSight.pet_id, PetSight.created_at).in_(subquery),  # type: ignore
+        )
+        .filter(Pet.lost.is_(True))  # type: ignore
+        .order_by(PetSight.created_at, PetSight.entity_id)  # type: ignore
+        .limit(PAGE_SIZE)
+    )
+
+    result = await session.execute(query)
+    return result.scalars().all()
+
+
+async def get_most_recent_lost_pet_sights_lateral(session: Session) -> Any:
+    # Top-1 sighting per lost pet, computed on every read
+    lost_pets = (
+        select(Pet.entity_id)  # type: ignore
+        .where(Pet.lost == True)  # type: ignore
+        .subquery("lost_pets")
+    )
+
+    latest_sight = aliased(
+        PetSight,
+        select(PetSight)
+        .where(PetSight.pet_id == lost_pets.c.entity_id)  # type: ignore
+        .order_by(
+            PetSight.created_at.desc(),  # type: ignore
+            PetSight.entity_id.desc(),  # type: ignore
+        )
+        .limit(1)
+        .lateral("latest_sight"),
+    )
+
+    query = (
+        select(latest_sight)
+        .select_from(lost_pets)
+        .join(latest_sight, true())
+        .order_by(latest_sight.created_at, latest_sight.entity_id)
+        .limit(PAGE_SIZE)
+    )
+
+    result = await session.execute(query)
+    return result.scalars().all()
+
+
+async def get_most_recent_lost_pet_sights_projection(session: Session) -> Any:
+    return await AlchemyPetsSightRepository().get_most_recent_lost_pet_sights_page(
+        session=session, limit=PAGE_SIZE
+    )
+
+
+QueryFunctions = dict[str, Callable[[Session], Awaitable[Any]]]
+
+COMPUTED_QUERIES: QueryFunctions = {
+    "GROUP BY subquery, first page": get_most_recent_lost_pet_sights_group_by,
+    "LATERAL top-1, first page": get_most_recent_lost_pet_sights_lateral,
+}
+
+PROJECTION_QUERIES: QueryFunctions = {
+    "pets_last_sight projection, first page with count": (
+        get_most_recent_lost_pet_sights_projection
+    ),
+}
+
+
+async def explain_most_recent_queries(
+    repository_utils: RepositoryUtils, title: str, queries: QueryFunctions
+) -> None:
+    print(f"\n{'=' * 30} {title} {'=' * 30}")
+
+    for name, query in queries.items():
+        with StatementRecorder(engine=repository_utils.engine) as recorder:
+            async with repository_utils.sessionmaker() as session:
+                async with timed(f"\n--- {name}"):
+                    await query(session)
+
+        for statement, parameters in recorder.statements:
+            print(await explain(repository_utils.engine, statement, parameters))
+
+
+async def main(pets: int, sightings: int) -> None:
+    dependencies: DependencyContainer = DependencyContainer()
+    dependencies.register(ProjectConfig, ProjectConfig(YamlConfigFileName.TESTING))
+    initialize_contexts(dependencies)
+
+    repository_utils: RepositoryUtils = dependencies.resolve(RepositoryUtils)
+    runner: MigrationRunner = MigrationRunner(engine=repository_utils.engine)
+
+    try:
+        await repository_utils.create_metadata()
+        await repository_utils.clear_database()
+        await runner.downgrade(target_version=1)
+
+        async with timed(f"Seeding {pets} pets and {sightings} sightings"):
+            async with repository_utils.engine.begin() as conn:
+                for statement in SEED_STATEMENTS:
+                    await conn.execute(
+                        text(statement), {"pets": pets, "sightings": sightings}
+                    )
+
+                await conn.execute(text("ANALYZE accounts, profiles, animals"))
+                await conn.execute(text("ANALYZE pets_sight"))
+
+        await explain_most_recent_queries(
+            repository_utils, "Before migration 2", COMPUTED_QUERIES
+        )
+
+        async with timed("Applying migrations"):
+            await runner.upgrade()
+
+        await explain_most_recent_queries(
+            repository_utils,
+            "After migrations 2 and 3",
+            {**COMPUTED_QUERIES, **PROJECTION_QUERIES},
+        )
+    finally:
+        await repository_utils.clear_database()
+        await repository_utils.dispose_engine()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.most_recent_lost_pet_sights"
+    )
+    parser.add_argument("--pets", type=int, default=200_000)
+    parser.add_argument("--sightings", type=int, default=10_000_000)
+    arguments = parser.parse_args()
+
+    asyncio.run(main(arguments.pets, arguments.sightings))
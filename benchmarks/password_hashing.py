@@ -0,0 +1,86 @@
+"""
+Login throughput of HashUtils hashing on threads versus on a process pool.
+
+Hashes a password once and verifies it concurrently, the bcrypt work of a login,
+with the same number of workers in both modes. Reports logins per second and per
+second per core.
+
+Usage:
+    python -m benchmarks.password_hashing --logins 200 --rounds 12 > bench_output.txt
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from bounded_contexts import initialize_contexts
+from common.background import configure_executors
+from common.dependencies import DependencyContainer
+from config import ExecutorConfig, HashingConfig, ProjectConfig, YamlConfigFileName
+from infrastructure.crypto import HashUtils
+from infrastructure.crypto.bcrypt import PROCESS_MODE, THREAD_MODE
+
+PASSWORD: str = "benchmark_password"
+
+
+async def logins_per_second(mode: str, logins: int, rounds: int, workers: int) -> float:
+    hash_utils: HashUtils = HashUtils(
+        config=HashingConfig(
+            mode=mode, workers=workers, min_rounds=rounds, latency_budget_ms=0
+        )
+    )
+
+    try:
+        hashed: str = await hash_utils.hash_string(PASSWORD)
+
+        # Warm up every worker (process start up) before measuring
+        await asyncio.gather(
+            *(hash_utils.verify_hash(PASSWORD, hashed) for _ in range(workers))
+        )
+
+        start: float = time.perf_counter()
+        await asyncio.gather(
+            *(hash_utils.verify_hash(PASSWORD, hashed) for _ in range(logins))
+        )
+
+        return logins / (time.perf_counter() - start)
+    finally:
+        await hash_utils.stop()
+
+
+async def main(logins: int, rounds: int, workers: int) -> None:
+    dependencies: DependencyContainer = DependencyContainer()
+    dependencies.register(ProjectConfig, ProjectConfig(YamlConfigFileName.TESTING))
+    initialize_contexts(dependencies)
+
+    cores: int = os.cpu_count() or 1
+
+    # The thread mode runs on the crypto executor, sized like the process pool
+    configure_executors(
+        {
+            "crypto": ExecutorConfig(
+                max_workers=workers, max_queue_size=logins, queue_timeout=3600
+            )
+        }
+    )
+
+    print(f"{logins} logins, {rounds} rounds, {workers} workers, {cores} cores")
+
+    for mode in (THREAD_MODE, PROCESS_MODE):
+        throughput: float = await logins_per_second(mode, logins, rounds, workers)
+
+        print(
+            f"{mode}: {throughput:.1f} logins/s, "
+            f"{throughput / cores:.1f} logins/s per core"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.password_hashing")
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    arguments = parser.parse_args()
+
+    asyncio.run(main(arguments.logins, arguments.rounds, arguments.workers))
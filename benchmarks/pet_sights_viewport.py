@@ -0,0 +1,196 @@
+"""
+Viewport (bounding box) and radius searches over pet sightings.
+
+Seeds the testing database with a large pets_sight table spread over the south of
+South America, then runs a city sized viewport, a neighbourhood radius and a country
+sized viewport: first as plain latitude/longitude BETWEEN filters (the only option
+before migration 4), then through AlchemyPetsSightRepository, whose filters scan the
+geohash index of migration 4. Every query is explained once and then timed over a
+few runs, the median is the number to compare with the 10ms viewport budget.
+
+Usage:
+    python -m benchmarks.pet_sights_viewport --sightings 10000000 > bench_output.txt
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, Any
+
+from sqlalchemy import select, text
+
+from benchmarks.benchmark_utils import StatementRecorder, explain, timed
+from bounded_contexts import initialize_contexts
+from bounded_contexts.pets_domain.entities import PetSight
+from bounded_contexts.pets_domain.repositories.alchemy.alchemy_pets_sight_repository import (
+    AlchemyPetsSightRepository,
+)
+from common.dependencies import DependencyContainer
+from common.geo import BoundingBox, GeoCircle
+from config import ProjectConfig, YamlConfigFileName
+from infrastructure.database import RepositoryUtils
+from infrastructure.database.migrations import MigrationRunner
+from infrastructure.uow_abstraction.unit_of_work_module import Session
+
+PAGE_SIZE = 20
+RUNS = 20
+
+# Montevideo, ~10km x 10km
+CITY_VIEWPORT = BoundingBox(south=-34.95, west=-56.25, north=-34.85, east=-56.10)
+NEIGHBOURHOOD = GeoCircle(latitude=-34.9, longitude=-56.16, radius_km=1.0)
+# Uruguay
+COUNTRY_VIEWPORT = BoundingBox(south=-35.0, west=-58.5, north=-30.0, east=-53.0)
+
+SEED_STATEMENTS: list[str] = [
+    "INSERT INTO accounts (entity_id, email, password, verified) "
+    "VALUES ('benchmark_account', 'benchmark@petconnect.icu', '', true)",
+    "INSERT INTO profiles "
+    "(entity_id, first_name, surname, phone_number, account_id, profile_type) "
+    "VALUES ('benchmark_profile', 'Bench', 'Mark', '0', 'benchmark_account', "
+    "'PERSONAL_PROFILE')",
+    "INSERT INTO animals (entity_id, animal_name, birth_year, species, gender, size, "
+    "sterilized, vaccinated, picture, animal_type, profile_id, lost) "
+    "SELECT 'benchmark_pet_' || i, md5(i::text), 2010 + i % 14, 'DOG', 'MALE', "
+    "'SMALL', true, true, 'picture', 'PET', 'benchmark_profile', i % 20 = 0 "
+    "FROM generate_series(1, :pets) AS i",
+    # Uniform over latitudes -55..-20 and longitudes -75..-45
+    "INSERT INTO pets_sight (entity_id, pet_id, latitude, longitude, created_at) "
+    "SELECT 'benchmark_sight_' || i, 'benchmark_pet_' || (1 + i % :pets), "
+    "-55 + random() * 35, -75 + random() * 30, now() - (i || ' seconds')::interval "
+    "FROM generate_series(1, :sightings) AS i",
+]
+
+
+def between_query(bounding_box: BoundingBox) -> Callable[[Session], Awaitable[Any]]:
+    async def query(session: Session) -> Any:
+        # Only the columns that exist before migration 4
+        result = await session.execute(
+            select(
+                PetSight.entity_id,  # type: ignore
+                PetSight.latitude,  # type: ignore
+                PetSight.longitude,  # type: ignore
+                PetSight.created_at,  # type: ignore
+            )
+            .where(
+                PetSight.latitude.between(  # type: ignore
+                    bounding_box.south, bounding_box.north
+                ),
+                PetSight.longitude.between(  # type: ignore
+                    bounding_box.west, bounding_box.east
+                ),
+            )
+            .order_by(PetSight.created_at, PetSight.entity_id)  # type: ignore
+            .limit(PAGE_SIZE)
+        )
+        return result.all()
+
+    return query
+
+
+def repository_query(
+    bounding_box: BoundingBox | None = None, circle: GeoCircle | None = None
+) -> Callable[[Session], Awaitable[Any]]:
+    async def query(session: Session) -> Any:
+        return await AlchemyPetsSightRepository().get_pet_sights(
+            session=session,
+            limit=PAGE_SIZE,
+            bounding_box=bounding_box,
+            circle=circle,
+        )
+
+    return query
+
+
+QueryFunctions = dict[str, Callable[[Session], Awaitable[Any]]]
+
+BETWEEN_QUERIES: QueryFunctions = {
+    "city viewport, BETWEEN": between_query(CITY_VIEWPORT),
+    "1km radius bounding box, BETWEEN": between_query(
+        NEIGHBOURHOOD.bounding_boxes()[0]
+    ),
+    "country viewport, BETWEEN": between_query(COUNTRY_VIEWPORT),
+}
+
+GEOHASH_QUERIES: QueryFunctions = {
+    "city viewport, geohash": repository_query(bounding_box=CITY_VIEWPORT),
+    "1km radius, geohash": repository_query(circle=NEIGHBOURHOOD),
+    "country viewport, geohash": repository_query(bounding_box=COUNTRY_VIEWPORT),
+}
+
+
+async def run_viewport_queries(
+    repository_utils: RepositoryUtils, title: str, queries: QueryFunctions
+) -> None:
+    print(f"\n{'=' * 30} {title} {'=' * 30}")
+
+    for name, query in queries.items():
+        with StatementRecorder(engine=repository_utils.engine) as recorder:
+            async with repository_utils.sessionmaker() as session:
+                await query(session)
+
+        print(f"\n--- {name}")
+
+        for statement, parameters in recorder.statements:
+            print(await explain(repository_utils.engine, statement, parameters))
+
+        durations: list[float] = []
+
+        async with repository_utils.sessionmaker() as session:
+            for _ in range(RUNS):
+                start: float = time.perf_counter()
+                await query(session)
+                durations.append((time.perf_counter() - start) * 1000)
+
+        print(
+            f"{name}: median {statistics.median(durations):.2f} ms, "
+            f"max {max(durations):.2f} ms over {RUNS} runs"
+        )
+
+
+async def main(pets: int, sightings: int) -> None:
+    dependencies: DependencyContainer = DependencyContainer()
+    dependencies.register(ProjectConfig, ProjectConfig(YamlConfigFileName.TESTING))
+    initialize_contexts(dependencies)
+
+    repository_utils: RepositoryUtils = dependencies.resolve(RepositoryUtils)
+    runner: MigrationRunner = MigrationRunner(engine=repository_utils.engine)
+
+    try:
+        await repository_utils.create_metadata()
+        await repository_utils.clear_database()
+        await runner.downgrade(target_version=3)
+
+        async with timed(f"Seeding {pets} pets and {sightings} sightings"):
+            async with repository_utils.engine.begin() as conn:
+                for statement in SEED_STATEMENTS:
+                    await conn.execute(
+                        text(statement), {"pets": pets, "sightings": sightings}
+                    )
+
+                await conn.execute(text("ANALYZE accounts, profiles, animals"))
+                await conn.execute(text("ANALYZE pets_sight"))
+
+        await run_viewport_queries(
+            repository_utils, "Before migration 4", BETWEEN_QUERIES
+        )
+
+        # Includes the geohash backfill of every seeded sighting
+        async with timed("Applying migrations"):
+            await runner.upgrade()
+
+        await run_viewport_queries(
+            repository_utils, "After migration 4", GEOHASH_QUERIES
+        )
+    finally:
+        await repository_utils.clear_database()
+        await repository_utils.dispose_engine()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.pet_sights_viewport")
+    parser.add_argument("--pets", type=int, default=200_000)
+    parser.add_argument("--sightings", type=int, default=10_000_000)
+    arguments = parser.parse_args()
+
+    asyncio.run(main(arguments.pets, arguments.sightings))
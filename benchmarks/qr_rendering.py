@@ -0,0 +1,70 @@
+"""
+Per image latency and output size of the QR code generators.
+
+Renders the QR codes of the same pet urls, one at a time in this process, with the
+plain PyQRGenerator and with the BrandedQRGenerator as PNG, WebP and SVG. Reports
+the mean, p50 and p95 latency per image and the mean image size.
+
+Usage:
+    python -m benchmarks.qr_rendering --images 500 > bench_output.txt
+"""
+
+import argparse
+import dataclasses
+import statistics
+import time
+from typing import Callable
+from uuid import uuid4
+
+from infrastructure.qr.branded_qr_code import BRANDED_QR_STYLE, render_branded_qr_code
+from infrastructure.qr.qr_code import QRStyle, render_qr_code
+
+FRONTEND_URL: str = "https://petconnect.icu"
+
+
+def measure(
+    name: str, urls: list[str], style: QRStyle, render: Callable[[str, QRStyle], bytes]
+) -> None:
+    # The first render loads and scales the logo, as the first one of a process does
+    render(urls[0], style)
+
+    latencies: list[float] = []
+    sizes: list[int] = []
+
+    for url in urls:
+        start: float = time.perf_counter()
+        image: bytes = render(url, style)
+        latencies.append((time.perf_counter() - start) * 1000)
+        sizes.append(len(image))
+
+    p95: float = statistics.quantiles(latencies, n=20)[-1]
+
+    print(
+        f"{name}: mean {statistics.mean(latencies):.2f} ms, "
+        f"p50 {statistics.median(latencies):.2f} ms, p95 {p95:.2f} ms, "
+        f"{statistics.mean(sizes) / 1024:.1f} KiB/image"
+    )
+
+
+def main(images: int) -> None:
+    urls: list[str] = [
+        f"{FRONTEND_URL}/found-pet/{uuid4().hex}/qr" for _ in range(images)
+    ]
+
+    measure("PyQRGenerator, png", urls, QRStyle(), render_qr_code)
+
+    for image_format in ("png", "webp", "svg"):
+        measure(
+            f"BrandedQRGenerator, {image_format}",
+            urls,
+            dataclasses.replace(BRANDED_QR_STYLE, image_format=image_format),
+            render_branded_qr_code,
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.qr_rendering")
+    parser.add_argument("--images", type=int, default=500)
+    arguments = parser.parse_args()
+
+    main(arguments.images)
@@ -0,0 +1,94 @@
+"""
+Access token decoding: the previous executor path against TokenUtils.
+
+Decodes the same access token, as every authenticated route does, through the
+crypto executor (the previous TokenUtils.decode_token), inline without the
+verified tokens cache, and inline with it. Reports decodes per second.
+
+Usage:
+    python -m benchmarks.token_decoding --decodes 100000 > bench_output.txt
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+import jwt
+
+from bounded_contexts import initialize_contexts
+from bounded_contexts.auth.enum import TokenTypes
+from bounded_contexts.auth.value_objects import TokenData
+from common.background import Workload, run_async
+from common.dependencies import DependencyContainer
+from common.ttl_cache import TTLCache
+from config import ProjectConfig, YamlConfigFileName
+from infrastructure.crypto import TokenRevocationList, TokenUtils
+
+
+def token_utils(config: ProjectConfig, cache_size: int) -> TokenUtils[TokenData]:
+    return TokenUtils(
+        algorithm=config.crypto.algorithm,
+        token_secret=config.crypto.token_secret,
+        token_data_to_dict=TokenData.to_dict,
+        dict_to_token_data=TokenData.from_dict,
+        token_subject=TokenData.subject,
+        token_lifetime=lambda _: 3600,
+        verified_tokens=TTLCache(max_size=cache_size, ttl_seconds=3600),
+        revocation_list=TokenRevocationList(),
+    )
+
+
+async def decodes_per_second(
+    decodes: int, token: str, decode: Callable[[str], Awaitable[TokenData]]
+) -> float:
+    start: float = time.perf_counter()
+
+    for _ in range(decodes):
+        await decode(token)
+
+    return decodes / (time.perf_counter() - start)
+
+
+async def main(decodes: int) -> None:
+    dependencies: DependencyContainer = DependencyContainer()
+    config: ProjectConfig = ProjectConfig(YamlConfigFileName.TESTING)
+    dependencies.register(ProjectConfig, config)
+    initialize_contexts(dependencies)
+
+    uncached: TokenUtils[TokenData] = token_utils(config, cache_size=0)
+    cached: TokenUtils[TokenData] = token_utils(config, cache_size=1)
+
+    token: str = await cached.generate_token(
+        TokenData(account_id="benchmark_account", token_type=TokenTypes.ACCESS_TOKEN)
+    )
+
+    async def executor_decode(token: str) -> TokenData:
+        def _decode_jwt_sync() -> TokenData:
+            return TokenData.from_dict(
+                jwt.decode(
+                    jwt=token,
+                    key=config.crypto.token_secret,
+                    algorithms=[config.crypto.algorithm],
+                )
+            )
+
+        return await run_async(_decode_jwt_sync, workload=Workload.CRYPTO)
+
+    paths: dict[str, Callable[[str], Awaitable[TokenData]]] = {
+        "executor": executor_decode,
+        "inline": uncached.decode_token,
+        "inline, cached": cached.decode_token,
+    }
+
+    for name, decode in paths.items():
+        throughput: float = await decodes_per_second(decodes, token, decode)
+        print(f"{name}: {throughput:,.0f} decodes/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.token_decoding")
+    parser.add_argument("--decodes", type=int, default=100_000)
+    arguments = parser.parse_args()
+
+    asyncio.run(main(arguments.decodes))
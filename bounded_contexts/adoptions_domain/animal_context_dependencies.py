@@ -53,7 +53,9 @@ from bounded_contexts.social_domain.services.organization_service import (
 )
 from bounded_contexts.social_domain.services.profile_service import ProfileService
 from bounded_contexts.social_domain.views import ProfileViewFactory
+from bounded_contexts.social_domain.value_objects import ProfileSnapshot
 from common.dependencies import BaseContextDependencies
+from common.ttl_cache import TTLCache
 from config import ProjectConfig
 from infrastructure.database import RepositoryUtils
 from infrastructure.email import BaseEmailGateway
@@ -101,7 +103,10 @@ class AdoptionsContextDependencies(BaseContextDependencies):
 
     def _initialize_services(self) -> None:
         profile_service: ProfileService = ProfileService(
-            profile_repository=self.dependencies.resolve(ProfileRepository)
+            profile_repository=self.dependencies.resolve(ProfileRepository),
+            profile_snapshot_cache=self.dependencies.resolve(
+                TTLCache[str, ProfileSnapshot]
+            ),
         )
 
         self.dependencies.register(ProfileService, profile_service)
@@ -1,15 +1,14 @@
 from enum import Enum
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Template
+
+from common.email_templates import get_template, register_template_path
 
 BASE_DIR = Path(__file__).parent.parent.parent.parent
 
-COMMON_TEMPLATE_PATH = BASE_DIR / "common/templates/"
 ADOPTION_TEMPLATE_PATH = BASE_DIR / "bounded_contexts/adoptions_domain/email/templates/"
 
-template_env = Environment(
-    loader=FileSystemLoader([str(COMMON_TEMPLATE_PATH), str(ADOPTION_TEMPLATE_PATH)])
-)
+register_template_path(ADOPTION_TEMPLATE_PATH)
 
 
 # Steps to register new email:
@@ -32,7 +31,7 @@ def render_adoption_application_approved_template(
     owner_name: str,
     animal_name: str,
 ) -> str:
-    template: Template = template_env.get_template(
+    template: Template = get_template(
         AdoptionEmailTemplates.ADOPTION_APPLICATION_APPROVED_TEMPLATE.value
     )
 
@@ -46,7 +45,7 @@ def render_adoption_application_rejected_template(
     owner_name: str,
     animal_name: str,
 ) -> str:
-    template: Template = template_env.get_template(
+    template: Template = get_template(
         AdoptionEmailTemplates.ADOPTION_APPLICATION_REJECTED_TEMPLATE.value
     )
 
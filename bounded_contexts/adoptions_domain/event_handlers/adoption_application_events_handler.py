@@ -21,7 +21,7 @@ from bounded_contexts.social_domain.services.profile_service import ProfileServi
 from config import UrlConfig
 from infrastructure.database import RepositoryUtils
 from infrastructure.email import BaseEmailGateway
-from infrastructure.uow_abstraction import EventBus, make_unit_of_work
+from infrastructure.uow_abstraction import EventBus, UnitOfWork, make_unit_of_work
 
 
 class AdoptionApplicationEventHandler:
@@ -88,6 +88,7 @@ class AdoptionApplicationEventHandler:
 
             if adoption_application.state == AdoptionApplicationStates.ACCEPTED:
                 await self.__send_application_approved_email(
+                    uow=uow,
                     email=adopter_profile.account.email,
                     adopter_name=adopter_profile.first_name,
                     owner_name=owner_name,
@@ -95,6 +96,7 @@ class AdoptionApplicationEventHandler:
                 )
             else:
                 await self.__send_application_rejected_email(
+                    uow=uow,
                     email=adopter_profile.account.email,
                     adopter_name=adopter_profile.first_name,
                     owner_name=owner_name,
@@ -102,9 +104,15 @@ class AdoptionApplicationEventHandler:
                 )
 
     async def __send_application_approved_email(
-        self, email: str, adopter_name: str, owner_name: str, animal_name: str
+        self,
+        uow: UnitOfWork,
+        email: str,
+        adopter_name: str,
+        owner_name: str,
+        animal_name: str,
     ) -> None:
-        self.email_gateway.schedule_mail(
+        await self.email_gateway.schedule_mail(
+            uow=uow,
             recipient=email,
             subject=AdoptionEmailSubjects.ADOPTION_APPLICATION_STATUS_UPDATED.value,
             body=render_adoption_application_approved_template(
@@ -115,9 +123,15 @@ class AdoptionApplicationEventHandler:
         )
 
     async def __send_application_rejected_email(
-        self, email: str, adopter_name: str, owner_name: str, animal_name: str
+        self,
+        uow: UnitOfWork,
+        email: str,
+        adopter_name: str,
+        owner_name: str,
+        animal_name: str,
     ) -> None:
-        self.email_gateway.schedule_mail(
+        await self.email_gateway.schedule_mail(
+            uow=uow,
             recipient=email,
             subject=AdoptionEmailSubjects.ADOPTION_APPLICATION_STATUS_UPDATED.value,
             body=render_adoption_application_rejected_template(
@@ -1,3 +1,5 @@
+from sqlalchemy import func, select, update
+
 from bounded_contexts.adoptions_domain.email import AdoptionEmailSubjects
 from bounded_contexts.adoptions_domain.enum import AdoptionApplicationStates
 from bounded_contexts.adoptions_domain.services.adoption_applications_service import (
@@ -8,8 +10,14 @@ from bounded_contexts.adoptions_domain.use_cases.edit_adoption_application impor
 )
 from common.testing import BaseUseCaseTest
 from common.testing.base_testing_utils import BaseTestingUtils
-from infrastructure.email import BaseEmailGateway
-from infrastructure.uow_abstraction import UnitOfWork, unit_of_work
+from config import ProjectConfig
+from infrastructure.email import (
+    DeadLetterEmail,
+    EmailQueue,
+    QueuedEmail,
+    TestEmailGateway,
+)
+from infrastructure.uow_abstraction import UnitOfWork, make_unit_of_work, unit_of_work
 
 
 class TestAdoptionApplicationEventHandler(BaseUseCaseTest, BaseTestingUtils):
@@ -59,8 +67,8 @@ class TestAdoptionApplicationEventHandler(BaseUseCaseTest, BaseTestingUtils):
             self.dependencies.resolve(EditAdoptionApplicationUseCase)
         )
 
-        self.email_gateway: BaseEmailGateway = self.dependencies.resolve(
-            BaseEmailGateway
+        self.email_gateway: TestEmailGateway = self.dependencies.resolve(
+            TestEmailGateway
         )
 
         self.email_gateway.clear_cache()
@@ -126,3 +134,60 @@ class TestAdoptionApplicationEventHandler(BaseUseCaseTest, BaseTestingUtils):
         )
 
         self.assertTrue("fue rechazada" in application_emails[0].body)
+
+    async def test_failed_sends_are_retried_and_then_dead_lettered(self) -> None:
+        email_queue: EmailQueue = self.dependencies.resolve(EmailQueue)
+        max_attempts: int = self.dependencies.resolve(
+            ProjectConfig
+        ).email_queue.max_attempts
+
+        self.email_gateway.send_error = ConnectionError("provider unavailable")
+
+        try:
+            await self.edit_adoption_application_use_case.execute(
+                EditAdoptionApplicationUseCase.Request(
+                    actor_account_id=self.adoption_giver_personal_profile.account_id,
+                    application_data=ModifyAdoptionApplicationData(
+                        entity_id=self.adoption_application_personal_profile.adoption_application_data.entity_id,
+                        state=AdoptionApplicationStates.ACCEPTED,
+                    ),
+                )
+            )
+
+            async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+                queued: QueuedEmail = (
+                    await uow.session.scalars(select(QueuedEmail))
+                ).one()
+
+            self.assertEqual(self.adopter_profile.email, queued.recipient)
+            self.assertEqual(1, queued.attempts)
+            self.assertTrue("provider unavailable" in (queued.last_error or ""))
+
+            # Backing off, not claimed again until the retry delay is over
+            self.assertEqual(0, await email_queue.dispatch_pending())
+
+            # Ends the backoff of the last attempt
+            async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+                await uow.session.execute(
+                    update(QueuedEmail).values(
+                        attempts=max_attempts - 1, available_at=func.now()
+                    )
+                )
+
+            self.assertEqual(0, await email_queue.dispatch_pending())
+
+        finally:
+            self.email_gateway.send_error = None
+
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            pending_emails = await uow.session.scalar(
+                select(func.count()).select_from(QueuedEmail)
+            )
+            dead_letter: DeadLetterEmail = (
+                await uow.session.scalars(select(DeadLetterEmail))
+            ).one()
+
+        self.assertEqual(0, pending_emails)
+        self.assertEqual(self.adopter_profile.email, dead_letter.recipient)
+        self.assertEqual(max_attempts, dead_letter.attempts)
+        self.assertEqual([], self.email_gateway.email_cache)
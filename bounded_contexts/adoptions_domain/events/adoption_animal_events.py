@@ -11,6 +11,9 @@ class BaseAdoptionAnimalEvent(Event):
         )
         self.adoption_animal_id = adoption_animal_id
 
+    def aggregate_id(self) -> str | None:
+        return self.adoption_animal_id
+
 
 class AdoptionAnimalDeletedEvent(BaseAdoptionAnimalEvent):
     pass
@@ -11,6 +11,9 @@ class BaseAdoptionApplicationEvent(Event):
         )
         self.adoption_application_id = adoption_application_id
 
+    def aggregate_id(self) -> str | None:
+        return self.adoption_application_id
+
 
 class ApplicationStateUpdatedEvent(BaseAdoptionApplicationEvent):
     def __init__(
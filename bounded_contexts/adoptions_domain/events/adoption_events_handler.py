@@ -13,3 +13,6 @@ class AnimalAdoptedEvent(Event):
             issued=issued,
         )
         self.animal_id = animal_id
+
+    def aggregate_id(self) -> str | None:
+        return self.animal_id
@@ -4,6 +4,7 @@ from typing import Sequence
 from bounded_contexts.adoptions_domain.entities import (
     AdoptionApplication,
 )
+from common.pagination import Page
 from infrastructure.uow_abstraction.unit_of_work_module import Session
 
 
@@ -39,57 +40,33 @@ class AdoptionApplicationsRepository(ABC):
         pass
 
     @abstractmethod
-    async def get_received_applications_by_personal_profile(
+    async def get_received_applications_by_personal_profile_page(
         self,
         session: Session,
         profile_id: str,
         limit: int | None = None,
         offset: int | None = 0,
-    ) -> Sequence[AdoptionApplication]:
+    ) -> Page[AdoptionApplication]:
         pass
 
     @abstractmethod
-    async def count_received_applications_by_personal_profile(
-        self,
-        session: Session,
-        profile_id: str,
-    ) -> int:
-        pass
-
-    @abstractmethod
-    async def get_received_applications_by_organizational_profile(
+    async def get_received_applications_by_organizational_profile_page(
         self,
         session: Session,
         organization_id: str,
         limit: int | None = None,
         offset: int | None = 0,
-    ) -> Sequence[AdoptionApplication]:
+    ) -> Page[AdoptionApplication]:
         pass
 
     @abstractmethod
-    async def count_received_applications_by_organizational_profile(
-        self,
-        session: Session,
-        organization_id: str,
-    ) -> int:
-        pass
-
-    @abstractmethod
-    async def get_sent_applications(
+    async def get_sent_applications_page(
         self,
         session: Session,
         profile_id: str,
         limit: int | None = None,
         offset: int | None = 0,
-    ) -> Sequence[AdoptionApplication]:
-        pass
-
-    @abstractmethod
-    async def count_sent_applications(
-        self,
-        session: Session,
-        profile_id: str,
-    ) -> int:
+    ) -> Page[AdoptionApplication]:
         pass
 
     @abstractmethod
@@ -1,5 +1,5 @@
 from typing import Type, Sequence
-from sqlalchemy import select, func, join
+from sqlalchemy import Select, select, join
 
 from bounded_contexts.adoptions_domain.entities import (
     AdoptionApplication,
@@ -8,6 +8,7 @@ from bounded_contexts.adoptions_domain.entities import (
 from bounded_contexts.adoptions_domain.repositories.adoption_applications_repository import (
     AdoptionApplicationsRepository,
 )
+from common.pagination import Page, fetch_page
 from infrastructure.uow_abstraction.unit_of_work_module import Session
 
 
@@ -58,87 +59,82 @@ class AlchemyAdoptionApplicationsRepository(AdoptionApplicationsRepository):
         result = await session.execute(query)
         return result.scalars().all()
 
-    async def get_received_applications_by_personal_profile(
+    async def get_received_applications_by_personal_profile_page(
         self,
         session: Session,
         profile_id: str,
         limit: int | None = None,
         offset: int | None = 0,
-    ) -> Sequence[AdoptionApplication]:
-        query = (
-            select(self.model)
-            .select_from(
-                join(self.model, self.animals_model, self.animals_model.entity_id == self.model.animal_id)  # type: ignore
-            )
-            .where(
-                self.animals_model.profile_id == profile_id,  # type: ignore
-            )
-            .order_by(self.model.application_date)  # type: ignore
+    ) -> Page[AdoptionApplication]:
+        return await fetch_page(
+            session=session,
+            query=self.__received_applications_by_personal_profile_query(
+                profile_id=profile_id
+            ),
+            sort_column=self.model.application_date,
+            id_column=self.model.entity_id,
+            limit=limit,
+            offset=offset,
         )
 
-        if limit:
-            query = query.limit(limit)
-
-        if offset:
-            query = query.offset(offset)
-
-        result = await session.execute(query)
-        return result.scalars().all()
-
-    async def count_received_applications_by_personal_profile(
+    async def get_received_applications_by_organizational_profile_page(
         self,
         session: Session,
-        profile_id: str,
-    ) -> int:
-        query = (
-            func.count()
-            .select()
-            .select_from(
-                join(self.model, self.animals_model, self.animals_model.entity_id == self.model.animal_id)  # type: ignore
-            )
-            .where(
-                self.animals_model.profile_id == profile_id,  # type: ignore
-            )
+        organization_id: str,
+        limit: int | None = None,
+        offset: int | None = 0,
+    ) -> Page[AdoptionApplication]:
+        return await fetch_page(
+            session=session,
+            query=self.__received_applications_by_organizational_profile_query(
+                organization_id=organization_id
+            ),
+            sort_column=self.model.application_date,
+            id_column=self.model.entity_id,
+            limit=limit,
+            offset=offset,
         )
 
-        result = await session.execute(query)
-        return result.scalar()  # type: ignore
-
-    async def get_received_applications_by_organizational_profile(
+    async def get_sent_applications_page(
         self,
         session: Session,
-        organization_id: str,
+        profile_id: str,
         limit: int | None = None,
         offset: int | None = 0,
-    ) -> Sequence[AdoptionApplication]:
-        query = (
+    ) -> Page[AdoptionApplication]:
+        return await fetch_page(
+            session=session,
+            query=self.__sent_applications_query(profile_id=profile_id),
+            sort_column=self.model.application_date,
+            id_column=self.model.entity_id,
+            limit=limit,
+            offset=offset,
+        )
+
+    async def delete_applications(
+        self, session: Session, application: AdoptionApplication
+    ) -> None:
+        await session.delete(application)
+        await session.flush([application])
+
+    def __received_applications_by_personal_profile_query(
+        self, profile_id: str
+    ) -> Select:
+        return (
             select(self.model)
             .select_from(
                 join(self.model, self.animals_model, self.animals_model.entity_id == self.model.animal_id)  # type: ignore
             )
             .where(
-                self.animals_model.organization_id == organization_id,  # type: ignore
+                self.animals_model.profile_id == profile_id,  # type: ignore
             )
-            .order_by(self.model.application_date)  # type: ignore
         )
 
-        if limit:
-            query = query.limit(limit)
-
-        if offset:
-            query = query.offset(offset)
-
-        result = await session.execute(query)
-        return result.scalars().all()
-
-    async def count_received_applications_by_organizational_profile(
-        self,
-        session: Session,
-        organization_id: str,
-    ) -> int:
-        query = (
-            func.count()
-            .select()
+    def __received_applications_by_organizational_profile_query(
+        self, organization_id: str
+    ) -> Select:
+        return (
+            select(self.model)
             .select_from(
                 join(self.model, self.animals_model, self.animals_model.entity_id == self.model.animal_id)  # type: ignore
             )
@@ -147,52 +143,7 @@ class AlchemyAdoptionApplicationsRepository(AdoptionApplicationsRepository):
             )
         )
 
-        result = await session.execute(query)
-        return result.scalar()  # type: ignore
-
-    async def get_sent_applications(
-        self,
-        session: Session,
-        profile_id: str,
-        limit: int | None = None,
-        offset: int | None = 0,
-    ) -> Sequence[AdoptionApplication]:
-        query = (
-            select(self.model)
-            .where(
-                self.model.adopter_profile_id == profile_id,  # type: ignore
-            )
-            .order_by(self.model.application_date)  # type: ignore
+    def __sent_applications_query(self, profile_id: str) -> Select:
+        return select(self.model).where(
+            self.model.adopter_profile_id == profile_id,  # type: ignore
         )
-
-        if limit:
-            query = query.limit(limit)
-
-        if offset:
-            query = query.offset(offset)
-
-        result = await session.execute(query)
-        return result.scalars().all()
-
-    async def count_sent_applications(
-        self,
-        session: Session,
-        profile_id: str,
-    ) -> int:
-        query = (
-            func.count()
-            .select()
-            .select_from(self.model)
-            .where(
-                self.model.adopter_profile_id == profile_id,  # type: ignore
-            )
-        )
-
-        result = await session.execute(query)
-        return result.scalar()  # type: ignore
-
-    async def delete_applications(
-        self, session: Session, application: AdoptionApplication
-    ) -> None:
-        await session.delete(application)
-        await session.flush([application])
@@ -1,5 +1,5 @@
 from typing import Type, Sequence
-from sqlalchemy import select, func
+from sqlalchemy import Select, select
 
 from bounded_contexts.adoptions_domain.entities import AdoptionAnimal
 from bounded_contexts.adoptions_domain.enum import AdoptionAnimalStates
@@ -12,6 +12,7 @@ from bounded_contexts.social_domain.entities import (
     Organization,
 )
 from bounded_contexts.social_domain.enum import AnimalTypes
+from common.pagination import Cursor, CountMode, Page, fetch_page, paginate_query
 from infrastructure.uow_abstraction.unit_of_work_module import Session
 
 
@@ -46,6 +47,25 @@ class AlchemyAdoptionAnimalsRepository(AdoptionAnimalsRepository):
         result = await session.execute(query)
         return result.scalars().first()
 
+    async def get_multiple_animals_by_id(
+        self, session: Session, animal_ids: list[str], get_all: bool
+    ) -> Sequence[AdoptionAnimal]:
+        query = (
+            select(self.model)
+            .where(
+                self.model.entity_id.in_(animal_ids),  # type: ignore
+            )
+            .where(
+                self.model.animal_type == AnimalTypes.ANIMAL_FOR_ADOPTION  # type: ignore
+            )
+        )
+
+        if not get_all:
+            query = query.where(self.model.deleted == False)  # type: ignore
+
+        result = await session.execute(query)
+        return result.scalars().all()
+
     async def get_animals(
         self,
         session: Session,
@@ -54,104 +74,99 @@ class AlchemyAdoptionAnimalsRepository(AdoptionAnimalsRepository):
         offset: int | None = 0,
         profile_id: str | None = None,
         state: AdoptionAnimalStates | None = None,
+        cursor: Cursor | None = None,
     ) -> Sequence[AdoptionAnimal]:
-        query = (
-            select(self.model)
-            .where(self.model.animal_type == AnimalTypes.ANIMAL_FOR_ADOPTION)  # type: ignore
-            .where(self.model.deleted == False)  # type: ignore
-            .order_by(self.model.animal_name)  # type: ignore
+        query = paginate_query(
+            query=self.__animals_query(
+                species=species, profile_id=profile_id, state=state
+            ),
+            sort_column=self.model.animal_name,
+            id_column=self.model.entity_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
         )
 
-        if profile_id:
-            query = query.where(
-                self.model.profile_id == profile_id,  # type: ignore
-            )
-
-        if species:
-            query = query.filter(self.model.species.in_(species))  # type: ignore
-
-        if limit:
-            query = query.limit(limit)
-
-        if offset:
-            query = query.offset(offset)
-
-        if state:
-            query = query.where(self.model.state == state)  # type: ignore
-
         result = await session.execute(query)
         return result.scalars().all()
 
-    async def count_animals(
+    async def get_animals_page(
         self,
         session: Session,
         species: Sequence[AnimalSpecies] | None = None,
+        limit: int | None = None,
+        offset: int | None = 0,
         profile_id: str | None = None,
         state: AdoptionAnimalStates | None = None,
-    ) -> int:
-        query = (
-            func.count()
-            .select()
-            .select_from(self.model)
-            .where(self.model.animal_type == AnimalTypes.ANIMAL_FOR_ADOPTION)  # type: ignore
-            .where(self.model.deleted == False)  # type: ignore
+        cursor: Cursor | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> Page[AdoptionAnimal]:
+        return await fetch_page(
+            session=session,
+            query=self.__animals_query(
+                species=species, profile_id=profile_id, state=state
+            ),
+            sort_column=self.model.animal_name,
+            id_column=self.model.entity_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count_mode=count_mode,
         )
 
-        if profile_id:
-            query = query.where(
-                self.model.profile_id == profile_id,  # type: ignore
-            )
-
-        if species:
-            query = query.filter(self.model.species.in_(species))  # type: ignore
-
-        if state:
-            query = query.where(self.model.state == state)  # type: ignore
-
-        result = await session.execute(query)
-        return result.scalar()  # type: ignore
-
-    async def get_animals_by_organizational_profile(
+    async def get_animals_by_organizational_profile_page(
         self,
         session: Session,
         organization_id: str,
         species: Sequence[AnimalSpecies] | None = None,
         limit: int | None = None,
         offset: int | None = 0,
-    ) -> Sequence[AdoptionAnimal]:
+        cursor: Cursor | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> Page[AdoptionAnimal]:
+        return await fetch_page(
+            session=session,
+            query=self.__animals_by_organization_query(
+                organization_id=organization_id, species=species
+            ),
+            sort_column=self.model.animal_name,
+            id_column=self.model.entity_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count_mode=count_mode,
+        )
+
+    def __animals_query(
+        self,
+        species: Sequence[AnimalSpecies] | None,
+        profile_id: str | None,
+        state: AdoptionAnimalStates | None,
+    ) -> Select:
         query = (
             select(self.model)
             .where(self.model.animal_type == AnimalTypes.ANIMAL_FOR_ADOPTION)  # type: ignore
             .where(self.model.deleted == False)  # type: ignore
-            .order_by(self.model.animal_name)  # type: ignore
         )
 
-        query = query.where(
-            self.model.organization_id == organization_id,  # type: ignore
-        )
+        if profile_id:
+            query = query.where(
+                self.model.profile_id == profile_id,  # type: ignore
+            )
 
         if species:
             query = query.filter(self.model.species.in_(species))  # type: ignore
 
-        if limit:
-            query = query.limit(limit)
-
-        if offset:
-            query = query.offset(offset)
+        if state:
+            query = query.where(self.model.state == state)  # type: ignore
 
-        result = await session.execute(query)
-        return result.scalars().all()
+        return query
 
-    async def count_animals_by_organizational_profile(
-        self,
-        session: Session,
-        organization_id: str,
-        species: Sequence[AnimalSpecies] | None = None,
-    ) -> int:
+    def __animals_by_organization_query(
+        self, organization_id: str, species: Sequence[AnimalSpecies] | None
+    ) -> Select:
         query = (
-            func.count()
-            .select()
-            .select_from(self.model)
+            select(self.model)
             .where(self.model.animal_type == AnimalTypes.ANIMAL_FOR_ADOPTION)  # type: ignore
             .where(self.model.deleted == False)  # type: ignore
         )
@@ -163,5 +178,4 @@ class AlchemyAdoptionAnimalsRepository(AdoptionAnimalsRepository):
         if species:
             query = query.filter(self.model.species.in_(species))  # type: ignore
 
-        result = await session.execute(query)
-        return result.scalar()  # type: ignore
+        return query
@@ -4,6 +4,7 @@ from typing import Sequence
 from bounded_contexts.adoptions_domain.entities import AdoptionAnimal
 from bounded_contexts.adoptions_domain.enum import AdoptionAnimalStates
 from bounded_contexts.social_domain.entities import AnimalSpecies
+from common.pagination import Cursor, CountMode, Page
 from infrastructure.uow_abstraction.unit_of_work_module import Session
 
 
@@ -20,6 +21,12 @@ class AdoptionAnimalsRepository(ABC):
     ) -> AdoptionAnimal | None:
         pass
 
+    @abstractmethod
+    async def get_multiple_animals_by_id(
+        self, session: Session, animal_ids: list[str], get_all: bool
+    ) -> Sequence[AdoptionAnimal]:
+        pass
+
     @abstractmethod
     async def get_animals(
         self,
@@ -29,35 +36,33 @@ class AdoptionAnimalsRepository(ABC):
         offset: int | None = 0,
         profile_id: str | None = None,
         state: AdoptionAnimalStates | None = None,
+        cursor: Cursor | None = None,
     ) -> Sequence[AdoptionAnimal]:
         pass
 
     @abstractmethod
-    async def count_animals(
+    async def get_animals_page(
         self,
         session: Session,
         species: Sequence[AnimalSpecies] | None = None,
+        limit: int | None = None,
+        offset: int | None = 0,
         profile_id: str | None = None,
         state: AdoptionAnimalStates | None = None,
-    ) -> int:
+        cursor: Cursor | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> Page[AdoptionAnimal]:
         pass
 
     @abstractmethod
-    async def get_animals_by_organizational_profile(
+    async def get_animals_by_organizational_profile_page(
         self,
         session: Session,
         organization_id: str,
         species: Sequence[AnimalSpecies] | None = None,
         limit: int | None = None,
         offset: int | None = 0,
-    ) -> Sequence[AdoptionAnimal]:
-        pass
-
-    @abstractmethod
-    async def count_animals_by_organizational_profile(
-        self,
-        session: Session,
-        organization_id: str,
-        species: Sequence[AnimalSpecies] | None = None,
-    ) -> int:
+        cursor: Cursor | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> Page[AdoptionAnimal]:
         pass
@@ -40,6 +40,7 @@ from bounded_contexts.social_domain.entities import (
     OrganizationalProfile,
 )
 from bounded_contexts.social_domain.enum import ProfileTypes
+from common.pagination import Page
 from infrastructure.date_utils import float_timestamp, datetime_now_tz
 from infrastructure.uow_abstraction import UnitOfWork
 
@@ -165,13 +166,29 @@ class AdoptionApplicationService:
         uow: UnitOfWork,
         profile: BaseProfile,
         filter_by_sent_applications: bool,
+    ) -> Sequence[AdoptionApplication]:
+        page: Page[AdoptionApplication] = await self.get_applications_page(
+            uow=uow,
+            profile=profile,
+            filter_by_sent_applications=filter_by_sent_applications,
+        )
+
+        return page.items
+
+    # TODO: check these nested ifs
+
+    async def get_applications_page(
+        self,
+        uow: UnitOfWork,
+        profile: BaseProfile,
+        filter_by_sent_applications: bool,
         limit: int | None = None,
         offset: int | None = 0,
-    ) -> Sequence[AdoptionApplication]:
+    ) -> Page[AdoptionApplication]:
         if filter_by_sent_applications:
             if profile.profile_type == ProfileTypes.ORGANIZATIONAL_PROFILE:
-                return []
-            return await self.applications_repository.get_sent_applications(
+                return Page(items=[], total_count=0)
+            return await self.applications_repository.get_sent_applications_page(
                 session=uow.session,
                 profile_id=profile.entity_id,
                 limit=limit,
@@ -179,7 +196,7 @@ class AdoptionApplicationService:
             )
         else:
             if profile.profile_type == ProfileTypes.PERSONAL_PROFILE:
-                return await self.applications_repository.get_received_applications_by_personal_profile(
+                return await self.applications_repository.get_received_applications_by_personal_profile_page(
                     session=uow.session,
                     profile_id=profile.entity_id,
                     limit=limit,
@@ -187,39 +204,13 @@ class AdoptionApplicationService:
                 )
             else:
                 organizational_profile = cast(OrganizationalProfile, profile)
-                return await self.applications_repository.get_received_applications_by_organizational_profile(
+                return await self.applications_repository.get_received_applications_by_organizational_profile_page(
                     session=uow.session,
                     organization_id=organizational_profile.organization_id,
                     limit=limit,
                     offset=offset,
                 )
 
-    # TODO: check these nested ifs
-
-    async def get_all_applications_count(
-        self,
-        uow: UnitOfWork,
-        profile: BaseProfile,
-        filter_by_sent_applications: bool,
-    ) -> int:
-        if filter_by_sent_applications:
-            if profile.profile_type == ProfileTypes.ORGANIZATIONAL_PROFILE:
-                return 0
-            return await self.applications_repository.count_sent_applications(
-                session=uow.session, profile_id=profile.entity_id
-            )
-        else:
-            if profile.profile_type == ProfileTypes.PERSONAL_PROFILE:
-                return await self.applications_repository.count_received_applications_by_personal_profile(
-                    session=uow.session, profile_id=profile.entity_id
-                )
-            else:
-                organizational_profile = cast(OrganizationalProfile, profile)
-                return await self.applications_repository.count_received_applications_by_organizational_profile(
-                    session=uow.session,
-                    organization_id=organizational_profile.organization_id,
-                )
-
     async def edit_application(
         self,
         uow: UnitOfWork,
@@ -24,6 +24,8 @@ from bounded_contexts.social_domain.entities import (
     OrganizationalProfile,
 )
 from bounded_contexts.social_domain.enum import ProfileTypes
+from bounded_contexts.social_domain.value_objects import ProfileSnapshot
+from common.pagination import Cursor, Page
 from infrastructure.date_utils import date_now, float_timestamp
 from infrastructure.uow_abstraction import UnitOfWork
 
@@ -130,69 +132,66 @@ class AdoptionAnimalsService:
     async def get_adoption_animal_by_id(
         self, uow: UnitOfWork, entity_id: str, get_all: bool = False
     ) -> AdoptionAnimal:
-        adoption_animal: AdoptionAnimal | None = (
-            await self.animals_repository.get_animal_by_id(
-                session=uow.session, entity_id=entity_id, get_all=get_all
-            )
+        adoption_animal: AdoptionAnimal | None = uow.entity_cache.get(
+            AdoptionAnimal, entity_id
+        )
+
+        # A deleted animal is only served from the cache to get_all lookups
+        if adoption_animal is not None and (get_all or not adoption_animal.deleted):
+            return adoption_animal
+
+        adoption_animal = await self.animals_repository.get_animal_by_id(
+            session=uow.session, entity_id=entity_id, get_all=get_all
         )
 
         if not adoption_animal:
             raise AnimalNotFoundByIdException(entity_id=entity_id)
 
+        uow.entity_cache.add(AdoptionAnimal, adoption_animal)
+
         return adoption_animal
 
-    async def get_all_adoption_animals(
+    async def get_multiple_adoption_animals_by_id(
+        self, uow: UnitOfWork, animal_ids: list[str], get_all: bool = False
+    ) -> Sequence[AdoptionAnimal]:
+        adoption_animals: Sequence[
+            AdoptionAnimal
+        ] = await self.animals_repository.get_multiple_animals_by_id(
+            session=uow.session, animal_ids=animal_ids, get_all=get_all
+        )
+
+        uow.entity_cache.add_many(AdoptionAnimal, adoption_animals)
+
+        return adoption_animals
+
+    async def get_adoption_animals_page(
         self,
         uow: UnitOfWork,
         species: list[AnimalSpecies] | None = None,
         limit: int | None = None,
         offset: int | None = 0,
-        profile: BaseProfile | None = None,
+        profile: ProfileSnapshot | None = None,
         state: AdoptionAnimalStates | None = None,
-    ) -> Sequence[AdoptionAnimal]:
-        if profile and profile.profile_type == ProfileTypes.ORGANIZATIONAL_PROFILE:
-            organization_id = cast(OrganizationalProfile, profile).organization_id
-
-            return await self.animals_repository.get_animals_by_organizational_profile(
+        cursor: Cursor | None = None,
+    ) -> Page[AdoptionAnimal]:
+        if profile and profile.organization_id:
+            return await self.animals_repository.get_animals_by_organizational_profile_page(
                 session=uow.session,
                 limit=limit,
                 offset=offset,
-                organization_id=organization_id,
+                organization_id=profile.organization_id,
                 species=species,
+                cursor=cursor,
             )
 
-        return await self.animals_repository.get_animals(
+        return await self.animals_repository.get_animals_page(
             session=uow.session,
             limit=limit,
             offset=offset,
             species=species,
             state=state,
             profile_id=profile.entity_id if profile else None,
-        )
-
-    async def get_all_adoption_animals_count(
-        self,
-        uow: UnitOfWork,
-        species: list[AnimalSpecies] | None = None,
-        profile: BaseProfile | None = None,
-        state: AdoptionAnimalStates | None = None,
-    ) -> int:
-        if profile and profile.profile_type == ProfileTypes.ORGANIZATIONAL_PROFILE:
-            organization_id = cast(OrganizationalProfile, profile).organization_id
-
-            return (
-                await self.animals_repository.count_animals_by_organizational_profile(
-                    session=uow.session,
-                    organization_id=organization_id,
-                    species=species,
-                )
-            )
-
-        return await self.animals_repository.count_animals(
-            session=uow.session,
-            species=species,
-            profile_id=profile.entity_id if profile else None,
-            state=state,
+            cursor=cursor,
         )
 
     async def edit_adoption_animal(
@@ -236,6 +235,8 @@ class AdoptionAnimalsService:
         self.__assert_profile_is_owner(profile=actor_profile, animal=adoption_animal)
 
         adoption_animal.deleted = True
+        uow.entity_cache.evict(AdoptionAnimal, adoption_animal.entity_id)
+
         self.__issue_adoption_animal_deleted_event(
             uow=uow, account=actor_profile.account, adoption_animal=adoption_animal
         )
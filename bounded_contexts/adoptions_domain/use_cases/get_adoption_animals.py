@@ -13,7 +13,6 @@ from bounded_contexts.adoptions_domain.views.adoption_animal_views import (
 )
 from bounded_contexts.social_domain.entities import (
     AnimalSpecies,
-    BaseProfile,
     OrganizationalProfile,
     Organization,
 )
@@ -22,6 +21,8 @@ from bounded_contexts.social_domain.services.organization_service import (
     OrganizationService,
 )
 from bounded_contexts.social_domain.services.profile_service import ProfileService
+from bounded_contexts.social_domain.value_objects import ProfileSnapshot
+from common.pagination import Page, decode_optional_cursor, get_next_cursor
 from infrastructure.database import RepositoryUtils
 from infrastructure.uow_abstraction import UnitOfWork, unit_of_work
 
@@ -34,6 +35,7 @@ class GetAdoptionAnimalsUseCase(BaseAdoptionsUseCase):
         offset: int | None
         account_id: str | None = None
         state: AdoptionAnimalStates | None = None
+        cursor: str | None = None
 
     def __init__(
         self,
@@ -55,36 +57,40 @@ class GetAdoptionAnimalsUseCase(BaseAdoptionsUseCase):
     async def execute(
         self, request: Request, uow: UnitOfWork
     ) -> AdoptionAnimalListView:
-        actor_profile: BaseProfile | None = None
+        actor_profile: ProfileSnapshot | None = None
 
         if request.account_id:
-            actor_profile = await self.profile_service.get_profile_by_account_id(
-                uow=uow, account_id=request.account_id
+            actor_profile = (
+                await self.profile_service.get_profile_snapshot_by_account_id(
+                    uow=uow, account_id=request.account_id
+                )
             )
 
-        animals = await self.adoption_animal_service.get_all_adoption_animals(
+        page: Page[
+            AdoptionAnimal
+        ] = await self.adoption_animal_service.get_adoption_animals_page(
             uow=uow,
             species=request.species,
             limit=request.limit,
             offset=request.offset,
             profile=actor_profile,
             state=request.state,
+            cursor=decode_optional_cursor(request.cursor),
         )
-
-        total_count = await self.adoption_animal_service.get_all_adoption_animals_count(
-            uow=uow,
-            species=request.species,
-            profile=actor_profile,
-            state=request.state,
-        )
+        animals = page.items
 
         return self.adoption_animal_view_factory.create_adoption_animal_list_view(
             animals=animals,
-            total_count=total_count,
+            total_count=page.total_count,
             publicator_names=await self.get_publicator_names(
                 uow=uow,
                 animals=animals,
             ),
+            next_cursor=get_next_cursor(
+                items=animals,
+                limit=request.limit,
+                sort_key=lambda animal: animal.animal_name,
+            ),
         )
 
     async def get_publicator_names(
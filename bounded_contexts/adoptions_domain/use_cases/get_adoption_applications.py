@@ -1,7 +1,10 @@
 from dataclasses import dataclass
-from typing import Sequence, Dict, cast
+from typing import Sequence, Dict, Iterable, cast
 
-from bounded_contexts.adoptions_domain.entities import AdoptionApplication
+from bounded_contexts.adoptions_domain.entities import (
+    AdoptionAnimal,
+    AdoptionApplication,
+)
 from bounded_contexts.adoptions_domain.services import AdoptionAnimalsService
 from bounded_contexts.adoptions_domain.services.adoption_applications_service import (
     AdoptionApplicationService,
@@ -15,7 +18,11 @@ from bounded_contexts.adoptions_domain.views.adoption_application_views import (
     AdoptionApplicationListView,
     AdoptionApplicationExtraInfoView,
 )
-from bounded_contexts.social_domain.entities import BaseProfile, OrganizationalProfile
+from bounded_contexts.social_domain.entities import (
+    BaseProfile,
+    OrganizationalProfile,
+    Organization,
+)
 from bounded_contexts.social_domain.enum import ProfileTypes
 from bounded_contexts.social_domain.services.organization_service import (
     OrganizationService,
@@ -23,6 +30,7 @@ from bounded_contexts.social_domain.services.organization_service import (
 from bounded_contexts.social_domain.services.profile_service import ProfileService
 from bounded_contexts.social_domain.views import ProfileViewFactory
 from bounded_contexts.social_domain.views.profile_views import BaseProfileView
+from common.pagination import Page
 from common.use_case import BaseUseCase
 from infrastructure.database import RepositoryUtils
 from infrastructure.uow_abstraction import UnitOfWork, unit_of_work
@@ -69,23 +77,17 @@ class GetAdoptionApplicationsUseCase(BaseUseCase):
             )
         )
 
-        applications: Sequence[
+        page: Page[
             AdoptionApplication
-        ] = await self.adoption_application_service.get_all_applications(
+        ] = await self.adoption_application_service.get_applications_page(
             uow=uow,
             profile=actor_profile,
             filter_by_sent_applications=request.filter_by_sent_applications,
             limit=request.limit,
             offset=request.offset,
         )
-
-        total_count: int = (
-            await self.adoption_application_service.get_all_applications_count(
-                uow=uow,
-                profile=actor_profile,
-                filter_by_sent_applications=request.filter_by_sent_applications,
-            )
-        )
+        applications = page.items
+        total_count = page.total_count
 
         if request.filter_by_sent_applications:
             return self.adoption_application_view_factory.create_adoption_application_list_view(
@@ -111,22 +113,29 @@ class GetAdoptionApplicationsUseCase(BaseUseCase):
         applications: Sequence[AdoptionApplication],
         publicator_name: str,
     ) -> Dict[AdoptionApplication, AdoptionApplicationExtraInfoView]:
+        adoption_animals: dict[str, AdoptionAnimal] = await self.get_adoption_animals(
+            uow=uow, applications=applications
+        )
+
+        adoption_giver_profiles: dict[str, BaseProfile] = await self.get_profiles(
+            uow=uow,
+            profile_ids=[animal.profile_id for animal in adoption_animals.values()],
+        )
+
+        organization_names: dict[str, str] = await self.get_organization_names(
+            uow=uow, profiles=adoption_giver_profiles.values()
+        )
+
         adoption_application_dict = {}
         for application in applications:
-            adoption_animal = (
-                await self.adoption_animals_service.get_adoption_animal_by_id(
-                    uow=uow, entity_id=application.animal_id, get_all=True
-                )
-            )
+            adoption_animal = adoption_animals[application.animal_id]
             animal_view: AdoptionAnimalView = (
                 self.animal_view_factory.create_adoption_animal_view(
                     adoption_animal=adoption_animal, publicator_name=publicator_name
                 )
             )
 
-            adoption_giver_profile = await self.profile_service.get_profile(
-                uow=uow, entity_id=adoption_animal.profile_id
-            )
+            adoption_giver_profile = adoption_giver_profiles[adoption_animal.profile_id]
             profile_view: BaseProfileView = (
                 self.profile_view_factory.create_profile_view(adoption_giver_profile)
             )
@@ -135,11 +144,10 @@ class GetAdoptionApplicationsUseCase(BaseUseCase):
                 organizational_profile: OrganizationalProfile = cast(
                     OrganizationalProfile, adoption_giver_profile
                 )
-                organization = await self.organization_service.get_organization_by_id(
-                    uow=uow, entity_id=organizational_profile.organization_id
-                )
 
-                profile_view.first_name = organization.organization_name
+                profile_view.first_name = organization_names[
+                    organizational_profile.organization_id
+                ]
                 profile_view.surname = ""
 
             extra_info = AdoptionApplicationExtraInfoView(
@@ -152,20 +160,25 @@ class GetAdoptionApplicationsUseCase(BaseUseCase):
     async def get_extra_info_for_received_applications(
         self, uow: UnitOfWork, applications: Sequence[AdoptionApplication]
     ) -> Dict[AdoptionApplication, AdoptionApplicationExtraInfoView]:
+        adopter_profiles: dict[str, BaseProfile] = await self.get_profiles(
+            uow=uow,
+            profile_ids=[
+                application.adopter_profile_id for application in applications
+            ],
+        )
+
+        adoption_animals: dict[str, AdoptionAnimal] = await self.get_adoption_animals(
+            uow=uow, applications=applications
+        )
+
         adoption_application_dict = {}
         for application in applications:
-            adopter_profile = await self.profile_service.get_profile(
-                uow=uow, entity_id=application.adopter_profile_id
-            )
+            adopter_profile = adopter_profiles[application.adopter_profile_id]
             profile_view: BaseProfileView = (
                 self.profile_view_factory.create_profile_view(adopter_profile)
             )
 
-            adoption_animal = (
-                await self.adoption_animals_service.get_adoption_animal_by_id(
-                    uow=uow, entity_id=application.animal_id, get_all=True
-                )
-            )
+            adoption_animal = adoption_animals[application.animal_id]
             animal_view: AdoptionAnimalView = (
                 self.animal_view_factory.create_adoption_animal_view(
                     adoption_animal=adoption_animal,
@@ -179,3 +192,48 @@ class GetAdoptionApplicationsUseCase(BaseUseCase):
 
             adoption_application_dict[application] = extra_info
         return adoption_application_dict
+
+    async def get_adoption_animals(
+        self, uow: UnitOfWork, applications: Sequence[AdoptionApplication]
+    ) -> dict[str, AdoptionAnimal]:
+        # One query for the whole page instead of one per application
+        adoption_animals: Sequence[
+            AdoptionAnimal
+        ] = await self.adoption_animals_service.get_multiple_adoption_animals_by_id(
+            uow=uow,
+            animal_ids=list({application.animal_id for application in applications}),
+            get_all=True,
+        )
+
+        return {animal.entity_id: animal for animal in adoption_animals}
+
+    async def get_profiles(
+        self, uow: UnitOfWork, profile_ids: list[str]
+    ) -> dict[str, BaseProfile]:
+        profiles: Sequence[
+            BaseProfile
+        ] = await self.profile_service.get_multiple_profiles_by_id(
+            uow=uow, profile_ids=list(set(profile_ids))
+        )
+
+        return {profile.entity_id: profile for profile in profiles}
+
+    async def get_organization_names(
+        self, uow: UnitOfWork, profiles: Iterable[BaseProfile]
+    ) -> dict[str, str]:
+        organization_ids: set[str] = {
+            cast(OrganizationalProfile, profile).organization_id
+            for profile in profiles
+            if profile.profile_type == ProfileTypes.ORGANIZATIONAL_PROFILE
+        }
+
+        organizations: Sequence[
+            Organization
+        ] = await self.organization_service.get_multiple_organizations_by_id(
+            uow=uow, organization_ids=list(organization_ids)
+        )
+
+        return {
+            organization.entity_id: organization.organization_name
+            for organization in organizations
+        }
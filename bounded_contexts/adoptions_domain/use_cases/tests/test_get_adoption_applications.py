@@ -15,7 +15,7 @@ from bounded_contexts.social_domain.entities.animal import (
     AnimalGender,
     AnimalSize,
 )
-from common.testing import BaseUseCaseTest
+from common.testing import BaseUseCaseTest, QueryCounter
 from common.testing.base_testing_utils import (
     BaseTestingUtils,
     AdoptionApplicationDataForTesting,
@@ -488,3 +488,59 @@ class TestGetAdoptionApplicationsUseCase(BaseUseCaseTest, BaseTestingUtils):
                     list_view.items[i].animal_nice_to_others,
                 ),
             )
+
+    async def test_get_all_sent_adoption_applications_query_count_does_not_grow_with_page_size(
+        self,
+    ) -> None:
+        with QueryCounter(engine=self.repository_utils.engine) as single_item_page:
+            await self.use_case.execute(
+                GetAdoptionApplicationsUseCase.Request(
+                    account_id=self.adopter_profile.account_id,
+                    filter_by_sent_applications=True,
+                    limit=1,
+                    offset=self.TEST_OFFSET_ZERO,
+                )
+            )
+
+        with QueryCounter(engine=self.repository_utils.engine) as full_page:
+            list_view: AdoptionApplicationListView = await self.use_case.execute(
+                GetAdoptionApplicationsUseCase.Request(
+                    account_id=self.adopter_profile.account_id,
+                    filter_by_sent_applications=True,
+                    limit=self.TEST_NO_LIMIT,
+                    offset=self.TEST_OFFSET_ZERO,
+                )
+            )
+
+        self.assertEqual(
+            len(self.applications_sent_by_adopter_profile), len(list_view.items)
+        )
+        self.assertEqual(single_item_page.count, full_page.count)
+
+    async def test_get_all_received_adoption_applications_query_count_does_not_grow_with_page_size(
+        self,
+    ) -> None:
+        with QueryCounter(engine=self.repository_utils.engine) as single_item_page:
+            await self.use_case.execute(
+                GetAdoptionApplicationsUseCase.Request(
+                    account_id=self.collaborator_profile.profile_data.account_id,
+                    filter_by_sent_applications=False,
+                    limit=1,
+                    offset=self.TEST_OFFSET_ZERO,
+                )
+            )
+
+        with QueryCounter(engine=self.repository_utils.engine) as full_page:
+            list_view: AdoptionApplicationListView = await self.use_case.execute(
+                GetAdoptionApplicationsUseCase.Request(
+                    account_id=self.collaborator_profile.profile_data.account_id,
+                    filter_by_sent_applications=False,
+                    limit=self.TEST_NO_LIMIT,
+                    offset=self.TEST_OFFSET_ZERO,
+                )
+            )
+
+        self.assertEqual(
+            len(self.applications_received_by_organization), len(list_view.items)
+        )
+        self.assertEqual(single_item_page.count, full_page.count)
@@ -35,6 +35,7 @@ class AdoptionAnimalView(BaseModel):
 class AdoptionAnimalListView(BaseModel):
     items: Sequence[AdoptionAnimalView]
     total_count: int
+    next_cursor: str | None = None
 
 
 class AdoptionAnimalViewFactory:
@@ -69,6 +70,7 @@ class AdoptionAnimalViewFactory:
         animals: Sequence[AdoptionAnimal],
         total_count: int,
         publicator_names: dict[str, str],
+        next_cursor: str | None = None,
     ) -> AdoptionAnimalListView:
         adoption_animals_list_view: list[AdoptionAnimalView] = []
 
@@ -81,5 +83,7 @@ class AdoptionAnimalViewFactory:
             )
 
         return AdoptionAnimalListView(
-            items=adoption_animals_list_view, total_count=total_count
+            items=adoption_animals_list_view,
+            total_count=total_count,
+            next_cursor=next_cursor,
         )
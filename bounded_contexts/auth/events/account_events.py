@@ -9,6 +9,9 @@ class BaseAccountEvent(Event):
         )
         self.email = email
 
+    def aggregate_id(self) -> str | None:
+        return self.actor_account_id
+
 
 class PasswordResetRequestEvent(BaseAccountEvent):
     pass
@@ -31,3 +34,6 @@ class AccountVerifiedEvent(Event):
         )
 
         self.email = email
+
+    def aggregate_id(self) -> str | None:
+        return self.actor_account_id
@@ -101,13 +101,20 @@ class AccountsService:
 
         await self.accounts_repository.flush(session=uow.session)
 
-    async def get_login_token(self, account: Account, password: str) -> str:
+    async def get_login_token(
+        self, uow: UnitOfWork, account: Account, password: str
+    ) -> str:
         if not await self.hash_utils.verify_hash(password, account.password):
             raise IncorrectLoginDataException(email=account.email)
 
         if not account.verified:
             raise AccountNotVerifiedException(account_id=account.entity_id)
 
+        # The password is only known here, so older hashes are upgraded on login
+        if await self.hash_utils.needs_rehash(account.password):
+            account.password = await self.hash_utils.hash_string(password)
+            await self.accounts_repository.flush(session=uow.session)
+
         return await self.generate_login_token(
             account_id=account.entity_id,
         )
@@ -144,6 +151,12 @@ class AccountsService:
 
         await self.accounts_repository.flush(session=uow.session)
 
+        # The reset token is single use, and sessions opened with the old password end
+        await self.token_utils.revoke_token(token=reset_password_token)
+        await self.token_utils.revoke_tokens_of(
+            TokenData(account_id=account.entity_id, token_type=TokenTypes.ACCESS_TOKEN)
+        )
+
     async def generate_login_token(self, account_id: str) -> str:
         return await self.token_utils.generate_token(
             TokenData(
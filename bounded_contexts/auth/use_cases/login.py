@@ -23,6 +23,7 @@ class LoginUseCase(BaseAuthUseCase):
         )
 
         access_token: str = await self.accounts_service.get_login_token(
+            uow=uow,
             account=account,
             password=request.password,
         )
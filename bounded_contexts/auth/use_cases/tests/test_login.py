@@ -1,3 +1,5 @@
+from unittest.mock import AsyncMock, patch
+
 from bounded_contexts.auth.exceptions import (
     IncorrectLoginDataException,
     AccountNotFoundByEmailException,
@@ -10,8 +12,9 @@ from bounded_contexts.auth.use_cases.tests.base_auth_testing_utils import (
 )
 from bounded_contexts.auth.value_objects import TokenData
 from bounded_contexts.auth.views import TokenView
+from common import password_hashing
 from common.testing import BaseUseCaseTest
-from infrastructure.crypto import TokenUtils
+from infrastructure.crypto import HashUtils, TokenUtils
 from infrastructure.uow_abstraction import unit_of_work, UnitOfWork, make_unit_of_work
 
 
@@ -31,6 +34,7 @@ class TestLoginUseCase(BaseUseCaseTest, BaseAuthTestingUtils):
         await BaseUseCaseTest.setUp(self)
 
         self.use_case: LoginUseCase = self.dependencies.resolve(LoginUseCase)
+        self.hash_utils: HashUtils = self.dependencies.resolve(HashUtils)
         self.token_utils: TokenUtils[TokenData] = self.dependencies.resolve(
             TokenUtils[TokenData]
         )
@@ -87,3 +91,46 @@ class TestLoginUseCase(BaseUseCaseTest, BaseAuthTestingUtils):
                     password=self.TEST_PASSWORD,
                 )
             )
+
+    async def test_login_rehashes_weaker_password_hash(self) -> None:
+        old_rounds: int = password_hashing.hash_rounds(self.user.password)
+        new_rounds: int = old_rounds + 1
+
+        # The cost factor was raised after the account was created
+        with patch.object(
+            self.hash_utils, "rounds", new=AsyncMock(return_value=new_rounds)
+        ):
+            await self.use_case.execute(
+                LoginUseCase.Request(
+                    email=self.TEST_EMAIL,
+                    password=self.TEST_PASSWORD,
+                )
+            )
+
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            account: AccountData = await self.get_account_by_id(
+                uow=uow, account_id=self.user.account_id
+            )
+
+        self.assertNotEqual(account.password, self.user.password)
+        self.assertEqual(password_hashing.hash_rounds(account.password), new_rounds)
+        self.assertTrue(
+            await self.hash_utils.verify_hash(
+                hash_to_verify=account.password,
+                string_to_verify=self.TEST_PASSWORD,
+            )
+        )
+
+        # The new hash keeps working for the next login
+        view: TokenView = await self.use_case.execute(
+            LoginUseCase.Request(
+                email=self.TEST_EMAIL,
+                password=self.TEST_PASSWORD,
+            )
+        )
+
+        token_payload: TokenData = await self.token_utils.decode_token(
+            token=view.access_token,
+        )
+
+        self.assertEqual(token_payload.account_id, self.user.account_id)
@@ -95,3 +95,42 @@ class TestResetPassword(BaseUseCaseTest, BaseAuthTestingUtils):
                     new_password="test",
                 )
             )
+
+    async def test_reset_password_revokes_tokens(self) -> None:
+        login_token: str = await self.accounts_service.generate_login_token(
+            account_id=self.user.account_id,
+        )
+        reset_password_token: str = (
+            await self.accounts_service.generate_password_reset_token(
+                account_id=self.user.account_id,
+            )
+        )
+
+        await self.use_case.execute(
+            ResetPasswordUseCase.Request(
+                reset_password_token=reset_password_token,
+                new_password="new_password",
+            )
+        )
+
+        # Sessions opened before the reset end
+        with self.assertRaises(DecodeTokenException):
+            await self.token_utils.decode_token(token=login_token)
+
+        # The reset token can't be used twice
+        with self.assertRaises(DecodeTokenException):
+            await self.use_case.execute(
+                ResetPasswordUseCase.Request(
+                    reset_password_token=reset_password_token,
+                    new_password="other_password",
+                )
+            )
+
+        # New logins work
+        token_data: TokenData = await self.token_utils.decode_token(
+            token=await self.accounts_service.generate_login_token(
+                account_id=self.user.account_id,
+            )
+        )
+
+        self.assertEqual(token_data.account_id, self.user.account_id)
@@ -15,6 +15,10 @@ class TokenData:
             "token_type": token_data.token_type.value,
         }
 
+    @staticmethod
+    def subject(token_data: "TokenData") -> str:
+        return token_data.account_id
+
     @staticmethod
     def from_dict(token_data_dict: dict) -> "TokenData":
         account_id: str | None = token_data_dict.get("account_id", None)
@@ -33,6 +33,7 @@ from bounded_contexts.social_domain.services.profile_service import ProfileServi
 from common.dependencies import BaseContextDependencies
 from config import MercadoPagoConfig, ProjectConfig, UrlConfig
 from infrastructure.database import RepositoryUtils
+from infrastructure.payment_gateway import PaymentGateway
 
 
 class DonationsContextDependencies(BaseContextDependencies):
@@ -73,6 +74,7 @@ class DonationsContextDependencies(BaseContextDependencies):
             mp_transactions_repository=self.dependencies.resolve(
                 MpTransactionsRepository
             ),
+            payment_gateway=self.dependencies.resolve(PaymentGateway),
         )
 
         self.dependencies.register(MercadoPagoService, mercado_pago_service)
@@ -1 +1,2 @@
 from .donation_campaign_finished import DonationCampaignFinishedEvent
+from .donation_created import DonationCreatedEvent
@@ -14,3 +14,6 @@ class DonationCampaignFinishedEvent(Event):
         )
 
         self.donation_campaign_id = donation_campaign_id
+
+    def aggregate_id(self) -> str | None:
+        return self.donation_campaign_id
@@ -0,0 +1,21 @@
+from infrastructure.uow_abstraction import Event
+
+
+class DonationCreatedEvent(Event):
+    def __init__(
+        self,
+        actor_account_id: str,
+        issued: float,
+        donation_campaign_id: str,
+        individual_donation_id: str,
+    ) -> None:
+        super().__init__(
+            actor_account_id=actor_account_id,
+            issued=issued,
+        )
+
+        self.donation_campaign_id = donation_campaign_id
+        self.individual_donation_id = individual_donation_id
+
+    def aggregate_id(self) -> str | None:
+        return self.donation_campaign_id
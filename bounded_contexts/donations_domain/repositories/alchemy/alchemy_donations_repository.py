@@ -7,6 +7,7 @@ from bounded_contexts.donations_domain.entities import (
     IndividualDonation,
 )
 from bounded_contexts.donations_domain.repositories import DonationsRepository
+from common.pagination import Cursor, paginate_query
 from infrastructure.uow_abstraction.unit_of_work_module import Session
 
 
@@ -61,13 +62,10 @@ class AlchemyDonationsRepository(DonationsRepository):
         limit: int | None = None,
         offset: int | None = 0,
         organization_id: str | None = None,
+        cursor: Cursor | None = None,
     ) -> Sequence[DonationCampaign]:
-        query = (
-            select(self.donation_campaign_model)
-            .order_by("campaign_name")
-            .where(
-                self.donation_campaign_model.active == active,  # type: ignore
-            )
+        query = select(self.donation_campaign_model).where(
+            self.donation_campaign_model.active == active,  # type: ignore
         )
 
         if organization_id is not None:
@@ -75,11 +73,14 @@ class AlchemyDonationsRepository(DonationsRepository):
                 self.donation_campaign_model.organization_id == organization_id,  # type: ignore
             )
 
-        if limit:
-            query = query.limit(limit)
-
-        if offset:
-            query = query.offset(offset)
+        query = paginate_query(
+            query=query,
+            sort_column=self.donation_campaign_model.campaign_name,
+            id_column=self.donation_campaign_model.entity_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
 
         result = await session.execute(query)
         return result.scalars().all()
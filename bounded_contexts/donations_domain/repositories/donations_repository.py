@@ -5,6 +5,7 @@ from bounded_contexts.donations_domain.entities import (
     DonationCampaign,
     IndividualDonation,
 )
+from common.pagination import Cursor
 from infrastructure.uow_abstraction.unit_of_work_module import Session
 
 
@@ -49,6 +50,7 @@ class DonationsRepository(ABC):
         limit: int | None = None,
         offset: int | None = 0,
         organization_id: str | None = None,
+        cursor: Cursor | None = None,
     ) -> Sequence[DonationCampaign]:
         pass
 
@@ -5,6 +5,7 @@ from bounded_contexts.donations_domain.entities import (
     DonationCampaign,
     IndividualDonation,
 )
+from bounded_contexts.donations_domain.events import DonationCreatedEvent
 from bounded_contexts.donations_domain.exceptions import (
     CollaboratorUnauthorizedCampaignManagementException,
     CampaignAlreadyFinishedException,
@@ -25,6 +26,8 @@ from bounded_contexts.social_domain.entities import (
     BaseProfile,
 )
 from bounded_contexts.social_domain.enum import OrganizationRoles, ProfileTypes
+from common.pagination import Cursor
+from infrastructure.date_utils import float_timestamp
 from infrastructure.uow_abstraction import UnitOfWork
 
 
@@ -116,6 +119,15 @@ class DonationsService:
         if campaign_donations_amount + amount >= donation_campaign.money_goal:
             donation_campaign.active = False
 
+        uow.emit_event(
+            DonationCreatedEvent(
+                actor_account_id=actor_profile.account.entity_id,
+                issued=float_timestamp(),
+                donation_campaign_id=donation_campaign.entity_id,
+                individual_donation_id=individual_donation.entity_id,
+            )
+        )
+
         return individual_donation
 
     async def get_donation_campaign_amount(
@@ -154,6 +166,7 @@ class DonationsService:
         limit: int | None = None,
         offset: int | None = 0,
         organization_id: str | None = None,
+        cursor: Cursor | None = None,
     ) -> Sequence[DonationCampaign]:
         return await self.donations_repository.get_donation_campaigns(
             session=uow.session,
@@ -161,6 +174,7 @@ class DonationsService:
             limit=limit,
             offset=offset,
             organization_id=organization_id,
+            cursor=cursor,
         )
 
     async def get_all_donation_campaigns_count(
@@ -1,15 +1,13 @@
 import logging
-from uuid import uuid4
+from uuid import NAMESPACE_URL, uuid4, uuid5
 
 from dateutil import parser
-import requests
 from bounded_contexts.donations_domain.entities import (
     PayerInfo,
     MercadoPagoRequest,
     MercadoPagoResponse,
     MercadoPagoTransaction,
 )
-import mercadopago
 
 from bounded_contexts.donations_domain.enum import MercadoPagoResponseStatuses
 from bounded_contexts.donations_domain.exceptions import (
@@ -17,8 +15,7 @@ from bounded_contexts.donations_domain.exceptions import (
     MercadoPagoTransactionNotApprovedException,
 )
 from bounded_contexts.donations_domain.repositories import MpTransactionsRepository
-from common.background import run_async
-from infrastructure.payment_gateway import MerchantData
+from infrastructure.payment_gateway import MerchantData, PaymentGateway
 from infrastructure.uow_abstraction import UnitOfWork
 
 
@@ -32,6 +29,7 @@ class MercadoPagoService:
         client_secret: str,
         frontend_url: str,
         mp_transactions_repository: MpTransactionsRepository,
+        payment_gateway: PaymentGateway,
     ) -> None:
         self.__ACCESS_TOKEN: str = access_token
         self.__client_id: str = client_id
@@ -40,33 +38,21 @@ class MercadoPagoService:
         self.mp_transactions_repository: MpTransactionsRepository = (
             mp_transactions_repository
         )
+        self.payment_gateway = payment_gateway
 
     async def get_access_token_details(self, code: str) -> MerchantData:
-        def __sync_request() -> dict:
-            response = requests.request(
-                method="POST",
-                url="https://api.mercadopago.com/oauth/token",
-                headers={
-                    "Content-Type": "application/json",
-                },
-                data={
-                    "client_id": self.__client_id,
-                    "client_secret": self.__client_secret,
-                    "code": code,
-                    "grant_type": "authorization_code",
-                    "redirect_uri": f"https://petconnect.icu/profile-foundation/account-verification",
-                    "test_token": "true" if "TEST" in self.__ACCESS_TOKEN else "false",
-                },
-            )
-
-            response_json, status_code = response.json(), response.status_code
-            self.logger.info(
-                f"MP Merchant data status code: {status_code} response: {response_json}"
-            )
-
-            return response_json
+        data: dict = await self.payment_gateway.create_oauth_token(
+            {
+                "client_id": self.__client_id,
+                "client_secret": self.__client_secret,
+                "code": code,
+                "grant_type": "authorization_code",
+                "redirect_uri": f"https://petconnect.icu/profile-foundation/account-verification",
+                "test_token": "true" if "TEST" in self.__ACCESS_TOKEN else "false",
+            }
+        )
 
-        data = await run_async(__sync_request)
+        self.logger.info(f"MP Merchant data response: {data}")
 
         return MerchantData(
             access_token=data["access_token"],
@@ -81,8 +67,6 @@ class MercadoPagoService:
     async def pay_with_card(
         self, merchant_access_token: str, request: MercadoPagoRequest
     ) -> MercadoPagoResponse:
-        sdk = mercadopago.SDK(merchant_access_token)
-
         payment_data = {
             "transaction_amount": float(request.transaction_amount),
             "token": request.token,
@@ -101,7 +85,20 @@ class MercadoPagoService:
         if request.application_fee:
             payment_data["application_fee"] = request.application_fee
 
-        payment_response = (sdk.payment().create(payment_data))["response"]
+        # Card tokens are single use: the same token is the same payment, even
+        # when the donor sends it twice
+        payment_response: dict = await self.payment_gateway.create_payment(
+            access_token=merchant_access_token,
+            payment=payment_data,
+            idempotency_key=uuid5(NAMESPACE_URL, f"card_token:{request.token}").hex,
+        )
+
+        if "id" not in payment_response:
+            # Rejected by the API (invalid token, amount...), not by the card issuer
+            raise MercadoPagoTransactionNotApprovedException(
+                status=payment_response.get("error", "error"),
+                status_detail=payment_response.get("message", ""),
+            )
 
         mercadopago_fee, application_fee = 0, 0
         for fee in payment_response.get("fee_details", []):
@@ -139,14 +136,16 @@ class MercadoPagoService:
         quantity: int,
         purpose: str,
     ) -> str:
-        sdk = mercadopago.SDK(merchant_access_token)
-
         preference_data = {
             "items": [{"title": title, "unit_price": price, "quantity": quantity}],
             "purpose": purpose,
         }
 
-        preference_response = (sdk.preference().create(preference_data))["response"]
+        preference_response: dict = await self.payment_gateway.create_preference(
+            access_token=merchant_access_token,
+            preference=preference_data,
+            idempotency_key=uuid4().hex,
+        )
 
         if preference_response.get("error"):
             raise MercadoPagoPreferenceNotGeneratedException(
@@ -4,6 +4,7 @@ from typing import Sequence
 from bounded_contexts.donations_domain.entities import DonationCampaign
 from bounded_contexts.donations_domain.use_cases import BaseDonationCampaignUseCase
 from bounded_contexts.donations_domain.views import DonationCampaignView
+from common.pagination import decode_optional_cursor
 from infrastructure.uow_abstraction import unit_of_work, UnitOfWork
 
 
@@ -14,6 +15,7 @@ class GetDonationCampaignsUseCase(BaseDonationCampaignUseCase):
         limit: int | None = None
         offset: int | None = None
         organization_id: str | None = None
+        cursor: str | None = None
 
     @unit_of_work
     async def execute(
@@ -29,6 +31,7 @@ class GetDonationCampaignsUseCase(BaseDonationCampaignUseCase):
             limit=request.limit,
             offset=request.offset,
             organization_id=request.organization_id,
+            cursor=decode_optional_cursor(request.cursor),
         )
 
         donation_campaign_amounts: dict[
@@ -19,6 +19,7 @@ from bounded_contexts.donations_domain.use_cases.donate_to_campaign import (
 from bounded_contexts.donations_domain.views import IndividualDonationView
 from common.testing import BaseUseCaseTest
 from common.testing.base_testing_utils import BaseTestingUtils
+from infrastructure.payment_gateway.fake_mercado_pago import REJECTED_CARD_TOKEN
 from infrastructure.uow_abstraction import make_unit_of_work, unit_of_work, UnitOfWork
 from unittest.mock import patch, AsyncMock
 
@@ -304,3 +305,44 @@ class TestCreateDonationCampaign(BaseUseCaseTest, BaseTestingUtils):
         mock_method.assert_called_once_with(
             merchant_access_token="test_access_token", request=self.mp_request
         )
+
+    async def test_donate_through_the_payment_gateway(self) -> None:
+        # Not patched: the testing config serves the fake MercadoPago in process
+        view: IndividualDonationView = await self.use_case.execute(
+            DonateToCampaignUseCase.Request(
+                actor_account_id=self.personal_profile.account_id,
+                donation_campaign_id=self.donation_campaign.entity_id,
+                transaction_amount=self.REQUESTED_AMOUNT,
+                application_fee=self.APPLICATION_FEE,
+                token=self.TOKEN,
+                description=self.DESCRIPTION,
+                installments=self.INSTALLMENTS,
+                payment_method_id=self.PAYMENT_METHOD_ID,
+                payment_type_id=self.PAYMENT_TYPE_ID,
+                payer_email=self.PAYER_EMAIL,
+                payer_identification_type=self.PAYER_ID_TYPE,
+                payer_identification_number=self.PAYER_ID_NUMBER,
+                payer_name=self.PAYER_NAME,
+            )
+        )
+
+        assert view.amount == self.FINAL_AMOUNT
+
+        with self.assertRaises(MercadoPagoTransactionNotApprovedException):
+            await self.use_case.execute(
+                DonateToCampaignUseCase.Request(
+                    actor_account_id=self.personal_profile.account_id,
+                    donation_campaign_id=self.donation_campaign.entity_id,
+                    transaction_amount=self.REQUESTED_AMOUNT,
+                    application_fee=self.APPLICATION_FEE,
+                    token=REJECTED_CARD_TOKEN,
+                    description=self.DESCRIPTION,
+                    installments=self.INSTALLMENTS,
+                    payment_method_id=self.PAYMENT_METHOD_ID,
+                    payment_type_id=self.PAYMENT_TYPE_ID,
+                    payer_email=self.PAYER_EMAIL,
+                    payer_identification_type=self.PAYER_ID_TYPE,
+                    payer_identification_number=self.PAYER_ID_NUMBER,
+                    payer_name=self.PAYER_NAME,
+                )
+            )
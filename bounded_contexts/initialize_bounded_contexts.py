@@ -1,3 +1,7 @@
+import dataclasses
+
+import httpx
+
 from bounded_contexts.adoptions_domain.animal_context_dependencies import (
     AdoptionsContextDependencies,
 )
@@ -15,22 +19,46 @@ from bounded_contexts.social_domain.social_context_dependencies import (
     SocialContextDependencies,
 )
 from bounded_contexts.auth.value_objects import TokenData
+from common.background import configure_executors
 from common.dependencies import DependencyContainer
-from config import ProjectConfig, S3Config
-from infrastructure.crypto import HashUtils, TokenUtils
+from common.email_templates import configure_templates
+from common.ttl_cache import TTLCache
+from config import MercadoPagoConfig, ProjectConfig, S3Config
+from infrastructure.cache import InMemorySharedCache, SharedCache
+from infrastructure.crypto import HashUtils, TokenRevocationList, TokenUtils
 from infrastructure.database import RepositoryUtils
 from infrastructure.email import (
     BaseEmailGateway,
+    EmailQueue,
     TestEmailGateway,
     SendgridEmailGateway,
+    app_email_queue,
 )
 from infrastructure.file_system import (
     FileSystemGateway,
     Boto3S3FileSystemGateway,
     TestingFileSystemGateway,
 )
+from infrastructure.payment_gateway import (
+    HttpxPaymentGateway,
+    PaymentGateway,
+    create_fake_mercado_pago_app,
+)
+from infrastructure.qr.branded_qr_code import BRANDED_QR_STYLE, BrandedQRGenerator
 from infrastructure.qr.qr_code import QRCodeGenerator, PyQRGenerator
-from infrastructure.uow_abstraction import EventBus, app_event_bus
+from infrastructure.uow_abstraction import (
+    EventBus,
+    OutboxDispatcher,
+    app_event_bus,
+    app_outbox_dispatcher,
+)
+
+# Verified access tokens, each kept until it expires or for the TTL
+VERIFIED_TOKENS_CACHE_SIZE: int = 10_000
+VERIFIED_TOKENS_CACHE_TTL_SECONDS: int = 3600
+
+# Entries of the in-process stand-in for the shared cache
+IN_MEMORY_SHARED_CACHE_SIZE: int = 10_000
 
 
 def initialize_contexts(dependencies: DependencyContainer) -> None:
@@ -77,15 +105,29 @@ def __initialize_infrastructure(
         app_event_bus,
     )
 
-    dependencies.register(HashUtils, HashUtils())
-
     project_config: ProjectConfig = dependencies.resolve(ProjectConfig)
 
+    configure_executors(project_config.executors.workloads)
+
+    # Every email template module is imported by now
+    configure_templates(project_config.templates)
+
+    dependencies.register(HashUtils, HashUtils(config=project_config.crypto.hashing))
+
     token_utils: TokenUtils[TokenData] = TokenUtils(
         algorithm=project_config.crypto.algorithm,
         token_secret=project_config.crypto.token_secret,
         token_data_to_dict=TokenData.to_dict,
         dict_to_token_data=TokenData.from_dict,
+        token_subject=TokenData.subject,
+        token_lifetime=lambda token_data: project_config.crypto.token_expiration[
+            token_data.token_type.value
+        ],
+        verified_tokens=TTLCache(
+            max_size=VERIFIED_TOKENS_CACHE_SIZE,
+            ttl_seconds=VERIFIED_TOKENS_CACHE_TTL_SECONDS,
+        ),
+        revocation_list=TokenRevocationList(),
     )
 
     dependencies.register(
@@ -120,7 +162,36 @@ def __initialize_infrastructure(
             s3_file_system_gateway,
         )
 
-    qr_code_generator = PyQRGenerator()
+    if project_config.report_cache.shared_backend == "memory":
+        dependencies.register(
+            SharedCache, InMemorySharedCache(max_size=IN_MEMORY_SHARED_CACHE_SIZE)
+        )
+
+    mp_config: MercadoPagoConfig = project_config.mp_config
+
+    # The fake API is served in-process, through the same pooled client
+    payment_gateway: PaymentGateway = HttpxPaymentGateway(
+        config=mp_config,
+        transport=(
+            httpx.ASGITransport(app=create_fake_mercado_pago_app())  # type: ignore
+            if mp_config.fake
+            else None
+        ),
+    )
+
+    dependencies.register(PaymentGateway, payment_gateway)
+
+    qr_code_generator: QRCodeGenerator
+
+    if project_config.qr.branded:
+        qr_code_generator = BrandedQRGenerator(
+            config=project_config.qr,
+            style=dataclasses.replace(
+                BRANDED_QR_STYLE, image_format=project_config.qr.image_format
+            ),
+        )
+    else:
+        qr_code_generator = PyQRGenerator(config=project_config.qr)
 
     dependencies.register(
         QRCodeGenerator,
@@ -131,16 +202,20 @@ def __initialize_infrastructure(
         dependencies.register(
             BaseEmailGateway,
             SendgridEmailGateway(
+                email_queue=app_email_queue,
                 api_key=project_config.email.sendgrid_api_key,
                 from_email_address=project_config.email.sendgrid_from_email,
             ),
         )
     else:
-        dependencies.register(
-            BaseEmailGateway,
-            TestEmailGateway(),
+        test_email_gateway: TestEmailGateway = TestEmailGateway(
+            email_queue=app_email_queue
         )
 
+        # Also by its own type, for the tests reading the sent emails
+        dependencies.register(BaseEmailGateway, test_email_gateway)
+        dependencies.register(TestEmailGateway, test_email_gateway)
+
 
 def __initialize_repository_utils(
     dependencies: DependencyContainer,
@@ -152,3 +227,17 @@ def __initialize_repository_utils(
     )
 
     dependencies.register(RepositoryUtils, repository_utils)
+
+    app_outbox_dispatcher.configure(
+        sessionmaker=repository_utils.sessionmaker, config=project_config.outbox
+    )
+
+    dependencies.register(OutboxDispatcher, app_outbox_dispatcher)
+
+    app_email_queue.configure(
+        sessionmaker=repository_utils.sessionmaker,
+        config=project_config.email_queue,
+        send_batch=dependencies.resolve(BaseEmailGateway).send_batch,
+    )
+
+    dependencies.register(EmailQueue, app_email_queue)
@@ -1,15 +1,12 @@
 from enum import Enum
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader, Template
+from common.email_templates import FragmentTemplate, register_template_path
 
 BASE_DIR = Path(__file__).parent.parent.parent.parent
 
-COMMON_TEMPLATE_PATH = BASE_DIR / "common/templates/"
 PET_TEMPLATE_PATH = BASE_DIR / "bounded_contexts/pets_domain/email/templates/"
 
-template_env = Environment(
-    loader=FileSystemLoader([str(COMMON_TEMPLATE_PATH), str(PET_TEMPLATE_PATH)])
-)
+register_template_path(PET_TEMPLATE_PATH)
 
 
 # Steps to register new email:
@@ -26,15 +23,23 @@ class PetEmailSubjects(Enum):
 
 
 # 3- Create render method below
+
+# Sent for every digest of sightings, rendered from memoized fragments
+pet_sight_template: FragmentTemplate = FragmentTemplate(
+    name=PetEmailTemplates.PET_SIGHT_TEMPLATE.value,
+    variables=("profile_name", "sightings", "last_location_url", "lost_pets_url"),
+)
+
+
 def render_pet_sight_template(
     profile_name: str,
+    sightings: int,
+    last_location_url: str,
     lost_pets_url: str,
 ) -> str:
-    template: Template = template_env.get_template(
-        PetEmailTemplates.PET_SIGHT_TEMPLATE.value
-    )
-
-    return template.render(
+    return pet_sight_template.render(
         profile_name=profile_name,
+        sightings=sightings,
+        last_location_url=last_location_url,
         lost_pets_url=lost_pets_url,
     )
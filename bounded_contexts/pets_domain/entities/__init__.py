@@ -1,2 +1,5 @@
 from .pet import Pet
 from .pet_sight import PetSight
+from .pet_last_sight import PetLastSight
+from .pet_sight_digest import PetSightDigest
+from .qr_regeneration_checkpoint import QrRegenerationCheckpoint
@@ -0,0 +1,20 @@
+from datetime import datetime
+
+
+class PetLastSight:
+    """
+    Read model with the most recent sighting of each sighted pet and whether the pet
+    is currently lost. Rebuilt from pets_sight and animals, never edited by hand.
+    """
+
+    def __init__(
+        self,
+        pet_id: str,
+        sight_id: str,
+        created_at: datetime,
+        lost: bool,
+    ) -> None:
+        self.pet_id = pet_id
+        self.sight_id = sight_id
+        self.created_at = created_at
+        self.lost = lost
@@ -1,5 +1,6 @@
 from datetime import datetime
 from common.entities import BaseDomainEntity
+from common.geo import geohash_encode
 
 
 class PetSight(BaseDomainEntity):
@@ -18,6 +19,7 @@ class PetSight(BaseDomainEntity):
         self.pet_id = pet_id
         self.latitude = latitude
         self.longitude = longitude
+        self.geohash = geohash_encode(latitude=latitude, longitude=longitude)
         self.account_id = account_id
         self.created_at = created_at
 
@@ -0,0 +1,25 @@
+from datetime import datetime
+
+
+class PetSightDigest:
+    """
+    Sightings of a pet not yet emailed to its owner. Created by the first sighting
+    of a coalescing window and sent as one email once the window is over.
+    """
+
+    def __init__(
+        self,
+        pet_id: str,
+        sightings: int,
+        latitude: float | None,
+        longitude: float | None,
+        last_sight_at: datetime,
+        send_at: datetime,
+    ) -> None:
+        self.pet_id = pet_id
+        self.sightings = sightings
+        # Location of the latest sighting of the window
+        self.latitude = latitude
+        self.longitude = longitude
+        self.last_sight_at = last_sight_at
+        self.send_at = send_at
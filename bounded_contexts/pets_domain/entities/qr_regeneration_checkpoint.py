@@ -0,0 +1,56 @@
+from datetime import datetime
+from typing import Sequence
+
+
+class QrRegenerationCheckpoint:
+    """
+    Progress of the QR codes regeneration for one generation (QR style and urls).
+    Saved with every batch, so an interrupted regeneration resumes after the last
+    committed batch instead of starting over.
+    """
+
+    def __init__(self, generation: str) -> None:
+        self.generation = generation
+        # Pets are scanned by entity id, this is the last one of the last committed
+        # batch
+        self.last_pet_id: str | None = None
+        self.finished: bool = False
+        self.scanned: int = 0
+        self.rendered: int = 0
+        self.skipped: int = 0
+        # Pets whose new QR code could not be uploaded, retried at the end of the scan
+        self.failed_pet_ids: list[str] = []
+        self.updated_at: datetime | None = None
+
+    @property
+    def failed(self) -> int:
+        return len(self.failed_pet_ids)
+
+    def restart(self) -> None:
+        self.last_pet_id = None
+        self.finished = False
+        self.scanned = 0
+        self.rendered = 0
+        self.skipped = 0
+        self.failed_pet_ids = []
+
+    def record_batch(
+        self,
+        last_pet_id: str,
+        scanned: int,
+        rendered: int,
+        skipped: int,
+        failed_pet_ids: Sequence[str],
+    ) -> None:
+        self.last_pet_id = last_pet_id
+        self.scanned += scanned
+        self.rendered += rendered
+        self.skipped += skipped
+        # Assigned, not appended, so the change of the JSON column is tracked
+        self.failed_pet_ids = [*self.failed_pet_ids, *failed_pet_ids]
+
+    def finish(self, rendered: int, failed_pet_ids: Sequence[str]) -> None:
+        # After retrying the failed pets, the ones failing again stay recorded
+        self.rendered += rendered
+        self.failed_pet_ids = list(failed_pet_ids)
+        self.finished = True
@@ -1 +1,2 @@
 from .pet_events_handler import PetEventHandler
+from .pet_sight_digest_sender import PetSightDigestSender
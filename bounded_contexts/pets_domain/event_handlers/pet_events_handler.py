@@ -1,3 +1,6 @@
+import logging
+from typing import Sequence
+
 from bounded_contexts.adoptions_domain.entities import AdoptionAnimal
 from bounded_contexts.adoptions_domain.events.adoption_events_handler import (
     AnimalAdoptedEvent,
@@ -7,18 +10,30 @@ from bounded_contexts.pets_domain.email.pet_email_templates import (
     PetEmailSubjects,
     render_pet_sight_template,
 )
-from bounded_contexts.pets_domain.entities import Pet
-from bounded_contexts.pets_domain.events import PetLostEvent, PetSightingEvent
+from bounded_contexts.pets_domain.entities import Pet, PetSightDigest
+from bounded_contexts.pets_domain.events import (
+    PetLostEvent,
+    PetFoundEvent,
+    PetSightingEvent,
+)
+from bounded_contexts.pets_domain.events.pet_events import BasePetEvent
+from bounded_contexts.pets_domain.exceptions import PetNotFoundByIdException
 from bounded_contexts.pets_domain.services import PetService, PetSightService
+from bounded_contexts.pets_domain.value_objects import PetOwnerContact
 from bounded_contexts.social_domain.entities import BaseProfile
 from bounded_contexts.social_domain.services.profile_service import ProfileService
-from config import UrlConfig
+from common.ttl_cache import TTLCache
+from config import PetSightDigestConfig, UrlConfig
 from infrastructure.database import RepositoryUtils
 from infrastructure.email import BaseEmailGateway
-from infrastructure.uow_abstraction import EventBus, make_unit_of_work
+from infrastructure.uow_abstraction import EventBus, UnitOfWork, make_unit_of_work
 
 
 class PetEventHandler:
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    MAPS_SEARCH_URL: str = "https://www.google.com/maps/search/?api=1&query="
+
     def __init__(
         self,
         repository_utils: RepositoryUtils,
@@ -29,6 +44,8 @@ class PetEventHandler:
         event_bus: EventBus,
         email_gateway: BaseEmailGateway,
         url_config: UrlConfig,
+        pet_sight_digest_config: PetSightDigestConfig,
+        pet_owner_cache: TTLCache[str, PetOwnerContact],
     ) -> None:
         self.repository_utils = repository_utils
         self.pet_service = pet_service
@@ -37,11 +54,24 @@ class PetEventHandler:
         self.adoption_animal_service = adoption_animal_service
         self.email_gateway = email_gateway
         self.url_config = url_config
+        self.pet_sight_digest_config = pet_sight_digest_config
+        # Owner of each sighted pet, a lost pet is usually sighted many times
+        self.pet_owner_cache = pet_owner_cache
 
         event_bus.on(PetLostEvent, self.__register_first_sight)
         event_bus.on(PetSightingEvent, self.__handle_pet_sight_event)
         event_bus.on(AnimalAdoptedEvent, self.__create_pet_from_adopted_animal)
 
+        # Latest sighting per pet projection, read by the lost pets map
+        event_bus.on(PetSightingEvent, self.__refresh_last_sight)
+        event_bus.on(PetLostEvent, self.__refresh_last_sight)
+        event_bus.on(PetFoundEvent, self.__refresh_last_sight)
+
+        # Cached map clusters of lost pet sightings
+        event_bus.on(PetSightingEvent, self.__invalidate_sight_clusters)
+        event_bus.on(PetLostEvent, self.__invalidate_all_sight_clusters)
+        event_bus.on(PetFoundEvent, self.__invalidate_all_sight_clusters)
+
     async def __register_first_sight(self, e: PetLostEvent) -> None:
         async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
             pet: Pet = await self.pet_service.get_pet_by_id(uow=uow, entity_id=e.pet_id)
@@ -61,33 +91,116 @@ class PetEventHandler:
             )
 
     async def __handle_pet_sight_event(self, e: PetSightingEvent) -> None:
+        if e.first_sight:
+            return
+
+        # Sightings are coalesced per pet, the owner gets one email per window
         async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
-            pet: Pet = await self.pet_service.get_pet_by_id(uow=uow, entity_id=e.pet_id)
+            await self.pet_sight_service.add_to_sight_digest(
+                uow=uow,
+                pet_id=e.pet_id,
+                latitude=e.latitude,
+                longitude=e.longitude,
+                window_seconds=self.pet_sight_digest_config.window,
+            )
+
+        if self.pet_sight_digest_config.window <= 0:
+            await self.send_due_sight_digests()
+
+    async def send_due_sight_digests(self) -> int:
+        """
+        Emails the owners of the pets whose digest window is over, returns how many
+        digests were sent.
+        """
+
+        batch_size: int = self.pet_sight_digest_config.batch_size
+        sent: int = 0
+
+        while True:
+            # Claimed and queued in one transaction, a failure puts the batch back
+            # without queueing any of its emails
+            async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+                digests: Sequence[
+                    PetSightDigest
+                ] = await self.pet_sight_service.claim_due_sight_digests(
+                    uow=uow, limit=batch_size
+                )
+
+                for digest in digests:
+                    await self.__send_pet_sight_digest(uow=uow, digest=digest)
+
+            sent += len(digests)
 
-            owner = await self.profile_service.get_profile(
-                uow=uow, entity_id=pet.profile_id
+            if len(digests) < batch_size:
+                return sent
+
+    async def __refresh_last_sight(self, e: BasePetEvent) -> None:
+        # Recomputed from pets_sight, so it does not matter in which order the
+        # sighting and lost/found events of a pet are handled
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            await self.pet_sight_service.refresh_last_sight(uow=uow, pet_id=e.pet_id)
+
+    async def __invalidate_sight_clusters(self, e: PetSightingEvent) -> None:
+        self.pet_sight_service.invalidate_lost_pet_sight_clusters(geohash=e.geohash)
+
+    async def __invalidate_all_sight_clusters(self, _: BasePetEvent) -> None:
+        # Every sighting of the pet joins or leaves the clusters
+        self.pet_sight_service.invalidate_lost_pet_sight_clusters()
+
+    async def __send_pet_sight_digest(
+        self, uow: UnitOfWork, digest: PetSightDigest
+    ) -> None:
+        try:
+            owner: PetOwnerContact = await self.__get_pet_owner(
+                uow=uow, pet_id=digest.pet_id
+            )
+        except PetNotFoundByIdException:
+            self.logger.info(
+                f"Dropping sightings digest of deleted pet {digest.pet_id}"
             )
+            return
 
-        await self.__send_pet_sight_email(
-            email=owner.account.email,
-            profile_name=owner.first_name,
-            pet_id=e.pet_id,
-            fe_route="lost-pets",
+        lost_pets_url: str = (
+            f"{self.url_config.frontend_url}/lost-pets?petId={digest.pet_id}"
         )
 
-    async def __send_pet_sight_email(
-        self, email: str, profile_name: str, pet_id: str, fe_route: str
-    ) -> None:
-        self.email_gateway.schedule_mail(
-            recipient=email,
+        if digest.latitude is None or digest.longitude is None:
+            last_location_url: str = lost_pets_url
+        else:
+            last_location_url = (
+                f"{self.MAPS_SEARCH_URL}{digest.latitude},{digest.longitude}"
+            )
+
+        await self.email_gateway.schedule_mail(
+            uow=uow,
+            recipient=owner.email,
             subject=PetEmailSubjects.PET_SIGHT.value,
             body=render_pet_sight_template(
-                profile_name=profile_name,
-                lost_pets_url=f"{self.url_config.frontend_url}"
-                f"/{fe_route}?petId={pet_id}",
+                profile_name=owner.first_name,
+                sightings=digest.sightings,
+                last_location_url=last_location_url,
+                lost_pets_url=lost_pets_url,
             ),
         )
 
+    async def __get_pet_owner(self, uow: UnitOfWork, pet_id: str) -> PetOwnerContact:
+        owner: PetOwnerContact | None = self.pet_owner_cache.get(pet_id)
+
+        if owner is not None:
+            return owner
+
+        pet: Pet = await self.pet_service.get_pet_by_id(uow=uow, entity_id=pet_id)
+        profile: BaseProfile = await self.profile_service.get_profile(
+            uow=uow, entity_id=pet.profile_id
+        )
+
+        owner = PetOwnerContact(
+            email=profile.account.email, first_name=profile.first_name
+        )
+        self.pet_owner_cache.set(pet_id, owner)
+
+        return owner
+
     async def __create_pet_from_adopted_animal(self, e: AnimalAdoptedEvent) -> None:
         async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
             adopter_profile: BaseProfile = (
@@ -0,0 +1,57 @@
+import asyncio
+import logging
+
+from bounded_contexts.pets_domain.event_handlers.pet_events_handler import (
+    PetEventHandler,
+)
+from config import PetSightDigestConfig
+
+
+class PetSightDigestSender:
+    """
+    Emails the sightings digests whose coalescing window is over, every
+    poll_interval seconds. Not started when the window is 0, the digests are then
+    sent by the sighting handler itself.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(
+        self, pet_event_handler: PetEventHandler, config: PetSightDigestConfig
+    ) -> None:
+        self.pet_event_handler = pet_event_handler
+        self.config = config
+        self.__wakeup: asyncio.Event | None = None
+        self.__task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self.config.window <= 0:
+            return
+
+        self.__wakeup = asyncio.Event()
+        self.__task = asyncio.create_task(self.__run(), name="pet_sight_digests")
+
+    async def stop(self) -> None:
+        # Pending digests stay in the table until the next start
+        if self.__task is None or self.__wakeup is None:
+            return
+
+        self.__wakeup.set()
+        await self.__task
+        self.__task = None
+
+    async def __run(self) -> None:
+        assert self.__wakeup is not None
+
+        while not self.__wakeup.is_set():
+            try:
+                await self.pet_event_handler.send_due_sight_digests()
+            except Exception as e:
+                self.logger.error("Sending pet sightings digests failed", exc_info=e)
+
+            try:
+                await asyncio.wait_for(
+                    self.__wakeup.wait(), timeout=self.config.poll_interval
+                )
+            except asyncio.TimeoutError:
+                pass
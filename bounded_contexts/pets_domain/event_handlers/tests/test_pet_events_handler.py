@@ -1,9 +1,21 @@
+from unittest.mock import AsyncMock, patch
+
+from sqlalchemy import func, select, update
+
 from bounded_contexts.pets_domain.email.pet_email_templates import PetEmailSubjects
+from bounded_contexts.pets_domain.entities import PetSightDigest
+from bounded_contexts.pets_domain.event_handlers import PetEventHandler
 from bounded_contexts.pets_domain.use_cases import RegisterPetSightUseCase
 from common.testing import BaseUseCaseTest
 from common.testing.base_testing_utils import BaseTestingUtils
-from infrastructure.email import BaseEmailGateway
-from infrastructure.uow_abstraction import UnitOfWork, unit_of_work
+from bounded_contexts.pets_domain.value_objects import PetOwnerContact
+from infrastructure.email import QueuedEmail, TestEmailGateway
+from infrastructure.uow_abstraction import (
+    OutboxMessage,
+    UnitOfWork,
+    make_unit_of_work,
+    unit_of_work,
+)
 
 
 class TestPetEventHandler(BaseUseCaseTest, BaseTestingUtils):
@@ -24,8 +36,8 @@ class TestPetEventHandler(BaseUseCaseTest, BaseTestingUtils):
             RegisterPetSightUseCase
         )
 
-        self.email_gateway: BaseEmailGateway = self.dependencies.resolve(
-            BaseEmailGateway
+        self.email_gateway: TestEmailGateway = self.dependencies.resolve(
+            TestEmailGateway
         )
 
         self.email_gateway.clear_cache()
@@ -73,3 +85,131 @@ class TestPetEventHandler(BaseUseCaseTest, BaseTestingUtils):
         )
 
         self.assertTrue("lost-pets?petId=" in sight_emails[0].body)
+
+    async def test_pet_sightings_are_coalesced_in_one_email(self) -> None:
+        pet_event_handler: PetEventHandler = self.dependencies.resolve(PetEventHandler)
+        pet_event_handler.pet_sight_digest_config.window = 3600
+
+        try:
+            # The first sight is skipped, the other three are coalesced
+            for _ in range(4):
+                await self.register_pet_sight.execute(
+                    RegisterPetSightUseCase.Request(
+                        pet_id=self.pet_data.entity_id,
+                        latitude=self.TEST_LATITUDE,
+                        longitude=self.TEST_LONGITUDE,
+                        account_id=None,
+                    )
+                )
+
+            self.assertEqual(0, await pet_event_handler.send_due_sight_digests())
+
+            # Ends the window
+            async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+                await uow.session.execute(
+                    update(PetSightDigest).values(send_at=func.now())
+                )
+
+            self.assertEqual(1, await pet_event_handler.send_due_sight_digests())
+
+        finally:
+            pet_event_handler.pet_sight_digest_config.window = 0
+
+        sight_emails = [
+            email
+            for email in self.email_gateway.email_cache
+            if email.subject == PetEmailSubjects.PET_SIGHT.value
+        ]
+
+        self.assertEqual(1, len(sight_emails))
+        self.assertEqual(self.profile.email, sight_emails[0].recipient)
+        self.assertTrue("<strong>3</strong>" in sight_emails[0].body)
+        self.assertTrue(
+            f"{self.TEST_LATITUDE},{self.TEST_LONGITUDE}" in sight_emails[0].body
+        )
+
+    async def test_register_pet_sight_dispatches_outbox(self) -> None:
+        await self.register_pet_sight.execute(
+            RegisterPetSightUseCase.Request(
+                pet_id=self.pet_data.entity_id,
+                latitude=self.TEST_LATITUDE,
+                longitude=self.TEST_LONGITUDE,
+                account_id=None,
+            )
+        )
+
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            pending_messages = await uow.session.scalar(
+                select(func.count()).select_from(OutboxMessage)
+            )
+
+        # Handled (and deleted) right after the commit with dispatch_inline
+        self.assertEqual(0, pending_messages)
+
+    async def test_failed_digest_batch_queues_no_emails(self) -> None:
+        pet_event_handler: PetEventHandler = self.dependencies.resolve(PetEventHandler)
+        pet_event_handler.pet_sight_digest_config.window = 3600
+
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            other_pet_data = (
+                await self.create_pet(uow=uow, actor_profile=self.profile, lost=True)
+            ).pet_data
+
+        try:
+            for pet_id in (self.pet_data.entity_id, other_pet_data.entity_id):
+                for _ in range(2):
+                    await self.register_pet_sight.execute(
+                        RegisterPetSightUseCase.Request(
+                            pet_id=pet_id,
+                            latitude=self.TEST_LATITUDE,
+                            longitude=self.TEST_LONGITUDE,
+                            account_id=None,
+                        )
+                    )
+
+            async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+                await uow.session.execute(
+                    update(PetSightDigest).values(send_at=func.now())
+                )
+
+            # The first digest of the batch is queued, the second one fails
+            with patch.object(
+                PetEventHandler,
+                "_PetEventHandler__get_pet_owner",
+                new_callable=AsyncMock,
+                side_effect=[
+                    PetOwnerContact(email=self.profile.email, first_name="owner"),
+                    RuntimeError("owner lookup failed"),
+                ],
+            ):
+                with self.assertRaises(RuntimeError):
+                    await pet_event_handler.send_due_sight_digests()
+
+            async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+                queued_emails = await uow.session.scalar(
+                    select(func.count()).select_from(QueuedEmail)
+                )
+
+            self.assertEqual(0, queued_emails)
+            self.assertEqual(
+                [],
+                [
+                    email
+                    for email in self.email_gateway.email_cache
+                    if email.subject == PetEmailSubjects.PET_SIGHT.value
+                ],
+            )
+
+            # Both digests were put back, each owner gets one email
+            self.assertEqual(2, await pet_event_handler.send_due_sight_digests())
+
+        finally:
+            pet_event_handler.pet_sight_digest_config.window = 0
+
+        sight_emails = [
+            email
+            for email in self.email_gateway.email_cache
+            if email.subject == PetEmailSubjects.PET_SIGHT.value
+        ]
+
+        self.assertEqual(2, len(sight_emails))
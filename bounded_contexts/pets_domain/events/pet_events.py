@@ -9,6 +9,9 @@ class BasePetEvent(Event):
         )
         self.pet_id = pet_id
 
+    def aggregate_id(self) -> str | None:
+        return self.pet_id
+
 
 class PetLostEvent(BasePetEvent):
     pass
@@ -23,9 +26,19 @@ class PetSightingEvent(BasePetEvent):
         self,
         issued: float,
         pet_id: str,
+        first_sight: bool = False,
+        geohash: str | None = None,
+        latitude: float | None = None,
+        longitude: float | None = None,
     ) -> None:
         super().__init__(
             actor_account_id=Event.EXTERNAL_ACTOR_ACCOUNT_ID,
             issued=issued,
             pet_id=pet_id,
         )
+        # The first sight is the last known location given by the owner
+        self.first_sight = first_sight
+        # Where the pet was seen, the map tiles containing it are out of date
+        self.geohash = geohash
+        self.latitude = latitude
+        self.longitude = longitude
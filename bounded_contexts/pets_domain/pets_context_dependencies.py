@@ -1,6 +1,9 @@
 from bounded_contexts.adoptions_domain.services import AdoptionAnimalsService
 from bounded_contexts.auth.services import AccountsService
-from bounded_contexts.pets_domain.event_handlers import PetEventHandler
+from bounded_contexts.pets_domain.event_handlers import (
+    PetEventHandler,
+    PetSightDigestSender,
+)
 from bounded_contexts.pets_domain.repositories import (
     PetsRepository,
     PetsSightRepository,
@@ -21,11 +24,16 @@ from bounded_contexts.pets_domain.use_cases import (
     RegenerateQrCodesUseCase,
 )
 from bounded_contexts.pets_domain.use_cases.get_pet_sights import GetPetSightsUseCase
+from bounded_contexts.pets_domain.use_cases.get_pet_sight_clusters import (
+    GetPetSightClustersUseCase,
+)
 from bounded_contexts.pets_domain.use_cases.get_pets import GetPetsUseCase
 from bounded_contexts.pets_domain.views import PetViewFactory, PetSightViewFactory
 from bounded_contexts.social_domain.repositories import ProfileRepository
 from bounded_contexts.social_domain.services.profile_service import ProfileService
+from bounded_contexts.social_domain.value_objects import ProfileSnapshot
 from common.dependencies import BaseContextDependencies
+from common.ttl_cache import TTLCache
 from config import ProjectConfig
 from infrastructure.database import RepositoryUtils
 from infrastructure.email import BaseEmailGateway
@@ -35,6 +43,13 @@ from infrastructure.uow_abstraction import EventBus
 
 
 class PetsContextDependencies(BaseContextDependencies):
+    PET_SIGHT_CLUSTER_CACHE_SIZE: int = 4_096
+    # Invalidated by the pet events, the TTL only bounds how stale a missed one is
+    PET_SIGHT_CLUSTER_CACHE_TTL_SECONDS: float = 600
+    PET_OWNER_CACHE_SIZE: int = 4_096
+    # Bounds how long a changed owner email or name takes to reach the digests
+    PET_OWNER_CACHE_TTL_SECONDS: float = 600
+
     def _initialize_view_factories(self) -> None:
         pet_view_factory: PetViewFactory = PetViewFactory()
 
@@ -55,7 +70,10 @@ class PetsContextDependencies(BaseContextDependencies):
 
     def _initialize_services(self) -> None:
         profile_service: ProfileService = ProfileService(
-            profile_repository=self.dependencies.resolve(ProfileRepository)
+            profile_repository=self.dependencies.resolve(ProfileRepository),
+            profile_snapshot_cache=self.dependencies.resolve(
+                TTLCache[str, ProfileSnapshot]
+            ),
         )
 
         self.dependencies.register(ProfileService, profile_service)
@@ -65,12 +83,17 @@ class PetsContextDependencies(BaseContextDependencies):
             file_system_gateway=self.dependencies.resolve(FileSystemGateway),
             qr_code=self.dependencies.resolve(QRCodeGenerator),
             url_config=self.dependencies.resolve(ProjectConfig).url_config,
+            qr_config=self.dependencies.resolve(ProjectConfig).qr,
         )
 
         self.dependencies.register(PetService, pet_service)
 
         pet_sight_service: PetSightService = PetSightService(
-            pets_sight_repository=self.dependencies.resolve(PetsSightRepository)
+            pets_sight_repository=self.dependencies.resolve(PetsSightRepository),
+            cluster_cache=TTLCache(
+                max_size=self.PET_SIGHT_CLUSTER_CACHE_SIZE,
+                ttl_seconds=self.PET_SIGHT_CLUSTER_CACHE_TTL_SECONDS,
+            ),
         )
 
         self.dependencies.register(PetSightService, pet_sight_service)
@@ -130,6 +153,14 @@ class PetsContextDependencies(BaseContextDependencies):
 
         self.dependencies.register(GetPetSightsUseCase, get_pet_sights)
 
+        get_pet_sight_clusters: GetPetSightClustersUseCase = GetPetSightClustersUseCase(
+            repository_utils=self.dependencies.resolve(RepositoryUtils),
+            pet_sight_service=self.dependencies.resolve(PetSightService),
+            pet_sight_view_factory=self.dependencies.resolve(PetSightViewFactory),
+        )
+
+        self.dependencies.register(GetPetSightClustersUseCase, get_pet_sight_clusters)
+
         get_most_recent_lost_pet_sights: GetMostRecentLostPetSightsUseCase = (
             GetMostRecentLostPetSightsUseCase(
                 repository_utils=self.dependencies.resolve(RepositoryUtils),
@@ -156,6 +187,7 @@ class PetsContextDependencies(BaseContextDependencies):
             pet_service=self.dependencies.resolve(PetService),
             profile_service=self.dependencies.resolve(ProfileService),
             pet_view_factory=self.dependencies.resolve(PetViewFactory),
+            qr_config=self.dependencies.resolve(ProjectConfig).qr,
         )
 
         self.dependencies.register(RegenerateQrCodesUseCase, regenerate_qr_codes)
@@ -170,6 +202,20 @@ class PetsContextDependencies(BaseContextDependencies):
             adoption_animal_service=self.dependencies.resolve(AdoptionAnimalsService),
             email_gateway=self.dependencies.resolve(BaseEmailGateway),
             url_config=self.dependencies.resolve(ProjectConfig).url_config,
+            pet_sight_digest_config=self.dependencies.resolve(
+                ProjectConfig
+            ).pet_sight_digest,
+            pet_owner_cache=TTLCache(
+                max_size=self.PET_OWNER_CACHE_SIZE,
+                ttl_seconds=self.PET_OWNER_CACHE_TTL_SECONDS,
+            ),
         )
 
         self.dependencies.register(PetEventHandler, pet_event_handler)
+
+        pet_sight_digest_sender: PetSightDigestSender = PetSightDigestSender(
+            pet_event_handler=pet_event_handler,
+            config=self.dependencies.resolve(ProjectConfig).pet_sight_digest,
+        )
+
+        self.dependencies.register(PetSightDigestSender, pet_sight_digest_sender)
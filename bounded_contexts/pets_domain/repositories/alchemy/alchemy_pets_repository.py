@@ -1,17 +1,19 @@
 from typing import Type, Sequence
-from sqlalchemy import select, func
+from sqlalchemy import Select, select
 
-from bounded_contexts.pets_domain.entities import Pet
+from bounded_contexts.pets_domain.entities import Pet, QrRegenerationCheckpoint
 from bounded_contexts.pets_domain.repositories.pets_repository import (
     PetsRepository,
 )
 from bounded_contexts.social_domain.enum import AnimalTypes
+from common.pagination import Cursor, CountMode, Page, fetch_page, paginate_query
 from infrastructure.uow_abstraction.unit_of_work_module import Session
 
 
 class AlchemyPetsRepository(PetsRepository):
     def __init__(self) -> None:
         self.model: Type[Pet] = Pet
+        self.checkpoint_model: Type[QrRegenerationCheckpoint] = QrRegenerationCheckpoint
 
     async def add_pet(self, session: Session, pet: Pet) -> None:
         session.add(pet)
@@ -52,50 +54,104 @@ class AlchemyPetsRepository(PetsRepository):
         offset: int | None = 0,
         lost: bool | None = None,
         profile_id: str | None = None,
+        cursor: Cursor | None = None,
     ) -> Sequence[Pet]:
-        query = (
-            select(self.model)
-            .order_by("animal_name")
-            .where(self.model.animal_type == AnimalTypes.PET)  # type: ignore
+        query = paginate_query(
+            query=self.__pets_query(lost=lost, profile_id=profile_id),
+            sort_column=self.model.animal_name,
+            id_column=self.model.entity_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
         )
 
-        if profile_id:
-            query = query.where(
-                self.model.profile_id == profile_id,  # type: ignore
-            )
+        result = await session.execute(query)
+        return result.scalars().all()
 
-        if lost is not None:
-            query = query.where(
-                self.model.lost == lost,  # type: ignore
-            )
+    async def get_pets_page(
+        self,
+        session: Session,
+        limit: int | None = None,
+        offset: int | None = 0,
+        lost: bool | None = None,
+        profile_id: str | None = None,
+        cursor: Cursor | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> Page[Pet]:
+        return await fetch_page(
+            session=session,
+            query=self.__pets_query(lost=lost, profile_id=profile_id),
+            sort_column=self.model.animal_name,
+            id_column=self.model.entity_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count_mode=count_mode,
+        )
+
+    async def get_pets_after(
+        self, session: Session, entity_id: str | None, limit: int
+    ) -> Sequence[Pet]:
+        # By primary key, the order doesn't change when a pet is edited meanwhile
+        query = self.__pets_query(lost=None, profile_id=None)
 
-        if limit:
-            query = query.limit(limit)
+        if entity_id is not None:
+            query = query.where(self.model.entity_id > entity_id)  # type: ignore
 
-        if offset:
-            query = query.offset(offset)
+        query = query.order_by(self.model.entity_id).limit(limit)  # type: ignore
 
         result = await session.execute(query)
         return result.scalars().all()
 
-    async def count_pets(
-        self, session: Session, lost: bool | None = None, profile_id: str | None = None
-    ) -> int:
-        query = (
-            func.count()
-            .select()
-            .select_from(self.model)
-            .where(self.model.animal_type == AnimalTypes.PET)  # type: ignore
-        )
-        if lost is not None:
-            query = query.where(self.model.lost == lost)  # type: ignore
+    async def get_pets_by_ids(
+        self, session: Session, entity_ids: Sequence[str]
+    ) -> Sequence[Pet]:
+        if not entity_ids:
+            return []
 
-        if profile_id:
-            query = query.where(self.model.profile_id == profile_id)  # type: ignore
+        query = self.__pets_query(lost=None, profile_id=None).where(
+            self.model.entity_id.in_(entity_ids)  # type: ignore
+        )
 
         result = await session.execute(query)
-        return result.scalar()  # type: ignore
+        return result.scalars().all()
 
     async def delete_pets(self, session: Session, pet: Pet) -> None:
         await session.delete(pet)
         await session.flush([pet])
+
+    async def get_qr_regeneration_checkpoint(
+        self, session: Session, generation: str
+    ) -> QrRegenerationCheckpoint | None:
+        # Locked until the batch commits, concurrent regenerations take turns
+        query = (
+            select(self.checkpoint_model)
+            .where(self.checkpoint_model.generation == generation)  # type: ignore
+            .with_for_update()
+        )
+
+        result = await session.execute(query)
+        return result.scalars().first()
+
+    async def add_qr_regeneration_checkpoint(
+        self, session: Session, checkpoint: QrRegenerationCheckpoint
+    ) -> None:
+        session.add(checkpoint)
+        await session.flush([checkpoint])
+
+    def __pets_query(self, lost: bool | None, profile_id: str | None) -> Select:
+        query = select(self.model).where(
+            self.model.animal_type == AnimalTypes.PET  # type: ignore
+        )
+
+        if profile_id:
+            query = query.where(
+                self.model.profile_id == profile_id,  # type: ignore
+            )
+
+        if lost is not None:
+            query = query.where(
+                self.model.lost == lost,  # type: ignore
+            )
+
+        return query
@@ -1,11 +1,35 @@
 from typing import Type, Sequence
 
-from sqlalchemy import select, func, join, tuple_
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    delete,
+    func,
+    join,
+    literal_column,
+    or_,
+    select,
+)
+from sqlalchemy.dialects.postgresql import insert
 
-from bounded_contexts.pets_domain.entities import PetSight, Pet
+from bounded_contexts.pets_domain.entities import (
+    PetSight,
+    Pet,
+    PetLastSight,
+    PetSightDigest,
+)
 from bounded_contexts.pets_domain.repositories.pets_sight_repository import (
     PetsSightRepository,
 )
+from bounded_contexts.pets_domain.value_objects import PetSightCluster
+from common.geo import (
+    BoundingBox,
+    GeoCircle,
+    EARTH_RADIUS_KM,
+    geohash_prefix_upper_bound,
+)
+from common.pagination import Cursor, CountMode, Page, fetch_page, paginate_query
 from infrastructure.uow_abstraction.unit_of_work_module import Session
 
 
@@ -13,6 +37,8 @@ class AlchemyPetsSightRepository(PetsSightRepository):
     def __init__(self) -> None:
         self.model: Type[PetSight] = PetSight
         self.pet_model: Type[Pet] = Pet
+        self.last_sight_model: Type[PetLastSight] = PetLastSight
+        self.digest_model: Type[PetSightDigest] = PetSightDigest
 
     async def add_pet_sight(self, session: Session, pet_sight: PetSight) -> None:
         session.add(pet_sight)
@@ -35,109 +61,315 @@ class AlchemyPetsSightRepository(PetsSightRepository):
         offset: int | None = 0,
         pet_id: str | None = None,
         lost: bool | None = None,
+        cursor: Cursor | None = None,
+        bounding_box: BoundingBox | None = None,
+        circle: GeoCircle | None = None,
     ) -> Sequence[PetSight]:
-        query = select(self.model).select_from(
-            join(self.model, self.pet_model, self.model.pet_id == self.pet_model.entity_id)  # type: ignore
+        query = paginate_query(
+            query=self.__pet_sights_query(
+                pet_id=pet_id, lost=lost, bounding_box=bounding_box, circle=circle
+            ),
+            sort_column=self.model.created_at,
+            id_column=self.model.entity_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
         )
 
-        if limit:
-            query = query.limit(limit)
-
-        if offset:
-            query = query.offset(offset)
+        result = await session.execute(query)
+        return result.scalars().all()
 
-        if pet_id:
-            query = query.where(self.model.pet_id == pet_id)  # type: ignore
+    async def get_pet_sights_page(
+        self,
+        session: Session,
+        limit: int | None = None,
+        offset: int | None = 0,
+        pet_id: str | None = None,
+        lost: bool | None = None,
+        cursor: Cursor | None = None,
+        bounding_box: BoundingBox | None = None,
+        circle: GeoCircle | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> Page[PetSight]:
+        return await fetch_page(
+            session=session,
+            query=self.__pet_sights_query(
+                pet_id=pet_id, lost=lost, bounding_box=bounding_box, circle=circle
+            ),
+            sort_column=self.model.created_at,
+            id_column=self.model.entity_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count_mode=count_mode,
+        )
 
-        if lost is not None:
-            query = query.where(self.pet_model.lost == lost)  # type: ignore
+    async def get_most_recent_lost_pet_sights_page(
+        self,
+        session: Session,
+        limit: int | None = None,
+        offset: int | None = 0,
+        cursor: Cursor | None = None,
+    ) -> Page[PetSight]:
+        # The latest sighting of each pet is precomputed in pets_last_sight, so this
+        # is an ordered scan of its partial index over lost pets
+        query = (
+            select(self.model)
+            .join(
+                self.last_sight_model,
+                self.last_sight_model.sight_id == self.model.entity_id,  # type: ignore
+            )
+            .where(self.last_sight_model.lost == True)  # type: ignore
+        )
 
-        query = query.order_by(self.model.created_at)  # type: ignore
+        return await fetch_page(
+            session=session,
+            query=query,
+            sort_column=self.last_sight_model.created_at,
+            id_column=self.last_sight_model.sight_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
 
-        result = await session.execute(query)
-        return result.scalars().all()
+    async def get_lost_pet_sight_clusters(
+        self, session: Session, cells: Sequence[str], cell_length: int
+    ) -> Sequence[PetSightCluster]:
+        cell = func.substr(self.model.geohash, 1, cell_length)  # type: ignore
 
-    async def count_pet_sights(
-        self, session: Session, pet_id: str | None = None, lost: bool | None = None
-    ) -> int:
         query = (
-            func.count()
-            .select()
+            select(
+                cell,
+                func.count(),
+                func.avg(self.model.latitude),  # type: ignore
+                func.avg(self.model.longitude),  # type: ignore
+            )
             .select_from(
                 join(self.model, self.pet_model, self.model.pet_id == self.pet_model.entity_id)  # type: ignore
             )
+            .where(self.pet_model.lost == True)  # type: ignore
+            .group_by(cell)
         )
 
-        if pet_id:
-            query = query.where(self.model.pet_id == pet_id)  # type: ignore
+        cell_ranges: list[ColumnElement] = self.__geohash_ranges(cells)
 
-        if lost is not None:
-            query = query.where(self.pet_model.lost == lost)  # type: ignore
+        if cell_ranges:
+            query = query.where(or_(*cell_ranges))
 
         result = await session.execute(query)
-        return result.scalar()  # type: ignore
-
-    async def get_most_recent_lost_pet_sights(
-        self, session: Session, limit: int | None = None, offset: int | None = 0
-    ) -> Sequence[PetSight]:
-        subquery = select(
-            self.model.pet_id,  # type: ignore
-            func.max(self.model.created_at),  # type: ignore
-        ).group_by(
-            self.model.pet_id  # type: ignore
-        )
 
-        query = (
-            select(self.model)
-            .select_from(
-                join(self.model, self.pet_model, self.model.pet_id == self.pet_model.entity_id)  # type: ignore
+        return [
+            PetSightCluster(
+                cell=cell, count=count, latitude=latitude, longitude=longitude
             )
-            .where(
-                tuple_(self.model.pet_id, self.model.created_at).in_(subquery),  # type: ignore
+            for cell, count, latitude, longitude in result.all()
+        ]
+
+    async def refresh_last_sight(self, session: Session, pet_id: str) -> None:
+        latest_sight = (
+            self.__last_sight_select()
+            .where(self.model.pet_id == pet_id)  # type: ignore
+            .order_by(
+                self.model.created_at.desc(),  # type: ignore
+                self.model.entity_id.desc(),  # type: ignore
             )
-            .filter(self.pet_model.lost.is_(True))  # type: ignore
-            .order_by(self.model.created_at)  # type: ignore
+            .limit(1)
         )
 
-        if limit:
-            query = query.limit(limit)
+        query = insert(self.last_sight_model).from_select(
+            ["pet_id", "sight_id", "created_at", "lost"], latest_sight
+        )
+        query = query.on_conflict_do_update(
+            index_elements=["pet_id"],
+            set_={
+                "sight_id": query.excluded.sight_id,
+                "created_at": query.excluded.created_at,
+                "lost": query.excluded.lost,
+            },
+        )
 
-        if offset:
-            query = query.offset(offset)
+        await session.execute(query)
 
-        query = query.order_by(self.model.created_at)  # type: ignore
+    async def rebuild_last_sights(self, session: Session) -> int:
+        latest_sights = (
+            self.__last_sight_select()
+            .distinct(self.model.pet_id)  # type: ignore
+            .order_by(
+                self.model.pet_id,  # type: ignore
+                self.model.created_at.desc(),  # type: ignore
+                self.model.entity_id.desc(),  # type: ignore
+            )
+        )
 
-        result = await session.execute(query)
+        await session.execute(delete(self.last_sight_model))
+        result = await session.execute(
+            insert(self.last_sight_model).from_select(
+                ["pet_id", "sight_id", "created_at", "lost"], latest_sights
+            )
+        )
 
-        # Get the most recent records per pet
-        return result.scalars().all()
+        return result.rowcount  # type: ignore
 
-    async def count_most_recent_lost_pet_sights(self, session: Session) -> int:
-        # Query to retrieve the most recent records per pet
-        subquery = select(  # type: ignore
-            self.model.pet_id,  # type: ignore
-            func.max(self.model.created_at),  # type: ignore
-        ).group_by(
-            self.model.pet_id  # type: ignore
+    async def add_to_sight_digest(
+        self,
+        session: Session,
+        pet_id: str,
+        latitude: float | None,
+        longitude: float | None,
+        window_seconds: float,
+    ) -> None:
+        query = insert(self.digest_model).values(
+            pet_id=pet_id,
+            sightings=1,
+            latitude=latitude,
+            longitude=longitude,
+            last_sight_at=func.now(),
+            send_at=func.now() + literal_column("interval '1 second'") * window_seconds,
+        )
+        # The window keeps the send time of its first sighting
+        query = query.on_conflict_do_update(
+            index_elements=["pet_id"],
+            set_={
+                "sightings": self.digest_model.sightings + 1,  # type: ignore
+                "latitude": query.excluded.latitude,
+                "longitude": query.excluded.longitude,
+                "last_sight_at": query.excluded.last_sight_at,
+            },
+        )
+
+        await session.execute(query)
+
+    async def claim_due_sight_digests(
+        self, session: Session, limit: int
+    ) -> Sequence[PetSightDigest]:
+        # SKIP LOCKED lets several workers send digests, a rollback puts them back
+        due_digests = (
+            select(self.digest_model.pet_id)  # type: ignore
+            .where(self.digest_model.send_at <= func.now())  # type: ignore
+            .order_by(self.digest_model.send_at)  # type: ignore
+            .limit(limit)
+            .with_for_update(skip_locked=True)
         )
 
         query = (
-            func.count()
-            .select()
-            .select_from(
-                join(self.model, self.pet_model, self.model.pet_id == self.pet_model.entity_id)  # type: ignore
-            )
+            delete(self.digest_model)
             .where(
-                tuple_(self.model.pet_id, self.model.created_at).in_(subquery),  # type: ignore
+                self.digest_model.pet_id.in_(due_digests.scalar_subquery())  # type: ignore
             )
-            .filter(self.pet_model.lost.is_(True))  # type: ignore
+            .returning(self.digest_model)
+            .execution_options(synchronize_session=False)
         )
 
         result = await session.execute(query)
-
-        return result.scalar()  # type: ignore
+        return result.scalars().all()
 
     async def delete(self, session: Session, pet_sights: Sequence[PetSight]) -> None:
         for pet_sight in pet_sights:
             await session.delete(pet_sight)
         await session.flush()
+
+    def __pet_sights_query(
+        self,
+        pet_id: str | None,
+        lost: bool | None,
+        bounding_box: BoundingBox | None = None,
+        circle: GeoCircle | None = None,
+    ) -> Select:
+        query = select(self.model).select_from(
+            join(self.model, self.pet_model, self.model.pet_id == self.pet_model.entity_id)  # type: ignore
+        )
+
+        if pet_id:
+            query = query.where(self.model.pet_id == pet_id)  # type: ignore
+
+        if lost is not None:
+            query = query.where(self.pet_model.lost == lost)  # type: ignore
+
+        if bounding_box:
+            query = query.where(self.__bounding_box_filter(bounding_box))
+
+        if circle:
+            # The circle's bounding boxes narrow the rows down through the geohash
+            # index, the distance is only computed for those. With a bbox too, both
+            # filters apply and only the points inside both areas are returned
+            query = query.where(
+                or_(
+                    *(
+                        self.__bounding_box_filter(circle_box)
+                        for circle_box in circle.bounding_boxes()
+                    )
+                ),
+                self.__distance_km(circle) <= circle.radius_km,
+            )
+
+        return query
+
+    def __bounding_box_filter(self, bounding_box: BoundingBox) -> ColumnElement:
+        # Every covering cell is a contiguous range of the geohash index, the exact
+        # coordinates then drop the points of those cells outside the box
+        cell_ranges: list[ColumnElement] = self.__geohash_ranges(
+            bounding_box.geohash_cells()
+        )
+
+        conditions: list[ColumnElement] = [
+            self.model.latitude.between(  # type: ignore
+                bounding_box.south, bounding_box.north
+            ),
+            self.model.longitude.between(  # type: ignore
+                bounding_box.west, bounding_box.east
+            ),
+        ]
+
+        # A box covering the whole world has a single empty cell, nothing to scan
+        if cell_ranges:
+            conditions.insert(0, or_(*cell_ranges))
+
+        return and_(*conditions)
+
+    def __geohash_ranges(self, cells: Sequence[str]) -> list[ColumnElement]:
+        # The empty cell is the whole world, it needs no range
+        return [
+            and_(
+                self.model.geohash >= cell,  # type: ignore
+                self.model.geohash < geohash_prefix_upper_bound(cell),  # type: ignore
+            )
+            for cell in cells
+            if cell
+        ]
+
+    def __distance_km(self, circle: GeoCircle) -> ColumnElement:
+        # Haversine distance from the circle's center
+        latitude = func.radians(self.model.latitude)
+        center_latitude = func.radians(circle.latitude)
+        half_latitude_delta = (latitude - center_latitude) / 2
+        half_longitude_delta = (
+            func.radians(self.model.longitude) - func.radians(circle.longitude)
+        ) / 2
+
+        return (
+            2
+            * EARTH_RADIUS_KM
+            * func.asin(
+                # Rounding can take near antipodal points slightly above 1, which
+                # asin rejects as out of range
+                func.least(
+                    1.0,
+                    func.sqrt(
+                        func.power(func.sin(half_latitude_delta), 2)
+                        + func.cos(latitude)
+                        * func.cos(center_latitude)
+                        * func.power(func.sin(half_longitude_delta), 2)
+                    ),
+                )
+            )
+        )
+
+    def __last_sight_select(self) -> Select:
+        return select(
+            self.model.pet_id,  # type: ignore
+            self.model.entity_id,  # type: ignore
+            self.model.created_at,  # type: ignore
+            self.pet_model.lost,  # type: ignore
+        ).select_from(
+            join(self.model, self.pet_model, self.model.pet_id == self.pet_model.entity_id)  # type: ignore
+        )
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Sequence
 
-from bounded_contexts.pets_domain.entities import Pet
+from bounded_contexts.pets_domain.entities import Pet, QrRegenerationCheckpoint
+from common.pagination import Cursor, CountMode, Page
 from infrastructure.uow_abstraction.unit_of_work_module import Session
 
 
@@ -34,15 +35,47 @@ class PetsRepository(ABC):
         offset: int | None = 0,
         lost: bool | None = None,
         profile_id: str | None = None,
+        cursor: Cursor | None = None,
     ) -> Sequence[Pet]:
         pass
 
     @abstractmethod
-    async def count_pets(
-        self, session: Session, lost: bool | None = None, profile_id: str | None = None
-    ) -> int:
+    async def get_pets_page(
+        self,
+        session: Session,
+        limit: int | None = None,
+        offset: int | None = 0,
+        lost: bool | None = None,
+        profile_id: str | None = None,
+        cursor: Cursor | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> Page[Pet]:
+        pass
+
+    @abstractmethod
+    async def get_pets_after(
+        self, session: Session, entity_id: str | None, limit: int
+    ) -> Sequence[Pet]:
+        pass
+
+    @abstractmethod
+    async def get_pets_by_ids(
+        self, session: Session, entity_ids: Sequence[str]
+    ) -> Sequence[Pet]:
         pass
 
     @abstractmethod
     async def delete_pets(self, session: Session, pet: Pet) -> None:
         pass
+
+    @abstractmethod
+    async def get_qr_regeneration_checkpoint(
+        self, session: Session, generation: str
+    ) -> QrRegenerationCheckpoint | None:
+        pass
+
+    @abstractmethod
+    async def add_qr_regeneration_checkpoint(
+        self, session: Session, checkpoint: QrRegenerationCheckpoint
+    ) -> None:
+        pass
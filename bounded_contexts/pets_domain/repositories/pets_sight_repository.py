@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod
 from typing import Sequence
 
-from bounded_contexts.pets_domain.entities import PetSight
+from bounded_contexts.pets_domain.entities import PetSight, PetSightDigest
+from bounded_contexts.pets_domain.value_objects import PetSightCluster
+from common.geo import BoundingBox, GeoCircle
+from common.pagination import Cursor, CountMode, Page
 from infrastructure.uow_abstraction.unit_of_work_module import Session
 
 
@@ -24,23 +27,66 @@ class PetsSightRepository(ABC):
         offset: int | None = 0,
         pet_id: str | None = None,
         lost: bool | None = None,
+        cursor: Cursor | None = None,
+        bounding_box: BoundingBox | None = None,
+        circle: GeoCircle | None = None,
     ) -> Sequence[PetSight]:
         pass
 
     @abstractmethod
-    async def count_pet_sights(
-        self, session: Session, pet_id: str | None = None, lost: bool | None = None
-    ) -> int:
+    async def get_pet_sights_page(
+        self,
+        session: Session,
+        limit: int | None = None,
+        offset: int | None = 0,
+        pet_id: str | None = None,
+        lost: bool | None = None,
+        cursor: Cursor | None = None,
+        bounding_box: BoundingBox | None = None,
+        circle: GeoCircle | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> Page[PetSight]:
         pass
 
     @abstractmethod
-    async def get_most_recent_lost_pet_sights(
-        self, session: Session, limit: int | None = None, offset: int | None = 0
-    ) -> Sequence[PetSight]:
+    async def get_most_recent_lost_pet_sights_page(
+        self,
+        session: Session,
+        limit: int | None = None,
+        offset: int | None = 0,
+        cursor: Cursor | None = None,
+    ) -> Page[PetSight]:
+        pass
+
+    @abstractmethod
+    async def get_lost_pet_sight_clusters(
+        self, session: Session, cells: Sequence[str], cell_length: int
+    ) -> Sequence[PetSightCluster]:
+        pass
+
+    @abstractmethod
+    async def refresh_last_sight(self, session: Session, pet_id: str) -> None:
+        pass
+
+    @abstractmethod
+    async def rebuild_last_sights(self, session: Session) -> int:
+        pass
+
+    @abstractmethod
+    async def add_to_sight_digest(
+        self,
+        session: Session,
+        pet_id: str,
+        latitude: float | None,
+        longitude: float | None,
+        window_seconds: float,
+    ) -> None:
         pass
 
     @abstractmethod
-    async def count_most_recent_lost_pet_sights(self, session: Session) -> int:
+    async def claim_due_sight_digests(
+        self, session: Session, limit: int
+    ) -> Sequence[PetSightDigest]:
         pass
 
     @abstractmethod
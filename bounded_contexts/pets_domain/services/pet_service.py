@@ -1,9 +1,15 @@
+import asyncio
+import hashlib
+import logging
 from dataclasses import dataclass
 from datetime import date
 from typing import Sequence
 from uuid import uuid4
+
+import anyio
+
 from bounded_contexts.auth.entities import Account
-from bounded_contexts.pets_domain.entities import Pet
+from bounded_contexts.pets_domain.entities import Pet, QrRegenerationCheckpoint
 from bounded_contexts.pets_domain.events import PetFoundEvent, PetLostEvent
 from bounded_contexts.pets_domain.exceptions import PetUnauthorizedAccessException
 from bounded_contexts.pets_domain.exceptions.owner_is_not_a_personal_profile_exception import (
@@ -14,6 +20,7 @@ from bounded_contexts.pets_domain.exceptions.pet_not_found_exception import (
     PetNotFoundByAdoptionAnimalIdException,
 )
 from bounded_contexts.pets_domain.repositories import PetsRepository
+from bounded_contexts.pets_domain.value_objects import QrRegenerationBatch
 from bounded_contexts.social_domain.entities import (
     BaseProfile,
     AnimalSpecies,
@@ -21,7 +28,8 @@ from bounded_contexts.social_domain.entities import (
     AnimalSize,
 )
 from bounded_contexts.social_domain.enum import ProfileTypes
-from config import UrlConfig
+from common.pagination import Cursor, Page
+from config import QRConfig, UrlConfig
 from infrastructure.date_utils import float_timestamp, date_now
 from infrastructure.file_system import FileSystemGateway, FileSystemPrefix
 from infrastructure.qr.qr_code import QRCodeGenerator
@@ -67,44 +75,166 @@ class ModifyPetData:
 
 
 class PetService:
+    logger: logging.Logger = logging.getLogger(__name__)
+
     def __init__(
         self,
         pets_repository: PetsRepository,
         qr_code: QRCodeGenerator,
         file_system_gateway: FileSystemGateway,
         url_config: UrlConfig,
+        qr_config: QRConfig,
     ) -> None:
         self.pets_repository = pets_repository
         self.qr_code = qr_code
         self.file_system_gateway = file_system_gateway
         self.url_config = url_config
+        self.qr_config = qr_config
+
+    def qr_code_generation(self) -> str:
+        """
+        Changes with the QR style and the urls, and so with the QR codes of every pet.
+        """
+
+        return hashlib.sha256(
+            f"{self.qr_code.style.fingerprint()}\x00{self.url_config.frontend_url}"
+            f"\x00{self.url_config.backend_url}".encode()
+        ).hexdigest()
+
+    async def start_qr_regeneration(self, uow: UnitOfWork) -> QrRegenerationCheckpoint:
+        # Resumes the unfinished regeneration of the current generation, if any
+        generation: str = self.qr_code_generation()
+        checkpoint: QrRegenerationCheckpoint | None = (
+            await self.pets_repository.get_qr_regeneration_checkpoint(
+                session=uow.session, generation=generation
+            )
+        )
+
+        if checkpoint is None:
+            checkpoint = QrRegenerationCheckpoint(generation=generation)
+            await self.pets_repository.add_qr_regeneration_checkpoint(
+                session=uow.session, checkpoint=checkpoint
+            )
+        elif checkpoint.finished:
+            checkpoint.restart()
+            await uow.flush()
+
+        return checkpoint
+
+    async def get_qr_regeneration_checkpoint(
+        self, uow: UnitOfWork, generation: str
+    ) -> QrRegenerationCheckpoint | None:
+        return await self.pets_repository.get_qr_regeneration_checkpoint(
+            session=uow.session, generation=generation
+        )
+
+    async def regenerate_qr_codes(
+        self, uow: UnitOfWork, pets: Sequence[Pet]
+    ) -> QrRegenerationBatch:
+        """
+        Renders and uploads the QR codes of the pets whose image is not the one of
+        the current style and urls. The replaced images are only deleted by
+        delete_qr_code_files, once the new urls are committed.
+        """
+
+        batch: QrRegenerationBatch = QrRegenerationBatch()
+        outdated: list[tuple[Pet, str]] = []
+
+        for pet in pets:
+            file_key: str = self.qr_code.image_key(self.__qr_code_data(pet.entity_id))
+
+            if pet.qr_code == self.__qr_code_url(file_key):
+                batch.skipped += 1
+            else:
+                outdated.append((pet, file_key))
+
+        images: list[bytes] = await self.qr_code.generate_qr_codes(
+            [self.__qr_code_data(pet.entity_id) for pet, _ in outdated]
+        )
+        batch.rendered = len(images)
+
+        uploads: asyncio.Semaphore = asyncio.Semaphore(
+            self.qr_config.upload_concurrency
+        )
+
+        async def upload(pet: Pet, file_key: str, image: bytes) -> None:
+            async with uploads:
+                try:
+                    await self.file_system_gateway.save_file(
+                        prefix=FileSystemPrefix.QR, file_key=file_key, file=image
+                    )
+                except Exception as e:
+                    self.logger.error(
+                        f"Error uploading QR code of {pet.entity_id}: {e}"
+                    )
+                    batch.failed_pet_ids.append(pet.entity_id)
+                    return
+
+            replaced_file: str | None = self.__qr_code_file_key(pet.qr_code)
 
-    async def __create_qr_code_file(self, pet_id: str) -> None:
-        qr_code: bytes = await self.qr_code.generate_qr_code(
-            f"{self.url_config.frontend_url}/found-pet/{pet_id}/qr"
+            if replaced_file is not None:
+                batch.replaced_files.append(replaced_file)
+
+            pet.qr_code = self.__qr_code_url(file_key)
+
+        async with anyio.create_task_group() as task_group:
+            for (pet, file_key), image in zip(outdated, images):
+                task_group.start_soon(upload, pet, file_key, image)
+
+        await uow.flush()
+
+        return batch
+
+    async def delete_qr_code_files(self, file_keys: Sequence[str]) -> None:
+        deletes: asyncio.Semaphore = asyncio.Semaphore(
+            self.qr_config.upload_concurrency
         )
 
+        async def delete(file_key: str) -> None:
+            async with deletes:
+                try:
+                    await self.file_system_gateway.delete_file(
+                        prefix=FileSystemPrefix.QR, file_key=file_key
+                    )
+                except Exception as e:
+                    # Only an orphaned image, nothing points to it anymore
+                    self.logger.warning(f"Error deleting QR code {file_key}: {e}")
+
+        async with anyio.create_task_group() as task_group:
+            for file_key in file_keys:
+                task_group.start_soon(delete, file_key)
+
+    async def __create_qr_code_file(self, pet_id: str) -> str:
+        data: str = self.__qr_code_data(pet_id)
+        file_key: str = self.qr_code.image_key(data)
+
+        qr_code: bytes = await self.qr_code.generate_qr_code(data)
+
         await self.file_system_gateway.save_file(
             prefix=FileSystemPrefix.QR,
-            file_key=pet_id + ".png",
+            file_key=file_key,
             file=qr_code,
         )
 
-    async def regenerate_qr_code(self, _uow: UnitOfWork, pet: Pet) -> None:
-        try:
-            await self.file_system_gateway.delete_file(
-                prefix=FileSystemPrefix.QR,
-                file_key=pet.entity_id + ".png",
-            )
-        except:
-            pass
+        return self.__qr_code_url(file_key)
 
-        await self.__create_qr_code_file(pet_id=pet.entity_id)
+    def __qr_code_data(self, pet_id: str) -> str:
+        return f"{self.url_config.frontend_url}/found-pet/{pet_id}/qr"
 
-        pet.qr_code = (
-            f"{self.url_config.backend_url}/files/"
-            f"{FileSystemPrefix.QR.value}/{pet.entity_id}.png"
-        )
+    def __qr_code_url(self, file_key: str) -> str:
+        return f"{self.__qr_code_url_prefix()}{file_key}"
+
+    def __qr_code_file_key(self, qr_code_url: str | None) -> str | None:
+        # Images uploaded under another backend url are left alone
+        if qr_code_url is None or not qr_code_url.startswith(
+            self.__qr_code_url_prefix()
+        ):
+            return None
+
+        return qr_code_url[len(self.__qr_code_url_prefix()) :]
+
+    def __qr_code_url_prefix(self) -> str:
+        return f"{self.url_config.backend_url}/files/{FileSystemPrefix.QR.value}/"
 
     async def create_pet(
         self,
@@ -131,7 +261,7 @@ class PetService:
         if lost and lost_date is None:
             lost_date = date_now()
 
-        await self.__create_qr_code_file(pet_id=pet_id)
+        qr_code: str = await self.__create_qr_code_file(pet_id=pet_id)
 
         pet: Pet = Pet(
             entity_id=pet_id,
@@ -145,7 +275,7 @@ class PetService:
             lost=lost,
             lost_date=lost_date,
             profile_id=actor_profile.entity_id,
-            qr_code=f"{self.url_config.backend_url}/files/{FileSystemPrefix.QR.value}/{pet_id}.png",
+            qr_code=qr_code,
             picture=picture,
             race=race,
             special_care=special_care,
@@ -154,6 +284,10 @@ class PetService:
 
         await self.pets_repository.add_pet(session=uow.session, pet=pet)
 
+        # Pets registered as lost are listed like the ones reported lost later
+        if lost:
+            self.__issue_pet_lost_event(uow=uow, account=actor_profile.account, pet=pet)
+
         return pet
 
     async def edit_pet(
@@ -240,6 +374,7 @@ class PetService:
         offset: int | None = 0,
         lost: bool | None = None,
         profile_id: str | None = None,
+        cursor: Cursor | None = None,
     ) -> Sequence[Pet]:
         pets: Sequence[Pet] = await self.pets_repository.get_pets(
             session=uow.session,
@@ -247,15 +382,41 @@ class PetService:
             offset=offset,
             lost=lost,
             profile_id=profile_id,
+            cursor=cursor,
         )
 
         return pets
 
-    async def get_all_pets_count(
-        self, uow: UnitOfWork, lost: bool | None = None, profile_id: str | None = None
-    ) -> int:
-        return await self.pets_repository.count_pets(
-            session=uow.session, lost=lost, profile_id=profile_id
+    async def get_pets_after(
+        self, uow: UnitOfWork, entity_id: str | None, limit: int
+    ) -> Sequence[Pet]:
+        return await self.pets_repository.get_pets_after(
+            session=uow.session, entity_id=entity_id, limit=limit
+        )
+
+    async def get_pets_by_ids(
+        self, uow: UnitOfWork, entity_ids: Sequence[str]
+    ) -> Sequence[Pet]:
+        return await self.pets_repository.get_pets_by_ids(
+            session=uow.session, entity_ids=entity_ids
+        )
+
+    async def get_pets_page(
+        self,
+        uow: UnitOfWork,
+        limit: int | None = None,
+        offset: int | None = 0,
+        lost: bool | None = None,
+        profile_id: str | None = None,
+        cursor: Cursor | None = None,
+    ) -> Page[Pet]:
+        return await self.pets_repository.get_pets_page(
+            session=uow.session,
+            limit=limit,
+            offset=offset,
+            lost=lost,
+            profile_id=profile_id,
+            cursor=cursor,
         )
 
     async def delete_pet(self, uow: UnitOfWork, pet: Pet) -> None:
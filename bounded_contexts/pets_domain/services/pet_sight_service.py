@@ -3,13 +3,24 @@ from datetime import datetime
 from typing import Sequence
 from uuid import uuid4
 
-from bounded_contexts.pets_domain.entities import PetSight, Pet
+from bounded_contexts.pets_domain.entities import PetSight, Pet, PetSightDigest
 from bounded_contexts.pets_domain.events import PetSightingEvent
 from bounded_contexts.pets_domain.exceptions import SightForNotLostPetException
 from bounded_contexts.pets_domain.exceptions.pet_sight_not_found_exception import (
     PetSightNotFoundException,
 )
 from bounded_contexts.pets_domain.repositories import PetsSightRepository
+from bounded_contexts.pets_domain.value_objects import PetSightCluster
+from common.exceptions import InvalidGeoAreaException
+from common.geo import (
+    BoundingBox,
+    GeoCircle,
+    MIN_ZOOM,
+    MAX_ZOOM,
+    geohash_length_for_zoom,
+)
+from common.pagination import Cursor, CountMode, Page
+from common.ttl_cache import TTLCache
 from infrastructure.date_utils import datetime_now_tz, float_timestamp
 from infrastructure.uow_abstraction import UnitOfWork
 
@@ -25,8 +36,18 @@ class PetSightData:
 
 
 class PetSightService:
-    def __init__(self, pets_sight_repository: PetsSightRepository) -> None:
+    # Cluster cells are at most this many geohash characters longer than the tiles,
+    # so a tile holds at most 32**2 clusters
+    MAX_CLUSTER_DEPTH: int = 2
+
+    def __init__(
+        self,
+        pets_sight_repository: PetsSightRepository,
+        cluster_cache: TTLCache[tuple[int, str], Sequence[PetSightCluster]],
+    ) -> None:
         self.pets_sight_repository = pets_sight_repository
+        # Clusters of one map tile, keyed by (cluster cell length, tile geohash)
+        self.cluster_cache = cluster_cache
 
     async def create_pet_sight(
         self,
@@ -53,11 +74,11 @@ class PetSightService:
             session=uow.session, pet_sight=pet_sight
         )
 
-        if not is_first_sight:
-            self.__issue_pet_sight_event(
-                uow=uow,
-                pet=pet,
-            )
+        self.__issue_pet_sight_event(
+            uow=uow,
+            pet_sight=pet_sight,
+            first_sight=is_first_sight,
+        )
 
         return pet_sight
 
@@ -80,36 +101,54 @@ class PetSightService:
         offset: int | None = 0,
         pet_id: str | None = None,
         lost: bool | None = None,
+        cursor: Cursor | None = None,
     ) -> Sequence[PetSight]:
         pet_sights: Sequence[
             PetSight
         ] = await self.pets_sight_repository.get_pet_sights(
-            session=uow.session, limit=limit, offset=offset, pet_id=pet_id, lost=lost
+            session=uow.session,
+            limit=limit,
+            offset=offset,
+            pet_id=pet_id,
+            lost=lost,
+            cursor=cursor,
         )
 
         return pet_sights
 
-    async def get_all_pet_sights_count(
-        self, uow: UnitOfWork, pet_id: str | None = None, lost: bool | None = None
-    ) -> int:
-        return await self.pets_sight_repository.count_pet_sights(
-            session=uow.session, pet_id=pet_id, lost=lost
-        )
-
-    async def get_most_recent_lost_pet_sights(
-        self, uow: UnitOfWork, limit: int | None = None, offset: int | None = 0
-    ) -> Sequence[PetSight]:
-        pet_sights: Sequence[
-            PetSight
-        ] = await self.pets_sight_repository.get_most_recent_lost_pet_sights(
-            session=uow.session, limit=limit, offset=offset
+    async def get_pet_sights_page(
+        self,
+        uow: UnitOfWork,
+        limit: int | None = None,
+        offset: int | None = 0,
+        pet_id: str | None = None,
+        lost: bool | None = None,
+        cursor: Cursor | None = None,
+        count_mode: CountMode = CountMode.EXACT,
+        bounding_box: BoundingBox | None = None,
+        circle: GeoCircle | None = None,
+    ) -> Page[PetSight]:
+        return await self.pets_sight_repository.get_pet_sights_page(
+            session=uow.session,
+            limit=limit,
+            offset=offset,
+            pet_id=pet_id,
+            lost=lost,
+            cursor=cursor,
+            count_mode=count_mode,
+            bounding_box=bounding_box,
+            circle=circle,
         )
 
-        return pet_sights
-
-    async def get_most_recent_lost_pet_sights_count(self, uow: UnitOfWork) -> int:
-        return await self.pets_sight_repository.count_most_recent_lost_pet_sights(
-            session=uow.session
+    async def get_most_recent_lost_pet_sights_page(
+        self,
+        uow: UnitOfWork,
+        limit: int | None = None,
+        offset: int | None = 0,
+        cursor: Cursor | None = None,
+    ) -> Page[PetSight]:
+        return await self.pets_sight_repository.get_most_recent_lost_pet_sights_page(
+            session=uow.session, limit=limit, offset=offset, cursor=cursor
         )
 
     async def delete_pet_sights(
@@ -119,6 +158,108 @@ class PetSightService:
             session=uow.session, pet_sights=pet_sights
         )
 
+    async def refresh_last_sight(self, uow: UnitOfWork, pet_id: str) -> None:
+        await self.pets_sight_repository.refresh_last_sight(
+            session=uow.session, pet_id=pet_id
+        )
+
+    async def rebuild_last_sights(self, uow: UnitOfWork) -> int:
+        return await self.pets_sight_repository.rebuild_last_sights(session=uow.session)
+
+    async def add_to_sight_digest(
+        self,
+        uow: UnitOfWork,
+        pet_id: str,
+        latitude: float | None,
+        longitude: float | None,
+        window_seconds: float,
+    ) -> None:
+        """
+        Counts a sighting in the pending digest of the pet, the first sighting after
+        a digest was sent opens a new window of `window_seconds`.
+        """
+
+        await self.pets_sight_repository.add_to_sight_digest(
+            session=uow.session,
+            pet_id=pet_id,
+            latitude=latitude,
+            longitude=longitude,
+            window_seconds=window_seconds,
+        )
+
+    async def claim_due_sight_digests(
+        self, uow: UnitOfWork, limit: int
+    ) -> Sequence[PetSightDigest]:
+        # Removed from the pending digests, they are sent when the uow commits
+        return await self.pets_sight_repository.claim_due_sight_digests(
+            session=uow.session, limit=limit
+        )
+
+    async def get_lost_pet_sight_clusters(
+        self, uow: UnitOfWork, bounding_box: BoundingBox, zoom: int
+    ) -> list[PetSightCluster]:
+        """
+        Sightings of lost pets inside `bounding_box`, grouped into geohash cells
+        sized for the map zoom level.
+
+        The box is snapped to the geohash cells covering it (the map tiles), so
+        panning reuses the clusters of the tiles already seen. Every tile is cached
+        until a sighting inside it is registered or a pet is lost or found.
+        """
+
+        if not MIN_ZOOM <= zoom <= MAX_ZOOM:
+            raise InvalidGeoAreaException(area=f"zoom={zoom}")
+
+        covering_cells: list[str] = bounding_box.geohash_cells()
+        # A viewport too large for its zoom gets coarser clusters instead of more
+        cell_length: int = min(
+            geohash_length_for_zoom(zoom),
+            len(covering_cells[0]) + self.MAX_CLUSTER_DEPTH,
+        )
+        tiles: list[str] = sorted({cell[:cell_length] for cell in covering_cells})
+
+        clusters: list[PetSightCluster] = []
+        missing_tiles: list[str] = []
+
+        for tile in tiles:
+            tile_clusters = self.cluster_cache.get((cell_length, tile))
+
+            if tile_clusters is None:
+                missing_tiles.append(tile)
+            else:
+                clusters.extend(tile_clusters)
+
+        if not missing_tiles:
+            return clusters
+
+        computed_clusters: Sequence[
+            PetSightCluster
+        ] = await self.pets_sight_repository.get_lost_pet_sight_clusters(
+            session=uow.session, cells=missing_tiles, cell_length=cell_length
+        )
+
+        for tile in missing_tiles:
+            tile_clusters = [
+                cluster
+                for cluster in computed_clusters
+                if cluster.cell.startswith(tile)
+            ]
+            self.cluster_cache.set((cell_length, tile), tile_clusters)
+            clusters.extend(tile_clusters)
+
+        return clusters
+
+    def invalidate_lost_pet_sight_clusters(self, geohash: str | None = None) -> None:
+        # Without a location every tile may have changed
+        if geohash is None:
+            self.cluster_cache.clear()
+            return
+
+        sight_geohash: str = geohash
+        self.cluster_cache.invalidate_where(
+            lambda key: sight_geohash.startswith(key[1])
+        )
+
     async def is_first_pet_sight(self, uow: UnitOfWork, pet_id: str) -> bool:
         pet_sights: Sequence[
             PetSight
@@ -134,10 +275,16 @@ class PetSightService:
             raise SightForNotLostPetException(pet_id=pet.entity_id)
 
     @staticmethod
-    def __issue_pet_sight_event(uow: UnitOfWork, pet: Pet) -> None:
+    def __issue_pet_sight_event(
+        uow: UnitOfWork, pet_sight: PetSight, first_sight: bool
+    ) -> None:
         uow.emit_event(
             PetSightingEvent(
                 issued=float_timestamp(),
-                pet_id=pet.entity_id,
+                pet_id=pet_sight.pet_id,
+                first_sight=first_sight,
+                geohash=pet_sight.geohash,
+                latitude=pet_sight.latitude,
+                longitude=pet_sight.longitude,
             )
         )
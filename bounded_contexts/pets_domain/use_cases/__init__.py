@@ -5,6 +5,7 @@ from .register_pet_sight_use_case import RegisterPetSightUseCase
 from .get_pet import GetPetUseCase
 from .get_pets import GetPetsUseCase
 from .get_pet_sights import GetPetSightsUseCase
+from .get_pet_sight_clusters import GetPetSightClustersUseCase
 from .get_most_recent_lost_pet_sights import GetMostRecentLostPetSightsUseCase
 from .delete_pet import DeletePetUseCase
 from .regenerate_qr_codes import RegenerateQrCodesUseCase
@@ -1,10 +1,10 @@
 from dataclasses import dataclass
-from typing import Sequence
 
 from bounded_contexts.pets_domain.entities import PetSight
 from bounded_contexts.pets_domain.services import PetSightService
 from bounded_contexts.pets_domain.views import PetSightViewFactory
 from bounded_contexts.pets_domain.views.pet_sight_view import PetSightListView
+from common.pagination import Page, decode_optional_cursor, get_next_cursor
 from common.use_case import BaseUseCase
 from infrastructure.database import RepositoryUtils
 from infrastructure.uow_abstraction import UnitOfWork, unit_of_work
@@ -15,6 +15,7 @@ class GetMostRecentLostPetSightsUseCase(BaseUseCase):
     class Request:
         limit: int | None
         offset: int | None
+        cursor: str | None = None
 
     def __init__(
         self,
@@ -31,16 +32,22 @@ class GetMostRecentLostPetSightsUseCase(BaseUseCase):
 
     @unit_of_work
     async def execute(self, request: Request, uow: UnitOfWork) -> PetSightListView:
-        pet_sights: Sequence[
+        page: Page[
             PetSight
-        ] = await self.pet_sight_service.get_most_recent_lost_pet_sights(
-            uow=uow, limit=request.limit, offset=request.offset
-        )
-
-        total_count: int = (
-            await self.pet_sight_service.get_most_recent_lost_pet_sights_count(uow=uow)
+        ] = await self.pet_sight_service.get_most_recent_lost_pet_sights_page(
+            uow=uow,
+            limit=request.limit,
+            offset=request.offset,
+            cursor=decode_optional_cursor(request.cursor),
         )
+        pet_sights = page.items
 
         return self.pet_sight_view_factory.create_pet_sight_list_view(
-            pet_sights=pet_sights, total_count=total_count
+            pet_sights=pet_sights,
+            total_count=page.total_count,
+            next_cursor=get_next_cursor(
+                items=pet_sights,
+                limit=request.limit,
+                sort_key=lambda pet_sight: pet_sight.created_at,
+            ),
         )
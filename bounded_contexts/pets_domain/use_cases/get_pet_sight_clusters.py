@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+
+from bounded_contexts.pets_domain.services import PetSightService
+from bounded_contexts.pets_domain.views import PetSightViewFactory
+from bounded_contexts.pets_domain.views.pet_sight_view import PetSightClusterListView
+from common.geo import BoundingBox
+from common.use_case import BaseUseCase
+from infrastructure.database import RepositoryUtils
+from infrastructure.uow_abstraction import UnitOfWork, unit_of_work
+
+
+class GetPetSightClustersUseCase(BaseUseCase):
+    @dataclass
+    class Request:
+        zoom: int
+        # "west,south,east,north", the whole world when missing
+        bbox: str | None = None
+
+    def __init__(
+        self,
+        repository_utils: RepositoryUtils,
+        pet_sight_service: PetSightService,
+        pet_sight_view_factory: PetSightViewFactory,
+    ) -> None:
+        super().__init__(
+            repository_utils=repository_utils,
+        )
+
+        self.pet_sight_service = pet_sight_service
+        self.pet_sight_view_factory = pet_sight_view_factory
+
+    @unit_of_work
+    async def execute(
+        self, request: Request, uow: UnitOfWork
+    ) -> PetSightClusterListView:
+        bounding_box: BoundingBox = (
+            BoundingBox.parse(request.bbox) if request.bbox else BoundingBox.world()
+        )
+
+        clusters = await self.pet_sight_service.get_lost_pet_sight_clusters(
+            uow=uow, bounding_box=bounding_box, zoom=request.zoom
+        )
+
+        return self.pet_sight_view_factory.create_pet_sight_cluster_list_view(
+            clusters=clusters, zoom=request.zoom
+        )
@@ -1,10 +1,16 @@
 from dataclasses import dataclass
-from typing import Sequence
 
 from bounded_contexts.pets_domain.entities import PetSight
 from bounded_contexts.pets_domain.services import PetSightService
 from bounded_contexts.pets_domain.views import PetSightViewFactory
 from bounded_contexts.pets_domain.views.pet_sight_view import PetSightListView
+from common.geo import parse_optional_bounding_box, parse_optional_circle
+from common.pagination import (
+    CountMode,
+    Page,
+    decode_optional_cursor,
+    get_next_cursor,
+)
 from common.use_case import BaseUseCase
 from infrastructure.database import RepositoryUtils
 from infrastructure.uow_abstraction import UnitOfWork, unit_of_work
@@ -17,6 +23,13 @@ class GetPetSightsUseCase(BaseUseCase):
         offset: int | None
         pet_id: str | None = None
         lost: bool | None = None
+        cursor: str | None = None
+        estimated_count: bool = False
+        # "west,south,east,north"
+        bbox: str | None = None
+        # "latitude,longitude", together with radius_km
+        near: str | None = None
+        radius_km: float | None = None
 
     def __init__(
         self,
@@ -33,20 +46,29 @@ class GetPetSightsUseCase(BaseUseCase):
 
     @unit_of_work
     async def execute(self, request: Request, uow: UnitOfWork) -> PetSightListView:
-        pet_sights: Sequence[
-            PetSight
-        ] = await self.pet_sight_service.get_all_pet_sights(
+        page: Page[PetSight] = await self.pet_sight_service.get_pet_sights_page(
             uow=uow,
             limit=request.limit,
             offset=request.offset,
             pet_id=request.pet_id,
             lost=request.lost,
+            cursor=decode_optional_cursor(request.cursor),
+            count_mode=CountMode.ESTIMATED
+            if request.estimated_count
+            else CountMode.EXACT,
+            bounding_box=parse_optional_bounding_box(request.bbox),
+            circle=parse_optional_circle(
+                near=request.near, radius_km=request.radius_km
+            ),
         )
-
-        total_count: int = await self.pet_sight_service.get_all_pet_sights_count(
-            uow=uow, pet_id=request.pet_id, lost=request.lost
-        )
+        pet_sights = page.items
 
         return self.pet_sight_view_factory.create_pet_sight_list_view(
-            pet_sights=pet_sights, total_count=total_count
+            pet_sights=pet_sights,
+            total_count=page.total_count,
+            next_cursor=get_next_cursor(
+                items=pet_sights,
+                limit=request.limit,
+                sort_key=lambda pet_sight: pet_sight.created_at,
+            ),
         )
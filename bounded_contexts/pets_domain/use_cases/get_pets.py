@@ -5,7 +5,9 @@ from bounded_contexts.pets_domain.entities import Pet
 from bounded_contexts.pets_domain.services import PetService
 from bounded_contexts.pets_domain.use_cases import BasePetsUseCase
 from bounded_contexts.pets_domain.views import PetViewFactory, PetListView
+from bounded_contexts.social_domain.entities import BaseProfile
 from bounded_contexts.social_domain.services.profile_service import ProfileService
+from common.pagination import Page, decode_optional_cursor, get_next_cursor
 from infrastructure.database import RepositoryUtils
 from infrastructure.uow_abstraction import UnitOfWork, unit_of_work
 
@@ -17,6 +19,7 @@ class GetPetsUseCase(BasePetsUseCase):
         offset: int | None
         lost: bool | None
         profile_id: str | None
+        cursor: str | None = None
 
     def __init__(
         self,
@@ -35,21 +38,24 @@ class GetPetsUseCase(BasePetsUseCase):
 
     @unit_of_work
     async def execute(self, request: Request, uow: UnitOfWork) -> PetListView:
-        pets: Sequence[Pet] = await self.pet_service.get_all_pets(
+        page: Page[Pet] = await self.pet_service.get_pets_page(
             uow=uow,
             limit=request.limit,
             offset=request.offset,
             lost=request.lost,
             profile_id=request.profile_id,
+            cursor=decode_optional_cursor(request.cursor),
         )
-        total_count: int = await self.pet_service.get_all_pets_count(
-            uow=uow, lost=request.lost, profile_id=request.profile_id
-        )
+        pets = page.items
 
         pets_dict = await self.get_extra_info_for_pets(uow=uow, pets=pets)
 
         return self.pet_view_factory.create_pet_list_view(
-            pets=pets_dict, total_count=total_count
+            pets=pets_dict,
+            total_count=page.total_count,
+            next_cursor=get_next_cursor(
+                items=pets, limit=request.limit, sort_key=lambda pet: pet.animal_name
+            ),
         )
 
     async def get_extra_info_for_pets(
@@ -57,10 +63,14 @@ class GetPetsUseCase(BasePetsUseCase):
         uow: UnitOfWork,
         pets: Sequence[Pet],
     ) -> Dict[Pet, str]:
-        pets_dict = {}
-        for pet in pets:
-            owner = await self.profile_service.get_profile(
-                uow=uow, entity_id=pet.profile_id
-            )
-            pets_dict[pet] = owner.first_name + " " + owner.surname
-        return pets_dict
+        owners: Sequence[
+            BaseProfile
+        ] = await self.profile_service.get_multiple_profiles_by_id(
+            uow=uow, profile_ids=list({pet.profile_id for pet in pets})
+        )
+
+        owner_names: dict[str, str] = {
+            owner.entity_id: owner.first_name + " " + owner.surname for owner in owners
+        }
+
+        return {pet: owner_names[pet.profile_id] for pet in pets}
@@ -1,18 +1,49 @@
+import logging
+import time
+from dataclasses import dataclass
+from typing import Sequence
+
+from bounded_contexts.pets_domain.entities import Pet, QrRegenerationCheckpoint
 from bounded_contexts.pets_domain.services import PetService
 from bounded_contexts.pets_domain.use_cases import BasePetsUseCase
+from bounded_contexts.pets_domain.value_objects import QrRegenerationBatch
 from bounded_contexts.pets_domain.views import PetViewFactory
 from bounded_contexts.social_domain.services.profile_service import ProfileService
+from config import QRConfig
 from infrastructure.database import RepositoryUtils
-from infrastructure.uow_abstraction import unit_of_work, UnitOfWork
+from infrastructure.uow_abstraction import UnitOfWork, make_unit_of_work
 
 
 class RegenerateQrCodesUseCase(BasePetsUseCase):
+    """
+    Regenerates the QR codes whose image is not the one of the current style and
+    urls, in batches of qr.batch_size pets scanned by id. Every batch commits with a
+    checkpoint, so calling it again after an interruption resumes where it stopped.
+    Pets whose upload failed are recorded in the checkpoint and retried once the
+    scan is over.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    @dataclass
+    class Response:
+        # Counts of the whole regeneration, resumed runs included
+        scanned: int
+        rendered: int
+        skipped: int
+        failed: int
+        resumed: bool
+        # Of this run only
+        elapsed_seconds: float
+        pets_per_second: float
+
     def __init__(
         self,
         repository_utils: RepositoryUtils,
         pet_service: PetService,
         pet_view_factory: PetViewFactory,
         profile_service: ProfileService,
+        qr_config: QRConfig,
     ) -> None:
         super().__init__(
             repository_utils=repository_utils,
@@ -20,10 +51,93 @@ class RegenerateQrCodesUseCase(BasePetsUseCase):
             pet_view_factory=pet_view_factory,
         )
         self.profile_service = profile_service
+        self.qr_config = qr_config
+
+    async def execute(self) -> Response:
+        started_at: float = time.perf_counter()
+        scanned: int = 0
+
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            checkpoint: QrRegenerationCheckpoint = (
+                await self.pet_service.start_qr_regeneration(uow=uow)
+            )
+            generation: str = checkpoint.generation
+            resumed: bool = checkpoint.last_pet_id is not None
+
+        while not checkpoint.finished:
+            async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+                current: QrRegenerationCheckpoint | None = (
+                    await self.pet_service.get_qr_regeneration_checkpoint(
+                        uow=uow, generation=generation
+                    )
+                )
+
+                # Finished by a concurrent regeneration meanwhile
+                if current is None or current.finished:
+                    break
+
+                checkpoint = current
+
+                pets: Sequence[Pet] = await self.pet_service.get_pets_after(
+                    uow=uow,
+                    entity_id=checkpoint.last_pet_id,
+                    limit=self.qr_config.batch_size,
+                )
+
+                batch: QrRegenerationBatch = await self.pet_service.regenerate_qr_codes(
+                    uow=uow, pets=pets
+                )
+
+                if pets:
+                    checkpoint.record_batch(
+                        last_pet_id=pets[-1].entity_id,
+                        scanned=len(pets),
+                        rendered=batch.rendered,
+                        skipped=batch.skipped,
+                        failed_pet_ids=batch.failed_pet_ids,
+                    )
+
+                replaced_files: list[str] = batch.replaced_files
+
+                if len(pets) < self.qr_config.batch_size:
+                    # End of the scan, the failed pets get one more attempt
+                    retry: QrRegenerationBatch = await self.__retry_failed_pets(
+                        uow=uow, checkpoint=checkpoint
+                    )
+                    checkpoint.finish(
+                        rendered=retry.rendered, failed_pet_ids=retry.failed_pet_ids
+                    )
+                    replaced_files += retry.replaced_files
+
+            await self.pet_service.delete_qr_code_files(replaced_files)
+
+            scanned += len(pets)
+            self.logger.info(
+                f"QR codes: {checkpoint.scanned} scanned, {checkpoint.rendered} "
+                f"rendered, {checkpoint.skipped} skipped, {checkpoint.failed} failed, "
+                f"{self.__per_second(scanned, started_at):.0f} pets/s"
+            )
+
+        return self.Response(
+            scanned=checkpoint.scanned,
+            rendered=checkpoint.rendered,
+            skipped=checkpoint.skipped,
+            failed=checkpoint.failed,
+            resumed=resumed,
+            elapsed_seconds=time.perf_counter() - started_at,
+            pets_per_second=self.__per_second(scanned, started_at),
+        )
+
+    async def __retry_failed_pets(
+        self, uow: UnitOfWork, checkpoint: QrRegenerationCheckpoint
+    ) -> QrRegenerationBatch:
+        # Deleted pets are not returned, they are dropped from the failures
+        pets: Sequence[Pet] = await self.pet_service.get_pets_by_ids(
+            uow=uow, entity_ids=checkpoint.failed_pet_ids
+        )
 
-    @unit_of_work
-    async def execute(self, uow: UnitOfWork) -> None:
-        pets = await self.pet_service.get_all_pets(uow=uow)
+        return await self.pet_service.regenerate_qr_codes(uow=uow, pets=pets)
 
-        for pet in pets:
-            await self.pet_service.regenerate_qr_code(uow, pet=pet)
+    @staticmethod
+    def __per_second(count: int, started_at: float) -> float:
+        return count / max(time.perf_counter() - started_at, 1e-9)
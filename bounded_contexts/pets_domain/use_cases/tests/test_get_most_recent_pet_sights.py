@@ -14,7 +14,7 @@ from bounded_contexts.social_domain.entities import (
 )
 from common.testing import BaseUseCaseTest
 from common.testing.base_testing_utils import BaseTestingUtils
-from infrastructure.uow_abstraction import unit_of_work, UnitOfWork
+from infrastructure.uow_abstraction import unit_of_work, UnitOfWork, make_unit_of_work
 
 
 class TestGetMostRecentPetSightsUseCase(BaseUseCaseTest, BaseTestingUtils):
@@ -181,3 +181,20 @@ class TestGetMostRecentPetSightsUseCase(BaseUseCaseTest, BaseTestingUtils):
                 ),
             )
             index_offset += 1
+
+    async def test_get_pet_sights_after_rebuilding_last_sights(self) -> None:
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            rebuilt: int = await self.pet_sight_service.rebuild_last_sights(uow=uow)
+
+        self.assertEqual(len(self.pet_sights), rebuilt)
+
+        list_view: PetSightListView = await self.use_case.execute(
+            GetMostRecentLostPetSightsUseCase.Request(
+                limit=self.TEST_NO_LIMIT, offset=self.TEST_OFFSET_ZERO
+            )
+        )
+
+        self.assertEqual(
+            [pet_sight.entity_id for pet_sight in self.pet_sights],
+            [pet_sight.entity_id for pet_sight in list_view.items],
+        )
@@ -0,0 +1,80 @@
+from bounded_contexts.pets_domain.use_cases.get_pet_sight_clusters import (
+    GetPetSightClustersUseCase,
+)
+from bounded_contexts.pets_domain.views.pet_sight_view import PetSightClusterListView
+from common.exceptions import InvalidGeoAreaException
+from common.testing import BaseUseCaseTest
+from common.testing.base_testing_utils import BaseTestingUtils
+from infrastructure.uow_abstraction import unit_of_work, UnitOfWork, make_unit_of_work
+
+
+class TestGetPetSightClustersUseCase(BaseUseCaseTest, BaseTestingUtils):
+    # Montevideo, a city sized viewport
+    TEST_BBOX = "-56.25,-34.95,-56.10,-34.85"
+    TEST_CITY_ZOOM = 12
+    TEST_COUNTRY_ZOOM = 6
+
+    @unit_of_work
+    async def initial_data(self, uow: UnitOfWork) -> None:
+        self.profile = await self.create_profile(uow=uow)
+        self.lost_pet_data = (
+            await self.create_pet(uow=uow, actor_profile=self.profile, lost=True)
+        ).pet_data
+
+        for latitude, longitude in [(-34.9011, -56.1645), (-34.9012, -56.1646)]:
+            await self.create_pet_sight(
+                uow=uow,
+                pet_id=self.lost_pet_data.entity_id,
+                account_id=self.profile.account_id,
+                latitude=latitude,
+                longitude=longitude,
+            )
+
+    async def setUp(self) -> None:
+        await BaseUseCaseTest.setUp(self)
+
+        self.use_case: GetPetSightClustersUseCase = self.dependencies.resolve(
+            GetPetSightClustersUseCase
+        )
+
+        await self.initial_data()
+
+    async def test_get_pet_sight_clusters_success(self) -> None:
+        list_view: PetSightClusterListView = await self.use_case.execute(
+            GetPetSightClustersUseCase.Request(
+                zoom=self.TEST_COUNTRY_ZOOM, bbox=self.TEST_BBOX
+            )
+        )
+
+        self.assertEqual(1, len(list_view.items))
+        self.assertEqual(2, list_view.items[0].count)
+        self.assertAlmostEqual(-34.90115, list_view.items[0].latitude)
+        self.assertAlmostEqual(-56.16455, list_view.items[0].longitude)
+
+    async def test_get_pet_sight_clusters_after_new_sight(self) -> None:
+        request = GetPetSightClustersUseCase.Request(
+            zoom=self.TEST_CITY_ZOOM, bbox=self.TEST_BBOX
+        )
+        list_view: PetSightClusterListView = await self.use_case.execute(request)
+
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            await self.create_pet_sight(
+                uow=uow,
+                pet_id=self.lost_pet_data.entity_id,
+                account_id=self.profile.account_id,
+                latitude=-34.9013,
+                longitude=-56.1647,
+            )
+
+        new_list_view: PetSightClusterListView = await self.use_case.execute(request)
+
+        self.assertEqual(
+            sum(cluster.count for cluster in list_view.items) + 1,
+            sum(cluster.count for cluster in new_list_view.items),
+        )
+
+    async def test_get_pet_sight_clusters_invalid_zoom(self) -> None:
+        with self.assertRaises(InvalidGeoAreaException):
+            await self.use_case.execute(
+                GetPetSightClustersUseCase.Request(zoom=30, bbox=self.TEST_BBOX)
+            )
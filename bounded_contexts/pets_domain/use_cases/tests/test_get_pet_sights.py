@@ -9,9 +9,10 @@ from bounded_contexts.social_domain.entities.animal import (
 )
 from bounded_contexts.pets_domain.use_cases.get_pet_sights import GetPetSightsUseCase
 from bounded_contexts.pets_domain.views.pet_sight_view import PetSightListView
+from common.exceptions import InvalidGeoAreaException
 from common.testing import BaseUseCaseTest
 from common.testing.base_testing_utils import BaseTestingUtils
-from infrastructure.uow_abstraction import unit_of_work, UnitOfWork
+from infrastructure.uow_abstraction import unit_of_work, UnitOfWork, make_unit_of_work
 
 
 class TestGetPetSightsUseCase(BaseUseCaseTest, BaseTestingUtils):
@@ -202,3 +203,112 @@ class TestGetPetSightsUseCase(BaseUseCaseTest, BaseTestingUtils):
                     list_view.items[i].account_id,
                 ),
             )
+
+    async def test_get_pet_sights_in_bounding_box_and_radius(self) -> None:
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            # Montevideo and Buenos Aires
+            montevideo_sight = await self.create_pet_sight(
+                uow=uow,
+                pet_id=self.lost_pet_data1.entity_id,
+                account_id=self.profile.account_id,
+                latitude=-34.9011,
+                longitude=-56.1645,
+            )
+            await self.create_pet_sight(
+                uow=uow,
+                pet_id=self.lost_pet_data1.entity_id,
+                account_id=self.profile.account_id,
+                latitude=-34.6037,
+                longitude=-58.3816,
+            )
+
+        bbox_view: PetSightListView = await self.use_case.execute(
+            GetPetSightsUseCase.Request(
+                limit=None,
+                offset=self.TEST_OFFSET_ZERO,
+                bbox="-56.4,-35.0,-56.0,-34.7",
+            )
+        )
+        near_view: PetSightListView = await self.use_case.execute(
+            GetPetSightsUseCase.Request(
+                limit=None,
+                offset=self.TEST_OFFSET_ZERO,
+                near="-34.9,-56.16",
+                radius_km=5,
+            )
+        )
+
+        for list_view in (bbox_view, near_view):
+            self.assertEqual(1, list_view.total_count)
+            self.assertEqual(montevideo_sight.entity_id, list_view.items[0].entity_id)
+
+    async def test_get_pet_sights_in_bounding_box_within_radius(self) -> None:
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            # Both inside the radius, only the first inside the viewport
+            viewport_sight = await self.create_pet_sight(
+                uow=uow,
+                pet_id=self.lost_pet_data1.entity_id,
+                account_id=self.profile.account_id,
+                latitude=-34.9011,
+                longitude=-56.1645,
+            )
+            await self.create_pet_sight(
+                uow=uow,
+                pet_id=self.lost_pet_data1.entity_id,
+                account_id=self.profile.account_id,
+                latitude=-34.8800,
+                longitude=-56.0500,
+            )
+
+        list_view: PetSightListView = await self.use_case.execute(
+            GetPetSightsUseCase.Request(
+                limit=None,
+                offset=self.TEST_OFFSET_ZERO,
+                bbox="-56.2,-35.0,-56.1,-34.8",
+                near="-34.9,-56.16",
+                radius_km=20,
+            )
+        )
+
+        self.assertEqual(1, list_view.total_count)
+        self.assertEqual(viewport_sight.entity_id, list_view.items[0].entity_id)
+
+    async def test_get_pet_sights_in_radius_across_the_antimeridian(self) -> None:
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            # Each a few km away from the center, on the other side of ±180
+            east_sight = await self.create_pet_sight(
+                uow=uow,
+                pet_id=self.lost_pet_data1.entity_id,
+                account_id=self.profile.account_id,
+                latitude=-17.0,
+                longitude=179.95,
+            )
+            west_sight = await self.create_pet_sight(
+                uow=uow,
+                pet_id=self.lost_pet_data1.entity_id,
+                account_id=self.profile.account_id,
+                latitude=-17.0,
+                longitude=-179.95,
+            )
+
+        list_view: PetSightListView = await self.use_case.execute(
+            GetPetSightsUseCase.Request(
+                limit=None,
+                offset=self.TEST_OFFSET_ZERO,
+                near="-17.0,179.99",
+                radius_km=20,
+            )
+        )
+
+        self.assertEqual(
+            {east_sight.entity_id, west_sight.entity_id},
+            {pet_sight.entity_id for pet_sight in list_view.items},
+        )
+
+    async def test_get_pet_sights_invalid_bounding_box(self) -> None:
+        with self.assertRaises(InvalidGeoAreaException):
+            await self.use_case.execute(
+                GetPetSightsUseCase.Request(
+                    limit=None, offset=self.TEST_OFFSET_ZERO, bbox="-56.0,-35.0,-57.0"
+                )
+            )
@@ -6,6 +6,7 @@ from bounded_contexts.social_domain.entities.animal import (
 from bounded_contexts.pets_domain.services import PetData, PetService
 from bounded_contexts.pets_domain.use_cases import GetPetsUseCase
 from bounded_contexts.pets_domain.views import PetListView
+from common.exceptions import InvalidCursorException
 from common.testing import BaseUseCaseTest
 from common.testing.base_testing_utils import BaseTestingUtils, PetDataForTesting
 from infrastructure.uow_abstraction import unit_of_work, UnitOfWork, make_unit_of_work
@@ -267,6 +268,19 @@ class TestGetPetsUseCase(BaseUseCaseTest, BaseTestingUtils):
             )
             index_offset += 1
 
+    async def test_get_pets_pagination_past_last_page(self) -> None:
+        list_view: PetListView = await self.use_case.execute(
+            GetPetsUseCase.Request(
+                limit=self.TEST_LIMIT,
+                offset=len(self.pets),
+                lost=None,
+                profile_id=None,
+            )
+        )
+
+        self.assertEqual([], list_view.items)
+        self.assertEqual(len(self.pets), list_view.total_count)
+
     async def test_get_lost_pets(self) -> None:
         list_view: PetListView = await self.use_case.execute(
             GetPetsUseCase.Request(
@@ -456,3 +470,43 @@ class TestGetPetsUseCase(BaseUseCaseTest, BaseTestingUtils):
                     list_view.items[i].special_care,
                 ),
             )
+
+    async def test_get_pets_pagination_with_cursor(self) -> None:
+        entity_ids: list[str] = []
+        cursor: str | None = None
+
+        while True:
+            list_view: PetListView = await self.use_case.execute(
+                GetPetsUseCase.Request(
+                    limit=self.TEST_LIMIT,
+                    offset=self.TEST_OFFSET_ZERO,
+                    lost=None,
+                    profile_id=None,
+                    cursor=cursor,
+                )
+            )
+
+            self.assertEqual(len(self.pets), list_view.total_count)
+            entity_ids.extend(pet.entity_id for pet in list_view.items)
+
+            if list_view.next_cursor is None:
+                break
+
+            cursor = list_view.next_cursor
+
+        self.assertEqual(
+            [pet.pet_data.entity_id for pet in self.pets],
+            entity_ids,
+        )
+
+    async def test_get_pets_with_invalid_cursor(self) -> None:
+        with self.assertRaises(InvalidCursorException):
+            await self.use_case.execute(
+                GetPetsUseCase.Request(
+                    limit=self.TEST_LIMIT,
+                    offset=self.TEST_OFFSET_ZERO,
+                    lost=None,
+                    profile_id=None,
+                    cursor="not a cursor",
+                )
+            )
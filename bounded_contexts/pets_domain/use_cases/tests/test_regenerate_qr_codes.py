@@ -0,0 +1,101 @@
+from unittest.mock import AsyncMock, patch
+
+from sqlalchemy import update
+
+from bounded_contexts.pets_domain.entities import Pet
+from bounded_contexts.pets_domain.use_cases import RegenerateQrCodesUseCase
+from common.testing import BaseUseCaseTest
+from common.testing.base_testing_utils import BaseTestingUtils
+from infrastructure.uow_abstraction import make_unit_of_work, UnitOfWork, unit_of_work
+
+
+class TestRegenerateQrCodes(BaseUseCaseTest, BaseTestingUtils):
+    @unit_of_work
+    async def initial_data(self, uow: UnitOfWork) -> None:
+        self.profile = await self.create_profile(uow=uow)
+        self.pets = [
+            await self.create_pet(uow=uow, actor_profile=self.profile) for _ in range(3)
+        ]
+
+    async def setUp(self) -> None:
+        await BaseUseCaseTest.setUp(self)
+
+        self.regenerate_qr_codes: RegenerateQrCodesUseCase = self.dependencies.resolve(
+            RegenerateQrCodesUseCase
+        )
+
+        await self.initial_data()
+
+    async def test_regenerate_qr_codes_skips_unchanged_codes(self) -> None:
+        response = await self.regenerate_qr_codes.execute()
+
+        self.assertEqual(3, response.scanned)
+        self.assertEqual(0, response.rendered)
+        self.assertEqual(3, response.skipped)
+
+    async def test_regenerate_qr_codes_renders_outdated_codes(self) -> None:
+        outdated_pet_id: str = self.pets[0].pet_data.entity_id
+
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            await uow.session.execute(
+                update(Pet)
+                .where(Pet.entity_id == outdated_pet_id)  # type: ignore
+                .values(qr_code=f"https://.../files/QR/{outdated_pet_id}.png")
+            )
+
+        response = await self.regenerate_qr_codes.execute()
+
+        self.assertEqual(1, response.rendered)
+        self.assertEqual(2, response.skipped)
+        self.assertEqual(0, response.failed)
+        self.assertFalse(response.resumed)
+
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            pet: Pet = await self.pet_service.get_pet_by_id(
+                uow=uow, entity_id=outdated_pet_id
+            )
+
+        # Stored under the hash of its content instead of the pet id
+        self.assertNotIn(outdated_pet_id, pet.qr_code)
+
+        # A second run finds nothing to render
+        response = await self.regenerate_qr_codes.execute()
+
+        self.assertEqual(0, response.rendered)
+        self.assertEqual(3, response.skipped)
+
+    async def test_regenerate_qr_codes_retries_failed_uploads(self) -> None:
+        outdated_pet_id: str = self.pets[0].pet_data.entity_id
+        outdated_qr_code: str = f"https://.../files/QR/{outdated_pet_id}.png"
+
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            await uow.session.execute(
+                update(Pet)
+                .where(Pet.entity_id == outdated_pet_id)  # type: ignore
+                .values(qr_code=outdated_qr_code)
+            )
+
+        with patch.object(
+            self.pet_service.file_system_gateway,
+            "save_file",
+            new_callable=AsyncMock,
+            side_effect=ConnectionError("storage unavailable"),
+        ) as save_file:
+            response = await self.regenerate_qr_codes.execute()
+
+        # Failed in the scan and once more at its end
+        self.assertEqual(2, save_file.await_count)
+        self.assertEqual(1, response.failed)
+
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            pet: Pet = await self.pet_service.get_pet_by_id(
+                uow=uow, entity_id=outdated_pet_id
+            )
+
+        self.assertEqual(outdated_qr_code, pet.qr_code)
+
+        # The failed pet is rendered by the next run
+        response = await self.regenerate_qr_codes.execute()
+
+        self.assertEqual(1, response.rendered)
+        self.assertEqual(0, response.failed)
@@ -0,0 +1,3 @@
+from .pet_sight_cluster import PetSightCluster
+from .pet_owner_contact import PetOwnerContact
+from .qr_regeneration_batch import QrRegenerationBatch
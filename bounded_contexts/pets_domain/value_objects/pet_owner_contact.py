@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PetOwnerContact:
+    # Who is emailed about the sightings of a pet
+    email: str
+    first_name: str
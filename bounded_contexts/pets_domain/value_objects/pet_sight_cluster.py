@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PetSightCluster:
+    # Sightings of lost pets inside one geohash cell, placed at their centroid
+    cell: str
+    count: int
+    latitude: float
+    longitude: float
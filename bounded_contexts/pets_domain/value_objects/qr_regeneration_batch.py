@@ -0,0 +1,12 @@
+from dataclasses import dataclass, field
+
+
+@dataclass
+class QrRegenerationBatch:
+    # Outcome of regenerating the QR codes of one batch of pets
+    rendered: int = 0
+    skipped: int = 0
+    # Pets whose new image could not be uploaded, they keep the previous one
+    failed_pet_ids: list[str] = field(default_factory=list)
+    # Keys of the images replaced by the batch, deleted once it commits
+    replaced_files: list[str] = field(default_factory=list)
@@ -3,6 +3,7 @@ from typing import Sequence
 
 from pydantic import BaseModel
 from bounded_contexts.pets_domain.entities import PetSight
+from bounded_contexts.pets_domain.value_objects import PetSightCluster
 
 
 class PetSightView(BaseModel):
@@ -17,6 +18,19 @@ class PetSightView(BaseModel):
 class PetSightListView(BaseModel):
     items: Sequence[PetSightView]
     total_count: int
+    next_cursor: str | None = None
+
+
+class PetSightClusterView(BaseModel):
+    cell: str
+    count: int
+    latitude: float
+    longitude: float
+
+
+class PetSightClusterListView(BaseModel):
+    items: Sequence[PetSightClusterView]
+    zoom: int
 
 
 class PetSightViewFactory:
@@ -33,7 +47,9 @@ class PetSightViewFactory:
 
     @staticmethod
     def create_pet_sight_list_view(
-        pet_sights: Sequence[PetSight], total_count: int
+        pet_sights: Sequence[PetSight],
+        total_count: int,
+        next_cursor: str | None = None,
     ) -> PetSightListView:
         pet_sights_list_view: list[PetSightView] = []
 
@@ -41,4 +57,25 @@ class PetSightViewFactory:
             pet_sights_list_view.append(
                 PetSightViewFactory.create_pet_sight_view(pet_sight=pet_sight)
             )
-        return PetSightListView(items=pet_sights_list_view, total_count=total_count)
+        return PetSightListView(
+            items=pet_sights_list_view,
+            total_count=total_count,
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def create_pet_sight_cluster_list_view(
+        clusters: Sequence[PetSightCluster], zoom: int
+    ) -> PetSightClusterListView:
+        return PetSightClusterListView(
+            items=[
+                PetSightClusterView(
+                    cell=cluster.cell,
+                    count=cluster.count,
+                    latitude=cluster.latitude,
+                    longitude=cluster.longitude,
+                )
+                for cluster in clusters
+            ],
+            zoom=zoom,
+        )
@@ -47,6 +47,7 @@ class PetAndOwnerView(BaseModel):
 class PetListView(BaseModel):
     items: Sequence[PetView]
     total_count: int
+    next_cursor: str | None = None
 
 
 class PetAndOwnerListView(BaseModel):
@@ -81,14 +82,18 @@ class PetViewFactory:
         )
 
     @staticmethod
-    def create_pet_list_view(pets: Dict[Pet, str], total_count: int) -> PetListView:
+    def create_pet_list_view(
+        pets: Dict[Pet, str], total_count: int, next_cursor: str | None = None
+    ) -> PetListView:
         pets_list_view: list[PetView] = []
 
         for pet, owner_name in pets.items():
             pets_list_view.append(
                 PetViewFactory.create_pet_view(pet=pet, owner_name=owner_name)
             )
-        return PetListView(items=pets_list_view, total_count=total_count)
+        return PetListView(
+            items=pets_list_view, total_count=total_count, next_cursor=next_cursor
+        )
 
     @staticmethod
     def create_pet_and_owner_view(
@@ -1,2 +1,5 @@
 from .adopted_animal import AdoptedAnimal
 from .collected_money import CollectedMoney
+from .report_bucket_totals import ReportBucketTotals
+from .report_period import ReportPeriod
+from .report_cache_stats import ReportCacheStats
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass(frozen=True)
+class ReportBucketTotals:
+    """
+    Totals of a report over the day, week or month starting on `bucket_start`:
+    adoptions, donations or sightings, and the money collected by the donations.
+    """
+
+    bucket_start: date
+    count: int
+    amount: float | None = None
+    application_amount: float | None = None
@@ -0,0 +1,35 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ReportCacheStats:
+    """
+    Lookups of the report cache since the worker started, answered by its own
+    cache, by the shared cache, or loaded from the database.
+    """
+
+    local_hits: int
+    shared_hits: int
+    loads: int
+    entries: int
+
+    @property
+    def lookups(self) -> int:
+        return self.local_hits + self.shared_hits + self.loads
+
+    @property
+    def hit_ratio(self) -> float:
+        return (
+            (self.local_hits + self.shared_hits) / self.lookups if self.lookups else 0.0
+        )
+
+    @property
+    def local_hit_ratio(self) -> float:
+        return self.local_hits / self.lookups if self.lookups else 0.0
+
+    @property
+    def shared_hit_ratio(self) -> float:
+        # Over the lookups that missed the worker cache
+        shared_lookups: int = self.shared_hits + self.loads
+
+        return self.shared_hits / shared_lookups if shared_lookups else 0.0
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from datetime import date
+
+from common.exceptions import InvalidDateRangeException
+
+
+@dataclass(frozen=True)
+class ReportPeriod:
+    """
+    Days covered by a report, both ends included. None leaves that end open.
+    """
+
+    date_from: date | None = None
+    date_to: date | None = None
+
+    def __post_init__(self) -> None:
+        # Checked on creation: exports are streamed after the route returns
+        if (
+            self.date_from is not None
+            and self.date_to is not None
+            and self.date_from > self.date_to
+        ):
+            raise InvalidDateRangeException(
+                date_from=self.date_from, date_to=self.date_to
+            )
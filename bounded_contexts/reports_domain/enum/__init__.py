@@ -0,0 +1 @@
+from .report_enums import ReportBucket, ReportName
@@ -0,0 +1,14 @@
+from enum import Enum
+
+
+class ReportName(Enum):
+    ADOPTED_ANIMALS = "adopted_animals"
+    COLLECTED_MONEY = "collected_money"
+    LOST_AND_FOUND_PETS = "lost_and_found_pets"
+
+
+class ReportBucket(Enum):
+    # date_trunc fields, weeks start on Monday
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
@@ -0,0 +1 @@
+from .reports_event_handler import ReportsEventHandler
@@ -0,0 +1,64 @@
+from bounded_contexts.adoptions_domain.events.adoption_events_handler import (
+    AnimalAdoptedEvent,
+)
+from bounded_contexts.donations_domain.events import DonationCreatedEvent
+from bounded_contexts.pets_domain.events import (
+    PetLostEvent,
+    PetFoundEvent,
+    PetSightingEvent,
+)
+from bounded_contexts.pets_domain.events.pet_events import BasePetEvent
+from bounded_contexts.reports_domain.services import ReportService
+from infrastructure.database import RepositoryUtils
+from infrastructure.uow_abstraction import EventBus, make_unit_of_work
+
+
+class ReportsEventHandler:
+    """
+    Keeps the report summary tables current, `python -m projections rebuild`
+    recomputes them from scratch. Cached reports are invalidated once the refreshed
+    rows are committed.
+    """
+
+    def __init__(
+        self,
+        repository_utils: RepositoryUtils,
+        reports_service: ReportService,
+        event_bus: EventBus,
+    ) -> None:
+        self.repository_utils = repository_utils
+        self.reports_service = reports_service
+
+        event_bus.on(DonationCreatedEvent, self.__refresh_campaign_donations)
+        event_bus.on(AnimalAdoptedEvent, self.__refresh_adoptions)
+
+        event_bus.on(PetSightingEvent, self.__refresh_pet)
+        event_bus.on(PetLostEvent, self.__refresh_pet)
+        event_bus.on(PetFoundEvent, self.__refresh_pet)
+
+    async def __refresh_campaign_donations(self, e: DonationCreatedEvent) -> None:
+        organization_id: str | None
+
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            organization_id = await self.reports_service.refresh_campaign_donations(
+                uow=uow, donation_campaign_id=e.donation_campaign_id
+            )
+
+        await self.reports_service.invalidate_reports(organization_id=organization_id)
+
+    async def __refresh_adoptions(self, e: AnimalAdoptedEvent) -> None:
+        organization_id: str | None
+
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            organization_id = await self.reports_service.refresh_adoptions(
+                uow=uow, animal_id=e.animal_id
+            )
+
+        await self.reports_service.invalidate_reports(organization_id=organization_id)
+
+    async def __refresh_pet(self, e: BasePetEvent) -> None:
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            await self.reports_service.refresh_pet(uow=uow, pet_id=e.pet_id)
+
+        # Lost and found pets are reported for every organization
+        await self.reports_service.invalidate_reports(organization_id=None)
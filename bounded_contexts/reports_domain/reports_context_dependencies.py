@@ -1,3 +1,4 @@
+from bounded_contexts.reports_domain.event_handlers import ReportsEventHandler
 from bounded_contexts.reports_domain.repositories import ReportsRepository
 from bounded_contexts.reports_domain.repositories.alchemy.alchemy_reports_repository import (
     AlchemyReportsRepository,
@@ -12,6 +13,9 @@ from bounded_contexts.reports_domain.use_cases.get_collected_money import (
 from bounded_contexts.reports_domain.use_cases.get_lost_and_found_pets import (
     GetLostAndFoundPetsUseCase,
 )
+from bounded_contexts.reports_domain.use_cases.get_report_cache_stats import (
+    GetReportCacheStatsUseCase,
+)
 from bounded_contexts.reports_domain.views import AdoptedAnimalsViewFactory
 from bounded_contexts.reports_domain.views.collected_money_view import (
     CollectedMoneyViewFactory,
@@ -19,8 +23,19 @@ from bounded_contexts.reports_domain.views.collected_money_view import (
 from bounded_contexts.reports_domain.views.lost_and_found_pets_view import (
     LostAndFoundPetsViewFactory,
 )
+from bounded_contexts.reports_domain.views.report_buckets_view import (
+    ReportBucketsViewFactory,
+)
+from bounded_contexts.reports_domain.views.report_cache_stats_view import (
+    ReportCacheStatsViewFactory,
+)
+from bounded_contexts.reports_domain.services.report_cache import ReportCache
 from common.dependencies import BaseContextDependencies
+from common.ttl_cache import TTLCache
+from config import ProjectConfig, ReportCacheConfig
+from infrastructure.cache import SharedCache
 from infrastructure.database import RepositoryUtils
+from infrastructure.uow_abstraction import EventBus
 
 
 class ReportsContextDependencies(BaseContextDependencies):
@@ -49,14 +64,48 @@ class ReportsContextDependencies(BaseContextDependencies):
             LostAndFoundPetsViewFactory, lost_and_found_pets_view_factory
         )
 
+        report_buckets_view_factory: ReportBucketsViewFactory = (
+            ReportBucketsViewFactory()
+        )
+
+        self.dependencies.register(
+            ReportBucketsViewFactory, report_buckets_view_factory
+        )
+
+        report_cache_stats_view_factory: ReportCacheStatsViewFactory = (
+            ReportCacheStatsViewFactory()
+        )
+
+        self.dependencies.register(
+            ReportCacheStatsViewFactory, report_cache_stats_view_factory
+        )
+
     def _initialize_repositories(self) -> None:
         reports_repository: ReportsRepository = AlchemyReportsRepository()
 
         self.dependencies.register(ReportsRepository, reports_repository)
 
     def _initialize_services(self) -> None:
+        report_cache_config: ReportCacheConfig = self.dependencies.resolve(
+            ProjectConfig
+        ).report_cache
+
+        report_cache: ReportCache = ReportCache(
+            local=TTLCache(
+                max_size=report_cache_config.max_size,
+                ttl_seconds=report_cache_config.ttl,
+            ),
+            shared=(
+                self.dependencies.resolve(SharedCache)
+                if report_cache_config.shared_backend
+                else None
+            ),
+            shared_ttl_seconds=report_cache_config.shared_ttl,
+        )
+
         reports_service: ReportService = ReportService(
-            reports_repository=self.dependencies.resolve(ReportsRepository)
+            reports_repository=self.dependencies.resolve(ReportsRepository),
+            report_cache=report_cache,
         )
 
         self.dependencies.register(ReportService, reports_service)
@@ -69,6 +118,9 @@ class ReportsContextDependencies(BaseContextDependencies):
                 adopted_animals_view_factory=self.dependencies.resolve(
                     AdoptedAnimalsViewFactory
                 ),
+                report_buckets_view_factory=self.dependencies.resolve(
+                    ReportBucketsViewFactory
+                ),
             )
         )
 
@@ -83,6 +135,9 @@ class ReportsContextDependencies(BaseContextDependencies):
                 collected_money_view_factory=self.dependencies.resolve(
                     CollectedMoneyViewFactory
                 ),
+                report_buckets_view_factory=self.dependencies.resolve(
+                    ReportBucketsViewFactory
+                ),
             )
         )
 
@@ -97,6 +152,9 @@ class ReportsContextDependencies(BaseContextDependencies):
                 lost_and_found_pets_view_factory=self.dependencies.resolve(
                     LostAndFoundPetsViewFactory
                 ),
+                report_buckets_view_factory=self.dependencies.resolve(
+                    ReportBucketsViewFactory
+                ),
             )
         )
 
@@ -104,5 +162,25 @@ class ReportsContextDependencies(BaseContextDependencies):
             GetLostAndFoundPetsUseCase, get_lost_and_found_pets_use_case
         )
 
+        get_report_cache_stats_use_case: GetReportCacheStatsUseCase = (
+            GetReportCacheStatsUseCase(
+                repository_utils=self.dependencies.resolve(RepositoryUtils),
+                reports_service=self.dependencies.resolve(ReportService),
+                report_cache_stats_view_factory=self.dependencies.resolve(
+                    ReportCacheStatsViewFactory
+                ),
+            )
+        )
+
+        self.dependencies.register(
+            GetReportCacheStatsUseCase, get_report_cache_stats_use_case
+        )
+
     def _initialize_event_handlers(self) -> None:
-        pass
+        reports_event_handler: ReportsEventHandler = ReportsEventHandler(
+            repository_utils=self.dependencies.resolve(RepositoryUtils),
+            reports_service=self.dependencies.resolve(ReportService),
+            event_bus=self.dependencies.resolve(EventBus),
+        )
+
+        self.dependencies.register(ReportsEventHandler, reports_event_handler)
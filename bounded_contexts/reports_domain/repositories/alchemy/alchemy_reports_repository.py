@@ -1,135 +1,477 @@
-from typing import Sequence
+from datetime import datetime, time, timedelta, timezone
+from typing import Any, AsyncIterator, Sequence
 
-from sqlalchemy import text
+from sqlalchemy import TextClause, text
 
-from bounded_contexts.reports_domain.dataclasses import AdoptedAnimal, CollectedMoney
+from bounded_contexts.reports_domain.dataclasses import (
+    AdoptedAnimal,
+    CollectedMoney,
+    ReportBucketTotals,
+    ReportPeriod,
+)
 from bounded_contexts.reports_domain.dataclasses.lost_and_found_pets import (
     LostAndFoundPets,
 )
+from bounded_contexts.reports_domain.enum import ReportBucket
 from bounded_contexts.reports_domain.repositories.reports_repository import (
     ReportsRepository,
 )
 from infrastructure.uow_abstraction.unit_of_work_module import Session
 
+# Summary rows computed from the fact tables, {filter} narrows them to one campaign,
+# animal or pet. Donations are dated by their approval, or by when they were stored
+# if the payment has no approval date, so a rebuild keeps every donation on its day.
+CAMPAIGN_DONATIONS_SELECT: str = (
+    "SELECT ind.donation_campaign_id, "
+    "(coalesce(mp.date_approved, ind.created_at) AT TIME ZONE 'UTC')::date AS day, "
+    "dc.organization_id, count(*) AS donations, sum(ind.amount) AS collected_amount, "
+    "sum(ind.application_fee) AS application_collected_amount "
+    "FROM individual_donations ind "
+    "JOIN donation_campaigns dc ON dc.entity_id = ind.donation_campaign_id "
+    "JOIN mp_transactions mp ON mp.entity_id = ind.mp_transaction_id "
+    "{filter} "
+    "GROUP BY 1, 2, 3"
+)
+
+ADOPTIONS_SELECT: str = (
+    "SELECT ad.entity_id AS adoption_id, a.organization_id, o.organization_name, a.entity_id AS animal_id, a.animal_name, a.species::text AS animal_species, a.birth_year AS animal_birth_year, a.size::text AS animal_size, "
+    "ap.adopter_profile_id AS adopter_id, concat(p.first_name, ' ', p.surname) AS adopter_name, a.publication_date AS start_date_for_adoption, ad.adoption_date "
+    "FROM animals a "
+    "JOIN adoption_applications ap ON ap.animal_id = a.entity_id "
+    "JOIN adoptions ad ON ad.adoption_application_id = ap.entity_id "
+    "JOIN profiles p ON p.entity_id = ap.adopter_profile_id "
+    "JOIN organizations o ON o.entity_id = a.organization_id "
+    "WHERE a.animal_type = 'ANIMAL_FOR_ADOPTION' {filter}"
+)
+
+PETS_SELECT: str = (
+    "SELECT a.entity_id AS pet_id, a.lost, COUNT(ps.pet_id) AS sightings "
+    "FROM animals a "
+    "LEFT JOIN pets_sight ps ON a.entity_id = ps.pet_id "
+    "WHERE a.animal_type = 'PET' {filter} "
+    "GROUP BY a.entity_id"
+)
+
+CAMPAIGN_DONATIONS_INSERT: str = (
+    "INSERT INTO report_campaign_donations (donation_campaign_id, day, organization_id, donations, collected_amount, application_collected_amount) "
+    f"{CAMPAIGN_DONATIONS_SELECT} "
+    "ON CONFLICT (donation_campaign_id, day) DO UPDATE SET "
+    "organization_id = EXCLUDED.organization_id, donations = EXCLUDED.donations, "
+    "collected_amount = EXCLUDED.collected_amount, "
+    "application_collected_amount = EXCLUDED.application_collected_amount"
+)
+
+ADOPTIONS_INSERT: str = (
+    "INSERT INTO report_adoptions (adoption_id, organization_id, organization_name, animal_id, animal_name, animal_species, animal_birth_year, animal_size, "
+    "adopter_id, adopter_name, start_date_for_adoption, adoption_date) "
+    f"{ADOPTIONS_SELECT} "
+    "ON CONFLICT (adoption_id) DO UPDATE SET "
+    "organization_id = EXCLUDED.organization_id, organization_name = EXCLUDED.organization_name, "
+    "animal_id = EXCLUDED.animal_id, animal_name = EXCLUDED.animal_name, "
+    "animal_species = EXCLUDED.animal_species, animal_birth_year = EXCLUDED.animal_birth_year, "
+    "animal_size = EXCLUDED.animal_size, adopter_id = EXCLUDED.adopter_id, "
+    "adopter_name = EXCLUDED.adopter_name, start_date_for_adoption = EXCLUDED.start_date_for_adoption, "
+    "adoption_date = EXCLUDED.adoption_date"
+)
+
+PETS_INSERT: str = (
+    "INSERT INTO report_pets (pet_id, lost, sightings) "
+    f"{PETS_SELECT} "
+    "ON CONFLICT (pet_id) DO UPDATE SET "
+    "lost = EXCLUDED.lost, sightings = EXCLUDED.sightings"
+)
+
+PET_SIGHTINGS_INSERT: str = (
+    "INSERT INTO report_pet_sightings (pet_id, day, sightings) "
+    "SELECT ps.pet_id, (ps.created_at AT TIME ZONE 'UTC')::date AS day, count(*) AS sightings "
+    "FROM pets_sight ps "
+    "{filter} "
+    "GROUP BY 1, 2 "
+    "ON CONFLICT (pet_id, day) DO UPDATE SET sightings = EXCLUDED.sightings"
+)
+
+# Exports read the rows from a server side cursor, this many at a time
+STREAM_OPTIONS: dict[str, Any] = {"yield_per": 500}
+
 
 class AlchemyReportsRepository(ReportsRepository):
+    """
+    Reports are read from the report_* summary tables. Each refresh recomputes the
+    rows of one campaign, animal or pet from the fact tables, so handling an event
+    twice or out of order leaves the same rows. Days are UTC days.
+    """
+
     def __init__(self) -> None:
         pass
 
     async def get_adopted_animals(
-        self, session: Session, organization_id: str | None = None
+        self,
+        session: Session,
+        organization_id: str | None = None,
+        period: ReportPeriod = ReportPeriod(),
     ) -> Sequence[AdoptedAnimal]:
-        txt_query = (
-            "SELECT ad.entity_id AS adoption_id, a.organization_id, o.organization_name, a.entity_id AS animal_id, a.animal_name, a.species AS animal_species, a.birth_year AS animal_birth_year, a.size AS animal_size, "
-            "ap.adopter_profile_id AS adopter_id, concat(p.first_name, ' ', p.surname) AS adopter_name, a.publication_date AS start_date_for_adoption, ad.adoption_date "
-            "FROM animals a "
-            "JOIN animals a1 ON a.entity_id = a1.adoption_animal_id "
-            "JOIN adoption_applications ap ON ap.animal_id = a.entity_id "
-            "JOIN adoptions ad ON ad.adoption_application_id = ap.entity_id "
-            "JOIN profiles p ON p.entity_id = ap.adopter_profile_id "
-            "JOIN organizations o ON o.entity_id = a.organization_id "
-            "WHERE a.animal_type = 'ANIMAL_FOR_ADOPTION' "
+        query, params = self.__adopted_animals_query(
+            organization_id=organization_id, period=period
         )
+        result = await session.execute(query, params)
 
-        if organization_id is not None:
-            txt_query += "AND a.organization_id = :organization_id"
+        return [AdoptedAnimal(**row) for row in result.mappings()]
 
-        query = text(txt_query)
-        params = {"organization_id": organization_id}
+    async def stream_adopted_animals(
+        self,
+        session: Session,
+        organization_id: str | None = None,
+        period: ReportPeriod = ReportPeriod(),
+    ) -> AsyncIterator[AdoptedAnimal]:
+        query, params = self.__adopted_animals_query(
+            organization_id=organization_id, period=period
+        )
+        result = await session.stream(query, params, execution_options=STREAM_OPTIONS)
 
-        result = await session.execute(query, params)
-        rows = result.fetchall()
-
-        data = [dict(zip(result.keys(), row)) for row in rows]
-
-        animals = [
-            AdoptedAnimal(
-                row["adoption_id"],
-                row["organization_id"],
-                row["organization_name"],
-                row["animal_id"],
-                row["animal_name"],
-                row["animal_species"],
-                row["animal_birth_year"],
-                row["animal_size"],
-                row["adopter_id"],
-                row["adopter_name"],
-                row["start_date_for_adoption"],
-                row["adoption_date"],
-            )
-            for row in data
-        ]
-        return animals
+        async for row in result.mappings():
+            yield AdoptedAnimal(**row)
 
     async def get_collected_money(
-        self, session: Session, organization_id: str | None
+        self,
+        session: Session,
+        organization_id: str | None,
+        period: ReportPeriod = ReportPeriod(),
     ) -> Sequence[CollectedMoney]:
-        txt_query = (
-            "SELECT dc.entity_id AS donation_campaign_id, dc.campaign_name AS donation_campaign_name, "
-            "dc.money_goal, dc.active AS campaign_is_active, sum(ind.amount) AS collected_amount, "
-            "sum(ind.application_fee) AS application_collected_amount, org.organization_name "
-            "FROM donation_campaigns dc "
-            "JOIN individual_donations ind ON dc.entity_id = ind.donation_campaign_id "
-            "JOIN organizations org ON org.entity_id = dc.organization_id "
+        query, params = self.__collected_money_query(
+            organization_id=organization_id, period=period
         )
+        result = await session.execute(query, params)
 
-        params = {}
+        return [CollectedMoney(**row) for row in result.mappings()]
 
-        if organization_id is not None:
-            txt_query += " WHERE org.entity_id = :organization_id "
-            params = {"organization_id": organization_id}
+    async def stream_collected_money(
+        self,
+        session: Session,
+        organization_id: str | None,
+        period: ReportPeriod = ReportPeriod(),
+    ) -> AsyncIterator[CollectedMoney]:
+        query, params = self.__collected_money_query(
+            organization_id=organization_id, period=period
+        )
+        result = await session.stream(query, params, execution_options=STREAM_OPTIONS)
 
-        txt_query += " GROUP BY dc.entity_id, org.organization_name "
+        async for row in result.mappings():
+            yield CollectedMoney(**row)
 
-        query = text(txt_query)
+    async def get_lost_and_found_pets(
+        self, session: Session, period: ReportPeriod = ReportPeriod()
+    ) -> Sequence[LostAndFoundPets]:
+        query, params = self.__lost_and_found_pets_query(period=period)
         result = await session.execute(query, params)
-        rows = result.fetchall()
-
-        data = [dict(zip(result.keys(), row)) for row in rows]
-
-        collected_money = [
-            CollectedMoney(
-                row["donation_campaign_id"],
-                row["donation_campaign_name"],
-                row["organization_name"],
-                row["money_goal"],
-                row["collected_amount"],
-                row["application_collected_amount"],
-                row["campaign_is_active"],
+
+        return [LostAndFoundPets(**row) for row in result.mappings()]
+
+    async def stream_lost_and_found_pets(
+        self, session: Session, period: ReportPeriod = ReportPeriod()
+    ) -> AsyncIterator[LostAndFoundPets]:
+        query, params = self.__lost_and_found_pets_query(period=period)
+        result = await session.stream(query, params, execution_options=STREAM_OPTIONS)
+
+        async for row in result.mappings():
+            yield LostAndFoundPets(**row)
+
+    async def get_adoption_buckets(
+        self,
+        session: Session,
+        organization_id: str | None,
+        period: ReportPeriod,
+        bucket: ReportBucket,
+    ) -> Sequence[ReportBucketTotals]:
+        conditions, params = self.__timestamp_conditions("adoption_date", period)
+
+        return await self.__get_buckets(
+            session=session,
+            totals="count(*) AS count",
+            bucket_column="adoption_date AT TIME ZONE 'UTC'",
+            table="report_adoptions",
+            conditions=conditions + self.__organization_condition(organization_id),
+            params={**params, "organization_id": organization_id},
+            bucket=bucket,
+        )
+
+    async def get_donation_buckets(
+        self,
+        session: Session,
+        organization_id: str | None,
+        period: ReportPeriod,
+        bucket: ReportBucket,
+    ) -> Sequence[ReportBucketTotals]:
+        conditions, params = self.__day_conditions("day", period)
+
+        return await self.__get_buckets(
+            session=session,
+            totals=(
+                "sum(donations) AS count, sum(collected_amount) AS amount, "
+                "sum(application_collected_amount) AS application_amount"
+            ),
+            bucket_column="day::timestamp",
+            table="report_campaign_donations",
+            conditions=conditions + self.__organization_condition(organization_id),
+            params={**params, "organization_id": organization_id},
+            bucket=bucket,
+        )
+
+    async def get_sighting_buckets(
+        self, session: Session, period: ReportPeriod, bucket: ReportBucket
+    ) -> Sequence[ReportBucketTotals]:
+        conditions, params = self.__day_conditions("day", period)
+
+        return await self.__get_buckets(
+            session=session,
+            totals="sum(sightings) AS count",
+            bucket_column="day::timestamp",
+            table="report_pet_sightings",
+            conditions=conditions,
+            params=params,
+            bucket=bucket,
+        )
+
+    async def refresh_campaign_donations(
+        self, session: Session, donation_campaign_id: str
+    ) -> str | None:
+        params = {"donation_campaign_id": donation_campaign_id}
+
+        await session.execute(
+            text(
+                "DELETE FROM report_campaign_donations "
+                "WHERE donation_campaign_id = :donation_campaign_id"
+            ),
+            params,
+        )
+        await session.execute(
+            text(
+                CAMPAIGN_DONATIONS_INSERT.format(
+                    filter="WHERE ind.donation_campaign_id = :donation_campaign_id"
+                )
+            ),
+            params,
+        )
+
+        result = await session.execute(
+            text(
+                "SELECT organization_id FROM donation_campaigns "
+                "WHERE entity_id = :donation_campaign_id"
+            ),
+            params,
+        )
+
+        return result.scalar_one_or_none()
+
+    async def refresh_adoptions(self, session: Session, animal_id: str) -> str | None:
+        params = {"animal_id": animal_id}
+
+        await session.execute(
+            text(ADOPTIONS_INSERT.format(filter="AND a.entity_id = :animal_id")),
+            params,
+        )
+
+        result = await session.execute(
+            text("SELECT organization_id FROM animals WHERE entity_id = :animal_id"),
+            params,
+        )
+
+        return result.scalar_one_or_none()
+
+    async def refresh_pet(self, session: Session, pet_id: str) -> None:
+        params = {"pet_id": pet_id}
+
+        await session.execute(
+            text(PETS_INSERT.format(filter="AND a.entity_id = :pet_id")), params
+        )
+        await session.execute(
+            text("DELETE FROM report_pet_sightings WHERE pet_id = :pet_id"), params
+        )
+        await session.execute(
+            text(PET_SIGHTINGS_INSERT.format(filter="WHERE ps.pet_id = :pet_id")),
+            params,
+        )
+
+    async def rebuild_campaign_donations(self, session: Session) -> int:
+        await session.execute(text("DELETE FROM report_campaign_donations"))
+        result = await session.execute(
+            text(CAMPAIGN_DONATIONS_INSERT.format(filter=""))
+        )
+
+        return result.rowcount  # type: ignore
+
+    async def rebuild_adoptions(self, session: Session) -> int:
+        await session.execute(text("DELETE FROM report_adoptions"))
+        result = await session.execute(text(ADOPTIONS_INSERT.format(filter="")))
+
+        return result.rowcount  # type: ignore
+
+    async def rebuild_pets(self, session: Session) -> int:
+        await session.execute(text("DELETE FROM report_pets"))
+        result = await session.execute(
+            text(
+                PETS_INSERT.format(
+                    filter="AND (a.lost = true OR ps.pet_id IS NOT NULL)"
+                )
             )
-            for row in data
-        ]
-        return collected_money
+        )
 
-    async def get_lost_and_found_pets(
-        self, session: Session
-    ) -> Sequence[LostAndFoundPets]:
+        return result.rowcount  # type: ignore
+
+    async def rebuild_pet_sightings(self, session: Session) -> int:
+        await session.execute(text("DELETE FROM report_pet_sightings"))
+        result = await session.execute(text(PET_SIGHTINGS_INSERT.format(filter="")))
+
+        return result.rowcount  # type: ignore
+
+    @staticmethod
+    async def __get_buckets(
+        session: Session,
+        totals: str,
+        bucket_column: str,
+        table: str,
+        conditions: list[str],
+        params: dict[str, Any],
+        bucket: ReportBucket,
+    ) -> Sequence[ReportBucketTotals]:
         txt_query = (
-            "SELECT a.entity_id AS pet_id, a.animal_name AS pet_name, a.species AS pet_species, a.race AS pet_race, "
-            "COUNT(ps.pet_id) AS amount_of_sights, a.lost_date, a.found_date "
-            "FROM animals a "
-            "LEFT JOIN pets_sight ps ON a.entity_id = ps.pet_id "
-            "WHERE a.animal_type = 'PET' "
-            "GROUP BY a.entity_id "
-            "HAVING COUNT(ps.pet_id) > 0 OR a.lost = true"
-        )
-
-        query = text(txt_query)
-        result = await session.execute(query)
-        rows = result.fetchall()
-
-        data = [dict(zip(result.keys(), row)) for row in rows]
-
-        lost_and_found_pets = [
-            LostAndFoundPets(
-                row["pet_id"],
-                row["pet_name"],
-                row["pet_species"],
-                row["pet_race"],
-                row["amount_of_sights"],
-                row["lost_date"],
-                row["found_date"],
+            f"SELECT date_trunc(:bucket, {bucket_column})::date AS bucket_start, {totals} "
+            f"FROM {table} "
+        )
+
+        if conditions:
+            txt_query += "WHERE " + " AND ".join(conditions) + " "
+
+        txt_query += "GROUP BY 1 ORDER BY 1"
+
+        result = await session.execute(
+            text(txt_query), {**params, "bucket": bucket.value}
+        )
+
+        return [ReportBucketTotals(**row) for row in result.mappings()]
+
+    @staticmethod
+    def __organization_condition(organization_id: str | None) -> list[str]:
+        if organization_id is None:
+            return []
+
+        return ["organization_id = :organization_id"]
+
+    @staticmethod
+    def __day_conditions(
+        column: str, period: ReportPeriod
+    ) -> tuple[list[str], dict[str, Any]]:
+        conditions: list[str] = []
+
+        if period.date_from is not None:
+            conditions.append(f"{column} >= :date_from")
+
+        if period.date_to is not None:
+            conditions.append(f"{column} <= :date_to")
+
+        return conditions, {"date_from": period.date_from, "date_to": period.date_to}
+
+    @staticmethod
+    def __timestamp_conditions(
+        column: str, period: ReportPeriod
+    ) -> tuple[list[str], dict[str, Any]]:
+        # Bounds as UTC instants, so the index on the column is usable
+        conditions: list[str] = []
+        params: dict[str, Any] = {}
+
+        if period.date_from is not None:
+            conditions.append(f"{column} >= :since")
+            params["since"] = datetime.combine(
+                period.date_from, time.min, tzinfo=timezone.utc
+            )
+
+        if period.date_to is not None:
+            conditions.append(f"{column} < :until")
+            params["until"] = datetime.combine(
+                period.date_to + timedelta(days=1), time.min, tzinfo=timezone.utc
             )
-            for row in data
-        ]
-        return lost_and_found_pets
+
+        return conditions, params
+
+    @staticmethod
+    def __adopted_animals_query(
+        organization_id: str | None, period: ReportPeriod
+    ) -> tuple[TextClause, dict[str, Any]]:
+        conditions, params = AlchemyReportsRepository.__timestamp_conditions(
+            "adoption_date", period
+        )
+        conditions += AlchemyReportsRepository.__organization_condition(organization_id)
+
+        txt_query = (
+            "SELECT adoption_id, organization_id, organization_name, animal_id, animal_name, animal_species, animal_birth_year, animal_size, "
+            "adopter_id, adopter_name, start_date_for_adoption, adoption_date "
+            "FROM report_adoptions "
+        )
+
+        if conditions:
+            txt_query += "WHERE " + " AND ".join(conditions)
+
+        return text(txt_query), {**params, "organization_id": organization_id}
+
+    @staticmethod
+    def __collected_money_query(
+        organization_id: str | None, period: ReportPeriod
+    ) -> tuple[TextClause, dict[str, Any]]:
+        conditions, params = AlchemyReportsRepository.__day_conditions("day", period)
+        conditions += AlchemyReportsRepository.__organization_condition(organization_id)
+
+        txt_query = (
+            "SELECT donation_campaign_id, sum(collected_amount) AS collected_amount, "
+            "sum(application_collected_amount) AS application_collected_amount "
+            "FROM report_campaign_donations "
+        )
+
+        if conditions:
+            txt_query += " WHERE " + " AND ".join(conditions)
+
+        txt_query += " GROUP BY donation_campaign_id "
+
+        # Names, goal and state are looked up by key for the summarized campaigns
+        txt_query = (
+            "SELECT dc.entity_id AS donation_campaign_id, dc.campaign_name AS donation_campaign_name, "
+            "org.organization_name, dc.money_goal, rcd.collected_amount, "
+            "rcd.application_collected_amount, dc.active AS campaign_is_active "
+            f"FROM ({txt_query}) rcd "
+            "JOIN donation_campaigns dc ON dc.entity_id = rcd.donation_campaign_id "
+            "JOIN organizations org ON org.entity_id = dc.organization_id "
+        )
+
+        return text(txt_query), {**params, "organization_id": organization_id}
+
+    @staticmethod
+    def __lost_and_found_pets_query(
+        period: ReportPeriod,
+    ) -> tuple[TextClause, dict[str, Any]]:
+        if period.date_from is None and period.date_to is None:
+            return (
+                text(
+                    "SELECT a.entity_id AS pet_id, a.animal_name AS pet_name, a.species AS pet_species, a.race AS pet_race, "
+                    "rp.sightings AS amount_of_sights, a.lost_date, a.found_date "
+                    "FROM report_pets rp "
+                    "JOIN animals a ON a.entity_id = rp.pet_id "
+                    "WHERE rp.sightings > 0 OR rp.lost = true"
+                ),
+                {},
+            )
+
+        # Pets sighted in the period, with the sightings in it, and pets lost in it
+        conditions, params = AlchemyReportsRepository.__day_conditions("day", period)
+        lost_conditions, _ = AlchemyReportsRepository.__day_conditions(
+            "a.lost_date", period
+        )
+
+        txt_query = (
+            "SELECT a.entity_id AS pet_id, a.animal_name AS pet_name, a.species AS pet_species, a.race AS pet_race, "
+            "coalesce(rps.sightings, 0) AS amount_of_sights, a.lost_date, a.found_date "
+            "FROM report_pets rp "
+            "JOIN animals a ON a.entity_id = rp.pet_id "
+            "LEFT JOIN (SELECT pet_id, sum(sightings) AS sightings FROM report_pet_sightings "
+            f"WHERE {' AND '.join(conditions)} GROUP BY pet_id) rps ON rps.pet_id = rp.pet_id "
+            f"WHERE rps.sightings > 0 OR (rp.lost = true AND {' AND '.join(lost_conditions)})"
+        )
+
+        return text(txt_query), params
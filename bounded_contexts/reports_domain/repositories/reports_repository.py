@@ -1,28 +1,128 @@
 from abc import ABC, abstractmethod
-from typing import Sequence
+from typing import AsyncIterator, Sequence
 
-from bounded_contexts.reports_domain.dataclasses import AdoptedAnimal, CollectedMoney
+from bounded_contexts.reports_domain.dataclasses import (
+    AdoptedAnimal,
+    CollectedMoney,
+    ReportBucketTotals,
+    ReportPeriod,
+)
 from bounded_contexts.reports_domain.dataclasses.lost_and_found_pets import (
     LostAndFoundPets,
 )
+from bounded_contexts.reports_domain.enum import ReportBucket
 from infrastructure.uow_abstraction.unit_of_work_module import Session
 
 
 class ReportsRepository(ABC):
     @abstractmethod
     async def get_adopted_animals(
-        self, session: Session, organization_id: str | None = None
+        self,
+        session: Session,
+        organization_id: str | None = None,
+        period: ReportPeriod = ReportPeriod(),
     ) -> Sequence[AdoptedAnimal]:
         pass
 
+    @abstractmethod
+    def stream_adopted_animals(
+        self,
+        session: Session,
+        organization_id: str | None = None,
+        period: ReportPeriod = ReportPeriod(),
+    ) -> AsyncIterator[AdoptedAnimal]:
+        pass
+
     @abstractmethod
     async def get_collected_money(
-        self, session: Session, organization_id: str | None
+        self,
+        session: Session,
+        organization_id: str | None,
+        period: ReportPeriod = ReportPeriod(),
     ) -> Sequence[CollectedMoney]:
         pass
 
+    @abstractmethod
+    def stream_collected_money(
+        self,
+        session: Session,
+        organization_id: str | None,
+        period: ReportPeriod = ReportPeriod(),
+    ) -> AsyncIterator[CollectedMoney]:
+        pass
+
     @abstractmethod
     async def get_lost_and_found_pets(
-        self, session: Session
+        self, session: Session, period: ReportPeriod = ReportPeriod()
     ) -> Sequence[LostAndFoundPets]:
         pass
+
+    @abstractmethod
+    def stream_lost_and_found_pets(
+        self, session: Session, period: ReportPeriod = ReportPeriod()
+    ) -> AsyncIterator[LostAndFoundPets]:
+        pass
+
+    @abstractmethod
+    async def get_adoption_buckets(
+        self,
+        session: Session,
+        organization_id: str | None,
+        period: ReportPeriod,
+        bucket: ReportBucket,
+    ) -> Sequence[ReportBucketTotals]:
+        pass
+
+    @abstractmethod
+    async def get_donation_buckets(
+        self,
+        session: Session,
+        organization_id: str | None,
+        period: ReportPeriod,
+        bucket: ReportBucket,
+    ) -> Sequence[ReportBucketTotals]:
+        pass
+
+    @abstractmethod
+    async def get_sighting_buckets(
+        self, session: Session, period: ReportPeriod, bucket: ReportBucket
+    ) -> Sequence[ReportBucketTotals]:
+        pass
+
+    @abstractmethod
+    async def refresh_campaign_donations(
+        self, session: Session, donation_campaign_id: str
+    ) -> str | None:
+        """
+        Returns the organization of the campaign, None if it doesn't exist.
+        """
+
+        pass
+
+    @abstractmethod
+    async def refresh_adoptions(self, session: Session, animal_id: str) -> str | None:
+        """
+        Returns the organization of the animal, None if it doesn't exist.
+        """
+
+        pass
+
+    @abstractmethod
+    async def refresh_pet(self, session: Session, pet_id: str) -> None:
+        pass
+
+    @abstractmethod
+    async def rebuild_campaign_donations(self, session: Session) -> int:
+        pass
+
+    @abstractmethod
+    async def rebuild_adoptions(self, session: Session) -> int:
+        pass
+
+    @abstractmethod
+    async def rebuild_pets(self, session: Session) -> int:
+        pass
+
+    @abstractmethod
+    async def rebuild_pet_sightings(self, session: Session) -> int:
+        pass
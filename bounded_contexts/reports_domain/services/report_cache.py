@@ -0,0 +1,95 @@
+from typing import Any, Awaitable, Callable, TypeVar
+
+from bounded_contexts.reports_domain.dataclasses import ReportCacheStats
+from common.ttl_cache import TTLCache
+from infrastructure.cache import SharedCache
+
+T = TypeVar("T")
+
+# Namespace of the results that cover every organization
+ALL_ORGANIZATIONS: str = "*"
+
+
+class ReportCache:
+    """
+    Report results grouped by organization. Looked up in this worker's cache, then
+    in the shared cache (when there is one), and loaded on a miss of both.
+
+    Invalidating an organization also drops the results covering every one. It must
+    happen after the changes are committed, or a read in between could cache the
+    previous results again.
+    """
+
+    def __init__(
+        self,
+        local: TTLCache[tuple[str, str], Any],
+        shared: SharedCache | None = None,
+        shared_ttl_seconds: float = 0,
+    ) -> None:
+        self.__local = local
+        self.__shared = shared
+        self.__shared_ttl_seconds = shared_ttl_seconds
+        self.__shared_hits: int = 0
+        self.__loads: int = 0
+        # Invalidations per namespace, a result loaded across one isn't stored
+        self.__generations: dict[str, int] = {}
+
+    async def get_or_load(
+        self, organization_id: str | None, key: str, load: Callable[[], Awaitable[T]]
+    ) -> T:
+        namespace: str = organization_id or ALL_ORGANIZATIONS
+        value: T | None = self.__local.get((namespace, key))
+
+        if value is not None:
+            return value
+
+        if self.__shared is not None:
+            value = await self.__shared.get(namespace, key)
+
+            if value is not None:
+                self.__shared_hits += 1
+                self.__local.set((namespace, key), value)
+                return value
+
+        generation: int = self.__generations.get(namespace, 0)
+        value = await load()
+        self.__loads += 1
+
+        if generation != self.__generations.get(namespace, 0):
+            return value
+
+        self.__local.set((namespace, key), value)
+
+        if self.__shared is not None:
+            await self.__shared.set(namespace, key, value, self.__shared_ttl_seconds)
+
+        return value
+
+    async def invalidate(self, organization_id: str | None) -> None:
+        namespaces: set[str] = {organization_id or ALL_ORGANIZATIONS, ALL_ORGANIZATIONS}
+
+        for namespace in namespaces:
+            self.__generations[namespace] = self.__generations.get(namespace, 0) + 1
+
+        self.__local.invalidate_where(lambda key: key[0] in namespaces)
+
+        if self.__shared is not None:
+            for namespace in namespaces:
+                await self.__shared.invalidate(namespace)
+
+    async def clear(self) -> None:
+        for namespace in self.__generations:
+            self.__generations[namespace] += 1
+
+        self.__local.clear()
+
+        if self.__shared is not None:
+            await self.__shared.clear()
+
+    def stats(self) -> ReportCacheStats:
+        return ReportCacheStats(
+            local_hits=self.__local.hits,
+            shared_hits=self.__shared_hits,
+            loads=self.__loads,
+            entries=len(self.__local),
+        )
@@ -1,10 +1,18 @@
-from typing import Sequence
+from typing import AsyncIterator, Sequence
 
-from bounded_contexts.reports_domain.dataclasses import AdoptedAnimal, CollectedMoney
+from bounded_contexts.reports_domain.dataclasses import (
+    AdoptedAnimal,
+    CollectedMoney,
+    ReportBucketTotals,
+    ReportCacheStats,
+    ReportPeriod,
+)
 from bounded_contexts.reports_domain.dataclasses.lost_and_found_pets import (
     LostAndFoundPets,
 )
+from bounded_contexts.reports_domain.enum import ReportBucket, ReportName
 from bounded_contexts.reports_domain.repositories import ReportsRepository
+from bounded_contexts.reports_domain.services.report_cache import ReportCache
 from infrastructure.uow_abstraction import UnitOfWork
 
 
@@ -12,27 +20,188 @@ class ReportService:
     def __init__(
         self,
         reports_repository: ReportsRepository,
+        report_cache: ReportCache,
     ) -> None:
         self.reports_repository = reports_repository
+        # Dashboards ask for the same few reports over and over, the report event
+        # handlers invalidate them
+        self.report_cache = report_cache
 
     async def get_adopted_animals(
-        self, uow: UnitOfWork, organization_id: str | None = None
+        self,
+        uow: UnitOfWork,
+        organization_id: str | None = None,
+        period: ReportPeriod = ReportPeriod(),
     ) -> Sequence[AdoptedAnimal]:
-        return await self.reports_repository.get_adopted_animals(
-            session=uow.session, organization_id=organization_id
+        return await self.report_cache.get_or_load(
+            organization_id=organization_id,
+            key=self.__cache_key(ReportName.ADOPTED_ANIMALS, period),
+            load=lambda: self.reports_repository.get_adopted_animals(
+                session=uow.session, organization_id=organization_id, period=period
+            ),
+        )
+
+    def stream_adopted_animals(
+        self,
+        uow: UnitOfWork,
+        organization_id: str | None = None,
+        period: ReportPeriod = ReportPeriod(),
+    ) -> AsyncIterator[AdoptedAnimal]:
+        return self.reports_repository.stream_adopted_animals(
+            session=uow.session, organization_id=organization_id, period=period
         )
 
     async def get_collected_money(
-        self, uow: UnitOfWork, organization_id: str | None
+        self,
+        uow: UnitOfWork,
+        organization_id: str | None,
+        period: ReportPeriod = ReportPeriod(),
     ) -> Sequence[CollectedMoney]:
-        return await self.reports_repository.get_collected_money(
-            session=uow.session,
+        return await self.report_cache.get_or_load(
             organization_id=organization_id,
+            key=self.__cache_key(ReportName.COLLECTED_MONEY, period),
+            load=lambda: self.reports_repository.get_collected_money(
+                session=uow.session, organization_id=organization_id, period=period
+            ),
+        )
+
+    def stream_collected_money(
+        self,
+        uow: UnitOfWork,
+        organization_id: str | None,
+        period: ReportPeriod = ReportPeriod(),
+    ) -> AsyncIterator[CollectedMoney]:
+        return self.reports_repository.stream_collected_money(
+            session=uow.session, organization_id=organization_id, period=period
         )
 
     async def get_lost_and_found_pets(
-        self, uow: UnitOfWork
+        self, uow: UnitOfWork, period: ReportPeriod = ReportPeriod()
     ) -> Sequence[LostAndFoundPets]:
-        return await self.reports_repository.get_lost_and_found_pets(
-            session=uow.session
+        return await self.report_cache.get_or_load(
+            organization_id=None,
+            key=self.__cache_key(ReportName.LOST_AND_FOUND_PETS, period),
+            load=lambda: self.reports_repository.get_lost_and_found_pets(
+                session=uow.session, period=period
+            ),
+        )
+
+    def stream_lost_and_found_pets(
+        self, uow: UnitOfWork, period: ReportPeriod = ReportPeriod()
+    ) -> AsyncIterator[LostAndFoundPets]:
+        return self.reports_repository.stream_lost_and_found_pets(
+            session=uow.session, period=period
+        )
+
+    async def get_report_buckets(
+        self,
+        uow: UnitOfWork,
+        report: ReportName,
+        organization_id: str | None,
+        period: ReportPeriod,
+        bucket: ReportBucket,
+    ) -> Sequence[ReportBucketTotals]:
+        """
+        Adoptions, donations or sightings per day, week or month of the period.
+        Lost and found pets are not per organization, `organization_id` is ignored.
+        """
+
+        if report is ReportName.LOST_AND_FOUND_PETS:
+            organization_id = None
+
+        return await self.report_cache.get_or_load(
+            organization_id=organization_id,
+            key=self.__cache_key(report, period, bucket),
+            load=lambda: self.__load_report_buckets(
+                uow=uow,
+                report=report,
+                organization_id=organization_id,
+                period=period,
+                bucket=bucket,
+            ),
         )
+
+    async def invalidate_reports(self, organization_id: str | None) -> None:
+        """
+        Drops the cached reports of the organization, and those of every one. None
+        drops only the latter, lost and found pets among them.
+        """
+
+        await self.report_cache.invalidate(organization_id=organization_id)
+
+    def report_cache_stats(self) -> ReportCacheStats:
+        return self.report_cache.stats()
+
+    async def refresh_campaign_donations(
+        self, uow: UnitOfWork, donation_campaign_id: str
+    ) -> str | None:
+        return await self.reports_repository.refresh_campaign_donations(
+            session=uow.session, donation_campaign_id=donation_campaign_id
+        )
+
+    async def refresh_adoptions(self, uow: UnitOfWork, animal_id: str) -> str | None:
+        return await self.reports_repository.refresh_adoptions(
+            session=uow.session, animal_id=animal_id
+        )
+
+    async def refresh_pet(self, uow: UnitOfWork, pet_id: str) -> None:
+        await self.reports_repository.refresh_pet(session=uow.session, pet_id=pet_id)
+
+    async def rebuild_summaries(self, uow: UnitOfWork) -> dict[str, int]:
+        """
+        Recomputes every summary table from the fact tables, returns the rows
+        written to each one.
+        """
+
+        return {
+            "report_campaign_donations": (
+                await self.reports_repository.rebuild_campaign_donations(
+                    session=uow.session
+                )
+            ),
+            "report_adoptions": await self.reports_repository.rebuild_adoptions(
+                session=uow.session
+            ),
+            "report_pets": await self.reports_repository.rebuild_pets(
+                session=uow.session
+            ),
+            "report_pet_sightings": (
+                await self.reports_repository.rebuild_pet_sightings(session=uow.session)
+            ),
+        }
+
+    async def __load_report_buckets(
+        self,
+        uow: UnitOfWork,
+        report: ReportName,
+        organization_id: str | None,
+        period: ReportPeriod,
+        bucket: ReportBucket,
+    ) -> Sequence[ReportBucketTotals]:
+        if report is ReportName.ADOPTED_ANIMALS:
+            return await self.reports_repository.get_adoption_buckets(
+                session=uow.session,
+                organization_id=organization_id,
+                period=period,
+                bucket=bucket,
+            )
+
+        if report is ReportName.COLLECTED_MONEY:
+            return await self.reports_repository.get_donation_buckets(
+                session=uow.session,
+                organization_id=organization_id,
+                period=period,
+                bucket=bucket,
+            )
+
+        return await self.reports_repository.get_sighting_buckets(
+            session=uow.session, period=period, bucket=bucket
+        )
+
+    @staticmethod
+    def __cache_key(
+        report: ReportName, period: ReportPeriod, bucket: ReportBucket | None = None
+    ) -> str:
+        bucket_name: str = "rows" if bucket is None else bucket.value
+
+        return f"{report.value}:{period.date_from}:{period.date_to}:{bucket_name}"
@@ -1,6 +1,11 @@
 from dataclasses import dataclass
-from typing import Sequence
-from bounded_contexts.reports_domain.dataclasses import AdoptedAnimal
+from typing import AsyncIterator, Sequence
+from bounded_contexts.reports_domain.dataclasses import (
+    AdoptedAnimal,
+    ReportBucketTotals,
+    ReportPeriod,
+)
+from bounded_contexts.reports_domain.enum import ReportBucket, ReportName
 from bounded_contexts.reports_domain.services import ReportService
 from bounded_contexts.reports_domain.use_cases.base_reports_use_case import (
     BaseReportsUseCase,
@@ -9,25 +14,37 @@ from bounded_contexts.reports_domain.views.adopted_animals_view import (
     AdoptedAnimalsListView,
     AdoptedAnimalsViewFactory,
 )
+from bounded_contexts.reports_domain.views.report_buckets_view import (
+    ReportBucketsListView,
+    ReportBucketsViewFactory,
+)
+from common.export import ExportFormat, encode_rows
 from infrastructure.database import RepositoryUtils
-from infrastructure.uow_abstraction import UnitOfWork, unit_of_work
+from infrastructure.uow_abstraction import (
+    UnitOfWork,
+    make_unit_of_work,
+    unit_of_work,
+)
 
 
 class GetAdoptedAnimalsUseCase(BaseReportsUseCase):
     @dataclass
     class Request:
         organization_id: str | None
+        period: ReportPeriod = ReportPeriod()
 
     def __init__(
         self,
         repository_utils: RepositoryUtils,
         reports_service: ReportService,
         adopted_animals_view_factory: AdoptedAnimalsViewFactory,
+        report_buckets_view_factory: ReportBucketsViewFactory,
     ) -> None:
         super().__init__(
             repository_utils=repository_utils, report_service=reports_service
         )
         self.adopted_animals_view_factory = adopted_animals_view_factory
+        self.report_buckets_view_factory = report_buckets_view_factory
 
     @unit_of_work
     async def execute(
@@ -36,10 +53,45 @@ class GetAdoptedAnimalsUseCase(BaseReportsUseCase):
         animals: Sequence[AdoptedAnimal]
 
         animals = await self.report_service.get_adopted_animals(
-            uow=uow, organization_id=request.organization_id
+            uow=uow, organization_id=request.organization_id, period=request.period
         )
 
         return self.adopted_animals_view_factory.create_adopted_animal_list_view(
             animals=animals,
             total_count=len(animals),
         )
+
+    @unit_of_work
+    async def execute_buckets(
+        self, request: Request, bucket: ReportBucket, uow: UnitOfWork
+    ) -> ReportBucketsListView:
+        buckets: Sequence[ReportBucketTotals]
+
+        buckets = await self.report_service.get_report_buckets(
+            uow=uow,
+            report=ReportName.ADOPTED_ANIMALS,
+            organization_id=request.organization_id,
+            period=request.period,
+            bucket=bucket,
+        )
+
+        return self.report_buckets_view_factory.create_report_buckets_list_view(
+            report=ReportName.ADOPTED_ANIMALS, bucket=bucket, buckets=buckets
+        )
+
+    async def export(
+        self, request: Request, export_format: ExportFormat
+    ) -> AsyncIterator[bytes]:
+        # Iterated by the response after the route returns, so it has its own
+        # unit of work, open while the rows are sent
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            async for chunk in encode_rows(
+                rows=self.report_service.stream_adopted_animals(
+                    uow=uow,
+                    organization_id=request.organization_id,
+                    period=request.period,
+                ),
+                row_type=AdoptedAnimal,
+                export_format=export_format,
+            ):
+                yield chunk
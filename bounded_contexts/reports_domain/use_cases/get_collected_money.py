@@ -1,5 +1,10 @@
-from typing import Sequence
-from bounded_contexts.reports_domain.dataclasses import CollectedMoney
+from typing import AsyncIterator, Sequence
+from bounded_contexts.reports_domain.dataclasses import (
+    CollectedMoney,
+    ReportBucketTotals,
+    ReportPeriod,
+)
+from bounded_contexts.reports_domain.enum import ReportBucket, ReportName
 from bounded_contexts.reports_domain.services import ReportService
 from bounded_contexts.reports_domain.use_cases.base_reports_use_case import (
     BaseReportsUseCase,
@@ -8,8 +13,17 @@ from bounded_contexts.reports_domain.views.collected_money_view import (
     CollectedMoneyViewFactory,
     CollectedMoneyListView,
 )
+from bounded_contexts.reports_domain.views.report_buckets_view import (
+    ReportBucketsListView,
+    ReportBucketsViewFactory,
+)
+from common.export import ExportFormat, encode_rows
 from infrastructure.database import RepositoryUtils
-from infrastructure.uow_abstraction import UnitOfWork, unit_of_work
+from infrastructure.uow_abstraction import (
+    UnitOfWork,
+    make_unit_of_work,
+    unit_of_work,
+)
 
 
 class GetCollectedMoneyUseCase(BaseReportsUseCase):
@@ -18,24 +32,68 @@ class GetCollectedMoneyUseCase(BaseReportsUseCase):
         repository_utils: RepositoryUtils,
         reports_service: ReportService,
         collected_money_view_factory: CollectedMoneyViewFactory,
+        report_buckets_view_factory: ReportBucketsViewFactory,
     ) -> None:
         super().__init__(
             repository_utils=repository_utils, report_service=reports_service
         )
         self.collected_money_view_factory = collected_money_view_factory
+        self.report_buckets_view_factory = report_buckets_view_factory
 
     @unit_of_work
     async def execute(
-        self, organization_id: str | None, uow: UnitOfWork
+        self,
+        organization_id: str | None,
+        uow: UnitOfWork,
+        period: ReportPeriod = ReportPeriod(),
     ) -> CollectedMoneyListView:
         collected_money: Sequence[CollectedMoney]
 
         collected_money = await self.report_service.get_collected_money(
             uow=uow,
             organization_id=organization_id,
+            period=period,
         )
 
         return self.collected_money_view_factory.create_collected_money_list_view(
             campaign_donations=collected_money,
             total_count=len(collected_money),
         )
+
+    @unit_of_work
+    async def execute_buckets(
+        self,
+        organization_id: str | None,
+        period: ReportPeriod,
+        bucket: ReportBucket,
+        uow: UnitOfWork,
+    ) -> ReportBucketsListView:
+        buckets: Sequence[ReportBucketTotals]
+
+        buckets = await self.report_service.get_report_buckets(
+            uow=uow,
+            report=ReportName.COLLECTED_MONEY,
+            organization_id=organization_id,
+            period=period,
+            bucket=bucket,
+        )
+
+        return self.report_buckets_view_factory.create_report_buckets_list_view(
+            report=ReportName.COLLECTED_MONEY, bucket=bucket, buckets=buckets
+        )
+
+    async def export(
+        self,
+        organization_id: str | None,
+        export_format: ExportFormat,
+        period: ReportPeriod = ReportPeriod(),
+    ) -> AsyncIterator[bytes]:
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            async for chunk in encode_rows(
+                rows=self.report_service.stream_collected_money(
+                    uow=uow, organization_id=organization_id, period=period
+                ),
+                row_type=CollectedMoney,
+                export_format=export_format,
+            ):
+                yield chunk
@@ -1,7 +1,9 @@
-from typing import Sequence
+from typing import AsyncIterator, Sequence
+from bounded_contexts.reports_domain.dataclasses import ReportBucketTotals, ReportPeriod
 from bounded_contexts.reports_domain.dataclasses.lost_and_found_pets import (
     LostAndFoundPets,
 )
+from bounded_contexts.reports_domain.enum import ReportBucket, ReportName
 from bounded_contexts.reports_domain.services import ReportService
 from bounded_contexts.reports_domain.use_cases.base_reports_use_case import (
     BaseReportsUseCase,
@@ -10,8 +12,17 @@ from bounded_contexts.reports_domain.views.lost_and_found_pets_view import (
     LostAndFoundPetsViewFactory,
     LostAndFoundPetsListView,
 )
+from bounded_contexts.reports_domain.views.report_buckets_view import (
+    ReportBucketsListView,
+    ReportBucketsViewFactory,
+)
+from common.export import ExportFormat, encode_rows
 from infrastructure.database import RepositoryUtils
-from infrastructure.uow_abstraction import UnitOfWork, unit_of_work
+from infrastructure.uow_abstraction import (
+    UnitOfWork,
+    make_unit_of_work,
+    unit_of_work,
+)
 
 
 class GetLostAndFoundPetsUseCase(BaseReportsUseCase):
@@ -20,17 +31,23 @@ class GetLostAndFoundPetsUseCase(BaseReportsUseCase):
         repository_utils: RepositoryUtils,
         reports_service: ReportService,
         lost_and_found_pets_view_factory: LostAndFoundPetsViewFactory,
+        report_buckets_view_factory: ReportBucketsViewFactory,
     ) -> None:
         super().__init__(
             repository_utils=repository_utils, report_service=reports_service
         )
         self.lost_and_found_pets_view_factory = lost_and_found_pets_view_factory
+        self.report_buckets_view_factory = report_buckets_view_factory
 
     @unit_of_work
-    async def execute(self, uow: UnitOfWork) -> LostAndFoundPetsListView:
+    async def execute(
+        self, uow: UnitOfWork, period: ReportPeriod = ReportPeriod()
+    ) -> LostAndFoundPetsListView:
         lost_and_found_pets: Sequence[LostAndFoundPets]
 
-        lost_and_found_pets = await self.report_service.get_lost_and_found_pets(uow=uow)
+        lost_and_found_pets = await self.report_service.get_lost_and_found_pets(
+            uow=uow, period=period
+        )
 
         return (
             self.lost_and_found_pets_view_factory.create_lost_and_found_pets_list_view(
@@ -38,3 +55,35 @@ class GetLostAndFoundPetsUseCase(BaseReportsUseCase):
                 total_count=len(lost_and_found_pets),
             )
         )
+
+    @unit_of_work
+    async def execute_buckets(
+        self, period: ReportPeriod, bucket: ReportBucket, uow: UnitOfWork
+    ) -> ReportBucketsListView:
+        buckets: Sequence[ReportBucketTotals]
+
+        # Sightings per bucket, lost and found pets are counted in the list
+        buckets = await self.report_service.get_report_buckets(
+            uow=uow,
+            report=ReportName.LOST_AND_FOUND_PETS,
+            organization_id=None,
+            period=period,
+            bucket=bucket,
+        )
+
+        return self.report_buckets_view_factory.create_report_buckets_list_view(
+            report=ReportName.LOST_AND_FOUND_PETS, bucket=bucket, buckets=buckets
+        )
+
+    async def export(
+        self, export_format: ExportFormat, period: ReportPeriod = ReportPeriod()
+    ) -> AsyncIterator[bytes]:
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            async for chunk in encode_rows(
+                rows=self.report_service.stream_lost_and_found_pets(
+                    uow=uow, period=period
+                ),
+                row_type=LostAndFoundPets,
+                export_format=export_format,
+            ):
+                yield chunk
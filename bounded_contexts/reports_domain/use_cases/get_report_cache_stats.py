@@ -0,0 +1,28 @@
+from bounded_contexts.reports_domain.services import ReportService
+from bounded_contexts.reports_domain.use_cases.base_reports_use_case import (
+    BaseReportsUseCase,
+)
+from bounded_contexts.reports_domain.views.report_cache_stats_view import (
+    ReportCacheStatsView,
+    ReportCacheStatsViewFactory,
+)
+from infrastructure.database import RepositoryUtils
+
+
+class GetReportCacheStatsUseCase(BaseReportsUseCase):
+    def __init__(
+        self,
+        repository_utils: RepositoryUtils,
+        reports_service: ReportService,
+        report_cache_stats_view_factory: ReportCacheStatsViewFactory,
+    ) -> None:
+        super().__init__(
+            repository_utils=repository_utils, report_service=reports_service
+        )
+        self.report_cache_stats_view_factory = report_cache_stats_view_factory
+
+    async def execute(self) -> ReportCacheStatsView:
+        # Stats of the worker answering, each one keeps its own
+        return self.report_cache_stats_view_factory.create_report_cache_stats_view(
+            stats=self.report_service.report_cache_stats()
+        )
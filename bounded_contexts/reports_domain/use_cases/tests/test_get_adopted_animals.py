@@ -0,0 +1,180 @@
+from datetime import date, datetime, timedelta, timezone
+
+from bounded_contexts.adoptions_domain.enum import AdoptionApplicationStates
+from bounded_contexts.adoptions_domain.services.adoption_applications_service import (
+    ModifyAdoptionApplicationData,
+)
+from bounded_contexts.adoptions_domain.use_cases.edit_adoption_application import (
+    EditAdoptionApplicationUseCase,
+)
+from bounded_contexts.reports_domain.dataclasses import (
+    ReportCacheStats,
+    ReportPeriod,
+)
+from bounded_contexts.reports_domain.enum import ReportBucket
+from bounded_contexts.reports_domain.services import ReportService
+from bounded_contexts.reports_domain.use_cases.get_adopted_animals import (
+    GetAdoptedAnimalsUseCase,
+)
+from bounded_contexts.reports_domain.views.adopted_animals_view import (
+    AdoptedAnimalsListView,
+)
+from bounded_contexts.reports_domain.views.report_buckets_view import (
+    ReportBucketsListView,
+)
+from common.testing import BaseUseCaseTest
+from common.testing.base_testing_utils import BaseTestingUtils
+from infrastructure.uow_abstraction import UnitOfWork, unit_of_work
+
+
+class TestGetAdoptedAnimals(BaseUseCaseTest, BaseTestingUtils):
+    @unit_of_work
+    async def initial_data(self, uow: UnitOfWork) -> None:
+        self.organizational_profile = await self.create_organizational_profile(uow=uow)
+        self.other_organizational_profile = await self.create_organizational_profile(
+            uow=uow,
+            account_email="other_organization@gmail.com",
+            organization_name="huellitas",
+        )
+        self.adopter_profile = await self.create_profile(uow=uow)
+
+        self.animal_data = (
+            await self.create_adoption_animal(
+                uow=uow, actor_profile=self.organizational_profile.profile_data
+            )
+        ).adoption_animal_data
+
+        self.application_data = (
+            await self.create_adoption_application(
+                uow=uow,
+                actor_profile=self.adopter_profile,
+                animal_id=self.animal_data.entity_id,
+            )
+        ).adoption_application_data
+
+        self.organization_id: str = self.organizational_profile.organization.entity_id
+        self.other_organization_id: str = (
+            self.other_organizational_profile.organization.entity_id
+        )
+
+    async def setUp(self) -> None:
+        await BaseUseCaseTest.setUp(self)
+
+        self.use_case: GetAdoptedAnimalsUseCase = self.dependencies.resolve(
+            GetAdoptedAnimalsUseCase
+        )
+        self.edit_application: EditAdoptionApplicationUseCase = (
+            self.dependencies.resolve(EditAdoptionApplicationUseCase)
+        )
+        self.reports_service: ReportService = self.dependencies.resolve(ReportService)
+
+        await self.initial_data()
+
+    async def adopt_animal(self) -> None:
+        await self.edit_application.execute(
+            EditAdoptionApplicationUseCase.Request(
+                actor_account_id=self.organizational_profile.profile_data.account_id,
+                application_data=ModifyAdoptionApplicationData(
+                    entity_id=self.application_data.entity_id,
+                    state=AdoptionApplicationStates.ACCEPTED,
+                ),
+            )
+        )
+
+    async def get_adopted_animal_ids(
+        self, organization_id: str | None, period: ReportPeriod = ReportPeriod()
+    ) -> list[str]:
+        view: AdoptedAnimalsListView = await self.use_case.execute(
+            GetAdoptedAnimalsUseCase.Request(
+                organization_id=organization_id, period=period
+            )
+        )
+
+        return [item.animal_id for item in view.items]
+
+    async def test_adoptions_are_reported_as_they_happen(self) -> None:
+        # Cached empty, for the organization and for every organization
+        self.assertEqual([], await self.get_adopted_animal_ids(self.organization_id))
+        self.assertEqual([], await self.get_adopted_animal_ids(None))
+
+        await self.adopt_animal()
+
+        self.assertEqual(
+            [self.animal_data.entity_id],
+            await self.get_adopted_animal_ids(self.organization_id),
+        )
+        self.assertEqual(
+            [self.animal_data.entity_id], await self.get_adopted_animal_ids(None)
+        )
+
+    async def test_adoptions_keep_the_other_organizations_cached(self) -> None:
+        await self.get_adopted_animal_ids(self.other_organization_id)
+
+        await self.adopt_animal()
+
+        before: ReportCacheStats = self.reports_service.report_cache_stats()
+
+        self.assertEqual(
+            [], await self.get_adopted_animal_ids(self.other_organization_id)
+        )
+
+        after: ReportCacheStats = self.reports_service.report_cache_stats()
+
+        self.assertEqual(0, after.loads - before.loads)
+        self.assertEqual(1, after.local_hits - before.local_hits)
+
+    async def test_adoptions_are_filtered_by_date_range(self) -> None:
+        today: date = datetime.now(timezone.utc).date()
+
+        await self.adopt_animal()
+
+        self.assertEqual(
+            [self.animal_data.entity_id],
+            await self.get_adopted_animal_ids(
+                self.organization_id, ReportPeriod(date_from=today, date_to=today)
+            ),
+        )
+        self.assertEqual(
+            [],
+            await self.get_adopted_animal_ids(
+                self.organization_id, ReportPeriod(date_to=today - timedelta(days=1))
+            ),
+        )
+        self.assertEqual(
+            [],
+            await self.get_adopted_animal_ids(
+                self.organization_id, ReportPeriod(date_from=today + timedelta(days=1))
+            ),
+        )
+
+    async def test_adoptions_are_bucketed_by_day_and_month(self) -> None:
+        today: date = datetime.now(timezone.utc).date()
+
+        await self.adopt_animal()
+
+        for bucket, bucket_start in (
+            (ReportBucket.DAY, today),
+            (ReportBucket.MONTH, today.replace(day=1)),
+        ):
+            view: ReportBucketsListView = await self.use_case.execute_buckets(
+                GetAdoptedAnimalsUseCase.Request(
+                    organization_id=self.organization_id,
+                    period=ReportPeriod(date_from=today),
+                ),
+                bucket=bucket,
+            )
+
+            self.assertEqual(
+                [(bucket_start, 1)],
+                [(item.bucket_start, item.count) for item in view.items],
+            )
+
+        view = await self.use_case.execute_buckets(
+            GetAdoptedAnimalsUseCase.Request(
+                organization_id=self.other_organization_id,
+                period=ReportPeriod(date_from=today),
+            ),
+            bucket=ReportBucket.DAY,
+        )
+
+        self.assertEqual([], view.items)
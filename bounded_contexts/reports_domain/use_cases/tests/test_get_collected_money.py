@@ -0,0 +1,221 @@
+from datetime import date, datetime, timedelta, timezone
+
+from bounded_contexts.donations_domain.use_cases.donate_to_campaign import (
+    DonateToCampaignUseCase,
+)
+from bounded_contexts.reports_domain.dataclasses import (
+    ReportCacheStats,
+    ReportPeriod,
+)
+from bounded_contexts.reports_domain.enum import ReportBucket
+from bounded_contexts.reports_domain.services import ReportService
+from bounded_contexts.reports_domain.use_cases.get_collected_money import (
+    GetCollectedMoneyUseCase,
+)
+from bounded_contexts.reports_domain.views.collected_money_view import (
+    CollectedMoneyListView,
+)
+from bounded_contexts.reports_domain.views.report_buckets_view import (
+    ReportBucketsListView,
+)
+from common.testing import BaseUseCaseTest
+from common.testing.base_testing_utils import BaseTestingUtils
+from infrastructure.uow_abstraction import UnitOfWork, unit_of_work
+
+
+class TestGetCollectedMoney(BaseUseCaseTest, BaseTestingUtils):
+    REQUESTED_AMOUNT: float = 1000
+    # The fake MercadoPago keeps a 4.1% fee
+    FINAL_AMOUNT: float = 959
+    APPLICATION_FEE: float = 100
+
+    @unit_of_work
+    async def initial_data(self, uow: UnitOfWork) -> None:
+        self.organizational_profile = await self.create_organizational_profile(uow=uow)
+        self.other_organizational_profile = await self.create_organizational_profile(
+            uow=uow,
+            account_email="other_organization@gmail.com",
+            organization_name="huellitas",
+        )
+        self.personal_profile = await self.create_profile(uow=uow)
+
+        self.donation_campaign = await self.create_donation_campaign(
+            uow=uow, profile=self.organizational_profile
+        )
+
+        self.organization_id: str = self.organizational_profile.organization.entity_id
+        self.other_organization_id: str = (
+            self.other_organizational_profile.organization.entity_id
+        )
+
+    async def setUp(self) -> None:
+        await BaseUseCaseTest.setUp(self)
+
+        self.use_case: GetCollectedMoneyUseCase = self.dependencies.resolve(
+            GetCollectedMoneyUseCase
+        )
+        self.donate_to_campaign: DonateToCampaignUseCase = self.dependencies.resolve(
+            DonateToCampaignUseCase
+        )
+        self.reports_service: ReportService = self.dependencies.resolve(ReportService)
+        self.donations: int = 0
+
+        await self.initial_data()
+
+    async def donate(self) -> None:
+        # Card tokens are single use, the payment idempotency key is derived from it
+        self.donations += 1
+
+        # Not patched: the testing config serves the fake MercadoPago in process
+        await self.donate_to_campaign.execute(
+            DonateToCampaignUseCase.Request(
+                actor_account_id=self.personal_profile.account_id,
+                donation_campaign_id=self.donation_campaign.entity_id,
+                transaction_amount=self.REQUESTED_AMOUNT,
+                application_fee=self.APPLICATION_FEE,
+                token=f"TOKEN_{self.donations}",
+                description="DESCRIPTION",
+                installments=1,
+                payment_method_id="VISA",
+                payment_type_id="CREDIT_CARD",
+                payer_email="PAYER_EMAIL@MAIL.COM",
+                payer_identification_type="DNI",
+                payer_identification_number="22222222",
+                payer_name="PAYER_NAME",
+            )
+        )
+
+    async def get_collected_money(
+        self, organization_id: str | None, period: ReportPeriod = ReportPeriod()
+    ) -> list[tuple[str, float, float]]:
+        view: CollectedMoneyListView = await self.use_case.execute(
+            organization_id=organization_id, period=period
+        )
+
+        return [
+            (
+                item.donation_campaign_id,
+                item.collected_amount,
+                item.application_collected_amount,
+            )
+            for item in view.items
+        ]
+
+    async def test_donations_are_reported_as_they_are_made(self) -> None:
+        # Cached empty, for the organization and for every organization
+        self.assertEqual([], await self.get_collected_money(self.organization_id))
+        self.assertEqual([], await self.get_collected_money(None))
+
+        await self.donate()
+
+        expected: list[tuple[str, float, float]] = [
+            (
+                self.donation_campaign.entity_id,
+                self.FINAL_AMOUNT,
+                self.APPLICATION_FEE,
+            )
+        ]
+
+        self.assertEqual(expected, await self.get_collected_money(self.organization_id))
+        self.assertEqual(expected, await self.get_collected_money(None))
+
+        await self.donate()
+
+        self.assertEqual(
+            [
+                (
+                    self.donation_campaign.entity_id,
+                    2 * self.FINAL_AMOUNT,
+                    2 * self.APPLICATION_FEE,
+                )
+            ],
+            await self.get_collected_money(self.organization_id),
+        )
+
+    async def test_donations_keep_the_other_organizations_cached(self) -> None:
+        await self.get_collected_money(self.other_organization_id)
+
+        await self.donate()
+
+        before: ReportCacheStats = self.reports_service.report_cache_stats()
+
+        self.assertEqual([], await self.get_collected_money(self.other_organization_id))
+
+        after: ReportCacheStats = self.reports_service.report_cache_stats()
+
+        self.assertEqual(0, after.loads - before.loads)
+        self.assertEqual(1, after.local_hits - before.local_hits)
+
+    async def test_donations_are_filtered_by_date_range(self) -> None:
+        today: date = datetime.now(timezone.utc).date()
+
+        await self.donate()
+
+        self.assertEqual(
+            [
+                (
+                    self.donation_campaign.entity_id,
+                    self.FINAL_AMOUNT,
+                    self.APPLICATION_FEE,
+                )
+            ],
+            await self.get_collected_money(
+                self.organization_id, ReportPeriod(date_from=today, date_to=today)
+            ),
+        )
+        self.assertEqual(
+            [],
+            await self.get_collected_money(
+                self.organization_id, ReportPeriod(date_to=today - timedelta(days=1))
+            ),
+        )
+        self.assertEqual(
+            [],
+            await self.get_collected_money(
+                self.organization_id, ReportPeriod(date_from=today + timedelta(days=1))
+            ),
+        )
+
+    async def test_donations_are_bucketed_by_day_and_week(self) -> None:
+        today: date = datetime.now(timezone.utc).date()
+
+        for _ in range(2):
+            await self.donate()
+
+        for bucket, bucket_start in (
+            (ReportBucket.DAY, today),
+            (ReportBucket.WEEK, today - timedelta(days=today.weekday())),
+        ):
+            view: ReportBucketsListView = await self.use_case.execute_buckets(
+                organization_id=self.organization_id,
+                period=ReportPeriod(date_from=today),
+                bucket=bucket,
+            )
+
+            self.assertEqual(
+                [
+                    (
+                        bucket_start,
+                        2,
+                        2 * self.FINAL_AMOUNT,
+                        2 * self.APPLICATION_FEE,
+                    )
+                ],
+                [
+                    (
+                        item.bucket_start,
+                        item.count,
+                        item.amount,
+                        item.application_amount,
+                    )
+                    for item in view.items
+                ],
+            )
+
+        view = await self.use_case.execute_buckets(
+            organization_id=self.other_organization_id,
+            period=ReportPeriod(date_from=today),
+            bucket=ReportBucket.DAY,
+        )
+
+        self.assertEqual([], view.items)
@@ -0,0 +1,159 @@
+from datetime import date, datetime, timedelta, timezone
+
+from bounded_contexts.pets_domain.use_cases import RegisterPetSightUseCase
+from bounded_contexts.reports_domain.dataclasses import (
+    ReportCacheStats,
+    ReportPeriod,
+)
+from bounded_contexts.reports_domain.enum import ReportBucket
+from bounded_contexts.reports_domain.services import ReportService
+from bounded_contexts.reports_domain.use_cases.get_lost_and_found_pets import (
+    GetLostAndFoundPetsUseCase,
+)
+from bounded_contexts.reports_domain.views.lost_and_found_pets_view import (
+    LostAndFoundPetsListView,
+)
+from bounded_contexts.reports_domain.views.report_buckets_view import (
+    ReportBucketsListView,
+)
+from common.exceptions import InvalidDateRangeException
+from common.export import ExportFormat
+from common.testing import BaseUseCaseTest
+from common.testing.base_testing_utils import BaseTestingUtils
+from infrastructure.uow_abstraction import UnitOfWork, make_unit_of_work, unit_of_work
+
+
+class TestGetLostAndFoundPets(BaseUseCaseTest, BaseTestingUtils):
+    TEST_LATITUDE: float = 35.70407437075822
+    TEST_LONGITUDE: float = 139.5577317304603
+
+    @unit_of_work
+    async def initial_data(self, uow: UnitOfWork) -> None:
+        self.profile = await self.create_profile(uow=uow)
+
+        self.lost_pet_data = (
+            await self.create_pet(uow=uow, actor_profile=self.profile, lost=True)
+        ).pet_data
+
+        self.not_lost_pet_data = (
+            await self.create_pet(uow=uow, actor_profile=self.profile)
+        ).pet_data
+
+    async def setUp(self) -> None:
+        await BaseUseCaseTest.setUp(self)
+
+        self.use_case: GetLostAndFoundPetsUseCase = self.dependencies.resolve(
+            GetLostAndFoundPetsUseCase
+        )
+
+        self.register_pet_sight: RegisterPetSightUseCase = self.dependencies.resolve(
+            RegisterPetSightUseCase
+        )
+
+        await self.initial_data()
+
+    async def test_sightings_are_counted_as_they_are_registered(self) -> None:
+        view: LostAndFoundPetsListView = await self.use_case.execute()
+
+        self.assertEqual(
+            [(self.lost_pet_data.entity_id, 0)],
+            [(item.pet_id, item.amount_of_sights) for item in view.items],
+        )
+
+        for _ in range(2):
+            await self.register_pet_sight.execute(
+                RegisterPetSightUseCase.Request(
+                    pet_id=self.lost_pet_data.entity_id,
+                    latitude=self.TEST_LATITUDE,
+                    longitude=self.TEST_LONGITUDE,
+                    account_id=None,
+                )
+            )
+
+        view = await self.use_case.execute()
+
+        self.assertEqual(
+            [(self.lost_pet_data.entity_id, 2)],
+            [(item.pet_id, item.amount_of_sights) for item in view.items],
+        )
+
+    async def test_rebuild_summaries_restores_the_report(self) -> None:
+        await self.register_pet_sight.execute(
+            RegisterPetSightUseCase.Request(
+                pet_id=self.lost_pet_data.entity_id,
+                latitude=self.TEST_LATITUDE,
+                longitude=self.TEST_LONGITUDE,
+                account_id=None,
+            )
+        )
+
+        expected: LostAndFoundPetsListView = await self.use_case.execute()
+
+        reports_service: ReportService = self.dependencies.resolve(ReportService)
+
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            summaries: dict[str, int] = await reports_service.rebuild_summaries(uow=uow)
+
+        self.assertEqual(1, summaries["report_pets"])
+        self.assertEqual(1, summaries["report_pet_sightings"])
+        self.assertEqual(expected, await self.use_case.execute())
+
+    async def test_export_streams_the_report_as_csv(self) -> None:
+        content: bytes = b"".join(
+            [chunk async for chunk in self.use_case.export(ExportFormat.CSV)]
+        )
+
+        lines: list[str] = content.decode().splitlines()
+
+        self.assertEqual(
+            "pet_id,pet_name,pet_species,pet_race,amount_of_sights,lost_date,found_date",
+            lines[0],
+        )
+        self.assertEqual(2, len(lines))
+        self.assertTrue(lines[1].startswith(f"{self.lost_pet_data.entity_id},Pepito,"))
+
+    async def test_sightings_are_bucketed_by_day(self) -> None:
+        today: date = datetime.now(timezone.utc).date()
+
+        for _ in range(2):
+            await self.register_pet_sight.execute(
+                RegisterPetSightUseCase.Request(
+                    pet_id=self.lost_pet_data.entity_id,
+                    latitude=self.TEST_LATITUDE,
+                    longitude=self.TEST_LONGITUDE,
+                    account_id=None,
+                )
+            )
+
+        view: ReportBucketsListView = await self.use_case.execute_buckets(
+            period=ReportPeriod(date_from=today), bucket=ReportBucket.DAY
+        )
+
+        self.assertEqual(
+            [(today, 2)], [(item.bucket_start, item.count) for item in view.items]
+        )
+
+        view = await self.use_case.execute(
+            period=ReportPeriod(date_to=today - timedelta(days=1))
+        )
+
+        self.assertEqual([], view.items)
+
+    async def test_period_must_not_end_before_it_starts(self) -> None:
+        today: date = datetime.now(timezone.utc).date()
+
+        with self.assertRaises(InvalidDateRangeException):
+            ReportPeriod(date_from=today, date_to=today - timedelta(days=1))
+
+    async def test_repeated_reports_are_served_from_the_cache(self) -> None:
+        reports_service: ReportService = self.dependencies.resolve(ReportService)
+        before: ReportCacheStats = reports_service.report_cache_stats()
+
+        first: LostAndFoundPetsListView = await self.use_case.execute()
+        second: LostAndFoundPetsListView = await self.use_case.execute()
+
+        after: ReportCacheStats = reports_service.report_cache_stats()
+
+        self.assertEqual(first, second)
+        self.assertEqual(1, after.loads - before.loads)
+        self.assertEqual(1, after.local_hits - before.local_hits)
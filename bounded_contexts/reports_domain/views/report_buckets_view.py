@@ -0,0 +1,46 @@
+from datetime import date
+from typing import Sequence
+
+from pydantic import BaseModel
+
+from bounded_contexts.reports_domain.dataclasses import ReportBucketTotals
+from bounded_contexts.reports_domain.enum import ReportBucket, ReportName
+
+
+class ReportBucketView(BaseModel):
+    bucket_start: date
+    count: int
+    amount: float | None = None
+    application_amount: float | None = None
+
+
+class ReportBucketsListView(BaseModel):
+    report: ReportName
+    bucket: ReportBucket
+    items: Sequence[ReportBucketView]
+    total_count: int
+
+
+class ReportBucketsViewFactory:
+    @staticmethod
+    def create_report_bucket_view(totals: ReportBucketTotals) -> ReportBucketView:
+        return ReportBucketView(
+            bucket_start=totals.bucket_start,
+            count=totals.count,
+            amount=totals.amount,
+            application_amount=totals.application_amount,
+        )
+
+    @staticmethod
+    def create_report_buckets_list_view(
+        report: ReportName, bucket: ReportBucket, buckets: Sequence[ReportBucketTotals]
+    ) -> ReportBucketsListView:
+        return ReportBucketsListView(
+            report=report,
+            bucket=bucket,
+            items=[
+                ReportBucketsViewFactory.create_report_bucket_view(totals=totals)
+                for totals in buckets
+            ],
+            total_count=len(buckets),
+        )
@@ -0,0 +1,29 @@
+from pydantic import BaseModel
+
+from bounded_contexts.reports_domain.dataclasses import ReportCacheStats
+
+
+class ReportCacheStatsView(BaseModel):
+    lookups: int
+    local_hits: int
+    shared_hits: int
+    loads: int
+    entries: int
+    hit_ratio: float
+    local_hit_ratio: float
+    shared_hit_ratio: float
+
+
+class ReportCacheStatsViewFactory:
+    @staticmethod
+    def create_report_cache_stats_view(stats: ReportCacheStats) -> ReportCacheStatsView:
+        return ReportCacheStatsView(
+            lookups=stats.lookups,
+            local_hits=stats.local_hits,
+            shared_hits=stats.shared_hits,
+            loads=stats.loads,
+            entries=stats.entries,
+            hit_ratio=stats.hit_ratio,
+            local_hit_ratio=stats.local_hit_ratio,
+            shared_hit_ratio=stats.shared_hit_ratio,
+        )
@@ -1,15 +1,14 @@
 from enum import Enum
 from pathlib import Path
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import Template
+
+from common.email_templates import get_template, register_template_path
 
 BASE_DIR = Path(__file__).parent.parent.parent.parent
 
-COMMON_TEMPLATE_PATH = BASE_DIR / "common/templates/"
 SOCIAL_TEMPLATE_PATH = BASE_DIR / "bounded_contexts/social_domain/email/templates/"
 
-template_env = Environment(
-    loader=FileSystemLoader([str(COMMON_TEMPLATE_PATH), str(SOCIAL_TEMPLATE_PATH)])
-)
+register_template_path(SOCIAL_TEMPLATE_PATH)
 
 
 # Steps to register new email:
@@ -36,7 +35,7 @@ def render_verify_account_template(
     profile_name: str,
     verify_account_url: str,
 ) -> str:
-    template: Template = template_env.get_template(
+    template: Template = get_template(
         SocialEmailTemplates.VERIFY_ACCOUNT_TEMPLATE.value
     )
 
@@ -50,9 +49,7 @@ def render_reset_password_template(
     profile_name: str,
     reset_password_url: str,
 ) -> str:
-    template: Template = template_env.get_template(
-        SocialEmailTemplates.RESET_PASSWORD.value
-    )
+    template: Template = get_template(SocialEmailTemplates.RESET_PASSWORD.value)
 
     return template.render(
         profile_name=profile_name,
@@ -64,9 +61,7 @@ def render_organization_verified_template(
     profile_name: str,
     organization_name: str,
 ) -> str:
-    template: Template = template_env.get_template(
-        SocialEmailTemplates.ORGANIZATION_VERIFIED.value
-    )
+    template: Template = get_template(SocialEmailTemplates.ORGANIZATION_VERIFIED.value)
 
     return template.render(
         profile_name=profile_name,
@@ -75,7 +70,7 @@ def render_organization_verified_template(
 
 
 def render_account_verified_template(profile_name: str) -> str:
-    template: Template = template_env.get_template(
+    template: Template = get_template(
         SocialEmailTemplates.ACCOUNT_VERIFIED_TEMPLATE.value
     )
 
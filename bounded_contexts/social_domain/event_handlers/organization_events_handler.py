@@ -42,7 +42,7 @@ class OrganizationEventsHandler:
         profile_name: str,
         organization_name: str,
     ) -> None:
-        self.email_gateway.schedule_mail(
+        await self.email_gateway.schedule_mail(
             recipient=email,
             subject=SocialEmailSubjects.ORGANIZATION_VERIFIED.value,
             body=render_organization_verified_template(
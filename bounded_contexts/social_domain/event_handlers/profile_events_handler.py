@@ -20,12 +20,13 @@ from bounded_contexts.social_domain.enum import OrganizationRoles, ProfileTypes
 from bounded_contexts.social_domain.events import (
     PersonalProfileCreatedEvent,
     OrganizationalProfileCreatedEvent,
+    OrganizationMemberStatusEditedEvent,
 )
 from bounded_contexts.social_domain.services.profile_service import ProfileService
 from config import UrlConfig
 from infrastructure.database import RepositoryUtils
 from infrastructure.email import BaseEmailGateway
-from infrastructure.uow_abstraction import EventBus, make_unit_of_work
+from infrastructure.uow_abstraction import EventBus, UnitOfWork, make_unit_of_work
 
 
 class VerifyAccountUrls(Enum):
@@ -68,9 +69,16 @@ class ProfileEventsHandler:
 
         event_bus.on(AccountVerifiedEvent, self.__handle_account_verified_event)
 
+        event_bus.on(
+            OrganizationMemberStatusEditedEvent,
+            self.__handle_organization_member_status_edited_event,
+        )
+
     async def __handle_personal_profile_created_event(
         self, e: PersonalProfileCreatedEvent
     ) -> None:
+        self.profile_service.invalidate_profile_snapshot(account_id=e.actor_account_id)
+
         await self.__send_verification_email(
             account_id=e.actor_account_id,
             email=e.email,
@@ -81,6 +89,8 @@ class ProfileEventsHandler:
     async def __handle_organizational_profile_created_event(
         self, e: OrganizationalProfileCreatedEvent
     ) -> None:
+        self.profile_service.invalidate_profile_snapshot(account_id=e.actor_account_id)
+
         await self.__send_verification_email(
             account_id=e.actor_account_id,
             email=e.email,
@@ -141,9 +151,14 @@ class ProfileEventsHandler:
                 return
 
             await self.__send_account_verified_email(
-                email=e.email, profile_name=profile.first_name
+                uow=uow, email=e.email, profile_name=profile.first_name
             )
 
+    async def __handle_organization_member_status_edited_event(
+        self, e: OrganizationMemberStatusEditedEvent
+    ) -> None:
+        self.profile_service.invalidate_profile_snapshot(account_id=e.member_account_id)
+
     async def __send_verification_email(
         self,
         account_id: str,
@@ -157,7 +172,7 @@ class ProfileEventsHandler:
             )
         )
 
-        self.email_gateway.schedule_mail(
+        await self.email_gateway.schedule_mail(
             recipient=email,
             subject=SocialEmailSubjects.VERIFY_ACCOUNT.value,
             body=render_verify_account_template(
@@ -182,7 +197,7 @@ class ProfileEventsHandler:
                 account_id=e.actor_account_id,
             )
 
-        self.email_gateway.schedule_mail(
+        await self.email_gateway.schedule_mail(
             recipient=e.email,
             subject=SocialEmailSubjects.RESET_PASSWORD.value,
             body=render_reset_password_template(
@@ -192,9 +207,10 @@ class ProfileEventsHandler:
         )
 
     async def __send_account_verified_email(
-        self, email: str, profile_name: str
+        self, uow: UnitOfWork, email: str, profile_name: str
     ) -> None:
-        self.email_gateway.schedule_mail(
+        await self.email_gateway.schedule_mail(
+            uow=uow,
             recipient=email,
             subject=SocialEmailSubjects.ACCOUNT_VERIFIED.value,
             body=render_account_verified_template(profile_name=profile_name),
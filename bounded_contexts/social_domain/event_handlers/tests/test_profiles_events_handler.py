@@ -15,7 +15,7 @@ from bounded_contexts.social_domain.use_cases import (
 from common.testing import BaseUseCaseTest
 from common.testing.base_testing_utils import BaseTestingUtils
 from infrastructure.date_utils import date_now
-from infrastructure.email import BaseEmailGateway
+from infrastructure.email import TestEmailGateway
 from infrastructure.uow_abstraction import make_unit_of_work
 
 
@@ -44,8 +44,8 @@ class TestProfileRegisteredEventHandler(BaseUseCaseTest, BaseTestingUtils):
             ResendVerificationRequest
         )
 
-        self.email_gateway: BaseEmailGateway = self.dependencies.resolve(
-            BaseEmailGateway
+        self.email_gateway: TestEmailGateway = self.dependencies.resolve(
+            TestEmailGateway
         )
 
         self.request_password_reset_use_case = self.dependencies.resolve(
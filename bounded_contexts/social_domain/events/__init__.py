@@ -3,4 +3,7 @@ from .profile_events import (
     OrganizationalProfileCreatedEvent,
 )
 
-from .organization_events import OrganizationVerifiedEvent
+from .organization_events import (
+    OrganizationVerifiedEvent,
+    OrganizationMemberStatusEditedEvent,
+)
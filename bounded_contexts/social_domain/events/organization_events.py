@@ -18,3 +18,23 @@ class OrganizationVerifiedEvent(Event):
         self.email = email
         self.profile_first_name = profile_first_name
         self.organization_name = organization_name
+
+
+class OrganizationMemberStatusEditedEvent(Event):
+    def __init__(
+        self,
+        actor_account_id: str,
+        issued: float,
+        member_account_id: str,
+        verified_by_organization: bool,
+    ) -> None:
+        super().__init__(
+            actor_account_id=actor_account_id,
+            issued=issued,
+        )
+
+        self.member_account_id = member_account_id
+        self.verified_by_organization = verified_by_organization
+
+    def aggregate_id(self) -> str | None:
+        return self.member_account_id
@@ -18,6 +18,9 @@ class PersonalProfileCreatedEvent(Event):
         self.email = email
         self.first_name = first_name
 
+    def aggregate_id(self) -> str | None:
+        return self.actor_account_id
+
 
 class OrganizationalProfileCreatedEvent(Event):
     def __init__(
@@ -36,3 +39,6 @@ class OrganizationalProfileCreatedEvent(Event):
         self.email = email
         self.first_name = first_name
         self.organization_role = organization_role
+
+    def aggregate_id(self) -> str | None:
+        return self.actor_account_id
@@ -120,6 +120,16 @@ class AlchemyProfileRepository(ProfileRepository):
         result = await session.execute(query)
         return result.scalar()  # type: ignore
 
+    async def get_multiple_profiles_by_id(
+        self, session: Session, profile_ids: list[str]
+    ) -> Sequence[BaseProfile]:
+        query = select(self.model).where(
+            self.model.entity_id.in_(profile_ids),  # type: ignore
+        )
+
+        result = await session.execute(query)
+        return result.scalars().all()
+
     async def get_multiple_personal_profiles_by_id(
         self, session: Session, profile_ids: list[str]
     ) -> Sequence[PersonalProfile]:
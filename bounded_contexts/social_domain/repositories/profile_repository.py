@@ -68,6 +68,12 @@ class ProfileRepository(ABC):
     ) -> int:
         pass
 
+    @abstractmethod
+    async def get_multiple_profiles_by_id(
+        self, session: Session, profile_ids: list[str]
+    ) -> Sequence[BaseProfile]:
+        pass
+
     @abstractmethod
     async def get_multiple_personal_profiles_by_id(
         self, session: Session, profile_ids: list[str]
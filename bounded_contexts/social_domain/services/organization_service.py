@@ -2,7 +2,10 @@ from typing import Sequence
 from uuid import uuid4
 from bounded_contexts.social_domain.entities import Organization, OrganizationalProfile
 from bounded_contexts.social_domain.enum import OrganizationRoles
-from bounded_contexts.social_domain.events import OrganizationVerifiedEvent
+from bounded_contexts.social_domain.events import (
+    OrganizationVerifiedEvent,
+    OrganizationMemberStatusEditedEvent,
+)
 from bounded_contexts.social_domain.exceptions import (
     OrganizationAlreadyRegisteredException,
     AcceptOrganizationMemberUnauthorizedException,
@@ -93,20 +96,28 @@ class OrganizationService:
     async def get_organization_by_id(
         self, uow: UnitOfWork, entity_id: str
     ) -> Organization:
-        organization: Organization | None = (
-            await self.organizations_repository.get_organization_by_id(
-                session=uow.session,
-                entity_id=entity_id,
-            )
+        organization: Organization | None = uow.entity_cache.get(
+            Organization, entity_id
+        )
+
+        if organization is not None:
+            return organization
+
+        organization = await self.organizations_repository.get_organization_by_id(
+            session=uow.session,
+            entity_id=entity_id,
         )
 
         if not organization:
             raise OrganizationNotFoundByIdException(entity_id=entity_id)
 
+        uow.entity_cache.add(Organization, organization)
+
         return organization
 
     async def accept_organization_profile(
         self,
+        uow: UnitOfWork,
         actor_profile: OrganizationalProfile,
         profile: OrganizationalProfile,
     ) -> None:
@@ -119,8 +130,13 @@ class OrganizationService:
 
         profile.verified_by_organization = True
 
+        self.__issue_organization_member_status_edited_event(
+            uow=uow, actor_profile=actor_profile, profile=profile
+        )
+
     async def disable_organization_profile(
         self,
+        uow: UnitOfWork,
         actor_profile: OrganizationalProfile,
         profile: OrganizationalProfile,
     ) -> None:
@@ -133,6 +149,10 @@ class OrganizationService:
 
         profile.verified_by_organization = False
 
+        self.__issue_organization_member_status_edited_event(
+            uow=uow, actor_profile=actor_profile, profile=profile
+        )
+
     async def get_multiple_organizations_by_id(
         self, uow: UnitOfWork, organization_ids: list[str]
     ) -> Sequence[Organization]:
@@ -142,6 +162,8 @@ class OrganizationService:
             session=uow.session, organization_ids=organization_ids
         )
 
+        uow.entity_cache.add_many(Organization, organizations)
+
         return organizations
 
     async def verify_organization(
@@ -171,3 +193,18 @@ class OrganizationService:
                 organization_name=organization.organization_name,
             )
         )
+
+    @staticmethod
+    def __issue_organization_member_status_edited_event(
+        uow: UnitOfWork,
+        actor_profile: OrganizationalProfile,
+        profile: OrganizationalProfile,
+    ) -> None:
+        uow.emit_event(
+            OrganizationMemberStatusEditedEvent(
+                actor_account_id=actor_profile.account.entity_id,
+                issued=float_timestamp(),
+                member_account_id=profile.account.entity_id,
+                verified_by_organization=profile.verified_by_organization,
+            )
+        )
@@ -25,6 +25,8 @@ from bounded_contexts.social_domain.exceptions import (
     RegisterOrganizationAdminUnauthorizedException,
 )
 from bounded_contexts.social_domain.repositories import ProfileRepository
+from bounded_contexts.social_domain.value_objects import ProfileSnapshot
+from common.ttl_cache import TTLCache
 from infrastructure.date_utils import float_timestamp
 from infrastructure.uow_abstraction import UnitOfWork
 
@@ -41,8 +43,13 @@ class ModifyProfileData:
 
 
 class ProfileService:
-    def __init__(self, profile_repository: ProfileRepository) -> None:
+    def __init__(
+        self,
+        profile_repository: ProfileRepository,
+        profile_snapshot_cache: TTLCache[str, ProfileSnapshot],
+    ) -> None:
         self.profile_repository = profile_repository
+        self.profile_snapshot_cache = profile_snapshot_cache
 
     async def create_personal_profile(
         self,
@@ -92,10 +99,37 @@ class ProfileService:
         if profile is None:
             raise ProfileNotFoundException()
 
+        self.profile_snapshot_cache.set(
+            account_id, ProfileSnapshot.from_profile(profile)
+        )
+
         return profile
 
+    async def get_profile_snapshot_by_account_id(
+        self, uow: UnitOfWork, account_id: str
+    ) -> ProfileSnapshot:
+        # Served from the process-wide cache, so no query on the hot path
+        snapshot: ProfileSnapshot | None = self.profile_snapshot_cache.get(account_id)
+
+        if snapshot is not None:
+            return snapshot
+
+        profile: BaseProfile = await self.get_profile_by_account_id(
+            uow=uow, account_id=account_id
+        )
+
+        return ProfileSnapshot.from_profile(profile)
+
+    def invalidate_profile_snapshot(self, account_id: str) -> None:
+        self.profile_snapshot_cache.invalidate(account_id)
+
     async def get_profile(self, uow: UnitOfWork, entity_id: str) -> BaseProfile:
-        profile: BaseProfile | None = await self.profile_repository.get_profile(
+        profile: BaseProfile | None = uow.entity_cache.get(BaseProfile, entity_id)
+
+        if profile is not None:
+            return profile
+
+        profile = await self.profile_repository.get_profile(
             session=uow.session,
             entity_id=entity_id,
         )
@@ -103,6 +137,8 @@ class ProfileService:
         if profile is None:
             raise ProfileNotFoundException()
 
+        uow.entity_cache.add(BaseProfile, profile)
+
         return profile
 
     async def find_profile_by_account_id(
@@ -301,6 +337,20 @@ class ProfileService:
             organization_id=actor_profile.organization_id,
         )
 
+    async def get_multiple_profiles_by_id(
+        self, uow: UnitOfWork, profile_ids: list[str]
+    ) -> Sequence[BaseProfile]:
+        profiles: Sequence[
+            BaseProfile
+        ] = await self.profile_repository.get_multiple_profiles_by_id(
+            session=uow.session,
+            profile_ids=profile_ids,
+        )
+
+        uow.entity_cache.add_many(BaseProfile, profiles)
+
+        return profiles
+
     async def get_multiple_personal_profiles_by_id(
         self, uow: UnitOfWork, profile_ids: list[str]
     ) -> Sequence[PersonalProfile]:
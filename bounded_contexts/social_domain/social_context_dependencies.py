@@ -34,7 +34,9 @@ from bounded_contexts.social_domain.views import (
     OrganizationViewFactory,
     ProfileViewFactory,
 )
+from bounded_contexts.social_domain.value_objects import ProfileSnapshot
 from common.dependencies import BaseContextDependencies
+from common.ttl_cache import TTLCache
 from config import ProjectConfig
 from infrastructure.database import RepositoryUtils
 from infrastructure.email import BaseEmailGateway
@@ -42,6 +44,9 @@ from infrastructure.uow_abstraction import EventBus
 
 
 class SocialContextDependencies(BaseContextDependencies):
+    PROFILE_SNAPSHOT_CACHE_SIZE: int = 10_000
+    PROFILE_SNAPSHOT_CACHE_TTL_SECONDS: float = 300
+
     def _initialize_view_factories(self) -> None:
         profile_view_factory: ProfileViewFactory = ProfileViewFactory()
 
@@ -65,8 +70,19 @@ class SocialContextDependencies(BaseContextDependencies):
         self.dependencies.register(OrganizationsRepository, organizations_repository)
 
     def _initialize_services(self) -> None:
+        # Shared by every ProfileService instance, other contexts create their own
+        profile_snapshot_cache: TTLCache[str, ProfileSnapshot] = TTLCache(
+            max_size=self.PROFILE_SNAPSHOT_CACHE_SIZE,
+            ttl_seconds=self.PROFILE_SNAPSHOT_CACHE_TTL_SECONDS,
+        )
+
+        self.dependencies.register(
+            TTLCache[str, ProfileSnapshot], profile_snapshot_cache
+        )
+
         profile_service: ProfileService = ProfileService(
             profile_repository=self.dependencies.resolve(ProfileRepository),
+            profile_snapshot_cache=profile_snapshot_cache,
         )
 
         self.dependencies.register(ProfileService, profile_service)
@@ -29,11 +29,12 @@ class EditOrganizationMemberStatus(BaseSocialUseCase):
 
         if request.accepted:
             await self.organization_service.accept_organization_profile(
+                uow=uow,
                 actor_profile=actor_profile,
                 profile=profile,
             )
 
         else:
             await self.organization_service.disable_organization_profile(
-                actor_profile=actor_profile, profile=profile
+                uow=uow, actor_profile=actor_profile, profile=profile
             )
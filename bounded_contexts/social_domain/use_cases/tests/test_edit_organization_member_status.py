@@ -155,3 +155,32 @@ class TestEditOrganizationMemberStatus(
                 )
 
                 self.assertFalse(organizational_profile.verified_by_organization)
+
+    async def test_edit_member_status_invalidates_profile_snapshot(self) -> None:
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            snapshot = await self.profile_service.get_profile_snapshot_by_account_id(
+                uow=uow,
+                account_id=self.collaborator.account_id,
+            )
+
+            self.assertFalse(snapshot.verified_by_organization)
+
+        await self.use_case.execute(
+            EditOrganizationMemberStatus.Request(
+                actor_account_id=self.organization_admin_data.account_id,
+                member_account_id=self.collaborator.account_id,
+                accepted=True,
+            )
+        )
+
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            snapshot = await self.profile_service.get_profile_snapshot_by_account_id(
+                uow=uow,
+                account_id=self.collaborator.account_id,
+            )
+
+            self.assertTrue(snapshot.verified_by_organization)
+            self.assertEqual(
+                self.organization_admin_data.organization_id, snapshot.organization_id
+            )
+            self.assertEqual(OrganizationRoles.COLLABORATOR, snapshot.organization_role)
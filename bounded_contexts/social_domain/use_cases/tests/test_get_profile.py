@@ -1,6 +1,6 @@
 from bounded_contexts.social_domain.enum import ProfileTypes
 from bounded_contexts.social_domain.use_cases import GetProfileUseCase
-from common.testing import BaseUseCaseTest
+from common.testing import BaseUseCaseTest, QueryCounter
 from common.testing.base_testing_utils import (
     BaseTestingUtils,
     ProfileData,
@@ -76,3 +76,25 @@ class TestGetProfile(BaseUseCaseTest, BaseTestingUtils):
             self.assertEqual(view.organization_id, profile.organization_id)
             self.assertEqual(view.organization_role, profile.organization_role.value)
             self.assertEqual(view.email, profile.account.email)
+
+    async def test_get_profile_twice_in_same_unit_of_work_hits_entity_cache(
+        self,
+    ) -> None:
+        async with make_unit_of_work(self.repository_utils.sessionmaker) as uow:
+            profile = await self.profile_service.get_profile(
+                uow=uow, entity_id=self.personal_profile.profile_id
+            )
+
+            with QueryCounter(engine=self.repository_utils.engine) as counter:
+                cached_profile = await self.profile_service.get_profile(
+                    uow=uow, entity_id=self.personal_profile.profile_id
+                )
+
+            self.assertIs(profile, cached_profile)
+            self.assertEqual(0, counter.count)
+            self.assertEqual(1, uow.entity_cache.hits)
+            self.assertEqual(1, uow.entity_cache.misses)
+
+            await uow.flush()
+
+            self.assertEqual(0, len(uow.entity_cache))
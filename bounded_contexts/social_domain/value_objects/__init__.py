@@ -0,0 +1 @@
+from .profile_snapshot import ProfileSnapshot
@@ -0,0 +1,36 @@
+from dataclasses import dataclass
+from typing import cast
+
+from bounded_contexts.social_domain.entities import BaseProfile, OrganizationalProfile
+from bounded_contexts.social_domain.enum import OrganizationRoles, ProfileTypes
+
+
+@dataclass(frozen=True)
+class ProfileSnapshot:
+    # The authorization-relevant part of a profile, cheap enough to cache per account
+    account_id: str
+    entity_id: str
+    profile_type: ProfileTypes
+    organization_id: str | None = None
+    organization_role: OrganizationRoles | None = None
+    verified_by_organization: bool | None = None
+
+    @staticmethod
+    def from_profile(profile: BaseProfile) -> "ProfileSnapshot":
+        if profile.profile_type == ProfileTypes.ORGANIZATIONAL_PROFILE:
+            organizational_profile = cast(OrganizationalProfile, profile)
+
+            return ProfileSnapshot(
+                account_id=profile.account.entity_id,
+                entity_id=profile.entity_id,
+                profile_type=profile.profile_type,
+                organization_id=organizational_profile.organization_id,
+                organization_role=organizational_profile.organization_role,
+                verified_by_organization=organizational_profile.verified_by_organization,
+            )
+
+        return ProfileSnapshot(
+            account_id=profile.account.entity_id,
+            entity_id=profile.entity_id,
+            profile_type=profile.profile_type,
+        )
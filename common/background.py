@@ -1,29 +1,250 @@
 """
 The Background Common module.
 
-Defines primitives for executing I/O blocking operations in the background using
-a thread pool executor.
+Defines primitives for executing blocking operations in the background, on one
+bounded thread pool executor per kind of workload.
 """
 
 import asyncio
-from typing import Callable, Any
-from concurrent.futures import ThreadPoolExecutor
+import functools
+import logging
+import os
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Mapping
+
+from common.exceptions import ExecutorRejectedException
+from config import ExecutorConfig
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class Workload(Enum):
+    # bcrypt and JWT, CPU bound
+    CRYPTO = "crypto"
+    # Network calls (S3, SendGrid, MercadoPago), mostly waiting
+    IO = "io"
+    # QR and image rendering
+    IMAGE = "image"
+
+
+@dataclass
+class ExecutorMetrics:
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    # Calls that found the queue full for longer than the queue timeout
+    rejected: int = 0
+    # Calls running or waiting in the pool queue
+    in_flight: int = 0
+    max_in_flight: int = 0
+    # Calls waiting for a place in the queue (backpressure)
+    waiting: int = 0
+    total_wait_seconds: float = 0.0
+
+    @property
+    def average_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.submitted if self.submitted else 0.0
+
+
+class BoundedExecutor:
+    """
+    Thread pool executor that accepts at most max_workers + max_queue_size calls.
+    Another executor (a process pool) can be given instead of the thread pool.
+
+    Callers past that wait (without blocking the loop) for a place up to the queue
+    timeout, and are then rejected with ExecutorRejectedException. Scheduled calls
+    are tracked until they finish, so drain() can wait for them on shutdown.
+    """
+
+    def __init__(
+        self, name: str, config: ExecutorConfig, executor: Executor | None = None
+    ) -> None:
+        self.name: str = name
+        self.config: ExecutorConfig = config
+        self.metrics: ExecutorMetrics = ExecutorMetrics()
+        self.__executor: Executor = executor or ThreadPoolExecutor(
+            max_workers=config.max_workers, thread_name_prefix=f"{name}_worker_"
+        )
+        self.__scheduled: set[asyncio.Future] = set()
+        self.__draining: bool = False
+        # Bound to the loop that first waits on it, created again for a new loop
+        self.__slots: asyncio.Semaphore | None = None
+        self.__slots_loop: asyncio.AbstractEventLoop | None = None
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        return await self.__run(
+            self.config.queue_timeout, functools.partial(func, *args, **kwargs)
+        )
+
+    def schedule(self, func: Callable[..., Any], *args, **kwargs) -> None:
+        """
+        Runs the call in the background without waiting for it. It waits for a place
+        in the queue as long as needed, the number of scheduled calls is bounded by
+        the queue size instead.
+        """
+
+        if self.__draining or len(self.__scheduled) >= self.__capacity():
+            self.metrics.rejected += 1
+            logger.error(f"Executor {self.name} rejected a scheduled call")
+            return
+
+        future = asyncio.ensure_future(
+            self.__run(None, functools.partial(func, *args, **kwargs))
+        )
+
+        self.__scheduled.add(future)
+        future.add_done_callback(self.__on_scheduled_done)
+
+    async def drain(self, timeout: float | None = None) -> None:
+        """
+        Stops accepting calls and waits for the scheduled ones to finish.
+        """
+
+        self.__draining = True
+
+        if self.__scheduled:
+            _, pending = await asyncio.wait(set(self.__scheduled), timeout=timeout)
+
+            if pending:
+                logger.error(
+                    f"Executor {self.name} abandoned {len(pending)} scheduled calls"
+                )
+
+        self.__executor.shutdown(wait=False)
+
+    def shutdown(self) -> None:
+        self.__draining = True
+        self.__executor.shutdown(wait=False)
+
+    def __capacity(self) -> int:
+        return self.config.max_workers + self.config.max_queue_size
+
+    def __get_slots(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+
+        if self.__slots is None or self.__slots_loop is not loop:
+            self.__slots = asyncio.Semaphore(self.__capacity())
+            self.__slots_loop = loop
+
+        return self.__slots
+
+    async def __run(self, timeout: float | None, call: Callable[[], Any]) -> Any:
+        if self.__draining:
+            self.metrics.rejected += 1
+            raise ExecutorRejectedException(executor_name=self.name)
+
+        slots: asyncio.Semaphore = self.__get_slots()
+        start: float = time.perf_counter()
+
+        self.metrics.waiting += 1
+        try:
+            await asyncio.wait_for(slots.acquire(), timeout=timeout)
+        except asyncio.TimeoutError:
+            self.metrics.rejected += 1
+            raise ExecutorRejectedException(executor_name=self.name)
+        finally:
+            self.metrics.waiting -= 1
+
+        self.metrics.submitted += 1
+        self.metrics.total_wait_seconds += time.perf_counter() - start
+        self.metrics.in_flight += 1
+        self.metrics.max_in_flight = max(
+            self.metrics.max_in_flight, self.metrics.in_flight
+        )
+
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(
+                self.__executor, call
+            )
+        except BaseException:
+            self.metrics.failed += 1
+            raise
+        finally:
+            self.metrics.in_flight -= 1
+            slots.release()
+
+        self.metrics.completed += 1
+
+        return result
+
+    def __on_scheduled_done(self, future: asyncio.Future) -> None:
+        self.__scheduled.discard(future)
+
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(
+                f"Scheduled call on executor {self.name} failed",
+                exc_info=future.exception(),
+            )
 
 
 ###
-# Thread pool executor used strictly to perform blocking operations in background
+# One executor per workload, so a burst of one kind can't starve the others.
+# Resized from the project config by configure_executors.
 ###
 
-MAX_THREAD_POOL_SIZE = 100
+_CPU_COUNT: int = os.cpu_count() or 1
+
+DEFAULT_EXECUTOR_CONFIGS: dict[Workload, ExecutorConfig] = {
+    Workload.CRYPTO: ExecutorConfig(
+        max_workers=_CPU_COUNT, max_queue_size=64, queue_timeout=2
+    ),
+    Workload.IO: ExecutorConfig(max_workers=32, max_queue_size=512, queue_timeout=5),
+    Workload.IMAGE: ExecutorConfig(
+        max_workers=_CPU_COUNT, max_queue_size=32, queue_timeout=10
+    ),
+}
+
+_executors: dict[Workload, BoundedExecutor] = {
+    workload: BoundedExecutor(name=workload.value, config=config)
+    for workload, config in DEFAULT_EXECUTOR_CONFIGS.items()
+}
+
+
+def configure_executors(configs: Mapping[str, ExecutorConfig]) -> None:
+    """
+    Applies the executor limits by workload name. Executors whose limits change are
+    replaced, the calls already running on them finish on the old threads.
+    """
+
+    for workload in Workload:
+        config: ExecutorConfig | None = configs.get(workload.value)
+
+        if config is None or config == _executors[workload].config:
+            continue
+
+        _executors[workload].shutdown()
+        _executors[workload] = BoundedExecutor(name=workload.value, config=config)
 
-BACKGROUND_THREAD_POOL_EXECUTOR = ThreadPoolExecutor(
-    max_workers=MAX_THREAD_POOL_SIZE, thread_name_prefix="background_worker_"
-)
 
+def get_executor(workload: Workload) -> BoundedExecutor:
+    return _executors[workload]
 
-async def run_async(func: Callable[..., Any], *args, **kwargs) -> Any:
+
+def executor_metrics() -> dict[str, ExecutorMetrics]:
+    return {
+        workload.value: executor.metrics for workload, executor in _executors.items()
+    }
+
+
+async def drain_executors(timeout: float | None = None) -> None:
+    """
+    Waits for the scheduled calls of every executor (fire and forget emails) before
+    the process exits.
     """
-    Runs a callable on the background thread pool executor using the current thread's
+
+    await asyncio.gather(
+        *(executor.drain(timeout=timeout) for executor in _executors.values())
+    )
+
+
+async def run_async(
+    func: Callable[..., Any], *args, workload: Workload = Workload.IO, **kwargs
+) -> Any:
+    """
+    Runs a callable on the executor of its workload using the current thread's
       I/O loop instance.
 
     Usage:
@@ -32,28 +253,20 @@ async def run_async(func: Callable[..., Any], *args, **kwargs) -> Any:
             # does some blocking stuff
             # ...
 
-        run_async(blocking_task, arg1, arg2, arg3)
+        run_async(blocking_task, arg1, arg2, arg3, workload=Workload.IO)
 
     :param Callable[..., Any] func: the function or callable to run in background
     :param tuple args: function arguments
+    :param Workload workload: the executor to run it on
     :param dict kwargs: function named arguments
     :return: funcs return value
+    :raises ExecutorRejectedException: if the executor queue stayed full
     """
 
-    def work():
-        return func(*args, **kwargs)
-
-    return await asyncio.get_event_loop().run_in_executor(
-        BACKGROUND_THREAD_POOL_EXECUTOR, work
-    )
-
-
-tasks = set()
-
-
-def run_fire_forget(func: Callable[..., Any], *args, **kwargs) -> None:
-    future = asyncio.ensure_future(run_async(func, *args, **kwargs))
+    return await _executors[workload].run(func, *args, **kwargs)
 
-    tasks.add(future)
 
-    future.add_done_callback(lambda _: tasks.remove(future))
+def run_fire_forget(
+    func: Callable[..., Any], *args, workload: Workload = Workload.IO, **kwargs
+) -> None:
+    _executors[workload].schedule(func, *args, **kwargs)
@@ -0,0 +1,141 @@
+"""
+The Email Templates Common module.
+
+Defines the Jinja environment shared by every email template module. Each bounded
+context registers its templates folder, and configure_templates compiles all of them
+at startup, so renders neither compile nor (with auto reload off) stat the files.
+"""
+
+import os
+import uuid
+from pathlib import Path
+from typing import Any, Sequence
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+from markupsafe import escape
+
+from config import TemplatesConfig
+
+COMMON_TEMPLATE_PATH = Path(__file__).parent / "templates"
+
+template_loader = FileSystemLoader([str(COMMON_TEMPLATE_PATH)])
+
+# Email templates extend base_template.html from the common folder, their own names
+# must be unique across bounded contexts
+template_env = Environment(loader=template_loader, auto_reload=True)
+
+
+def register_template_path(template_path: Path) -> None:
+    if str(template_path) not in template_loader.searchpath:
+        template_loader.searchpath.append(str(template_path))
+
+
+def configure_templates(config: TemplatesConfig) -> None:
+    template_env.auto_reload = config.auto_reload
+
+    if config.bytecode_cache_dir:
+        os.makedirs(config.bytecode_cache_dir, exist_ok=True)
+        template_env.bytecode_cache = FileSystemBytecodeCache(
+            directory=config.bytecode_cache_dir
+        )
+
+    precompile_templates()
+
+
+def precompile_templates() -> int:
+    """
+    Loads every registered template into the environment cache, returns how many.
+    """
+
+    names: list[str] = template_env.list_templates(extensions=["html"])
+
+    for name in names:
+        template_env.get_template(name)
+
+    return len(names)
+
+
+def get_template(name: str) -> Template:
+    return template_env.get_template(name)
+
+
+class FragmentTemplate:
+    """
+    Template rendered once, with markers in place of its variables, and split into
+    the static fragments between them. Renders only join the memoized fragments and
+    the values, for high volume emails.
+
+    Only for templates that print their variables as they are: no conditions, loops
+    or filters on them. This is checked against a regular render on the first use.
+    """
+
+    def __init__(self, name: str, variables: Sequence[str]) -> None:
+        self.name = name
+        self.variables = tuple(variables)
+        self.__template: Template | None = None
+        # Static text, then (variable index, static text) for every printed variable
+        self.__head: str = ""
+        self.__parts: list[tuple[int, str]] = []
+        self.__head_bytes: bytes = b""
+        self.__parts_bytes: list[tuple[int, bytes]] = []
+
+    def render(self, **values: Any) -> str:
+        strings: list[str] = self.__strings(values)
+
+        return self.__head + "".join(
+            strings[variable] + fragment for variable, fragment in self.__parts
+        )
+
+    def render_bytes(self, **values: Any) -> bytes:
+        strings: list[str] = self.__strings(values)
+
+        return self.__head_bytes + b"".join(
+            strings[variable].encode() + fragment
+            for variable, fragment in self.__parts_bytes
+        )
+
+    def __strings(self, values: dict[str, Any]) -> list[str]:
+        template: Template = get_template(self.name)
+
+        if template is not self.__template:
+            # First render, or the file changed and auto reload compiled it again
+            self.__split(template)
+
+        if template_env.autoescape:
+            return [str(escape(values[variable])) for variable in self.variables]
+
+        return [str(values[variable]) for variable in self.variables]
+
+    def __split(self, template: Template) -> None:
+        markers: dict[str, int] = {
+            f"\x00{uuid.uuid4().hex}\x00": index
+            for index, _ in enumerate(self.variables)
+        }
+        marked: str = template.render(
+            **{variable: marker for marker, variable in zip(markers, self.variables)}
+        )
+
+        head, *rest = marked.split("\x00")
+        parts: list[tuple[int, str]] = []
+
+        # Split on the marker delimiters: marker id, following text, marker id...
+        for marker_id, fragment in zip(rest[0::2], rest[1::2]):
+            parts.append((markers[f"\x00{marker_id}\x00"], fragment))
+
+        self.__head, self.__parts = head, parts
+        self.__head_bytes = head.encode()
+        self.__parts_bytes = [(variable, text.encode()) for variable, text in parts]
+        self.__template = template
+
+        self.__check(template)
+
+    def __check(self, template: Template) -> None:
+        sample: dict[str, str] = {
+            variable: f"<{variable} & {index}>"
+            for index, variable in enumerate(self.variables)
+        }
+
+        if self.render(**sample) != template.render(**sample):
+            raise ValueError(
+                f"Template {self.name} does not print its variables as they are"
+            )
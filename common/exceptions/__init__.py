@@ -1 +1,7 @@
 from .base_domain_exception import BaseDomainException
+from .invalid_cursor_exception import InvalidCursorException
+from .invalid_geo_area_exception import InvalidGeoAreaException
+from .executor_rejected_exception import ExecutorRejectedException
+from .invalid_date_range_exception import InvalidDateRangeException
+from .payment_gateway_unavailable_exception import PaymentGatewayUnavailableException
+from .bucket_export_not_supported_exception import BucketExportNotSupportedException
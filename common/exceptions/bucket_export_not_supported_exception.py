@@ -0,0 +1,10 @@
+from common.exceptions.base_domain_exception import BaseDomainException
+
+
+class BucketExportNotSupportedException(BaseDomainException):
+    def __init__(self, bucket: str, export_format: str) -> None:
+        self.bucket = bucket
+        self.export_format = export_format
+
+    def __str__(self) -> str:
+        return f"Exception(bucket={self.bucket}, export_format={self.export_format})"
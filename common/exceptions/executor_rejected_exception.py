@@ -0,0 +1,9 @@
+from common.exceptions.base_domain_exception import BaseDomainException
+
+
+class ExecutorRejectedException(BaseDomainException):
+    def __init__(self, executor_name: str) -> None:
+        self.executor_name = executor_name
+
+    def __str__(self) -> str:
+        return f"Exception(executor_name={self.executor_name})"
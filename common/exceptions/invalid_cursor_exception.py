@@ -0,0 +1,9 @@
+from common.exceptions.base_domain_exception import BaseDomainException
+
+
+class InvalidCursorException(BaseDomainException):
+    def __init__(self, cursor: str) -> None:
+        self.cursor = cursor
+
+    def __str__(self) -> str:
+        return f"Exception(cursor={self.cursor})"
@@ -0,0 +1,12 @@
+from datetime import date
+
+from common.exceptions.base_domain_exception import BaseDomainException
+
+
+class InvalidDateRangeException(BaseDomainException):
+    def __init__(self, date_from: date, date_to: date) -> None:
+        self.date_from = date_from
+        self.date_to = date_to
+
+    def __str__(self) -> str:
+        return f"Exception(date_from={self.date_from}, date_to={self.date_to})"
@@ -0,0 +1,9 @@
+from common.exceptions.base_domain_exception import BaseDomainException
+
+
+class InvalidGeoAreaException(BaseDomainException):
+    def __init__(self, area: str) -> None:
+        self.area = area
+
+    def __str__(self) -> str:
+        return f"Exception(area={self.area})"
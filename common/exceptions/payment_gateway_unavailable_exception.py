@@ -0,0 +1,9 @@
+from common.exceptions.base_domain_exception import BaseDomainException
+
+
+class PaymentGatewayUnavailableException(BaseDomainException):
+    def __init__(self, operation: str) -> None:
+        self.operation = operation
+
+    def __str__(self) -> str:
+        return f"Exception(operation={self.operation})"
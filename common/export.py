@@ -0,0 +1,79 @@
+"""
+The Export Common module.
+
+Encodes report rows as CSV or NDJSON while they are read, so an export holds a
+chunk of rows in memory instead of the whole result set.
+"""
+
+import csv
+import io
+import json
+from dataclasses import fields
+from datetime import date
+from enum import Enum
+from typing import Any, AsyncIterable, AsyncIterator
+
+# Rows encoded into every chunk sent to the client
+EXPORT_CHUNK_ROWS: int = 500
+
+
+class ExportFormat(Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+    @property
+    def media_type(self) -> str:
+        if self is ExportFormat.CSV:
+            return "text/csv"
+
+        return "application/x-ndjson"
+
+
+def export_value(value: Any) -> Any:
+    if isinstance(value, date):
+        return value.isoformat()
+
+    if isinstance(value, Enum):
+        return value.value
+
+    return value
+
+
+async def encode_rows(
+    rows: AsyncIterable[Any],
+    row_type: type,
+    export_format: ExportFormat,
+    chunk_rows: int = EXPORT_CHUNK_ROWS,
+) -> AsyncIterator[bytes]:
+    """
+    Encodes dataclass rows of `row_type`, yields the CSV header (even without rows)
+    and then one chunk every `chunk_rows` rows.
+    """
+
+    columns: list[str] = [field.name for field in fields(row_type)]
+    buffer: io.StringIO = io.StringIO()
+    writer = csv.writer(buffer)
+    pending: int = 0
+
+    if export_format is ExportFormat.CSV:
+        writer.writerow(columns)
+
+    async for row in rows:
+        values: list[Any] = [export_value(getattr(row, column)) for column in columns]
+
+        if export_format is ExportFormat.CSV:
+            writer.writerow(values)
+        else:
+            buffer.write(json.dumps(dict(zip(columns, values))))
+            buffer.write("\n")
+
+        pending += 1
+
+        if pending >= chunk_rows:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
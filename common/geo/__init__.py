@@ -0,0 +1,16 @@
+from .geo_area import (
+    BoundingBox,
+    GeoCircle,
+    EARTH_RADIUS_KM,
+    parse_optional_bounding_box,
+    parse_optional_circle,
+)
+from .geohash import (
+    GEOHASH_LENGTH,
+    MIN_ZOOM,
+    MAX_ZOOM,
+    geohash_encode,
+    geohash_covering_cells,
+    geohash_prefix_upper_bound,
+    geohash_length_for_zoom,
+)
@@ -0,0 +1,112 @@
+import math
+from dataclasses import dataclass
+
+from common.exceptions import InvalidGeoAreaException
+from common.geo.geohash import geohash_covering_cells
+
+EARTH_RADIUS_KM: float = 6371.0088
+
+
+@dataclass(frozen=True)
+class BoundingBox:
+    south: float
+    west: float
+    north: float
+    east: float
+
+    @staticmethod
+    def parse(bbox: str) -> "BoundingBox":
+        # "west,south,east,north", the order used by GeoJSON and most map clients
+        try:
+            west, south, east, north = (float(value) for value in bbox.split(","))
+        except ValueError:
+            raise InvalidGeoAreaException(area=bbox)
+
+        if not (-90.0 <= south <= north <= 90.0 and -180.0 <= west <= east <= 180.0):
+            raise InvalidGeoAreaException(area=bbox)
+
+        return BoundingBox(south=south, west=west, north=north, east=east)
+
+    @staticmethod
+    def world() -> "BoundingBox":
+        return BoundingBox(south=-90.0, west=-180.0, north=90.0, east=180.0)
+
+    def geohash_cells(self) -> list[str]:
+        return geohash_covering_cells(
+            south=self.south, west=self.west, north=self.north, east=self.east
+        )
+
+
+@dataclass(frozen=True)
+class GeoCircle:
+    latitude: float
+    longitude: float
+    radius_km: float
+
+    @staticmethod
+    def parse(near: str, radius_km: float) -> "GeoCircle":
+        # "latitude,longitude"
+        try:
+            latitude, longitude = (float(value) for value in near.split(","))
+        except ValueError:
+            raise InvalidGeoAreaException(area=near)
+
+        if not (
+            -90.0 <= latitude <= 90.0
+            and -180.0 <= longitude <= 180.0
+            and 0.0 < radius_km <= 1000.0
+        ):
+            raise InvalidGeoAreaException(area=f"{near};{radius_km}")
+
+        return GeoCircle(latitude=latitude, longitude=longitude, radius_km=radius_km)
+
+    def bounding_boxes(self) -> list[BoundingBox]:
+        """
+        Boxes covering the circle. A circle crossing the antimeridian is covered by
+        two, one on each side of it, since a box can't wrap around ±180.
+        """
+
+        latitude_delta: float = math.degrees(self.radius_km / EARTH_RADIUS_KM)
+        south: float = max(self.latitude - latitude_delta, -90.0)
+        north: float = min(self.latitude + latitude_delta, 90.0)
+
+        # Near the poles the circle spans every longitude
+        cos_latitude: float = math.cos(math.radians(max(abs(south), abs(north))))
+
+        if cos_latitude <= 0 or latitude_delta / cos_latitude >= 180.0:
+            return [BoundingBox(south=south, west=-180.0, north=north, east=180.0)]
+
+        longitude_delta: float = latitude_delta / cos_latitude
+        west: float = self.longitude - longitude_delta
+        east: float = self.longitude + longitude_delta
+
+        if west < -180.0:
+            return [
+                BoundingBox(south=south, west=west + 360.0, north=north, east=180.0),
+                BoundingBox(south=south, west=-180.0, north=north, east=east),
+            ]
+
+        if east > 180.0:
+            return [
+                BoundingBox(south=south, west=west, north=north, east=180.0),
+                BoundingBox(south=south, west=-180.0, north=north, east=east - 360.0),
+            ]
+
+        return [BoundingBox(south=south, west=west, north=north, east=east)]
+
+
+def parse_optional_bounding_box(bbox: str | None) -> BoundingBox | None:
+    return BoundingBox.parse(bbox) if bbox else None
+
+
+def parse_optional_circle(
+    near: str | None, radius_km: float | None
+) -> GeoCircle | None:
+    if near is None and radius_km is None:
+        return None
+
+    # A center without a radius (or the other way around) is not an area
+    if near is None or radius_km is None:
+        raise InvalidGeoAreaException(area=f"{near};{radius_km}")
+
+    return GeoCircle.parse(near=near, radius_km=radius_km)
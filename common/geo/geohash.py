@@ -0,0 +1,124 @@
+import math
+
+GEOHASH_ALPHABET: str = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+# Stored geohashes, ~3.7cm x 1.9cm cells
+GEOHASH_LENGTH: int = 12
+
+# Upper bound of cells used to cover an area, more cells mean more index ranges per
+# query, fewer cells mean bigger cells and more rows filtered out after the scan
+MAX_COVERING_CELLS: int = 16
+
+# Web map zoom levels, a 256px tile spans 360 / 2**zoom degrees of longitude
+MIN_ZOOM: int = 0
+MAX_ZOOM: int = 22
+
+# Clusters per tile width, roughly one cluster every 64px
+CLUSTER_CELLS_PER_TILE: int = 4
+
+
+def geohash_encode(
+    latitude: float, longitude: float, length: int = GEOHASH_LENGTH
+) -> str:
+    """
+    Geohash of a point: longitude and latitude bits interleaved (longitude first) and
+    written in base32. Points sharing a prefix are in the same cell, so a B-tree
+    index on the hash answers "points in this cell" with a range scan.
+    """
+
+    latitude_range: list[float] = [-90.0, 90.0]
+    longitude_range: list[float] = [-180.0, 180.0]
+    geohash: list[str] = []
+    even_bit: bool = True
+    bits: int = 0
+    char_index: int = 0
+
+    while len(geohash) < length:
+        value, value_range = (
+            (longitude, longitude_range) if even_bit else (latitude, latitude_range)
+        )
+        middle: float = (value_range[0] + value_range[1]) / 2
+
+        if value >= middle:
+            char_index = char_index * 2 + 1
+            value_range[0] = middle
+        else:
+            char_index = char_index * 2
+            value_range[1] = middle
+
+        even_bit = not even_bit
+        bits += 1
+
+        if bits == 5:
+            geohash.append(GEOHASH_ALPHABET[char_index])
+            bits = 0
+            char_index = 0
+
+    return "".join(geohash)
+
+
+def geohash_cell_size(length: int) -> tuple[float, float]:
+    # (height, width) in degrees of the cells of a given hash length
+    longitude_bits: int = math.ceil(length * 5 / 2)
+    latitude_bits: int = length * 5 // 2
+
+    return 180.0 / 2**latitude_bits, 360.0 / 2**longitude_bits
+
+
+def geohash_covering_cells(
+    south: float,
+    west: float,
+    north: float,
+    east: float,
+    max_cells: int = MAX_COVERING_CELLS,
+) -> list[str]:
+    """
+    Smallest set of same-length geohash cells covering a bounding box, using the
+    longest hash length that needs at most `max_cells` cells.
+    """
+
+    cells: list[str] = [""]
+
+    for length in range(1, GEOHASH_LENGTH + 1):
+        height, width = geohash_cell_size(length)
+
+        rows: range = range(
+            math.floor((south + 90.0) / height),
+            math.floor((min(north, 90.0 - height / 2) + 90.0) / height) + 1,
+        )
+        columns: range = range(
+            math.floor((west + 180.0) / width),
+            math.floor((min(east, 180.0 - width / 2) + 180.0) / width) + 1,
+        )
+
+        if len(rows) * len(columns) > max_cells:
+            break
+
+        # Encoding the center of each cell gives its hash
+        cells = [
+            geohash_encode(
+                latitude=-90.0 + (row + 0.5) * height,
+                longitude=-180.0 + (column + 0.5) * width,
+                length=length,
+            )
+            for row in rows
+            for column in columns
+        ]
+
+    return cells
+
+
+def geohash_prefix_upper_bound(prefix: str) -> str:
+    # Every hash starting with `prefix` sorts (bytewise) before this bound
+    return prefix + chr(ord(GEOHASH_ALPHABET[-1]) + 1)
+
+
+def geohash_length_for_zoom(zoom: int) -> int:
+    # Shortest hash length whose cells are at most 1/CLUSTER_CELLS_PER_TILE of a tile
+    tile_width: float = 360.0 / 2**zoom
+
+    for length in range(1, GEOHASH_LENGTH + 1):
+        if geohash_cell_size(length)[1] <= tile_width / CLUSTER_CELLS_PER_TILE:
+            return length
+
+    return GEOHASH_LENGTH
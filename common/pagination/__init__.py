@@ -0,0 +1,8 @@
+from .cursor import (
+    Cursor,
+    NEXT_CURSOR_HEADER,
+    decode_optional_cursor,
+    get_next_cursor,
+)
+from .keyset import paginate_query
+from .page import CountMode, Page, estimate_count, fetch_page
@@ -0,0 +1,90 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime, date
+from typing import Any, Callable, Sequence, TypeVar
+
+from common.exceptions import InvalidCursorException
+
+T = TypeVar("T")
+
+# Carries the next cursor on list routes whose body is a plain list
+NEXT_CURSOR_HEADER: str = "X-Next-Cursor"
+
+# Sort keys that JSON can't represent are tagged with their type
+_DATETIME_TAG = "datetime"
+_DATE_TAG = "date"
+_VALUE_TAG = "value"
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """
+    Position of the last item of a page, in a list ordered by (sort_key, entity_id).
+
+    The entity id breaks ties between items with the same sort key, so the next page
+    starts right after the last item even when names or dates repeat. Clients only
+    see the encoded form, an opaque url-safe string.
+    """
+
+    sort_key: Any
+    entity_id: str
+
+    def encode(self) -> str:
+        if isinstance(self.sort_key, datetime):
+            tagged_key = [_DATETIME_TAG, self.sort_key.isoformat()]
+        elif isinstance(self.sort_key, date):
+            tagged_key = [_DATE_TAG, self.sort_key.isoformat()]
+        else:
+            tagged_key = [_VALUE_TAG, self.sort_key]
+
+        payload: bytes = json.dumps([*tagged_key, self.entity_id]).encode()
+        return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+    @staticmethod
+    def decode(cursor: str) -> "Cursor":
+        try:
+            padding: str = "=" * (-len(cursor) % 4)
+            tag, sort_key, entity_id = json.loads(
+                base64.urlsafe_b64decode(cursor + padding)
+            )
+
+            if tag == _DATETIME_TAG:
+                sort_key = datetime.fromisoformat(sort_key)
+            elif tag == _DATE_TAG:
+                sort_key = date.fromisoformat(sort_key)
+            elif tag != _VALUE_TAG:
+                raise ValueError(tag)
+
+            if not isinstance(entity_id, str):
+                raise ValueError(entity_id)
+        except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+            raise InvalidCursorException(cursor=cursor)
+
+        return Cursor(sort_key=sort_key, entity_id=entity_id)
+
+
+def decode_optional_cursor(cursor: str | None) -> Cursor | None:
+    return Cursor.decode(cursor) if cursor else None
+
+
+def get_next_cursor(
+    items: Sequence[T], limit: int | None, sort_key: Callable[[T], Any]
+) -> str | None:
+    """
+    Cursor of the page after `items`, or None when `items` is the last page.
+
+    A page shorter than the limit is the last one, a full page may be followed by an
+    empty one (same trade-off as offset pagination, which never knew either).
+    """
+
+    if not limit or len(items) < limit:
+        return None
+
+    last_item = items[-1]
+
+    return Cursor(
+        sort_key=sort_key(last_item),
+        entity_id=getattr(last_item, "entity_id"),
+    ).encode()
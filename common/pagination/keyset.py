@@ -0,0 +1,40 @@
+from typing import Any
+
+from sqlalchemy import Select, tuple_, literal
+
+from common.pagination.cursor import Cursor
+
+
+def paginate_query(
+    query: Select,
+    sort_column: Any,
+    id_column: Any,
+    limit: int | None = None,
+    offset: int | None = 0,
+    cursor: Cursor | None = None,
+) -> Select:
+    """
+    Orders a query by (sort_column, id_column) and applies either keyset pagination,
+    when a cursor is given, or the classic limit/offset one.
+
+    With a cursor the database seeks straight to the first row after it through the
+    index on the sort column, instead of reading and discarding `offset` rows.
+    """
+
+    query = query.order_by(sort_column, id_column)
+
+    if cursor is not None:
+        query = query.where(
+            tuple_(sort_column, id_column)
+            > tuple_(
+                literal(cursor.sort_key, type_=sort_column.type),
+                literal(cursor.entity_id, type_=id_column.type),
+            )
+        )
+    elif offset:
+        query = query.offset(offset)
+
+    if limit:
+        query = query.limit(limit)
+
+    return query
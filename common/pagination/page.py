@@ -0,0 +1,108 @@
+import json
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Generic, Sequence, TypeVar
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from common.pagination.cursor import Cursor
+from common.pagination.keyset import paginate_query
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    items: Sequence[T]
+    total_count: int
+
+
+class CountMode(Enum):
+    # count(*) over the filtered rows, in the same statement as the page
+    EXACT = "exact"
+    # Planner row estimate, cheap on very large tables but only approximate
+    ESTIMATED = "estimated"
+
+
+async def fetch_page(
+    session: AsyncSession,
+    query: Select,
+    sort_column: Any,
+    id_column: Any,
+    limit: int | None = None,
+    offset: int | None = 0,
+    cursor: Cursor | None = None,
+    count_mode: CountMode = CountMode.EXACT,
+) -> Page:
+    """
+    Runs a filtered, unordered ORM query and returns one page of it together with the
+    total number of rows matching the filters.
+
+    The exact count is added to the page query as an uncorrelated scalar subquery, so
+    Postgres evaluates it once (InitPlan) and the page still comes straight from the
+    sort index, unlike count(*) OVER() which produces every row before the LIMIT. It
+    also ignores the cursor, so the total is the same on every page.
+    """
+
+    if count_mode == CountMode.ESTIMATED:
+        result = await session.execute(
+            paginate_query(query, sort_column, id_column, limit, offset, cursor)
+        )
+
+        return Page(
+            items=result.scalars().all(),
+            total_count=await estimate_count(session=session, query=query),
+        )
+
+    total_count_query = select(func.count()).select_from(query.subquery())
+
+    result = await session.execute(
+        paginate_query(
+            query.add_columns(total_count_query.scalar_subquery()),
+            sort_column,
+            id_column,
+            limit,
+            offset,
+            cursor,
+        )
+    )
+    rows = result.all()
+
+    if rows:
+        return Page(items=[row[0] for row in rows], total_count=rows[0][1])
+
+    # Past the last page the count has no row to travel in
+    if offset or cursor:
+        return Page(items=[], total_count=await session.scalar(total_count_query) or 0)
+
+    return Page(items=[], total_count=0)
+
+
+class _ExplainJson(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: Select) -> None:
+        self.statement = statement
+
+
+@compiles(_ExplainJson, "postgresql")
+def _compile_explain_json(element: _ExplainJson, compiler, **kw) -> str:
+    return f"EXPLAIN (FORMAT JSON) {compiler.process(element.statement, **kw)}"
+
+
+async def estimate_count(session: AsyncSession, query: Select) -> int:
+    """
+    Rows the planner expects `query` to return, read from the table statistics kept
+    by ANALYZE/autovacuum. Nothing is scanned, so it costs the same on any table size.
+    """
+
+    result = await session.execute(_ExplainJson(query))
+    plan = result.scalar()
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    return int(plan[0]["Plan"]["Plan Rows"])
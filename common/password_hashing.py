@@ -0,0 +1,35 @@
+"""
+bcrypt primitives run by the password hashing processes.
+
+Module level functions so the process pool can pickle them, kept apart from
+infrastructure.crypto so a hashing process doesn't import the token utilities.
+It still imports the common package (and with it config) when spawned.
+"""
+
+import time
+
+import bcrypt
+
+
+def hash_string(string_to_hash: str, rounds: int) -> str:
+    salt = bcrypt.gensalt(rounds=rounds)
+    hash_bytes: bytes = string_to_hash.encode("utf8")
+    return bcrypt.hashpw(hash_bytes, salt).decode("utf8")
+
+
+def verify_hash(string_to_verify: str, hash_to_verify: str) -> bool:
+    return bcrypt.checkpw(
+        string_to_verify.encode("utf8"),
+        hash_to_verify.encode("utf8"),
+    )
+
+
+def hash_seconds(rounds: int) -> float:
+    start: float = time.perf_counter()
+    hash_string("calibration", rounds)
+    return time.perf_counter() - start
+
+
+def hash_rounds(hashed: str) -> int:
+    # $2b$12$<salt and hash>
+    return int(hashed.split("$")[2])
@@ -0,0 +1,52 @@
+"""
+The Rate Limiter Common module.
+
+Defines a token bucket to keep calls to an external provider under its quota. It is
+meant to be used from the event loop thread only.
+"""
+
+import asyncio
+import time
+from typing import Callable
+
+
+class RateLimiter:
+    """
+    Token bucket refilled at `rate` tokens per second, holding at most `burst`.
+    acquire() waits (without blocking the loop) until enough tokens are available.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.__clock = clock
+        self.__tokens: float = burst
+        self.__updated_at: float = clock()
+        self.waited_seconds: float = 0.0
+
+    async def acquire(self, tokens: float = 1) -> None:
+        # A request larger than the bucket waits for a full bucket and overdraws it
+        needed: float = min(tokens, self.burst)
+
+        while True:
+            self.__refill()
+
+            if self.__tokens >= needed:
+                self.__tokens -= tokens
+                return
+
+            delay: float = (needed - self.__tokens) / self.rate
+            self.waited_seconds += delay
+            await asyncio.sleep(delay)
+
+    def __refill(self) -> None:
+        now: float = self.__clock()
+        self.__tokens = min(
+            self.burst, self.__tokens + (now - self.__updated_at) * self.rate
+        )
+        self.__updated_at = now
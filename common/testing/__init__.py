@@ -1 +1,2 @@
 from .base_testing import BaseUseCaseTest
+from .query_counter import QueryCounter
@@ -1,5 +1,6 @@
 import asynctest
 from bounded_contexts import initialize_contexts
+from bounded_contexts.reports_domain.services import ReportService
 from common.dependencies import DependencyContainer
 from config import ProjectConfig, YamlConfigFileName
 from infrastructure.database import RepositoryUtils
@@ -43,6 +44,9 @@ class BaseUseCaseTest(asynctest.TestCase):
         await self.repository_utils.dispose_engine()
         await self.repository_utils.clear_database()
 
+        # Cached reports of the previous test, computed from the cleared tables
+        await self.dependencies.resolve(ReportService).report_cache.clear()
+
     async def tearDown(self) -> None:
         pass
 
@@ -380,15 +380,20 @@ class BaseTestingUtils(ABC):
         )
 
     async def create_pet_sight(
-        self, uow: UnitOfWork, pet_id: str, account_id: str
+        self,
+        uow: UnitOfWork,
+        pet_id: str,
+        account_id: str,
+        latitude: float = 11552214.10,
+        longitude: float = 22663325.25,
     ) -> PetSight:
         pet: Pet = await self.pet_service.get_pet_by_id(uow=uow, entity_id=pet_id)
 
         return await self.pet_sight_service.create_pet_sight(
             uow=uow,
             pet=pet,
-            latitude=11552214.10,
-            longitude=22663325.25,
+            latitude=latitude,
+            longitude=longitude,
             account_id=account_id,
         )
 
@@ -0,0 +1,28 @@
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class QueryCounter:
+    """
+    Counts the SQL statements issued against an engine while the context is active.
+
+    Usage:
+        with QueryCounter(engine=repository_utils.engine) as counter:
+            await use_case.execute(request)
+
+        counter.count
+    """
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.engine = engine.sync_engine
+        self.count: int = 0
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.engine, "before_cursor_execute", self.__on_execute)
+        return self
+
+    def __exit__(self, *_) -> None:
+        event.remove(self.engine, "before_cursor_execute", self.__on_execute)
+
+    def __on_execute(self, *_) -> None:
+        self.count += 1
@@ -0,0 +1,47 @@
+import asyncio
+import threading
+
+import asynctest
+
+from common.background import BoundedExecutor
+from common.exceptions import ExecutorRejectedException
+from config import ExecutorConfig
+
+
+class TestBoundedExecutor(asynctest.TestCase):
+    async def setUp(self) -> None:
+        self.executor: BoundedExecutor = BoundedExecutor(
+            name="test",
+            config=ExecutorConfig(max_workers=1, max_queue_size=1, queue_timeout=0.05),
+        )
+        self.release: threading.Event = threading.Event()
+
+    async def tearDown(self) -> None:
+        self.release.set()
+        self.executor.shutdown()
+
+    async def test_full_executor_rejects_calls(self) -> None:
+        # One call running and one queued fill the executor
+        running = [
+            asyncio.ensure_future(self.executor.run(self.release.wait))
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0.01)
+
+        with self.assertRaises(ExecutorRejectedException):
+            await self.executor.run(self.release.wait)
+
+        self.assertEqual(self.executor.metrics.rejected, 1)
+        self.assertEqual(self.executor.metrics.in_flight, 2)
+
+        self.release.set()
+        await asyncio.gather(*running)
+
+        self.assertEqual(self.executor.metrics.completed, 2)
+        self.assertEqual(self.executor.metrics.in_flight, 0)
+
+    async def test_drained_executor_rejects_calls(self) -> None:
+        await self.executor.drain()
+
+        with self.assertRaises(ExecutorRejectedException):
+            await self.executor.run(self.release.wait)
@@ -0,0 +1,45 @@
+import asynctest
+
+from common.geo import BoundingBox, GeoCircle
+
+
+class TestGeoCircle(asynctest.TestCase):
+    def test_bounding_boxes(self) -> None:
+        circle: GeoCircle = GeoCircle(latitude=-34.9, longitude=-56.16, radius_km=10)
+
+        boxes: list[BoundingBox] = circle.bounding_boxes()
+
+        self.assertEqual(1, len(boxes))
+        self.assertTrue(boxes[0].south < -34.9 < boxes[0].north)
+        self.assertTrue(boxes[0].west < -56.16 < boxes[0].east)
+
+    def test_bounding_boxes_across_the_antimeridian(self) -> None:
+        # Fiji, the circle reaches past 180 degrees of longitude
+        circle: GeoCircle = GeoCircle(latitude=-17.0, longitude=179.9, radius_km=50)
+
+        east_box, west_box = circle.bounding_boxes()
+
+        self.assertTrue(east_box.west < 179.9)
+        self.assertEqual(180.0, east_box.east)
+        self.assertEqual(-180.0, west_box.west)
+        self.assertTrue(-180.0 < west_box.east < -179.0)
+        self.assertEqual(
+            (east_box.south, east_box.north), (west_box.south, west_box.north)
+        )
+
+        # The same circle seen from the other side of the antimeridian
+        mirrored: list[BoundingBox] = GeoCircle(
+            latitude=-17.0, longitude=-179.9, radius_km=50
+        ).bounding_boxes()
+
+        self.assertEqual(2, len(mirrored))
+        self.assertEqual(180.0, mirrored[0].east)
+        self.assertEqual(-180.0, mirrored[1].west)
+        self.assertTrue(-179.9 < mirrored[1].east)
+
+    def test_bounding_boxes_near_the_pole(self) -> None:
+        circle: GeoCircle = GeoCircle(latitude=89.9, longitude=10.0, radius_km=50)
+
+        (box,) = circle.bounding_boxes()
+
+        self.assertEqual((-180.0, 90.0, 180.0), (box.west, box.north, box.east))
@@ -0,0 +1,74 @@
+"""
+The TTL Cache Common module.
+
+Defines a small in-process LRU cache whose entries also expire after a fixed time to
+live. It is meant to be shared process-wide, from the event loop thread only.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Generic, TypeVar, Callable
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    def __init__(
+        self,
+        max_size: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.__clock = clock
+        self.__entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, key: K) -> V | None:
+        entry: tuple[float, V] | None = self.__entries.get(key)
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+
+        if expires_at <= self.__clock():
+            del self.__entries[key]
+            self.misses += 1
+            return None
+
+        self.__entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: K, value: V, ttl_seconds: float | None = None) -> None:
+        ttl: float = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+
+        self.__entries[key] = (self.__clock() + ttl, value)
+        self.__entries.move_to_end(key)
+
+        while len(self.__entries) > self.max_size:
+            self.__entries.popitem(last=False)
+
+    def invalidate(self, key: K) -> None:
+        self.__entries.pop(key, None)
+
+    def invalidate_where(self, predicate: Callable[[K], bool]) -> None:
+        # Walks every entry, meant for caches small enough to scan on each write
+        for key in [key for key in self.__entries if predicate(key)]:
+            del self.__entries[key]
+
+    def clear(self) -> None:
+        self.__entries.clear()
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups: int = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self) -> int:
+        return len(self.__entries)
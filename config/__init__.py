@@ -1,5 +1,6 @@
 from .config import (
     CryptoConfig,
+    HashingConfig,
     DBPoolConfig,
     DBConnectionConfig,
     DatabaseConfig,
@@ -8,4 +9,12 @@ from .config import (
     UrlConfig,
     S3Config,
     MercadoPagoConfig,
+    EmailQueueConfig,
+    TemplatesConfig,
+    PetSightDigestConfig,
+    ReportCacheConfig,
+    QRConfig,
+    OutboxConfig,
+    ExecutorConfig,
+    ExecutorsConfig,
 )
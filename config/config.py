@@ -24,10 +24,25 @@ class S3Config:
     aws_secret_access_key: str
 
 
+@dataclass
+class HashingConfig:
+    # 'process' hashes on a process pool, 'thread' on the crypto executor
+    mode: str
+    # Hashing processes, 0 for one per core
+    workers: int
+    # The bcrypt cost factor is the largest from min_rounds that hashes within the
+    # latency budget, measured at startup
+    min_rounds: int
+    latency_budget_ms: float
+
+
 @dataclass
 class CryptoConfig:
     token_secret: str
     algorithm: str
+    hashing: HashingConfig
+    # Token lifetime in seconds per token type
+    token_expiration: dict[str, float]
 
 
 @dataclass
@@ -62,11 +77,82 @@ class EmailConfig:
     sendgrid_from_email: str
 
 
+@dataclass
+class TemplatesConfig:
+    # Check the template files for changes on every render (development only)
+    auto_reload: bool
+    # Compiled templates are kept here between restarts, none when empty
+    bytecode_cache_dir: str
+
+
+@dataclass
+class EmailQueueConfig:
+    # Send right after the email is queued (tests, scripts) instead of in the
+    # background dispatcher
+    dispatch_inline: bool
+    batch_size: int
+    poll_interval: float
+    # How long a claimed email stays hidden from other dispatchers
+    lease: float
+    # Attempts before the email is moved to email_dead_letters
+    max_attempts: int
+    retry_base_delay: float
+    # Provider quota, in emails per second and burst size
+    rate_limit: float
+    rate_limit_burst: int
+    # Provider requests in flight
+    concurrency: int
+
+
+@dataclass
+class QRConfig:
+    # 'process' renders QR codes on a process pool, 'thread' on the image executor
+    mode: str
+    # Rendering processes, 0 for one per core
+    workers: int
+    # With the app logo at the center, plain codes otherwise
+    branded: bool
+    # 'png', 'webp' or 'svg', plain codes are always 'png'
+    image_format: str
+    # Pets rendered, uploaded and checkpointed together by the regeneration
+    batch_size: int
+    # Uploads in flight
+    upload_concurrency: int
+
+
+@dataclass
+class PetSightDigestConfig:
+    # Sightings of a pet within this many seconds of the first one are emailed
+    # together, 0 emails every sighting right away
+    window: float
+    poll_interval: float
+    batch_size: int
+
+
+@dataclass
+class ReportCacheConfig:
+    # Kept by each worker, up to ttl seconds after another worker invalidates them
+    max_size: int
+    ttl: float
+    # 'memory' also keeps them in the cache shared by the workers, '' doesn't
+    shared_backend: str
+    shared_ttl: float
+
+
 @dataclass
 class MercadoPagoConfig:
     access_token: str
     client_id: str
     client_secret: str
+    # true answers the calls with the local fake of the API
+    fake: bool
+    api_url: str
+    timeout: float
+    connect_timeout: float
+    # Connections kept open to the API, calls beyond them wait for a free one
+    max_connections: int
+    # Calls with an idempotency key are sent again on a timeout or a 5xx
+    max_attempts: int
 
 
 @dataclass
@@ -74,6 +160,39 @@ class StaffConfig:
     staff_email: str
 
 
+@dataclass
+class OutboxConfig:
+    # Handle the events right after the commit that stored them (tests, scripts)
+    # instead of in the background dispatcher
+    dispatch_inline: bool
+    batch_size: int
+    poll_interval: float
+    # How long a claimed message stays hidden from other dispatchers
+    lease: float
+    max_attempts: int
+    retry_base_delay: float
+    default_concurrency: int
+    # Concurrency limit per event type (event_id), default_concurrency otherwise
+    concurrency: dict[str, int]
+
+
+@dataclass
+class ExecutorConfig:
+    max_workers: int
+    # Calls accepted beyond max_workers, waiting in the pool queue
+    max_queue_size: int
+    # How long a call waits for a place in a full queue before being rejected
+    queue_timeout: float
+
+
+@dataclass
+class ExecutorsConfig:
+    # How long the shutdown waits for the scheduled (fire and forget) calls
+    drain_timeout: float
+    # Executor limits per workload name (crypto, io, image)
+    workloads: dict[str, ExecutorConfig]
+
+
 def parse_s3_config(yaml_data: dict) -> S3Config:
     return S3Config(
         fake=yaml_data["s3_config"]["fake"],
@@ -94,6 +213,13 @@ def parse_crypto_config(yaml_data: dict) -> CryptoConfig:
     return CryptoConfig(
         token_secret=yaml_data["crypto"]["token_secret"],
         algorithm=yaml_data["crypto"]["algorithm"],
+        hashing=HashingConfig(
+            mode=yaml_data["crypto"]["hashing"]["mode"],
+            workers=yaml_data["crypto"]["hashing"]["workers"],
+            min_rounds=yaml_data["crypto"]["hashing"]["min_rounds"],
+            latency_budget_ms=yaml_data["crypto"]["hashing"]["latency_budget_ms"],
+        ),
+        token_expiration=yaml_data["crypto"]["token_expiration_sec"],
     )
 
 
@@ -125,11 +251,66 @@ def parse_email_config(yaml_data: dict) -> EmailConfig:
     )
 
 
+def parse_templates_config(yaml_data: dict) -> TemplatesConfig:
+    return TemplatesConfig(
+        auto_reload=yaml_data["templates"]["auto_reload"],
+        bytecode_cache_dir=yaml_data["templates"]["bytecode_cache_dir"] or "",
+    )
+
+
+def parse_email_queue_config(yaml_data: dict) -> EmailQueueConfig:
+    return EmailQueueConfig(
+        dispatch_inline=yaml_data["email_queue"]["dispatch_inline"],
+        batch_size=yaml_data["email_queue"]["batch_size"],
+        poll_interval=yaml_data["email_queue"]["poll_interval_sec"],
+        lease=yaml_data["email_queue"]["lease_sec"],
+        max_attempts=yaml_data["email_queue"]["max_attempts"],
+        retry_base_delay=yaml_data["email_queue"]["retry_base_delay_sec"],
+        rate_limit=yaml_data["email_queue"]["rate_limit_per_sec"],
+        rate_limit_burst=yaml_data["email_queue"]["rate_limit_burst"],
+        concurrency=yaml_data["email_queue"]["concurrency"],
+    )
+
+
+def parse_qr_config(yaml_data: dict) -> QRConfig:
+    return QRConfig(
+        mode=yaml_data["qr"]["mode"],
+        workers=yaml_data["qr"]["workers"],
+        branded=yaml_data["qr"]["branded"],
+        image_format=yaml_data["qr"]["image_format"],
+        batch_size=yaml_data["qr"]["batch_size"],
+        upload_concurrency=yaml_data["qr"]["upload_concurrency"],
+    )
+
+
+def parse_pet_sight_digest_config(yaml_data: dict) -> PetSightDigestConfig:
+    return PetSightDigestConfig(
+        window=yaml_data["pet_sight_digest"]["window_sec"],
+        poll_interval=yaml_data["pet_sight_digest"]["poll_interval_sec"],
+        batch_size=yaml_data["pet_sight_digest"]["batch_size"],
+    )
+
+
+def parse_report_cache_config(yaml_data: dict) -> ReportCacheConfig:
+    return ReportCacheConfig(
+        max_size=yaml_data["report_cache"]["max_size"],
+        ttl=yaml_data["report_cache"]["ttl_sec"],
+        shared_backend=yaml_data["report_cache"]["shared_backend"],
+        shared_ttl=yaml_data["report_cache"]["shared_ttl_sec"],
+    )
+
+
 def parse_mp_config(yaml_data: dict) -> MercadoPagoConfig:
     return MercadoPagoConfig(
         access_token=yaml_data["mp_config"]["access_token"],
         client_id=yaml_data["mp_config"]["client_id"],
         client_secret=yaml_data["mp_config"]["client_secret"],
+        fake=yaml_data["mp_config"]["fake"],
+        api_url=yaml_data["mp_config"]["api_url"],
+        timeout=yaml_data["mp_config"]["timeout_sec"],
+        connect_timeout=yaml_data["mp_config"]["connect_timeout_sec"],
+        max_connections=yaml_data["mp_config"]["max_connections"],
+        max_attempts=yaml_data["mp_config"]["max_attempts"],
     )
 
 
@@ -139,6 +320,33 @@ def parse_staff_config(yaml_data: dict) -> StaffConfig:
     )
 
 
+def parse_outbox_config(yaml_data: dict) -> OutboxConfig:
+    return OutboxConfig(
+        dispatch_inline=yaml_data["outbox"]["dispatch_inline"],
+        batch_size=yaml_data["outbox"]["batch_size"],
+        poll_interval=yaml_data["outbox"]["poll_interval_sec"],
+        lease=yaml_data["outbox"]["lease_sec"],
+        max_attempts=yaml_data["outbox"]["max_attempts"],
+        retry_base_delay=yaml_data["outbox"]["retry_base_delay_sec"],
+        default_concurrency=yaml_data["outbox"]["default_concurrency"],
+        concurrency=yaml_data["outbox"].get("concurrency") or {},
+    )
+
+
+def parse_executors_config(yaml_data: dict) -> ExecutorsConfig:
+    return ExecutorsConfig(
+        drain_timeout=yaml_data["executors"]["drain_timeout_sec"],
+        workloads={
+            workload: ExecutorConfig(
+                max_workers=executor["max_workers"],
+                max_queue_size=executor["max_queue_size"],
+                queue_timeout=executor["queue_timeout_sec"],
+            )
+            for workload, executor in yaml_data["executors"]["workloads"].items()
+        },
+    )
+
+
 class YamlConfigFileName(Enum):
     APP_CONFIG = "app_config.yaml"
     TESTING = "testing_config.yaml"
@@ -181,6 +389,35 @@ def get_email_config(config_file_name: YamlConfigFileName) -> EmailConfig:
     return parse_email_config(config_dict)
 
 
+def get_templates_config(config_file_name: YamlConfigFileName) -> TemplatesConfig:
+    config_dict: dict = parse_config(config_file_name.value)
+    return parse_templates_config(config_dict)
+
+
+def get_email_queue_config(config_file_name: YamlConfigFileName) -> EmailQueueConfig:
+    config_dict: dict = parse_config(config_file_name.value)
+    return parse_email_queue_config(config_dict)
+
+
+def get_qr_config(config_file_name: YamlConfigFileName) -> QRConfig:
+    config_dict: dict = parse_config(config_file_name.value)
+    return parse_qr_config(config_dict)
+
+
+def get_pet_sight_digest_config(
+    config_file_name: YamlConfigFileName,
+) -> PetSightDigestConfig:
+    config_dict: dict = parse_config(config_file_name.value)
+    return parse_pet_sight_digest_config(config_dict)
+
+
+def get_report_cache_config(
+    config_file_name: YamlConfigFileName,
+) -> ReportCacheConfig:
+    config_dict: dict = parse_config(config_file_name.value)
+    return parse_report_cache_config(config_dict)
+
+
 def get_url_config(config_file_name: YamlConfigFileName) -> UrlConfig:
     config_dict: dict = parse_config(config_file_name.value)
     return parse_url_config(config_dict)
@@ -201,6 +438,16 @@ def get_staff_config(config_file_name: YamlConfigFileName) -> StaffConfig:
     return parse_staff_config(config_dict)
 
 
+def get_outbox_config(config_file_name: YamlConfigFileName) -> OutboxConfig:
+    config_dict: dict = parse_config(config_file_name.value)
+    return parse_outbox_config(config_dict)
+
+
+def get_executors_config(config_file_name: YamlConfigFileName) -> ExecutorsConfig:
+    config_dict: dict = parse_config(config_file_name.value)
+    return parse_executors_config(config_dict)
+
+
 class ProjectConfig:
     def __init__(
         self,
@@ -210,7 +457,16 @@ class ProjectConfig:
         self.crypto: CryptoConfig = get_crypto_config(config_file_name)
         self.database: DatabaseConfig = get_database_config(config_file_name)
         self.email: EmailConfig = get_email_config(config_file_name)
+        self.email_queue: EmailQueueConfig = get_email_queue_config(config_file_name)
+        self.templates: TemplatesConfig = get_templates_config(config_file_name)
+        self.qr: QRConfig = get_qr_config(config_file_name)
+        self.pet_sight_digest: PetSightDigestConfig = get_pet_sight_digest_config(
+            config_file_name
+        )
+        self.report_cache: ReportCacheConfig = get_report_cache_config(config_file_name)
         self.url_config: UrlConfig = get_url_config(config_file_name)
         self.s3_config: S3Config = get_s3_config(config_file_name)
         self.mp_config: MercadoPagoConfig = get_mp_config(config_file_name)
         self.staff_config: StaffConfig = get_staff_config(config_file_name)
+        self.outbox: OutboxConfig = get_outbox_config(config_file_name)
+        self.executors: ExecutorsConfig = get_executors_config(config_file_name)
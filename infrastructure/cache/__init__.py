@@ -0,0 +1 @@
+from .shared_cache import SharedCache, InMemorySharedCache
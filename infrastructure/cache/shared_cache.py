@@ -0,0 +1,59 @@
+import pickle
+from abc import ABC, abstractmethod
+from typing import Any
+
+from common.ttl_cache import TTLCache
+
+
+class SharedCache(ABC):
+    """
+    Cache shared by every worker process, such as Redis or Memcached. Entries belong
+    to a namespace and are invalidated together with it.
+    """
+
+    @abstractmethod
+    async def get(self, namespace: str, key: str) -> Any | None:
+        pass
+
+    @abstractmethod
+    async def set(
+        self, namespace: str, key: str, value: Any, ttl_seconds: float
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def invalidate(self, namespace: str) -> None:
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        pass
+
+
+class InMemorySharedCache(SharedCache):
+    """
+    Local stand-in for a shared cache, only shared within this process. Values are
+    stored pickled, as an external store would need them, so callers get copies and
+    values that can't be serialized fail here too.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.__entries: TTLCache[tuple[str, str], bytes] = TTLCache(
+            max_size=max_size, ttl_seconds=0
+        )
+
+    async def get(self, namespace: str, key: str) -> Any | None:
+        value: bytes | None = self.__entries.get((namespace, key))
+
+        return None if value is None else pickle.loads(value)
+
+    async def set(
+        self, namespace: str, key: str, value: Any, ttl_seconds: float
+    ) -> None:
+        self.__entries.set((namespace, key), pickle.dumps(value), ttl_seconds)
+
+    async def invalidate(self, namespace: str) -> None:
+        self.__entries.invalidate_where(lambda key: key[0] == namespace)
+
+    async def clear(self) -> None:
+        self.__entries.clear()
@@ -1,2 +1,3 @@
 from .bcrypt import HashUtils
 from .jwt_token import TokenUtils
+from .token_revocation import TokenRevocationList
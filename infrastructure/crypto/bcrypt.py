@@ -1,25 +1,104 @@
-import bcrypt
-from common.background import run_async
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from common import password_hashing
+from common.background import BoundedExecutor, Workload, get_executor
+from config import ExecutorConfig, HashingConfig
+
+THREAD_MODE: str = "thread"
+PROCESS_MODE: str = "process"
+
+# Past this a single hash takes minutes on any hardware
+MAX_ROUNDS: int = 20
+CALIBRATION_SAMPLES: int = 3
 
 
 class HashUtils:
-    @staticmethod
-    async def hash_string(string_to_hash: str) -> str:
-        def _hash_string_sync() -> str:
-            # Blocking I/O method
-            salt = bcrypt.gensalt()
-            hash_bytes: bytes = string_to_hash.encode("utf8")
-            return bcrypt.hashpw(hash_bytes, salt).decode("utf8")
-
-        return await run_async(_hash_string_sync)
-
-    @staticmethod
-    async def verify_hash(string_to_verify: str, hash_to_verify: str) -> bool:
-        def _verify_hash_sync() -> bool:
-            # Blocking I/O method
-            return bcrypt.checkpw(
-                string_to_verify.encode("utf8"),
-                hash_to_verify.encode("utf8"),
-            )
-
-        return await run_async(_verify_hash_sync)
+    """
+    Hashes passwords with bcrypt on a process pool, or on the crypto thread
+    executor in thread mode.
+
+    bcrypt holds the GIL for part of each hash, so threads don't scale with the
+    cores. The cost factor is calibrated on the first use (or start()) to the
+    largest number of rounds that hashes within the latency budget, each extra
+    round doubles the hashing time.
+    """
+
+    def __init__(self, config: HashingConfig) -> None:
+        self.config: HashingConfig = config
+        self.__rounds: int | None = None
+        self.__executor: BoundedExecutor = self.__create_executor()
+
+    async def start(self) -> None:
+        await self.rounds()
+
+    async def stop(self) -> None:
+        # The crypto executor of thread mode is drained with the others
+        if self.config.mode == PROCESS_MODE:
+            await self.__executor.drain()
+
+    async def rounds(self) -> int:
+        if self.__rounds is None:
+            self.__rounds = await self.__calibrate_rounds()
+
+        return self.__rounds
+
+    async def hash_string(self, string_to_hash: str) -> str:
+        return await self.__executor.run(
+            password_hashing.hash_string, string_to_hash, await self.rounds()
+        )
+
+    async def verify_hash(self, string_to_verify: str, hash_to_verify: str) -> bool:
+        return await self.__executor.run(
+            password_hashing.verify_hash, string_to_verify, hash_to_verify
+        )
+
+    async def needs_rehash(self, hashed: str) -> bool:
+        # Hashes made with a lower cost factor are upgraded on the next login
+        return password_hashing.hash_rounds(hashed) < await self.rounds()
+
+    def __create_executor(self) -> BoundedExecutor:
+        crypto_executor: BoundedExecutor = get_executor(Workload.CRYPTO)
+
+        if self.config.mode == THREAD_MODE:
+            return crypto_executor
+
+        if self.config.mode != PROCESS_MODE:
+            raise ValueError(f"Unknown hashing mode {self.config.mode}")
+
+        workers: int = self.config.workers or os.cpu_count() or 1
+
+        return BoundedExecutor(
+            name="bcrypt",
+            config=ExecutorConfig(
+                max_workers=workers,
+                max_queue_size=crypto_executor.config.max_queue_size,
+                queue_timeout=crypto_executor.config.queue_timeout,
+            ),
+            # Spawned, a forked worker would inherit the app threads and their locks
+            executor=ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ),
+        )
+
+    async def __calibrate_rounds(self) -> int:
+        min_rounds: int = self.config.min_rounds
+        budget: float = self.config.latency_budget_ms / 1000
+
+        if budget <= 0:
+            return min_rounds
+
+        # One at a time, concurrent samples would measure the contention too
+        seconds: float = min(
+            [
+                await self.__executor.run(password_hashing.hash_seconds, min_rounds)
+                for _ in range(CALIBRATION_SAMPLES)
+            ]
+        )
+
+        if seconds >= budget:
+            return min_rounds
+
+        return min(MAX_ROUNDS, min_rounds + int(math.log2(budget / seconds)))
@@ -1,19 +1,42 @@
 import logging
+import time
 import typing
+from dataclasses import dataclass
+from uuid import uuid4
+
 import jwt
-from jwt import DecodeError
+from jwt import InvalidTokenError
 from bounded_contexts.auth.exceptions import (
     GenerateTokenException,
     DecodeTokenException,
 )
-from common.background import run_async
+from common.ttl_cache import TTLCache
+from infrastructure.crypto.token_revocation import TokenRevocationList
 
 T = typing.TypeVar("T")
 
+# Registered claims added to every token
+_TOKEN_ID_CLAIM = "jti"
+_ISSUED_AT_CLAIM = "iat"
+_EXPIRATION_CLAIM = "exp"
+
+
+@dataclass(frozen=True)
+class VerifiedToken(typing.Generic[T]):
+    token_id: str
+    subject: str
+    issued_at: float
+    expires_at: float
+    data: T
+
 
 class TokenUtils(typing.Generic[T]):
     """Async jwt token utils.
-    We use generics to determine the return type of the token payload."""
+    We use generics to determine the return type of the token payload.
+
+    HS256 signing and verifying take microseconds, so they run inline instead of on
+    an executor. Verified tokens are kept in an LRU until they expire, a hit only
+    checks the revocation list."""
 
     logger: logging.Logger = logging.getLogger(__name__)
 
@@ -23,47 +46,110 @@ class TokenUtils(typing.Generic[T]):
         algorithm: str,
         token_data_to_dict: typing.Callable[[T], dict],
         dict_to_token_data: typing.Callable[[dict], T],
+        token_subject: typing.Callable[[T], str],
+        token_lifetime: typing.Callable[[T], float],
+        verified_tokens: TTLCache[str, VerifiedToken[T]],
+        revocation_list: TokenRevocationList,
+        clock: typing.Callable[[], float] = time.time,
     ) -> None:
         self.token_secret = token_secret
         self.algorithm = algorithm
         self.token_data_to_dict = token_data_to_dict
         self.dict_to_token_data = dict_to_token_data
+        self.token_subject = token_subject
+        self.token_lifetime = token_lifetime
+        self.verified_tokens = verified_tokens
+        self.revocation_list = revocation_list
+        self.__clock = clock
 
     async def generate_token(self, payload: T) -> str:
-        #  we should expire tokens... if we have time.
-        #  If this was a real project, we would have a token blacklist, expiration times, refresh tokens, etc...
-        #  but I don't see that it is worth it.
+        issued_at: float = self.__clock()
+
+        payload_dict: dict = {
+            **self.token_data_to_dict(payload),
+            _TOKEN_ID_CLAIM: uuid4().hex,
+            # Sub-second issue times, a token issued right after a revocation of
+            # its subject must not look revoked
+            _ISSUED_AT_CLAIM: issued_at,
+            _EXPIRATION_CLAIM: issued_at + self.token_lifetime(payload),
+        }
 
-        payload_dict: dict = self.token_data_to_dict(payload)
+        try:
+            return jwt.encode(
+                payload=payload_dict,
+                key=self.token_secret,
+                algorithm=self.algorithm,
+            )
 
-        def _generate_jwt_sync() -> str:
-            # Blocking I/O method, should be run in executor
+        except Exception as e:
+            self.logger.error(f"Error generating token: {e}")
+            raise GenerateTokenException(payload=payload_dict)
 
-            try:
-                return jwt.encode(
-                    payload=payload_dict,
-                    key=self.token_secret,
-                    algorithm=self.algorithm,
-                )
+    async def decode_token(self, token: str) -> T:
+        return self.__verify(token).data
 
-            except Exception as e:
-                self.logger.error(f"Error generating token: {e}")
-                raise GenerateTokenException(payload=payload_dict)
+    async def revoke_token(self, token: str) -> None:
+        verified_token: VerifiedToken[T] = self.__verify(token)
 
-        return await run_async(_generate_jwt_sync)
+        self.revocation_list.revoke_token(
+            token_id=verified_token.token_id, expires_at=verified_token.expires_at
+        )
 
-    async def decode_token(self, token: str) -> T:
-        def _decode_jwt_sync() -> T:
-            # Blocking I/O method, should be run in executor
-            try:
-                payload_dict: dict = jwt.decode(
-                    jwt=token, key=self.token_secret, algorithms=[self.algorithm]
-                )
+    async def revoke_tokens_of(self, payload: T) -> None:
+        """Revokes every token issued until now with the subject of the payload."""
+
+        self.revocation_list.revoke_subject(
+            subject=self.token_subject(payload),
+            max_lifetime=self.token_lifetime(payload),
+        )
+
+    def __verify(self, token: str) -> VerifiedToken[T]:
+        verified_token: VerifiedToken[T] | None = self.verified_tokens.get(token)
+
+        if verified_token is None:
+            verified_token = self.__decode(token)
+
+            self.verified_tokens.set(
+                token,
+                verified_token,
+                ttl_seconds=min(
+                    self.verified_tokens.ttl_seconds,
+                    verified_token.expires_at - self.__clock(),
+                ),
+            )
+
+        if self.revocation_list.is_revoked(
+            token_id=verified_token.token_id,
+            subject=verified_token.subject,
+            issued_at=verified_token.issued_at,
+        ):
+            self.logger.info(f"Revoked token used: {verified_token.token_id}")
+            raise DecodeTokenException(token=token)
+
+        return verified_token
+
+    def __decode(self, token: str) -> VerifiedToken[T]:
+        try:
+            payload_dict: dict = jwt.decode(
+                jwt=token,
+                key=self.token_secret,
+                algorithms=[self.algorithm],
+                options={
+                    "require": [_TOKEN_ID_CLAIM, _ISSUED_AT_CLAIM, _EXPIRATION_CLAIM]
+                },
+            )
 
-                return self.dict_to_token_data(payload_dict)
+        # Also expired tokens and tokens issued before expiration was added
+        except InvalidTokenError as e:
+            self.logger.error(f"Error decoding token: {e}")
+            raise DecodeTokenException(token=token)
 
-            except DecodeError as e:
-                self.logger.error(f"Error decoding token: {e}")
-                raise DecodeTokenException(token=token)
+        token_data: T = self.dict_to_token_data(payload_dict)
 
-        return await run_async(_decode_jwt_sync)
+        return VerifiedToken(
+            token_id=payload_dict[_TOKEN_ID_CLAIM],
+            subject=self.token_subject(token_data),
+            issued_at=payload_dict[_ISSUED_AT_CLAIM],
+            expires_at=payload_dict[_EXPIRATION_CLAIM],
+            data=token_data,
+        )
@@ -0,0 +1,58 @@
+import time
+from typing import Callable
+
+
+class TokenRevocationList:
+    """
+    In-process list of revoked tokens, checked on every decode without a DB hit.
+
+    Single tokens are revoked by id (jti), every token of a subject by issue time.
+    Entries are forgotten once the tokens they revoke would have expired anyway, so
+    the list stays as small as the number of revocations within a token lifetime.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        self.__clock = clock
+        # jti -> expiration of the revoked token
+        self.__revoked_tokens: dict[str, float] = {}
+        # subject -> (tokens issued before this time are revoked, expiration)
+        self.__revoked_subjects: dict[str, tuple[float, float]] = {}
+
+    def revoke_token(self, token_id: str, expires_at: float) -> None:
+        self.__purge()
+        self.__revoked_tokens[token_id] = expires_at
+
+    def revoke_subject(self, subject: str, max_lifetime: float) -> None:
+        self.__purge()
+        now: float = self.__clock()
+        self.__revoked_subjects[subject] = (now, now + max_lifetime)
+
+    def is_revoked(self, token_id: str, subject: str, issued_at: float) -> bool:
+        if token_id in self.__revoked_tokens:
+            return True
+
+        revoked_subject: tuple[float, float] | None = self.__revoked_subjects.get(
+            subject
+        )
+
+        return revoked_subject is not None and issued_at < revoked_subject[0]
+
+    def __len__(self) -> int:
+        return len(self.__revoked_tokens) + len(self.__revoked_subjects)
+
+    def __purge(self) -> None:
+        now: float = self.__clock()
+
+        for token_id in [
+            token_id
+            for token_id, expires_at in self.__revoked_tokens.items()
+            if expires_at <= now
+        ]:
+            del self.__revoked_tokens[token_id]
+
+        for subject in [
+            subject
+            for subject, (_, expires_at) in self.__revoked_subjects.items()
+            if expires_at <= now
+        ]:
+            del self.__revoked_subjects[subject]
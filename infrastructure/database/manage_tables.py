@@ -32,6 +32,37 @@ from infrastructure.database.tables.pets_domain.pets_sight import (
     create_pets_sight_table,
     map_pets_sight_table,
 )
+from infrastructure.database.tables.pets_domain.pets_last_sight import (
+    create_pets_last_sight_table,
+    map_pets_last_sight_table,
+)
+from infrastructure.database.tables.pets_domain.pets_sight_digests import (
+    create_pets_sight_digests_table,
+    map_pets_sight_digests_table,
+)
+from infrastructure.database.tables.pets_domain.qr_regeneration_checkpoints import (
+    create_qr_regeneration_checkpoints_table,
+    map_qr_regeneration_checkpoints_table,
+)
+from infrastructure.database.tables.reports_domain.report_adoptions import (
+    create_report_adoptions_table,
+)
+from infrastructure.database.tables.reports_domain.report_campaign_donations import (
+    create_report_campaign_donations_table,
+)
+from infrastructure.database.tables.reports_domain.report_pets import (
+    create_report_pets_table,
+    create_report_pet_sightings_table,
+)
+from infrastructure.database.tables.events import (
+    create_event_outbox_table,
+    map_event_outbox_table,
+)
+from infrastructure.database.tables.email import (
+    create_email_queue_table,
+    create_email_dead_letters_table,
+    map_email_queue_tables,
+)
 from infrastructure.database.tables.social_domain import (
     create_organizations_table,
     map_organizations_table,
@@ -105,6 +136,31 @@ async def create_tables(
         pets_sight_table=pets_sight_table, mapper_registry=orm_registry
     )
 
+    pets_last_sight_table = create_pets_last_sight_table(
+        metadata=metadata, pets=animals_table, pets_sight=pets_sight_table
+    )
+
+    map_pets_last_sight_table(
+        pets_last_sight_table=pets_last_sight_table, mapper_registry=orm_registry
+    )
+
+    pets_sight_digests_table = create_pets_sight_digests_table(
+        metadata=metadata, pets=animals_table
+    )
+
+    map_pets_sight_digests_table(
+        pets_sight_digests_table=pets_sight_digests_table, mapper_registry=orm_registry
+    )
+
+    qr_regeneration_checkpoints_table = create_qr_regeneration_checkpoints_table(
+        metadata=metadata
+    )
+
+    map_qr_regeneration_checkpoints_table(
+        qr_regeneration_checkpoints_table=qr_regeneration_checkpoints_table,
+        mapper_registry=orm_registry,
+    )
+
     # Donations domain
 
     donation_campaigns_table = create_donations_table(
@@ -139,5 +195,36 @@ async def create_tables(
         mapper_registry=orm_registry,
     )
 
+    # Reports domain, summary tables without entities
+
+    create_report_campaign_donations_table(
+        metadata=metadata, donation_campaigns=donation_campaigns_table
+    )
+
+    create_report_adoptions_table(metadata=metadata, adoptions=adoptions_table)
+
+    create_report_pets_table(metadata=metadata, pets=animals_table)
+
+    create_report_pet_sightings_table(metadata=metadata, pets=animals_table)
+
+    # Events
+
+    event_outbox_table = create_event_outbox_table(metadata=metadata)
+
+    map_event_outbox_table(
+        event_outbox_table=event_outbox_table, mapper_registry=orm_registry
+    )
+
+    # Email
+
+    email_queue_table = create_email_queue_table(metadata=metadata)
+    email_dead_letters_table = create_email_dead_letters_table(metadata=metadata)
+
+    map_email_queue_tables(
+        email_queue_table=email_queue_table,
+        email_dead_letters_table=email_dead_letters_table,
+        mapper_registry=orm_registry,
+    )
+
     async with db_engine.begin() as conn:
         await conn.run_sync(metadata.create_all)
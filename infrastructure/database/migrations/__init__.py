@@ -0,0 +1,3 @@
+from .migration import Migration
+from .migration_runner import MigrationRunner
+from .versions import MIGRATIONS
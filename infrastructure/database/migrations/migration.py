@@ -0,0 +1,22 @@
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class Migration:
+    """
+    A versioned schema change applied on top of the tables created by `create_tables`.
+
+    Migrations only evolve existing tables (indexes, constraints, backfills), new tables
+    are still created by `metadata.create_all`. Statements are plain SQL so they can be
+    reviewed as-is and must be idempotent (`IF NOT EXISTS` / `IF EXISTS`), because a
+    fresh database may already have the objects declared in the table definitions.
+
+    Non transactional migrations run each statement in autocommit mode, which is
+    required by `CREATE INDEX CONCURRENTLY` to build indexes without locking writes.
+    """
+
+    version: int
+    description: str
+    upgrade_statements: list[str]
+    downgrade_statements: list[str] = field(default_factory=list)
+    transactional: bool = True
@@ -0,0 +1,158 @@
+import logging
+from contextlib import asynccontextmanager
+from typing import Sequence, AsyncIterator
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncConnection
+
+from .migration import Migration
+from .versions import MIGRATIONS
+
+SCHEMA_MIGRATIONS_TABLE = "schema_migrations"
+
+# Arbitrary key, it only has to be the same for every process running migrations
+MIGRATIONS_ADVISORY_LOCK_KEY = 80_117_004
+
+
+class MigrationRunner:
+    """
+    Applies pending migrations and records them in the `schema_migrations` table.
+
+    Every app worker runs the migrations on startup, so the whole run is serialized
+    with a Postgres advisory lock: the first worker applies them and the rest find
+    nothing pending.
+
+    Usage:
+        runner = MigrationRunner(engine=repository_utils.engine)
+
+        await runner.upgrade()
+        await runner.downgrade(target_version=0)
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        migrations: Sequence[Migration] = MIGRATIONS,
+    ) -> None:
+        self.engine = engine
+        self.migrations = sorted(migrations, key=lambda migration: migration.version)
+
+    async def upgrade(self, target_version: int | None = None) -> list[Migration]:
+        async with self.__migrations_lock() as conn:
+            applied_versions: set[int] = await self.__get_applied_versions(conn)
+
+            pending: list[Migration] = [
+                migration
+                for migration in self.migrations
+                if migration.version not in applied_versions
+                and (target_version is None or migration.version <= target_version)
+            ]
+
+            for migration in pending:
+                self.logger.info(
+                    f"Applying migration {migration.version}: {migration.description}"
+                )
+
+                await self.__run(
+                    conn=conn,
+                    migration=migration,
+                    statements=migration.upgrade_statements,
+                    version_statement=text(
+                        f"INSERT INTO {SCHEMA_MIGRATIONS_TABLE} (version, description) "
+                        "VALUES (:version, :description)"
+                    ).bindparams(
+                        version=migration.version, description=migration.description
+                    ),
+                )
+
+            return pending
+
+    async def downgrade(self, target_version: int = 0) -> list[Migration]:
+        async with self.__migrations_lock() as conn:
+            applied_versions: set[int] = await self.__get_applied_versions(conn)
+
+            reverted: list[Migration] = [
+                migration
+                for migration in reversed(self.migrations)
+                if migration.version in applied_versions
+                and migration.version > target_version
+            ]
+
+            for migration in reverted:
+                self.logger.info(
+                    f"Reverting migration {migration.version}: {migration.description}"
+                )
+
+                await self.__run(
+                    conn=conn,
+                    migration=migration,
+                    statements=migration.downgrade_statements,
+                    version_statement=text(
+                        f"DELETE FROM {SCHEMA_MIGRATIONS_TABLE} WHERE version = :version"
+                    ).bindparams(version=migration.version),
+                )
+
+            return reverted
+
+    async def get_applied_versions(self) -> set[int]:
+        async with self.__migrations_lock() as conn:
+            return await self.__get_applied_versions(conn)
+
+    @asynccontextmanager
+    async def __migrations_lock(self) -> AsyncIterator[AsyncConnection]:
+        async with self.engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+
+            await conn.execute(
+                text("SELECT pg_advisory_lock(:key)").bindparams(
+                    key=MIGRATIONS_ADVISORY_LOCK_KEY
+                )
+            )
+
+            try:
+                await conn.execute(
+                    text(
+                        f"CREATE TABLE IF NOT EXISTS {SCHEMA_MIGRATIONS_TABLE} ("
+                        "version INTEGER PRIMARY KEY, "
+                        "description VARCHAR NOT NULL, "
+                        "applied_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now())"
+                    )
+                )
+
+                yield conn
+            finally:
+                await conn.execute(
+                    text("SELECT pg_advisory_unlock(:key)").bindparams(
+                        key=MIGRATIONS_ADVISORY_LOCK_KEY
+                    )
+                )
+
+    async def __run(
+        self,
+        conn: AsyncConnection,
+        migration: Migration,
+        statements: list[str],
+        version_statement,
+    ) -> None:
+        if migration.transactional:
+            async with self.engine.begin() as transaction_conn:
+                for statement in statements:
+                    await transaction_conn.execute(text(statement))
+
+                await transaction_conn.execute(version_statement)
+        else:
+            # Autocommit: a failure leaves the previous statements applied, so
+            # statements must be safe to re-run on the next attempt
+            for statement in statements:
+                await conn.execute(text(statement))
+
+            await conn.execute(version_statement)
+
+    @staticmethod
+    async def __get_applied_versions(conn: AsyncConnection) -> set[int]:
+        result = await conn.execute(
+            text(f"SELECT version FROM {SCHEMA_MIGRATIONS_TABLE}")
+        )
+        return set(result.scalars().all())
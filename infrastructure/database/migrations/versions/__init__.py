@@ -0,0 +1,27 @@
+from ..migration import Migration
+from .m0001_list_query_indexes import migration as m0001_list_query_indexes
+from .m0002_pets_sight_latest_index import migration as m0002_pets_sight_latest_index
+from .m0003_backfill_pets_last_sight import migration as m0003_backfill_pets_last_sight
+from .m0004_pets_sight_geohash import migration as m0004_pets_sight_geohash
+from .m0005_event_outbox_handled_by import migration as m0005_event_outbox_handled_by
+from .m0006_individual_donations_created_at import (
+    migration as m0006_individual_donations_created_at,
+)
+from .m0007_backfill_report_summaries import (
+    migration as m0007_backfill_report_summaries,
+)
+from .m0008_backfill_report_pet_sightings import (
+    migration as m0008_backfill_report_pet_sightings,
+)
+
+# Append new migrations here, versions must be unique and increasing
+MIGRATIONS: list[Migration] = [
+    m0001_list_query_indexes,
+    m0002_pets_sight_latest_index,
+    m0003_backfill_pets_last_sight,
+    m0004_pets_sight_geohash,
+    m0005_event_outbox_handled_by,
+    m0006_individual_donations_created_at,
+    m0007_backfill_report_summaries,
+    m0008_backfill_report_pet_sightings,
+]
@@ -0,0 +1,36 @@
+from ..migration import Migration
+
+# Indexes backing the list and count queries that filter on a few columns and order
+# by name. They are also declared in the table definitions, so on a fresh database
+# this migration finds them already created and only records its version.
+migration = Migration(
+    version=1,
+    description="Composite and partial indexes for list queries",
+    transactional=False,
+    upgrade_statements=[
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_profiles_account_id "
+        "ON profiles (account_id)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_animals_type_deleted_name "
+        "ON animals (animal_type, deleted, animal_name)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_animals_lost_type_name "
+        "ON animals (animal_type, animal_name) WHERE lost = true",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_pets_sight_pet_id_created_at "
+        "ON pets_sight (pet_id, created_at)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS "
+        "ix_individual_donations_donation_campaign_id "
+        "ON individual_donations (donation_campaign_id)",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_donation_campaigns_active_name "
+        "ON donation_campaigns (active, campaign_name)",
+        "ANALYZE profiles, animals, pets_sight, individual_donations, "
+        "donation_campaigns",
+    ],
+    downgrade_statements=[
+        "DROP INDEX CONCURRENTLY IF EXISTS ix_donation_campaigns_active_name",
+        "DROP INDEX CONCURRENTLY IF EXISTS "
+        "ix_individual_donations_donation_campaign_id",
+        "DROP INDEX CONCURRENTLY IF EXISTS ix_pets_sight_pet_id_created_at",
+        "DROP INDEX CONCURRENTLY IF EXISTS ix_animals_lost_type_name",
+        "DROP INDEX CONCURRENTLY IF EXISTS ix_animals_type_deleted_name",
+        "DROP INDEX CONCURRENTLY IF EXISTS ix_profiles_account_id",
+    ],
+)
@@ -0,0 +1,22 @@
+from ..migration import Migration
+
+# Backs the "latest sighting of each lost pet" lookup: for every lost pet the first
+# entry of this index under its pet_id is its most recent sighting, found without
+# sorting. It also serves the sightings of one pet ordered by date (read backwards),
+# so it replaces the ascending index of migration 1.
+migration = Migration(
+    version=2,
+    description="Descending (pet_id, created_at) index on pets_sight",
+    transactional=False,
+    upgrade_statements=[
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_pets_sight_pet_id_created_at_desc "
+        "ON pets_sight (pet_id, created_at DESC, entity_id DESC)",
+        "DROP INDEX CONCURRENTLY IF EXISTS ix_pets_sight_pet_id_created_at",
+        "ANALYZE pets_sight",
+    ],
+    downgrade_statements=[
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_pets_sight_pet_id_created_at "
+        "ON pets_sight (pet_id, created_at)",
+        "DROP INDEX CONCURRENTLY IF EXISTS ix_pets_sight_pet_id_created_at_desc",
+    ],
+)
@@ -0,0 +1,23 @@
+from ..migration import Migration
+
+# pets_last_sight is created by create_all and kept current by PetEventHandler from
+# then on, this fills it for the sightings registered before it existed. The same
+# rebuild can be run by hand with `python -m projections rebuild`.
+migration = Migration(
+    version=3,
+    description="Backfill the latest sighting per pet projection",
+    upgrade_statements=[
+        "INSERT INTO pets_last_sight (pet_id, sight_id, created_at, lost) "
+        "SELECT DISTINCT ON (pets_sight.pet_id) "
+        "pets_sight.pet_id, pets_sight.entity_id, pets_sight.created_at, "
+        "animals.lost "
+        "FROM pets_sight JOIN animals ON animals.entity_id = pets_sight.pet_id "
+        "ORDER BY pets_sight.pet_id, pets_sight.created_at DESC, "
+        "pets_sight.entity_id DESC "
+        "ON CONFLICT (pet_id) DO NOTHING",
+        "ANALYZE pets_last_sight",
+    ],
+    downgrade_statements=[
+        "DELETE FROM pets_last_sight",
+    ],
+)
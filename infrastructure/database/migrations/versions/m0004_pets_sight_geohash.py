@@ -0,0 +1,58 @@
+from ..migration import Migration
+
+# Geohash of every sighting, the pure-SQL spatial index behind the bbox and radius
+# searches (no PostGIS needed). New sightings get it from the application
+# (common.geo.geohash_encode), geohash_encode() below is the same algorithm in
+# PL/pgSQL and only backfills the existing rows. The "C" collation makes the index
+# order bytewise, which the prefix range scans rely on.
+migration = Migration(
+    version=4,
+    description="Geohash column and index on pets_sight",
+    transactional=False,
+    upgrade_statements=[
+        'ALTER TABLE pets_sight ADD COLUMN IF NOT EXISTS geohash VARCHAR(12) COLLATE "C"',
+        "CREATE OR REPLACE FUNCTION geohash_encode("
+        "latitude DOUBLE PRECISION, longitude DOUBLE PRECISION, hash_length INTEGER"
+        ") RETURNS VARCHAR LANGUAGE plpgsql IMMUTABLE STRICT AS $$ "
+        "DECLARE "
+        "alphabet CONSTANT TEXT := '0123456789bcdefghjkmnpqrstuvwxyz'; "
+        "latitude_min DOUBLE PRECISION := -90; latitude_max DOUBLE PRECISION := 90; "
+        "longitude_min DOUBLE PRECISION := -180; "
+        "longitude_max DOUBLE PRECISION := 180; "
+        "middle DOUBLE PRECISION; "
+        "hash TEXT := ''; even_bit BOOLEAN := true; "
+        "bits INTEGER := 0; char_index INTEGER := 0; "
+        "BEGIN "
+        "WHILE length(hash) < hash_length LOOP "
+        "IF even_bit THEN "
+        "middle := (longitude_min + longitude_max) / 2; "
+        "IF longitude >= middle THEN "
+        "char_index := char_index * 2 + 1; longitude_min := middle; "
+        "ELSE char_index := char_index * 2; longitude_max := middle; END IF; "
+        "ELSE "
+        "middle := (latitude_min + latitude_max) / 2; "
+        "IF latitude >= middle THEN "
+        "char_index := char_index * 2 + 1; latitude_min := middle; "
+        "ELSE char_index := char_index * 2; latitude_max := middle; END IF; "
+        "END IF; "
+        "even_bit := NOT even_bit; bits := bits + 1; "
+        "IF bits = 5 THEN "
+        "hash := hash || substr(alphabet, char_index + 1, 1); "
+        "bits := 0; char_index := 0; "
+        "END IF; "
+        "END LOOP; "
+        "RETURN hash; "
+        "END $$",
+        "UPDATE pets_sight SET geohash = geohash_encode(latitude, longitude, 12) "
+        "WHERE geohash IS NULL",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_pets_sight_geohash "
+        "ON pets_sight (geohash)",
+        "ANALYZE pets_sight",
+    ],
+    downgrade_statements=[
+        "DROP INDEX CONCURRENTLY IF EXISTS ix_pets_sight_geohash",
+        "ALTER TABLE pets_sight DROP COLUMN IF EXISTS geohash",
+        "DROP FUNCTION IF EXISTS geohash_encode("
+        "DOUBLE PRECISION, DOUBLE PRECISION, INTEGER)",
+    ],
+)
@@ -0,0 +1,14 @@
+from ..migration import Migration
+
+# Handlers that already succeeded for an outbox message, skipped when it is retried
+migration = Migration(
+    version=5,
+    description="Handlers already run per event_outbox message",
+    upgrade_statements=[
+        "ALTER TABLE event_outbox "
+        "ADD COLUMN IF NOT EXISTS handled_by JSONB NOT NULL DEFAULT '[]'::jsonb",
+    ],
+    downgrade_statements=[
+        "ALTER TABLE event_outbox DROP COLUMN IF EXISTS handled_by",
+    ],
+)
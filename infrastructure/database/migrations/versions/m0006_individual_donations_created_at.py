@@ -0,0 +1,16 @@
+from ..migration import Migration
+
+# Stable date of the donations whose payment has no approval date, for the reports.
+# The rows stored before it get the time of the migration.
+migration = Migration(
+    version=6,
+    description="Creation time of the individual donations",
+    upgrade_statements=[
+        "ALTER TABLE individual_donations "
+        "ADD COLUMN IF NOT EXISTS created_at TIMESTAMP WITH TIME ZONE "
+        "NOT NULL DEFAULT now()",
+    ],
+    downgrade_statements=[
+        "ALTER TABLE individual_donations DROP COLUMN IF EXISTS created_at",
+    ],
+)
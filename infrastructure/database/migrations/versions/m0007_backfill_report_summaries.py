@@ -0,0 +1,65 @@
+from ..migration import Migration
+
+# The report summary tables are created by create_all and kept current by
+# ReportsEventHandler from then on, this fills them from the donations, adoptions
+# and sightings stored before they existed. Same statements as
+# `python -m projections rebuild`, rows already there are recomputed.
+migration = Migration(
+    version=7,
+    description="Backfill the report summary tables",
+    upgrade_statements=[
+        "INSERT INTO report_campaign_donations (donation_campaign_id, day, "
+        "organization_id, donations, collected_amount, application_collected_amount) "
+        "SELECT ind.donation_campaign_id, "
+        "(coalesce(mp.date_approved, ind.created_at) AT TIME ZONE 'UTC')::date, "
+        "dc.organization_id, count(*), sum(ind.amount), sum(ind.application_fee) "
+        "FROM individual_donations ind "
+        "JOIN donation_campaigns dc ON dc.entity_id = ind.donation_campaign_id "
+        "JOIN mp_transactions mp ON mp.entity_id = ind.mp_transaction_id "
+        "GROUP BY 1, 2, 3 "
+        "ON CONFLICT (donation_campaign_id, day) DO UPDATE SET "
+        "organization_id = EXCLUDED.organization_id, "
+        "donations = EXCLUDED.donations, "
+        "collected_amount = EXCLUDED.collected_amount, "
+        "application_collected_amount = EXCLUDED.application_collected_amount",
+        "INSERT INTO report_adoptions (adoption_id, organization_id, "
+        "organization_name, animal_id, animal_name, animal_species, "
+        "animal_birth_year, animal_size, adopter_id, adopter_name, "
+        "start_date_for_adoption, adoption_date) "
+        "SELECT ad.entity_id, a.organization_id, o.organization_name, a.entity_id, "
+        "a.animal_name, a.species::text, a.birth_year, a.size::text, "
+        "ap.adopter_profile_id, concat(p.first_name, ' ', p.surname), "
+        "a.publication_date, ad.adoption_date "
+        "FROM animals a "
+        "JOIN adoption_applications ap ON ap.animal_id = a.entity_id "
+        "JOIN adoptions ad ON ad.adoption_application_id = ap.entity_id "
+        "JOIN profiles p ON p.entity_id = ap.adopter_profile_id "
+        "JOIN organizations o ON o.entity_id = a.organization_id "
+        "WHERE a.animal_type = 'ANIMAL_FOR_ADOPTION' "
+        "ON CONFLICT (adoption_id) DO UPDATE SET "
+        "organization_id = EXCLUDED.organization_id, "
+        "organization_name = EXCLUDED.organization_name, "
+        "animal_id = EXCLUDED.animal_id, animal_name = EXCLUDED.animal_name, "
+        "animal_species = EXCLUDED.animal_species, "
+        "animal_birth_year = EXCLUDED.animal_birth_year, "
+        "animal_size = EXCLUDED.animal_size, adopter_id = EXCLUDED.adopter_id, "
+        "adopter_name = EXCLUDED.adopter_name, "
+        "start_date_for_adoption = EXCLUDED.start_date_for_adoption, "
+        "adoption_date = EXCLUDED.adoption_date",
+        "INSERT INTO report_pets (pet_id, lost, sightings) "
+        "SELECT a.entity_id, a.lost, count(ps.pet_id) "
+        "FROM animals a LEFT JOIN pets_sight ps ON a.entity_id = ps.pet_id "
+        "WHERE a.animal_type = 'PET' AND (a.lost = true OR ps.pet_id IS NOT NULL) "
+        "GROUP BY a.entity_id "
+        "ON CONFLICT (pet_id) DO UPDATE SET "
+        "lost = EXCLUDED.lost, sightings = EXCLUDED.sightings",
+        "ANALYZE report_campaign_donations",
+        "ANALYZE report_adoptions",
+        "ANALYZE report_pets",
+    ],
+    downgrade_statements=[
+        "DELETE FROM report_campaign_donations",
+        "DELETE FROM report_adoptions",
+        "DELETE FROM report_pets",
+    ],
+)
@@ -0,0 +1,19 @@
+from ..migration import Migration
+
+# Sightings per pet and day, created by create_all with the date filtered reports.
+# Filled from pets_sight like the other summaries in migration 7.
+migration = Migration(
+    version=8,
+    description="Backfill the sightings per pet and day report table",
+    upgrade_statements=[
+        "INSERT INTO report_pet_sightings (pet_id, day, sightings) "
+        "SELECT ps.pet_id, (ps.created_at AT TIME ZONE 'UTC')::date, count(*) "
+        "FROM pets_sight ps "
+        "GROUP BY 1, 2 "
+        "ON CONFLICT (pet_id, day) DO UPDATE SET sightings = EXCLUDED.sightings",
+        "ANALYZE report_pet_sightings",
+    ],
+    downgrade_statements=[
+        "DELETE FROM report_pet_sightings",
+    ],
+)
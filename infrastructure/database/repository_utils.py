@@ -6,6 +6,7 @@ from sqlalchemy.orm import close_all_sessions, registry
 from config import DatabaseConfig
 from infrastructure.uow_abstraction.unit_of_work_module import make_unit_of_work
 from .manage_tables import create_tables
+from .migrations import MigrationRunner
 
 
 class DatabaseUrlProvider(ABC):
@@ -89,6 +90,9 @@ class RepositoryUtils:
             db_engine=self.engine,
         )
 
+        # create_all only creates missing tables, changes to existing ones are migrations
+        await MigrationRunner(engine=self.engine).upgrade()
+
     async def clear_database(self) -> None:
         try:
             close_all_sessions()
@@ -1,4 +1,15 @@
-from sqlalchemy import Table, Column, MetaData, String, ForeignKey, Boolean, Float
+from sqlalchemy import (
+    Table,
+    Column,
+    MetaData,
+    String,
+    ForeignKey,
+    Boolean,
+    Float,
+    Index,
+    DateTime,
+    func,
+)
 from sqlalchemy.sql.schema import SchemaItem
 from bounded_contexts.donations_domain.entities import (
     DonationCampaign,
@@ -44,6 +55,7 @@ def create_donations_table(
             nullable=False,
         ),
         Column("active", Boolean, nullable=False, default=True),
+        Index("ix_donation_campaigns_active_name", "active", "campaign_name"),
     ]
 
     return Table("donation_campaigns", metadata, *columns)
@@ -62,6 +74,7 @@ def create_individual_donation_tables(
             String,
             ForeignKey(donation_campaigns.c.entity_id),
             nullable=False,
+            index=True,
         ),
         Column(
             "donor_account_id",
@@ -90,6 +103,13 @@ def create_individual_donation_tables(
             ForeignKey(mp_transactions.c.entity_id),
             nullable=False,
         ),
+        # Reports fall back to it for payments without an approval date
+        Column(
+            "created_at",
+            DateTime(timezone=True),
+            nullable=False,
+            server_default=func.now(),
+        ),
     ]
 
     return Table("individual_donations", metadata, *columns)
@@ -0,0 +1,5 @@
+from .email_queue import (
+    create_email_queue_table,
+    create_email_dead_letters_table,
+    map_email_queue_tables,
+)
@@ -0,0 +1,80 @@
+from sqlalchemy import (
+    Table,
+    Column,
+    MetaData,
+    String,
+    BigInteger,
+    Integer,
+    Text,
+    DateTime,
+    Identity,
+    Index,
+    func,
+)
+from sqlalchemy.sql.schema import SchemaItem
+from infrastructure.email.email_queue import QueuedEmail, DeadLetterEmail
+
+
+def create_email_queue_table(metadata: MetaData) -> Table:
+    columns: list[SchemaItem] = [
+        Column("id", BigInteger, Identity(), primary_key=True),
+        Column("sender", String, nullable=False),
+        Column("recipient", String, nullable=False),
+        Column("subject", String, nullable=False),
+        Column("body", Text, nullable=False),
+        Column(
+            "created_at",
+            DateTime(timezone=True),
+            nullable=False,
+            server_default=func.now(),
+        ),
+        # Next attempt, pushed forward while a dispatcher holds the email and
+        # after every failed attempt
+        Column(
+            "available_at",
+            DateTime(timezone=True),
+            nullable=False,
+            server_default=func.now(),
+        ),
+        Column("attempts", Integer, nullable=False, server_default="0"),
+        Column("last_error", Text, nullable=True),
+        Index("ix_email_queue_available", "available_at", "id"),
+    ]
+
+    return Table("email_queue", metadata, *columns)
+
+
+def create_email_dead_letters_table(metadata: MetaData) -> Table:
+    columns: list[SchemaItem] = [
+        Column("id", BigInteger, Identity(), primary_key=True),
+        Column("sender", String, nullable=False),
+        Column("recipient", String, nullable=False),
+        Column("subject", String, nullable=False),
+        Column("body", Text, nullable=False),
+        Column("attempts", Integer, nullable=False),
+        Column("last_error", Text, nullable=True),
+        Column(
+            "failed_at",
+            DateTime(timezone=True),
+            nullable=False,
+            server_default=func.now(),
+        ),
+    ]
+
+    return Table("email_dead_letters", metadata, *columns)
+
+
+def map_email_queue_tables(
+    email_queue_table: Table,
+    email_dead_letters_table: Table,
+    mapper_registry,
+) -> None:
+    mapper_registry.map_imperatively(
+        QueuedEmail,
+        email_queue_table,
+    )
+
+    mapper_registry.map_imperatively(
+        DeadLetterEmail,
+        email_dead_letters_table,
+    )
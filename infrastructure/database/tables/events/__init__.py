@@ -0,0 +1 @@
+from .event_outbox import create_event_outbox_table, map_event_outbox_table
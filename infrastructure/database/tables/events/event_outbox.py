@@ -0,0 +1,62 @@
+from sqlalchemy import (
+    Table,
+    Column,
+    MetaData,
+    String,
+    BigInteger,
+    Integer,
+    Text,
+    DateTime,
+    Identity,
+    Index,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql.schema import SchemaItem
+from infrastructure.uow_abstraction.outbox import OutboxMessage
+
+
+def create_event_outbox_table(metadata: MetaData) -> Table:
+    columns: list[SchemaItem] = [
+        # Emission order, messages are claimed oldest first
+        Column("id", BigInteger, Identity(), primary_key=True),
+        Column("event_type", String, nullable=False),
+        Column("payload", JSONB, nullable=False),
+        Column(
+            "created_at",
+            DateTime(timezone=True),
+            nullable=False,
+            server_default=func.now(),
+        ),
+        # Next attempt, pushed forward while a dispatcher holds the message and
+        # after every failed attempt
+        Column(
+            "available_at",
+            DateTime(timezone=True),
+            nullable=False,
+            server_default=func.now(),
+        ),
+        Column("attempts", Integer, nullable=False, server_default="0"),
+        Column("handled_by", JSONB, nullable=False, server_default=text("'[]'::jsonb")),
+        Column("last_error", Text, nullable=True),
+        Column("failed_at", DateTime(timezone=True), nullable=True),
+        Index(
+            "ix_event_outbox_pending",
+            "available_at",
+            "id",
+            postgresql_where=text("failed_at IS NULL"),
+        ),
+    ]
+
+    return Table("event_outbox", metadata, *columns)
+
+
+def map_event_outbox_table(
+    event_outbox_table: Table,
+    mapper_registry,
+) -> None:
+    mapper_registry.map_imperatively(
+        OutboxMessage,
+        event_outbox_table,
+    )
@@ -0,0 +1,53 @@
+from sqlalchemy import (
+    Table,
+    Column,
+    MetaData,
+    String,
+    ForeignKey,
+    DateTime,
+    Boolean,
+    Index,
+    text,
+)
+from sqlalchemy.sql.schema import SchemaItem
+from bounded_contexts.pets_domain.entities import PetLastSight
+
+
+def create_pets_last_sight_table(
+    metadata: MetaData, pets: Table, pets_sight: Table
+) -> Table:
+    columns: list[SchemaItem] = [
+        Column(
+            "pet_id",
+            String,
+            ForeignKey(pets.c.entity_id, ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        Column(
+            "sight_id",
+            String,
+            ForeignKey(pets_sight.c.entity_id, ondelete="CASCADE"),
+            nullable=False,
+        ),
+        Column("created_at", DateTime(timezone=True), nullable=False),
+        Column("lost", Boolean, nullable=False),
+        # Lost pets map, ordered by the date of their latest sighting
+        Index(
+            "ix_pets_last_sight_lost_created_at",
+            "created_at",
+            "sight_id",
+            postgresql_where=text("lost = true"),
+        ),
+    ]
+
+    return Table("pets_last_sight", metadata, *columns)
+
+
+def map_pets_last_sight_table(
+    pets_last_sight_table: Table,
+    mapper_registry,
+) -> None:
+    mapper_registry.map_imperatively(
+        PetLastSight,
+        pets_last_sight_table,
+    )
@@ -6,9 +6,11 @@ from sqlalchemy import (
     ForeignKey,
     Double,
     DateTime,
+    Index,
 )
 from sqlalchemy.sql.schema import SchemaItem
 from bounded_contexts.pets_domain.entities import PetSight
+from common.geo import GEOHASH_LENGTH
 
 
 def create_pets_sight_table(metadata: MetaData, pets: Table, accounts: Table) -> Table:
@@ -23,6 +25,8 @@ def create_pets_sight_table(metadata: MetaData, pets: Table, accounts: Table) ->
         ),
         Column("latitude", Double, nullable=False),
         Column("longitude", Double, nullable=False),
+        # Bytewise ("C") ordering keeps every geohash prefix a contiguous index range
+        Column("geohash", String(GEOHASH_LENGTH, collation="C"), nullable=True),
         Column("created_at", DateTime(timezone=True), nullable=False),
         Column(
             "account_id",
@@ -33,7 +37,18 @@ def create_pets_sight_table(metadata: MetaData, pets: Table, accounts: Table) ->
         ),
     ]
 
-    return Table("pets_sight", metadata, *columns)
+    pets_sight_table = Table("pets_sight", metadata, *columns)
+
+    Index(
+        "ix_pets_sight_pet_id_created_at_desc",
+        pets_sight_table.c.pet_id,
+        pets_sight_table.c.created_at.desc(),
+        pets_sight_table.c.entity_id.desc(),
+    )
+
+    Index("ix_pets_sight_geohash", pets_sight_table.c.geohash)
+
+    return pets_sight_table
 
 
 def map_pets_sight_table(
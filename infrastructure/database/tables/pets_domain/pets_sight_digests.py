@@ -0,0 +1,43 @@
+from sqlalchemy import (
+    Table,
+    Column,
+    MetaData,
+    String,
+    ForeignKey,
+    DateTime,
+    Float,
+    Integer,
+    Index,
+)
+from sqlalchemy.sql.schema import SchemaItem
+from bounded_contexts.pets_domain.entities import PetSightDigest
+
+
+def create_pets_sight_digests_table(metadata: MetaData, pets: Table) -> Table:
+    columns: list[SchemaItem] = [
+        Column(
+            "pet_id",
+            String,
+            ForeignKey(pets.c.entity_id, ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        Column("sightings", Integer, nullable=False),
+        Column("latitude", Float, nullable=True),
+        Column("longitude", Float, nullable=True),
+        Column("last_sight_at", DateTime(timezone=True), nullable=False),
+        Column("send_at", DateTime(timezone=True), nullable=False),
+        # Digests whose window is over
+        Index("ix_pets_sight_digests_send_at", "send_at"),
+    ]
+
+    return Table("pets_sight_digests", metadata, *columns)
+
+
+def map_pets_sight_digests_table(
+    pets_sight_digests_table: Table,
+    mapper_registry,
+) -> None:
+    mapper_registry.map_imperatively(
+        PetSightDigest,
+        pets_sight_digests_table,
+    )
@@ -0,0 +1,50 @@
+from sqlalchemy import (
+    Table,
+    Column,
+    MetaData,
+    String,
+    Boolean,
+    Integer,
+    DateTime,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql.schema import SchemaItem
+from bounded_contexts.pets_domain.entities import QrRegenerationCheckpoint
+
+
+def create_qr_regeneration_checkpoints_table(metadata: MetaData) -> Table:
+    columns: list[SchemaItem] = [
+        Column("generation", String, primary_key=True),
+        Column("last_pet_id", String, nullable=True),
+        Column("finished", Boolean, nullable=False),
+        Column("scanned", Integer, nullable=False),
+        Column("rendered", Integer, nullable=False),
+        Column("skipped", Integer, nullable=False),
+        Column(
+            "failed_pet_ids",
+            JSONB,
+            nullable=False,
+            server_default=text("'[]'::jsonb"),
+        ),
+        Column(
+            "updated_at",
+            DateTime(timezone=True),
+            nullable=False,
+            server_default=func.now(),
+            onupdate=func.now(),
+        ),
+    ]
+
+    return Table("qr_regeneration_checkpoints", metadata, *columns)
+
+
+def map_qr_regeneration_checkpoints_table(
+    qr_regeneration_checkpoints_table: Table,
+    mapper_registry,
+) -> None:
+    mapper_registry.map_imperatively(
+        QrRegenerationCheckpoint,
+        qr_regeneration_checkpoints_table,
+    )
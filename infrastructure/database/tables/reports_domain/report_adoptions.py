@@ -0,0 +1,48 @@
+from sqlalchemy import (
+    Table,
+    Column,
+    MetaData,
+    String,
+    ForeignKey,
+    Date,
+    DateTime,
+    Integer,
+    Index,
+)
+from sqlalchemy.sql.schema import SchemaItem
+
+
+def create_report_adoptions_table(metadata: MetaData, adoptions: Table) -> Table:
+    """
+    One row per adoption with the animal, adopter and organization as they were
+    when it was recorded, kept by the reports event handler and written and read
+    with SQL by the reports repository.
+    """
+
+    columns: list[SchemaItem] = [
+        Column(
+            "adoption_id",
+            String,
+            ForeignKey(adoptions.c.entity_id, ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        Column("organization_id", String, nullable=False),
+        Column("organization_name", String, nullable=False),
+        Column("animal_id", String, nullable=False),
+        Column("animal_name", String, nullable=False),
+        Column("animal_species", String, nullable=False),
+        Column("animal_birth_year", Integer, nullable=False),
+        Column("animal_size", String, nullable=False),
+        Column("adopter_id", String, nullable=False),
+        Column("adopter_name", String, nullable=False),
+        Column("start_date_for_adoption", Date, nullable=True),
+        Column("adoption_date", DateTime(timezone=True), nullable=False),
+        # Adopted animals of an organization
+        Index(
+            "ix_report_adoptions_organization_date",
+            "organization_id",
+            "adoption_date",
+        ),
+    ]
+
+    return Table("report_adoptions", metadata, *columns)
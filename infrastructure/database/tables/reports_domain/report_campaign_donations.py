@@ -0,0 +1,41 @@
+from sqlalchemy import (
+    Table,
+    Column,
+    MetaData,
+    String,
+    ForeignKey,
+    Date,
+    Float,
+    Integer,
+    Index,
+)
+from sqlalchemy.sql.schema import SchemaItem
+
+
+def create_report_campaign_donations_table(
+    metadata: MetaData, donation_campaigns: Table
+) -> Table:
+    """
+    Donation totals of each campaign per approval day, kept by the reports event
+    handler and written and read with SQL by the reports repository.
+    """
+
+    columns: list[SchemaItem] = [
+        Column(
+            "donation_campaign_id",
+            String,
+            ForeignKey(donation_campaigns.c.entity_id, ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        Column("day", Date, primary_key=True),
+        Column("organization_id", String, nullable=False),
+        Column("donations", Integer, nullable=False),
+        Column("collected_amount", Float, nullable=False),
+        Column("application_collected_amount", Float, nullable=False),
+        # Collected money of an organization
+        Index(
+            "ix_report_campaign_donations_organization_day", "organization_id", "day"
+        ),
+    ]
+
+    return Table("report_campaign_donations", metadata, *columns)
@@ -0,0 +1,54 @@
+from sqlalchemy import (
+    Table,
+    Column,
+    MetaData,
+    String,
+    ForeignKey,
+    Boolean,
+    Date,
+    Integer,
+    Index,
+)
+from sqlalchemy.sql.schema import SchemaItem
+
+
+def create_report_pets_table(metadata: MetaData, pets: Table) -> Table:
+    """
+    Sightings count and lost flag of every pet that was lost or sighted, kept by
+    the reports event handler and written and read with SQL by the reports
+    repository.
+    """
+
+    columns: list[SchemaItem] = [
+        Column(
+            "pet_id",
+            String,
+            ForeignKey(pets.c.entity_id, ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        Column("lost", Boolean, nullable=False),
+        Column("sightings", Integer, nullable=False),
+    ]
+
+    return Table("report_pets", metadata, *columns)
+
+
+def create_report_pet_sightings_table(metadata: MetaData, pets: Table) -> Table:
+    """
+    Sightings of each pet per day, kept along with report_pets.
+    """
+
+    columns: list[SchemaItem] = [
+        Column(
+            "pet_id",
+            String,
+            ForeignKey(pets.c.entity_id, ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        Column("day", Date, primary_key=True),
+        Column("sightings", Integer, nullable=False),
+        # Sightings per day, week or month
+        Index("ix_report_pet_sightings_day", "day"),
+    ]
+
+    return Table("report_pet_sightings", metadata, *columns)
@@ -9,6 +9,8 @@ from sqlalchemy import (
     Enum,
     Date,
     Double,
+    Index,
+    text,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql.schema import SchemaItem
@@ -71,6 +73,14 @@ def create_animals_table(
         Column("last_known_longitude", Double, nullable=True),
         Column("adoption_animal_id", String, nullable=True),
         Column("deleted", Boolean, nullable=True),
+        # List queries, see migration m0001_list_query_indexes
+        Index("ix_animals_type_deleted_name", "animal_type", "deleted", "animal_name"),
+        Index(
+            "ix_animals_lost_type_name",
+            "animal_type",
+            "animal_name",
+            postgresql_where=text("lost = true"),
+        ),
     ]
 
     return Table("animals", metadata, *columns)
@@ -25,7 +25,13 @@ def create_profiles_table(
         Column("first_name", String, nullable=False),
         Column("surname", String, nullable=False),
         Column("phone_number", String, nullable=False),
-        Column("account_id", String, ForeignKey(accounts.c.entity_id), nullable=False),
+        Column(
+            "account_id",
+            String,
+            ForeignKey(accounts.c.entity_id),
+            nullable=False,
+            index=True,
+        ),
         Column("birthdate", Date),
         Column(
             "government_id", String
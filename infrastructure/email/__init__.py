@@ -1,5 +1,6 @@
+from .email_data import EmailData
+from .email_queue import EmailQueue, QueuedEmail, DeadLetterEmail, app_email_queue
 from .email_gateways import (
-    EmailData,
     BaseEmailGateway,
     TestEmailGateway,
     SendgridEmailGateway,
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class EmailData:
+    sender: str
+    recipient: str
+    subject: str
+    body: str
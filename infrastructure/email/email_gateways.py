@@ -1,23 +1,19 @@
 import logging
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from python_http_client import HTTPError
+from collections import deque
+from typing import Sequence
+
 from sendgrid import (
     Email as SendGridEmail,
     SendGridAPIClient,
     To as SendGridTo,
     Mail as SendGridMail,
     From as SendGridFrom,
+    Personalization as SendGridPersonalization,
 )
-from common import run_fire_forget
-
-
-@dataclass
-class EmailData:
-    sender: str
-    recipient: str
-    subject: str
-    body: str
+from infrastructure.email.email_data import EmailData
+from infrastructure.email.email_queue import EmailQueue
+from infrastructure.uow_abstraction import UnitOfWork
 
 
 class BaseEmailGateway(ABC):
@@ -25,28 +21,22 @@ class BaseEmailGateway(ABC):
 
     """
     Base email gateway, which provides a template on how should all other (probably twilio, testing or smtp ones)
-    should behave. Sending mails must be non-blocking, we must handle the http/smtp details in the background.
+    should behave. Mails are stored in the email queue and sent by it in the background, in batches.
     """
 
-    def __init__(self) -> None:
-        self._email_cache: list[EmailData] = []
-
-    def clear_cache(self) -> None:
-        self._email_cache.clear()
-
-    @property
-    def email_cache(self) -> list[EmailData]:
-        return self._email_cache
+    def __init__(self, email_queue: EmailQueue) -> None:
+        self.email_queue = email_queue
 
-    def schedule_mail(
+    async def schedule_mail(
         self,
         recipient: str,
         subject: str,
         body: str,
+        uow: UnitOfWork | None = None,
     ) -> None:
-        """Non-blocking sync operation of adding the email to the async loop,
-        Email will be sent when it is able to.
-        No need to await this function."""
+        """Stores the email in the email queue, it will be sent when the queue gets to it.
+        Survives restarts and provider outages, failed sends are retried. Given a unit of
+        work, the email is only queued if its transaction commits."""
 
         email_data: EmailData = EmailData(
             sender=self._get_sender_details(),
@@ -55,15 +45,13 @@ class BaseEmailGateway(ABC):
             body=body,
         )
 
-        self.email_cache.append(email_data)
-
-        # This sends the task in the background, it will get executed 'eventually'.
-        run_fire_forget(lambda: self._send_mail(email_data=email_data))
+        await self.email_queue.enqueue(email_data, uow=uow)
 
     @abstractmethod
-    def _send_mail(self, email_data: EmailData) -> None:
-        """Actually perform the I/O blocking operation of sending a mail. BLOCKING OPERATION, run only in
-        run_fire_forget_mode, or in an async manner on the background."""
+    def send_batch(self, emails: Sequence[EmailData]) -> None:
+        """Actually perform the I/O blocking operation of sending mails that share sender, subject
+        and body. BLOCKING OPERATION, called by the email queue on the background. Raises if the
+        provider didn't accept them."""
         pass
 
     @abstractmethod
@@ -72,39 +60,65 @@ class BaseEmailGateway(ABC):
 
 
 class TestEmailGateway(BaseEmailGateway):
-    def _send_mail(self, email_data: EmailData) -> None:
-        self.logger.info(
-            f"Sending email to '{email_data.recipient}' with subject '{email_data.subject}': \n"
-            f"{email_data.body}"
-        )
+    # Sent emails kept for the tests to inspect, the oldest are dropped
+    SENT_EMAILS_BUFFER_SIZE: int = 100
+
+    def __init__(self, email_queue: EmailQueue) -> None:
+        super().__init__(email_queue=email_queue)
+        self._email_cache: deque[EmailData] = deque(maxlen=self.SENT_EMAILS_BUFFER_SIZE)
+        # Raised by every send while set, for the tests of failed sends
+        self.send_error: Exception | None = None
+
+    def clear_cache(self) -> None:
+        self._email_cache.clear()
+
+    @property
+    def email_cache(self) -> list[EmailData]:
+        return list(self._email_cache)
+
+    def send_batch(self, emails: Sequence[EmailData]) -> None:
+        if self.send_error is not None:
+            raise self.send_error
+
+        for email_data in emails:
+            self.logger.info(
+                f"Sending email to '{email_data.recipient}' with subject '{email_data.subject}': \n"
+                f"{email_data.body}"
+            )
+
+            self._email_cache.append(email_data)
 
     def _get_sender_details(self) -> str:
         return "testing@pet-connect.com"
 
 
 class SendgridEmailGateway(BaseEmailGateway):
-    def __init__(self, api_key: str, from_email_address: str) -> None:
-        super().__init__()
+    def __init__(
+        self, email_queue: EmailQueue, api_key: str, from_email_address: str
+    ) -> None:
+        super().__init__(email_queue=email_queue)
         self.sendgrid_client: SendGridAPIClient = SendGridAPIClient(api_key=api_key)
         self.from_email: SendGridEmail = SendGridEmail(from_email_address)
 
-    def _send_mail(self, email_data: EmailData) -> None:
+    def send_batch(self, emails: Sequence[EmailData]) -> None:
         # docs: https://docs.sendgrid.com/for-developers/sending-email/quickstart-python
+        # One personalization per recipient, so recipients don't see each other
 
         from_email = SendGridFrom(name="Pet Connect", email=self.from_email.email)
-        to_email = SendGridTo(email_data.recipient)
 
         mail = SendGridMail(
-            from_email, to_email, email_data.subject, html_content=email_data.body
+            from_email=from_email,
+            subject=emails[0].subject,
+            html_content=emails[0].body,
         )
 
-        mail_json = mail.get()
-
-        try:
-            self.sendgrid_client.client.mail.send.post(request_body=mail_json)
+        for email_data in emails:
+            personalization = SendGridPersonalization()
+            personalization.add_to(SendGridTo(email_data.recipient))
+            mail.add_personalization(personalization)
 
-        except HTTPError as error:
-            self.logger.error(error)
+        # Raises python_http_client.HTTPError when SendGrid rejects the request
+        self.sendgrid_client.client.mail.send.post(request_body=mail.get())
 
     def _get_sender_details(self) -> str:
         return self.from_email.email
@@ -0,0 +1,352 @@
+"""
+The Email Queue module.
+
+Emails are stored in the email_queue table and sent afterwards by the EmailQueue
+dispatcher, so a restart or a provider outage doesn't lose them. Claimed emails with
+the same sender, subject and body are sent in one provider request (one
+personalization per recipient). Failed sends are retried with exponential backoff
+and moved to the email_dead_letters table after max_attempts. Sends are kept under
+the provider quota with a token bucket.
+
+Emails queued with a unit of work are committed (or rolled back) with the caller's
+changes, so a retried event handler doesn't queue them twice.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import datetime
+from typing import Callable, Sequence
+
+import anyio
+from sqlalchemy import (
+    ColumnElement,
+    Update,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from common.background import run_async
+from common.rate_limiter import RateLimiter
+from config import EmailQueueConfig
+from infrastructure.email.email_data import EmailData
+from infrastructure.uow_abstraction import UnitOfWork
+
+# Upper bound of the delay between two attempts of an email
+MAX_RETRY_DELAY_SECONDS: float = 3600
+
+# Recipients per provider request, SendGrid accepts up to 1000 personalizations
+MAX_RECIPIENTS_PER_SEND: int = 1000
+
+
+class QueuedEmail:
+    """
+    Row of the email_queue table, deleted once sent.
+    """
+
+    def __init__(self, sender: str, recipient: str, subject: str, body: str) -> None:
+        self.id: int | None = None
+        self.sender = sender
+        self.recipient = recipient
+        self.subject = subject
+        self.body = body
+        self.attempts: int = 0
+        self.last_error: str | None = None
+
+    @staticmethod
+    def from_email_data(email_data: EmailData) -> "QueuedEmail":
+        return QueuedEmail(
+            sender=email_data.sender,
+            recipient=email_data.recipient,
+            subject=email_data.subject,
+            body=email_data.body,
+        )
+
+    def to_email_data(self) -> EmailData:
+        return EmailData(
+            sender=self.sender,
+            recipient=self.recipient,
+            subject=self.subject,
+            body=self.body,
+        )
+
+
+class DeadLetterEmail:
+    """
+    Row of the email_dead_letters table: an email that ran out of attempts. Inserting
+    it back into email_queue sends it again.
+    """
+
+    def __init__(
+        self,
+        sender: str,
+        recipient: str,
+        subject: str,
+        body: str,
+        attempts: int,
+        last_error: str | None,
+    ) -> None:
+        self.id: int | None = None
+        self.sender = sender
+        self.recipient = recipient
+        self.subject = subject
+        self.body = body
+        self.attempts = attempts
+        self.last_error = last_error
+        self.failed_at: datetime | None = None
+
+
+# Sends emails sharing sender, subject and body in one request, raises on failure
+SendBatch = Callable[[Sequence[EmailData]], None]
+
+
+class EmailQueue:
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(self) -> None:
+        self.__sessionmaker: async_sessionmaker | None = None
+        self.__config: EmailQueueConfig | None = None
+        self.__send_batch: SendBatch | None = None
+        self.__rate_limiter: RateLimiter | None = None
+        self.__wakeup: asyncio.Event | None = None
+        self.__task: asyncio.Task | None = None
+        self.__stopping: bool = False
+
+    def configure(
+        self,
+        sessionmaker: async_sessionmaker,
+        config: EmailQueueConfig,
+        send_batch: SendBatch,
+    ) -> None:
+        self.__sessionmaker = sessionmaker
+        self.__config = config
+        self.__send_batch = send_batch
+        self.__rate_limiter = RateLimiter(
+            rate=config.rate_limit, burst=config.rate_limit_burst
+        )
+
+    async def enqueue(
+        self, email_data: EmailData, uow: UnitOfWork | None = None
+    ) -> None:
+        """
+        Queues the email in the transaction of `uow`, or in its own one without it.
+        """
+
+        assert self.__sessionmaker is not None
+
+        if uow is not None:
+            uow.session.add(QueuedEmail.from_email_data(email_data))
+            uow.on_commit(self.on_commit)
+            return
+
+        async with self.__sessionmaker() as session:
+            async with session.begin():
+                session.add(QueuedEmail.from_email_data(email_data))
+
+        await self.on_commit()
+
+    async def on_commit(self) -> None:
+        """
+        Called once new emails are committed.
+        """
+
+        assert self.__config is not None
+
+        if self.__config.dispatch_inline:
+            await self.dispatch_pending()
+        elif self.__wakeup is not None:
+            self.__wakeup.set()
+
+    def start(self) -> None:
+        self.__stopping = False
+        self.__wakeup = asyncio.Event()
+        self.__task = asyncio.create_task(self.__run(), name="email_queue")
+
+    async def stop(self) -> None:
+        # Lets the batch in progress finish, pending emails wait for the next start
+        if self.__task is None or self.__wakeup is None:
+            return
+
+        self.__stopping = True
+        self.__wakeup.set()
+        await self.__task
+        self.__task = None
+
+    async def dispatch_pending(self) -> int:
+        """
+        Sends batches until no email is available, returns how many were sent.
+        """
+
+        sent: int = 0
+
+        while not self.__stopping:
+            emails: Sequence[QueuedEmail] = await self.__claim_batch()
+
+            if not emails:
+                break
+
+            sent += await self.__send_claimed(emails)
+
+        return sent
+
+    async def __run(self) -> None:
+        assert self.__config is not None and self.__wakeup is not None
+
+        while not self.__stopping:
+            try:
+                await self.dispatch_pending()
+            except Exception as e:
+                self.logger.error("Email queue dispatch failed", exc_info=e)
+
+            try:
+                await asyncio.wait_for(
+                    self.__wakeup.wait(), timeout=self.__config.poll_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+
+            self.__wakeup.clear()
+
+    async def __claim_batch(self) -> Sequence[QueuedEmail]:
+        assert self.__sessionmaker is not None and self.__config is not None
+
+        # Same claim as the event outbox: SKIP LOCKED for concurrent dispatchers,
+        # the lease hides the claimed emails until they are sent or rescheduled
+        pending = (
+            select(QueuedEmail.id)  # type: ignore
+            .where(QueuedEmail.available_at <= func.now())  # type: ignore
+            .order_by(QueuedEmail.available_at, QueuedEmail.id)  # type: ignore
+            .limit(self.__config.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+
+        query = (
+            update(QueuedEmail)
+            .where(QueuedEmail.id.in_(pending.scalar_subquery()))  # type: ignore
+            .values(
+                available_at=func.now() + self.__seconds(self.__config.lease),
+                attempts=QueuedEmail.attempts + 1,  # type: ignore
+            )
+            .returning(QueuedEmail)
+            .execution_options(synchronize_session=False)
+        )
+
+        async with self.__sessionmaker() as session:
+            async with session.begin():
+                result = await session.execute(query)
+                emails: Sequence[QueuedEmail] = result.scalars().all()
+
+        return sorted(emails, key=lambda email: email.id or 0)
+
+    async def __send_claimed(self, emails: Sequence[QueuedEmail]) -> int:
+        assert self.__sessionmaker is not None and self.__config is not None
+        assert self.__send_batch is not None and self.__rate_limiter is not None
+
+        send_batch: SendBatch = self.__send_batch
+        rate_limiter: RateLimiter = self.__rate_limiter
+        concurrency: asyncio.Semaphore = asyncio.Semaphore(self.__config.concurrency)
+
+        sent: list[int] = []
+        failed: list[tuple[QueuedEmail, str]] = []
+
+        async def send(batch: Sequence[QueuedEmail]) -> None:
+            await rate_limiter.acquire(len(batch))
+
+            async with concurrency:
+                try:
+                    await run_async(
+                        send_batch, [email.to_email_data() for email in batch]
+                    )
+                except Exception as e:
+                    self.logger.error(
+                        f"Error sending {len(batch)} emails '{batch[0].subject}': {e}"
+                    )
+                    failed.extend((email, repr(e)) for email in batch)
+                    return
+
+            sent.extend(email.id or 0 for email in batch)
+
+        async with anyio.create_task_group() as task_group:
+            for batch in self.__group(emails):
+                task_group.start_soon(send, batch)
+
+        async with self.__sessionmaker() as session:
+            async with session.begin():
+                if sent:
+                    await session.execute(
+                        delete(QueuedEmail)
+                        .where(QueuedEmail.id.in_(sent))  # type: ignore
+                        .execution_options(synchronize_session=False)
+                    )
+
+                for email, error in failed:
+                    if email.attempts >= self.__config.max_attempts:
+                        await self.__dead_letter(session, email, error)
+                    else:
+                        await session.execute(self.__retry_update(email, error))
+
+        return len(sent)
+
+    @staticmethod
+    def __group(emails: Sequence[QueuedEmail]) -> list[list[QueuedEmail]]:
+        groups: dict[tuple[str, str, str], list[QueuedEmail]] = defaultdict(list)
+
+        for email in emails:
+            groups[(email.sender, email.subject, email.body)].append(email)
+
+        return [
+            group[start : start + MAX_RECIPIENTS_PER_SEND]
+            for group in groups.values()
+            for start in range(0, len(group), MAX_RECIPIENTS_PER_SEND)
+        ]
+
+    async def __dead_letter(
+        self, session: AsyncSession, email: QueuedEmail, error: str
+    ) -> None:
+        self.logger.error(
+            f"Giving up on email {email.id} to {email.recipient} "
+            f"after {email.attempts} attempts"
+        )
+
+        await session.execute(
+            insert(DeadLetterEmail).values(
+                sender=email.sender,
+                recipient=email.recipient,
+                subject=email.subject,
+                body=email.body,
+                attempts=email.attempts,
+                last_error=error,
+            )
+        )
+        await session.execute(
+            delete(QueuedEmail)
+            .where(QueuedEmail.id == email.id)  # type: ignore
+            .execution_options(synchronize_session=False)
+        )
+
+    def __retry_update(self, email: QueuedEmail, error: str) -> Update:
+        assert self.__config is not None
+
+        delay: float = min(
+            self.__config.retry_base_delay * 2 ** (email.attempts - 1),
+            MAX_RETRY_DELAY_SECONDS,
+        )
+
+        return (
+            update(QueuedEmail)
+            .where(QueuedEmail.id == email.id)  # type: ignore
+            .values(available_at=func.now() + self.__seconds(delay), last_error=error)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def __seconds(seconds: float) -> ColumnElement:
+        return literal_column("interval '1 second'") * seconds
+
+
+app_email_queue = EmailQueue()
@@ -11,6 +11,16 @@ class FileSystemPrefix(Enum):
     PET = "PET"
 
 
+def image_content_type(file_key: str) -> str:
+    extension: str = file_key.split(".")[-1]
+
+    # SVG QR codes, browsers only render them with the registered media type
+    if extension == "svg":
+        return "image/svg+xml"
+
+    return f"image/{extension}"
+
+
 class FileSystemGateway(ABC):
     @abstractmethod
     async def save_file(
@@ -71,7 +81,12 @@ class Boto3S3FileSystemGateway(FileSystemGateway):
         def _save_file():
             file_path = prefix.value + "/" + file_key
 
-            self.s3.put_object(Bucket=self.bucket_name, Key=file_path, Body=file)
+            self.s3.put_object(
+                Bucket=self.bucket_name,
+                Key=file_path,
+                Body=file,
+                ContentType=image_content_type(file_key),
+            )
 
         await run_async(_save_file)
 
@@ -86,7 +101,9 @@ class Boto3S3FileSystemGateway(FileSystemGateway):
 
     async def delete_file(self, prefix: FileSystemPrefix, file_key: str) -> None:
         def _delete_file():
-            self.s3.delete_object(Bucket=self.bucket_name, Key=file_key)
+            file_path = prefix.value + "/" + file_key
+
+            self.s3.delete_object(Bucket=self.bucket_name, Key=file_path)
 
         await run_async(_delete_file)
 
@@ -123,7 +140,7 @@ class Boto3S3FileSystemGateway(FileSystemGateway):
                 Params={
                     "Bucket": self.bucket_name,
                     "Key": file_path,
-                    "ResponseContentType": f'image/{file_key.split(".")[-1]}',
+                    "ResponseContentType": image_content_type(file_key),
                 },
                 ExpiresIn=3600,
             )
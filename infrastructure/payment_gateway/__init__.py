@@ -1 +1,3 @@
 from .mp_merchant_data import MerchantData
+from .payment_gateway import PaymentGateway, HttpxPaymentGateway
+from .fake_mercado_pago import create_fake_mercado_pago_app
@@ -0,0 +1,128 @@
+"""
+The Fake MercadoPago module.
+
+A local stand-in for the MercadoPago API endpoints the payment gateway calls, served
+in-process to the tests (through an ASGI transport) or over HTTP to the payments
+benchmark. Like the API, a repeated idempotency key returns the first response.
+
+Payments are approved, unless the card token is REJECTED_CARD_TOKEN, with a
+MercadoPago fee of MERCADOPAGO_FEE_RATE of the amount.
+"""
+
+import asyncio
+import itertools
+from datetime import datetime, timezone
+from typing import Any
+
+from fastapi import FastAPI, Header, Request
+from fastapi.responses import JSONResponse
+
+REJECTED_CARD_TOKEN: str = "REJECTED"
+MERCADOPAGO_FEE_RATE: float = 0.041
+
+
+def create_fake_mercado_pago_app(latency: float = 0) -> FastAPI:
+    """
+    :param latency: seconds waited before answering each call, as the network and
+        the API would take.
+    """
+
+    app: FastAPI = FastAPI()
+    ids = itertools.count(1)
+    # Idempotency key -> (status code, body) of the first response
+    responses: dict[str, tuple[int, dict]] = {}
+
+    async def respond(
+        idempotency_key: str | None, status_code: int, body: dict
+    ) -> JSONResponse:
+        await asyncio.sleep(latency)
+
+        if idempotency_key is not None:
+            status_code, body = responses.setdefault(
+                idempotency_key, (status_code, body)
+            )
+
+        return JSONResponse(status_code=status_code, content=body)
+
+    @app.post("/v1/payments")
+    async def create_payment(
+        request: Request,
+        authorization: str | None = Header(default=None),
+        x_idempotency_key: str | None = Header(default=None),
+    ) -> JSONResponse:
+        payment: dict[str, Any] = await request.json()
+
+        if not authorization:
+            return await respond(None, 401, {"message": "unauthorized"})
+
+        approved: bool = payment["token"] != REJECTED_CARD_TOKEN
+        amount: float = payment["transaction_amount"]
+        fee_details: list[dict] = [
+            {
+                "type": "mercadopago_fee",
+                "amount": round(amount * MERCADOPAGO_FEE_RATE, 2),
+            }
+        ]
+
+        if payment.get("application_fee"):
+            fee_details.append(
+                {"type": "application_fee", "amount": payment["application_fee"]}
+            )
+
+        return await respond(
+            x_idempotency_key,
+            201,
+            {
+                "id": next(ids),
+                "status": "approved" if approved else "rejected",
+                "status_detail": "accredited"
+                if approved
+                else "cc_rejected_other_reason",
+                "date_approved": (
+                    datetime.now(timezone.utc).isoformat() if approved else None
+                ),
+                "payment_method_id": payment["payment_method_id"],
+                "payment_type_id": "credit_card",
+                "refunds": [],
+                "transaction_amount": amount,
+                "fee_details": fee_details if approved else [],
+            },
+        )
+
+    @app.post("/checkout/preferences")
+    async def create_preference(
+        request: Request, x_idempotency_key: str | None = Header(default=None)
+    ) -> JSONResponse:
+        preference: dict[str, Any] = await request.json()
+
+        if not preference.get("items"):
+            return await respond(
+                x_idempotency_key,
+                400,
+                {"error": "bad_request", "message": "items needed", "status": 400},
+            )
+
+        return await respond(
+            x_idempotency_key, 201, {"id": f"fake-preference-{next(ids)}"}
+        )
+
+    @app.post("/oauth/token")
+    async def create_oauth_token(request: Request) -> JSONResponse:
+        credentials: dict[str, Any] = await request.json()
+        user_id: int = next(ids)
+
+        return await respond(
+            None,
+            200,
+            {
+                "access_token": f"TEST-fake-access-token-{user_id}",
+                "token_type": "bearer",
+                "expires_in": 15552000,
+                "scope": "offline_access read write",
+                "user_id": user_id,
+                "refresh_token": f"TG-fake-refresh-token-{credentials['code']}",
+                "public_key": f"TEST-fake-public-key-{user_id}",
+            },
+        )
+
+    return app
@@ -0,0 +1,145 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+
+import httpx
+
+from common.exceptions import PaymentGatewayUnavailableException
+from config import MercadoPagoConfig
+
+# Delay before sending a call again, times the attempts already made
+RETRY_BASE_DELAY_SECONDS: float = 0.25
+
+
+class PaymentGateway(ABC):
+    """
+    MercadoPago API calls. They return the JSON body of the response, whatever its
+    status, and raise PaymentGatewayUnavailableException when no response arrived.
+
+    Payments and preferences take an idempotency key: MercadoPago answers a repeated
+    key with the first result, so a call that timed out can be sent again.
+    """
+
+    @abstractmethod
+    async def create_payment(
+        self, access_token: str, payment: dict, idempotency_key: str
+    ) -> dict:
+        pass
+
+    @abstractmethod
+    async def create_preference(
+        self, access_token: str, preference: dict, idempotency_key: str
+    ) -> dict:
+        pass
+
+    @abstractmethod
+    async def create_oauth_token(self, credentials: dict) -> dict:
+        pass
+
+    @abstractmethod
+    async def stop(self) -> None:
+        pass
+
+
+class HttpxPaymentGateway(PaymentGateway):
+    """
+    Calls the API from the event loop on a pool of kept-alive connections, so a
+    payment waiting on MercadoPago doesn't hold up the other requests.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        config: MercadoPagoConfig,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.config = config
+        self.__transport = transport
+        self.__client: httpx.AsyncClient | None = None
+
+    async def create_payment(
+        self, access_token: str, payment: dict, idempotency_key: str
+    ) -> dict:
+        return await self.__post(
+            "/v1/payments",
+            body=payment,
+            access_token=access_token,
+            idempotency_key=idempotency_key,
+        )
+
+    async def create_preference(
+        self, access_token: str, preference: dict, idempotency_key: str
+    ) -> dict:
+        return await self.__post(
+            "/checkout/preferences",
+            body=preference,
+            access_token=access_token,
+            idempotency_key=idempotency_key,
+        )
+
+    async def create_oauth_token(self, credentials: dict) -> dict:
+        # Authorization codes are single use, the call is never sent again
+        return await self.__post("/oauth/token", body=credentials)
+
+    async def stop(self) -> None:
+        if self.__client is not None:
+            await self.__client.aclose()
+            self.__client = None
+
+    def __get_client(self) -> httpx.AsyncClient:
+        # Created on the first call, from the event loop that uses it
+        if self.__client is None:
+            self.__client = httpx.AsyncClient(
+                base_url=self.config.api_url,
+                timeout=httpx.Timeout(
+                    self.config.timeout, connect=self.config.connect_timeout
+                ),
+                limits=httpx.Limits(
+                    max_connections=self.config.max_connections,
+                    max_keepalive_connections=self.config.max_connections,
+                ),
+                transport=self.__transport,
+            )
+
+        return self.__client
+
+    async def __post(
+        self,
+        path: str,
+        body: dict,
+        access_token: str | None = None,
+        idempotency_key: str | None = None,
+    ) -> dict:
+        headers: dict[str, str] = {}
+
+        if access_token is not None:
+            headers["Authorization"] = f"Bearer {access_token}"
+
+        if idempotency_key is not None:
+            headers["X-Idempotency-Key"] = idempotency_key
+
+        attempts: int = self.config.max_attempts if idempotency_key else 1
+
+        for attempt in range(1, attempts + 1):
+            try:
+                response: httpx.Response = await self.__get_client().post(
+                    path, json=body, headers=headers
+                )
+            except httpx.TransportError as e:
+                self.logger.warning(
+                    f"MercadoPago {path} attempt {attempt} failed: {e!r}"
+                )
+            else:
+                if response.status_code < 500:
+                    return response.json()
+
+                self.logger.warning(
+                    f"MercadoPago {path} attempt {attempt} failed: "
+                    f"status {response.status_code}"
+                )
+
+            if attempt < attempts:
+                await asyncio.sleep(RETRY_BASE_DELAY_SECONDS * attempt)
+
+        raise PaymentGatewayUnavailableException(operation=path)
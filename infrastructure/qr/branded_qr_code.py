@@ -0,0 +1,217 @@
+"""
+The Branded QR Code module.
+
+QR codes with the app logo at their center, promoted from the
+static_qr_generation sandbox. Modules are drawn straight from the QR matrix instead
+of one rectangle at a time, the logo is loaded and scaled once per size (per
+process) and every thread encodes into its own reused buffer.
+"""
+
+import base64
+import functools
+import io
+import threading
+from pathlib import Path
+from typing import Sequence
+
+import qrcode
+from PIL import Image, ImageColor, ImageOps
+from qrcode.main import QRCode
+
+from config import QRConfig
+from infrastructure.qr.qr_code import PooledQRGenerator, QRStyle
+
+APP_LOGO_PATH: Path = Path(__file__).parent.parent.parent / "assets" / "logo_app.png"
+
+# The logo covers this fraction of the QR code side, the error correction restores
+# the modules behind it
+LOGO_SIDE_RATIO: float = 1 / 4
+
+# Colors of the scaled logo, a palette image encodes far faster and smaller than RGB
+LOGO_COLORS: int = 64
+
+# Scaled logos kept per process, one per QR code version in use
+LOGO_CACHE_SIZE: int = 32
+
+# Largest side of the logo embedded in SVG codes, the SVG itself scales
+SVG_LOGO_PIXELS: int = 256
+
+IMAGE_FORMATS: tuple[str, ...] = ("png", "webp", "svg")
+
+BRANDED_QR_STYLE: QRStyle = QRStyle(
+    error_correction=qrcode.constants.ERROR_CORRECT_H,
+    box_size=5,
+    border=1,
+    logo_path=str(APP_LOGO_PATH),
+)
+
+_buffers = threading.local()
+
+
+def render_branded_qr_codes(data: Sequence[str], style: QRStyle) -> list[bytes]:
+    # Module level, so the rendering processes can unpickle it
+    return [render_branded_qr_code(item, style) for item in data]
+
+
+def render_branded_qr_code(data: str, style: QRStyle) -> bytes:
+    modules: list[list[bool]] = _qr_modules(data, style)
+
+    if style.image_format == "svg":
+        return _svg(modules, style)
+
+    image: Image.Image = _raster(modules, style)
+    buffer: io.BytesIO = _buffer()
+
+    if style.image_format == "webp":
+        # Lossy compression blurs the module edges
+        image.save(buffer, "WEBP", lossless=True)
+    else:
+        image.save(buffer, "PNG")
+
+    return buffer.getvalue()
+
+
+def _qr_modules(data: str, style: QRStyle) -> list[list[bool]]:
+    qr = QRCode(error_correction=style.error_correction, border=style.border)
+    qr.add_data(data)
+    qr.make(fit=True)
+
+    return qr.get_matrix()
+
+
+def _raster(modules: list[list[bool]], style: QRStyle) -> Image.Image:
+    # Palette image: 0 is the fill color, 1 the background and the logo colors follow
+    count: int = len(modules)
+    side: int = count * style.box_size
+
+    indices: bytes = bytes(0 if dark else 1 for row in modules for dark in row)
+    image: Image.Image = Image.frombytes("L", (count, count), indices).resize(
+        (side, side), Image.NEAREST
+    )
+    palette: list[int] = [
+        *ImageColor.getrgb(style.fill_color)[:3],
+        *ImageColor.getrgb(style.back_color)[:3],
+    ]
+
+    if style.logo_path is not None:
+        logo, logo_palette = _palette_logo(
+            style.logo_path, int(side * LOGO_SIDE_RATIO), style.back_color
+        )
+        image.paste(logo, ((side - logo.width) // 2, (side - logo.height) // 2))
+        palette.extend(logo_palette)
+
+    image.putpalette(palette)
+
+    return image
+
+
+def _svg(modules: list[list[bool]], style: QRStyle) -> bytes:
+    count: int = len(modules)
+    side: int = count * style.box_size
+    path: list[str] = []
+
+    # One horizontal run of dark modules per path segment, in module units
+    for y, row in enumerate(modules):
+        x: int = 0
+
+        while x < count:
+            if not row[x]:
+                x += 1
+                continue
+
+            start: int = x
+
+            while x < count and row[x]:
+                x += 1
+
+            path.append(f"M{start} {y}h{x - start}v1h-{x - start}z")
+
+    parts: list[str] = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{side}" height="{side}" '
+        f'viewBox="0 0 {count} {count}" shape-rendering="crispEdges">',
+        f'<rect width="{count}" height="{count}" fill="{style.back_color}"/>',
+        f'<path fill="{style.fill_color}" d="{"".join(path)}"/>',
+    ]
+
+    if style.logo_path is not None:
+        logo_side: float = count * LOGO_SIDE_RATIO
+        offset: float = (count - logo_side) / 2
+        parts.append(
+            f'<image x="{offset}" y="{offset}" width="{logo_side}" '
+            f'height="{logo_side}" href="{_logo_data_uri(style.logo_path, style.back_color)}"/>'
+        )
+
+    parts.append("</svg>")
+
+    return "".join(parts).encode()
+
+
+@functools.lru_cache(maxsize=LOGO_CACHE_SIZE)
+def _scaled_logo(logo_path: str, side: int, back_color: str) -> Image.Image:
+    with Image.open(logo_path) as logo:
+        scaled: Image.Image = ImageOps.contain(
+            logo.convert("RGBA"), (side, side), Image.LANCZOS
+        )
+
+    # Flattened on a square of background, it covers the modules behind it
+    flattened: Image.Image = Image.new("RGB", (side, side), back_color)
+    flattened.paste(
+        scaled,
+        ((side - scaled.width) // 2, (side - scaled.height) // 2),
+        mask=scaled.getchannel("A"),
+    )
+
+    return flattened
+
+
+@functools.lru_cache(maxsize=LOGO_CACHE_SIZE)
+def _palette_logo(
+    logo_path: str, side: int, back_color: str
+) -> tuple[Image.Image, list[int]]:
+    """
+    The scaled logo as indices into the QR code palette (after its two colors), and
+    the colors of those indices. Only read by the renders, so threads share them.
+    """
+
+    quantized: Image.Image = _scaled_logo(logo_path, side, back_color).quantize(
+        colors=LOGO_COLORS, method=Image.Quantize.FASTOCTREE
+    )
+    indices: Image.Image = Image.frombytes(
+        "L", quantized.size, quantized.tobytes()
+    ).point(lambda index: index + 2)
+
+    return indices, (quantized.getpalette() or [])[: LOGO_COLORS * 3]
+
+
+@functools.lru_cache(maxsize=LOGO_CACHE_SIZE)
+def _logo_data_uri(logo_path: str, back_color: str) -> str:
+    logo: Image.Image = _scaled_logo(logo_path, SVG_LOGO_PIXELS, back_color).quantize(
+        colors=LOGO_COLORS, method=Image.Quantize.FASTOCTREE
+    )
+    buffer: io.BytesIO = io.BytesIO()
+    logo.save(buffer, "PNG")
+
+    return f"data:image/png;base64,{base64.b64encode(buffer.getvalue()).decode()}"
+
+
+def _buffer() -> io.BytesIO:
+    buffer: io.BytesIO | None = getattr(_buffers, "buffer", None)
+
+    if buffer is None:
+        buffer = _buffers.buffer = io.BytesIO()
+
+    buffer.seek(0)
+    buffer.truncate()
+
+    return buffer
+
+
+class BrandedQRGenerator(PooledQRGenerator):
+    # Logo QR codes as PNG, lossless WebP or SVG
+    render_batch = staticmethod(render_branded_qr_codes)
+
+    def __init__(self, config: QRConfig, style: QRStyle = BRANDED_QR_STYLE) -> None:
+        if style.image_format not in IMAGE_FORMATS:
+            raise ValueError(f"Unknown QR image format {style.image_format}")
+
+        super().__init__(config=config, style=style)
@@ -1,34 +1,192 @@
+import asyncio
+import dataclasses
+import functools
+import hashlib
 import io
+import math
+import multiprocessing
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Sequence
+
 import qrcode
 from qrcode.main import QRCode
 
-from common.background import run_async
+from common.background import BoundedExecutor, Workload, get_executor
+from config import ExecutorConfig, QRConfig
+
+THREAD_MODE: str = "thread"
+PROCESS_MODE: str = "process"
+
+# Upper bound of the codes sent to a rendering process at once
+MAX_RENDER_CHUNK_SIZE: int = 64
+
+
+@dataclass(frozen=True)
+class QRStyle:
+    error_correction: int = qrcode.constants.ERROR_CORRECT_L
+    box_size: int = 10
+    border: int = 4
+    fill_color: str = "black"
+    back_color: str = "white"
+    # Image placed at the center, needs a high error correction level
+    logo_path: str | None = None
+    # 'png', 'webp' or 'svg'
+    image_format: str = "png"
+
+    def fingerprint(self) -> str:
+        # The logo by its content, it is found at another path on another host
+        logo_digest: str | None = (
+            None if self.logo_path is None else _file_digest(self.logo_path)
+        )
+
+        return hashlib.sha256(
+            repr(dataclasses.replace(self, logo_path=logo_digest)).encode()
+        ).hexdigest()
+
+
+@functools.lru_cache
+def _file_digest(path: str) -> str:
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def render_qr_code(data: str, style: QRStyle) -> bytes:
+    img_byte_arr = io.BytesIO()
+
+    qr = QRCode(
+        error_correction=style.error_correction,
+        box_size=style.box_size,
+        border=style.border,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+
+    image = qr.make_image(fill_color=style.fill_color, back_color=style.back_color)
+    image.save(img_byte_arr, "png")
+
+    return img_byte_arr.getvalue()
+
+
+def render_qr_codes(data: Sequence[str], style: QRStyle) -> list[bytes]:
+    # Module level, so the rendering processes can unpickle it
+    return [render_qr_code(item, style) for item in data]
 
 
 class QRCodeGenerator(ABC):
+    """
+    Renders QR codes as images. Images are content addressed: their key is a hash of
+    the encoded data and the style, so an image already stored under its key never
+    needs rendering again.
+    """
+
+    def __init__(self, style: QRStyle) -> None:
+        self.style = style
+
+    def image_key(self, data: str) -> str:
+        digest: str = hashlib.sha256(
+            f"{self.style.fingerprint()}\x00{data}".encode()
+        ).hexdigest()
+
+        return f"{digest[:32]}.{self.style.image_format}"
+
     @abstractmethod
     async def generate_qr_code(self, data: str) -> bytes:
         pass
 
+    async def generate_qr_codes(self, data: Sequence[str]) -> list[bytes]:
+        return list(
+            await asyncio.gather(*(self.generate_qr_code(item) for item in data))
+        )
+
+    async def stop(self) -> None:
+        pass
+
+
+class PooledQRGenerator(QRCodeGenerator):
+    """
+    Renders QR codes with render_batch on a process pool, or on the image thread
+    executor in thread mode.
+
+    Rendering is pure Python holding the GIL, so threads don't scale with the cores.
+    Batches are split in one chunk per process to pay the pickling once per chunk.
+    """
+
+    # Module level function, so the rendering processes can unpickle it
+    render_batch: Callable[[Sequence[str], QRStyle], list[bytes]]
+
+    def __init__(self, config: QRConfig, style: QRStyle) -> None:
+        super().__init__(style=style)
+        self.config = config
+        self.__executor: BoundedExecutor = self.__create_executor()
 
-class PyQRGenerator(QRCodeGenerator):
-    # QR code generator using python's qrcode library
     async def generate_qr_code(self, data: str) -> bytes:
-        def _generate_qr_code() -> bytes:
-            img_byte_arr = io.BytesIO()
+        images: list[bytes] = await self.__executor.run(
+            type(self).render_batch, [data], self.style
+        )
+
+        return images[0]
+
+    async def generate_qr_codes(self, data: Sequence[str]) -> list[bytes]:
+        if not data:
+            return []
 
-            qr = QRCode(
-                error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=10,
-                border=4,
+        chunk_size: int = min(
+            MAX_RENDER_CHUNK_SIZE,
+            math.ceil(len(data) / self.__executor.config.max_workers),
+        )
+
+        chunks: list[list[bytes]] = await asyncio.gather(
+            *(
+                self.__executor.run(
+                    type(self).render_batch,
+                    data[start : start + chunk_size],
+                    self.style,
+                )
+                for start in range(0, len(data), chunk_size)
             )
-            qr.add_data(data)
-            qr.make(fit=True)
+        )
+
+        return [image for chunk in chunks for image in chunk]
+
+    async def stop(self) -> None:
+        # The image executor of thread mode is drained with the others
+        if self.config.mode == PROCESS_MODE:
+            await self.__executor.drain()
+
+    def __create_executor(self) -> BoundedExecutor:
+        image_executor: BoundedExecutor = get_executor(Workload.IMAGE)
+
+        if self.config.mode == THREAD_MODE:
+            return image_executor
+
+        if self.config.mode != PROCESS_MODE:
+            raise ValueError(f"Unknown QR rendering mode {self.config.mode}")
+
+        workers: int = self.config.workers or os.cpu_count() or 1
+
+        return BoundedExecutor(
+            name="qr",
+            config=ExecutorConfig(
+                max_workers=workers,
+                max_queue_size=image_executor.config.max_queue_size,
+                queue_timeout=image_executor.config.queue_timeout,
+            ),
+            # Spawned, a forked worker would inherit the app threads and their locks
+            executor=ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            ),
+        )
+
 
-            image = qr.make_image(fill_color="black", back_color="white")
-            image.save(img_byte_arr, "png")
+class PyQRGenerator(PooledQRGenerator):
+    # Plain PNG QR codes drawn by python's qrcode library
+    render_batch = staticmethod(render_qr_codes)
 
-            return img_byte_arr.getvalue()
+    def __init__(self, config: QRConfig, style: QRStyle = QRStyle()) -> None:
+        if style.logo_path is not None or style.image_format != "png":
+            raise ValueError("PyQRGenerator only renders plain PNG QR codes")
 
-        return await run_async(_generate_qr_code)
+        super().__init__(config=config, style=style)
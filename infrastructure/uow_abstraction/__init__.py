@@ -1,2 +1,5 @@
 from .event_bus_utils import Event, EventBus, app_event_bus
+from .entity_cache import EntityCache
+from .outbox import OutboxMessage
+from .outbox_dispatcher import OutboxDispatcher, app_outbox_dispatcher
 from .unit_of_work_module import UnitOfWork, make_unit_of_work, unit_of_work
@@ -0,0 +1,48 @@
+from typing import Any, Type, TypeVar, Iterable
+
+from common.entities import BaseDomainEntity
+
+
+class EntityCache:
+    """
+    Request-scoped identity map owned by a UnitOfWork.
+
+    Services look entities up here before going to the database. Cached entities are
+    the same instances tracked by the session, so in-memory edits are visible through
+    the cache. It is cleared whenever the unit of work flushes or rolls back.
+    """
+
+    ENTITY_T = TypeVar("ENTITY_T", bound=BaseDomainEntity)
+
+    def __init__(self) -> None:
+        self.__entities: dict[tuple[Type, str], Any] = dict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, entity_class: Type[ENTITY_T], entity_id: str) -> ENTITY_T | None:
+        entity = self.__entities.get((entity_class, entity_id))
+
+        if entity is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entity
+
+    def add(self, entity_class: Type[ENTITY_T], entity: ENTITY_T) -> None:
+        self.__entities[(entity_class, entity.entity_id)] = entity
+
+    def add_many(
+        self, entity_class: Type[ENTITY_T], entities: Iterable[ENTITY_T]
+    ) -> None:
+        for entity in entities:
+            self.add(entity_class=entity_class, entity=entity)
+
+    def evict(self, entity_class: Type[ENTITY_T], entity_id: str) -> None:
+        self.__entities.pop((entity_class, entity_id), None)
+
+    def clear(self) -> None:
+        self.__entities.clear()
+
+    def __len__(self) -> int:
+        return len(self.__entities)
@@ -1,6 +1,16 @@
+import logging
+import time
 from abc import ABC
-from typing import TypeVar, Type, Callable, Coroutine, Any
-from awebus import Bus
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
+from typing import TypeVar, Type, Callable, Coroutine, Any, ClassVar, Sequence
+
+import anyio
+
+Handler = Callable[[Any], Coroutine[Any, Any, None]]
+
+# Handlers running longer than this are cancelled and counted as failed
+DEFAULT_HANDLER_TIMEOUT_SECONDS: float = 30
 
 
 class Event(ABC):
@@ -10,6 +20,13 @@ class Event(ABC):
         Abstract Event class that defines concrete Event class' interface.
     """
 
+    # Every Event subclass by event_id, to rebuild events read from the outbox
+    __event_classes: ClassVar[dict[str, Type["Event"]]] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        Event.__event_classes[cls.event_id()] = cls
+
     def __init__(self, actor_account_id: str, issued: float) -> None:
         self.actor_account_id = actor_account_id
         self.issued = issued
@@ -18,23 +35,192 @@ class Event(ABC):
     def event_id(cls) -> str:
         return cls.__name__
 
+    @staticmethod
+    def event_class(event_id: str) -> Type["Event"]:
+        return Event.__event_classes[event_id]
+
+    def aggregate_id(self) -> str | None:
+        """
+        Entity the event is about. Events of the same aggregate are handled in the
+        order they were emitted, None means the event can be handled at any time.
+        """
+
+        return None
+
+
+@dataclass
+class HandlerMetrics:
+    calls: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def average_seconds(self) -> float:
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+
+@dataclass(frozen=True)
+class DispatchResult:
+    # Handlers that have handled the event, in this or in a previous dispatch
+    handled: frozenset[str]
+    errors: dict[str, BaseException] = field(default_factory=dict)
+
+    @property
+    def succeeded(self) -> bool:
+        return not self.errors
+
+
+class EventHandlingError(Exception):
+    def __init__(self, errors: dict[str, BaseException]) -> None:
+        super().__init__(
+            ", ".join(f"{name}: {error!r}" for name, error in errors.items())
+        )
+        self.errors = errors
+
+
+@dataclass(frozen=True)
+class _Subscription:
+    name: str
+    handler: Handler
+    timeout: float
+
 
 class EventBus:
+    """
+    Runs the handlers of each event concurrently, every handler isolated from the
+    others: it gets its own timeout and its failure is reported without cancelling
+    or undoing the rest (handlers commit their own units of work).
+    """
+
     EVENT_T = TypeVar("EVENT_T", bound=Event)
 
+    logger: logging.Logger = logging.getLogger(__name__)
+
     def __init__(self) -> None:
-        self.__bus_impl = Bus(event_use_weakref=False)
+        self.__subscriptions: dict[str, list[_Subscription]] = defaultdict(list)
+        self.__metrics: dict[str, HandlerMetrics] = defaultdict(HandlerMetrics)
 
     def on(
         self,
         event_class: Type[EVENT_T],
         handler: Callable[[EVENT_T], Coroutine[Any, Any, None]],
+        timeout: float = DEFAULT_HANDLER_TIMEOUT_SECONDS,
     ) -> None:
-        self.__bus_impl.on(event_class.event_id(), handler)
+        # Stable across restarts, the outbox remembers handlers by this name
+        name: str = f"{handler.__module__}.{handler.__qualname__}"
+
+        self.__subscriptions[event_class.event_id()].append(
+            _Subscription(name=name, handler=handler, timeout=timeout)
+        )
+
+    async def dispatch(
+        self, event: Event, skip_handlers: frozenset[str] = frozenset()
+    ) -> DispatchResult:
+        """
+        Runs every handler of `event` not in `skip_handlers`, so a retried event
+        only runs the handlers that failed before.
+        """
+
+        handled: set[str] = set(skip_handlers)
+        errors: dict[str, BaseException] = {}
+
+        async def run(subscription: _Subscription) -> None:
+            error: BaseException | None = await self.__run_handler(
+                subscription=subscription, event=event
+            )
+
+            if error is None:
+                handled.add(subscription.name)
+            else:
+                errors[subscription.name] = error
+
+        async with anyio.create_task_group() as task_group:
+            for subscription in self.__subscriptions[event.event_id()]:
+                if subscription.name not in skip_handlers:
+                    task_group.start_soon(run, subscription)
+
+        return DispatchResult(handled=frozenset(handled), errors=errors)
+
+    async def post_events(self, events: Sequence[Event]) -> None:
+        """
+        Dispatches `events`, concurrently across aggregates and in order within one,
+        and raises EventHandlingError once all of them ran if any handler failed.
+        """
+
+        errors: dict[str, BaseException] = {}
+
+        async def dispatch_in_order(aggregate_events: Sequence[Event]) -> None:
+            for event in aggregate_events:
+                result: DispatchResult = await self.dispatch(event)
+                errors.update(result.errors)
+
+        async with anyio.create_task_group() as task_group:
+            for aggregate_events in group_by_aggregate(events, lambda e: e):
+                task_group.start_soon(dispatch_in_order, aggregate_events)
+
+        if errors:
+            raise EventHandlingError(errors=errors)
+
+    def handler_metrics(self) -> dict[str, HandlerMetrics]:
+        return {name: replace(metrics) for name, metrics in self.__metrics.items()}
+
+    async def __run_handler(
+        self, subscription: _Subscription, event: Event
+    ) -> BaseException | None:
+        metrics: HandlerMetrics = self.__metrics[subscription.name]
+        error: BaseException | None = None
+        start: float = time.perf_counter()
+
+        try:
+            with anyio.fail_after(subscription.timeout):
+                await subscription.handler(event)
+        except TimeoutError as e:
+            metrics.timeouts += 1
+            error = e
+        except Exception as e:
+            error = e
+
+        elapsed: float = time.perf_counter() - start
+        metrics.calls += 1
+        metrics.total_seconds += elapsed
+        metrics.max_seconds = max(metrics.max_seconds, elapsed)
+
+        if error is not None:
+            metrics.errors += 1
+            self.logger.warning(
+                f"{subscription.name} failed handling {event.event_id()} "
+                f"after {elapsed:.3f}s",
+                exc_info=error,
+            )
+
+        return error
+
+
+T = TypeVar("T")
+
+
+def group_by_aggregate(
+    items: Sequence[T], get_event: Callable[[T], Event]
+) -> list[list[T]]:
+    """
+    Splits `items` into lists of the same aggregate, keeping their order. Events
+    without an aggregate get a list of their own.
+    """
+
+    groups: dict[str, list[T]] = {}
+    independent: list[list[T]] = []
+
+    for item in items:
+        aggregate_id: str | None = get_event(item).aggregate_id()
+
+        if aggregate_id is None:
+            independent.append([item])
+        else:
+            groups.setdefault(aggregate_id, []).append(item)
 
-    async def post_events(self, events: list[Event]) -> None:
-        for event in events:
-            await self.__bus_impl.emitAsync(event.event_id(), event)  # type: ignore
+    return [*groups.values(), *independent]
 
 
 app_event_bus = EventBus()
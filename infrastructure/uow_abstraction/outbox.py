@@ -0,0 +1,97 @@
+"""
+The Outbox module.
+
+Events emitted in a unit of work are stored in the event_outbox table, in the same
+transaction as the changes that caused them, and handled afterwards by the
+OutboxDispatcher. Events are stored as JSON: their attributes, with enums written as
+their values and restored from the event classes' __init__ annotations. Arguments
+added to an event after it was stored take their __init__ default.
+"""
+
+from datetime import datetime
+from enum import Enum
+import inspect
+from typing import Any, Type, get_args, get_type_hints
+
+from infrastructure.uow_abstraction.event_bus_utils import Event
+
+
+class OutboxMessage:
+    """
+    Row of the event_outbox table. Dispatched messages are deleted, messages that
+    ran out of attempts stay with failed_at set until someone looks at them.
+    """
+
+    def __init__(self, event_type: str, payload: dict[str, Any]) -> None:
+        self.id: int | None = None
+        self.event_type = event_type
+        self.payload = payload
+        self.attempts: int = 0
+        # Names of the handlers that already handled the event
+        self.handled_by: list[str] = []
+        self.last_error: str | None = None
+        self.failed_at: datetime | None = None
+
+    @staticmethod
+    def from_event(event: Event) -> "OutboxMessage":
+        return OutboxMessage(
+            event_type=event.event_id(), payload=serialize_event(event=event)
+        )
+
+
+def serialize_event(event: Event) -> dict[str, Any]:
+    return {
+        name: value.value if isinstance(value, Enum) else value
+        for name, value in vars(event).items()
+    }
+
+
+def deserialize_event(event_type: str, payload: dict[str, Any]) -> Event:
+    event_class: Type[Event] = Event.event_class(event_type)
+    annotations: dict[str, Any] = _init_annotations(event_class)
+
+    event: Event = event_class.__new__(event_class)
+
+    for name, default in _init_defaults(event_class).items():
+        setattr(event, name, default)
+
+    for name, value in payload.items():
+        enum_class: Type[Enum] | None = _enum_class(annotations.get(name))
+        setattr(event, name, value if enum_class is None else enum_class(value))
+
+    return event
+
+
+def _init_annotations(event_class: Type[Event]) -> dict[str, Any]:
+    # Attributes are set from the __init__ arguments of the class or of its bases
+    annotations: dict[str, Any] = {}
+
+    for cls in reversed(event_class.__mro__):
+        if "__init__" in vars(cls):
+            annotations.update(get_type_hints(vars(cls)["__init__"]))
+
+    return annotations
+
+
+def _init_defaults(event_class: Type[Event]) -> dict[str, Any]:
+    defaults: dict[str, Any] = {}
+
+    for cls in reversed(event_class.__mro__):
+        if "__init__" in vars(cls):
+            parameters = inspect.signature(vars(cls)["__init__"]).parameters
+            defaults.update(
+                (name, parameter.default)
+                for name, parameter in parameters.items()
+                if parameter.default is not inspect.Parameter.empty
+            )
+
+    return defaults
+
+
+def _enum_class(annotation: Any) -> Type[Enum] | None:
+    # Unwraps optional annotations (SomeEnum | None)
+    for candidate in get_args(annotation) or (annotation,):
+        if isinstance(candidate, type) and issubclass(candidate, Enum):
+            return candidate
+
+    return None
@@ -0,0 +1,243 @@
+"""
+The Outbox Dispatcher module.
+
+Drains the event_outbox table: claims batches of pending messages, dispatches them on
+the EventBus and deletes them once every handler succeeded. Messages of the same
+aggregate are dispatched in emission order, the rest concurrently. Failed messages
+are retried with exponential backoff, running only the handlers that have not
+succeeded yet, and given up (failed_at) after max_attempts. Delivery is
+at-least-once, a message whose dispatcher dies is claimed again once its lease ends.
+"""
+
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Sequence
+
+import anyio
+from sqlalchemy import delete, func, literal_column, select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from config import OutboxConfig
+from infrastructure.uow_abstraction.event_bus_utils import (
+    DispatchResult,
+    Event,
+    EventBus,
+    EventHandlingError,
+    app_event_bus,
+    group_by_aggregate,
+)
+from infrastructure.uow_abstraction.outbox import OutboxMessage, deserialize_event
+
+# Upper bound of the delay between two attempts of a message
+MAX_RETRY_DELAY_SECONDS: float = 3600
+
+
+class OutboxDispatcher:
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(self, event_bus: EventBus) -> None:
+        self.event_bus = event_bus
+        self.__sessionmaker: async_sessionmaker | None = None
+        self.__config: OutboxConfig | None = None
+        self.__wakeup: asyncio.Event | None = None
+        self.__task: asyncio.Task | None = None
+        self.__stopping: bool = False
+
+    def configure(self, sessionmaker: async_sessionmaker, config: OutboxConfig) -> None:
+        self.__sessionmaker = sessionmaker
+        self.__config = config
+
+    async def on_commit(self) -> None:
+        """
+        Called by the unit of work after committing new outbox messages.
+        """
+
+        if self.__config is None:
+            return
+
+        if self.__config.dispatch_inline:
+            await self.dispatch_pending()
+        elif self.__wakeup is not None:
+            self.__wakeup.set()
+
+    def start(self) -> None:
+        self.__stopping = False
+        self.__wakeup = asyncio.Event()
+        self.__task = asyncio.create_task(self.__run(), name="outbox_dispatcher")
+
+    async def stop(self) -> None:
+        # Lets the batch in progress finish, pending messages wait for the next start
+        if self.__task is None or self.__wakeup is None:
+            return
+
+        self.__stopping = True
+        self.__wakeup.set()
+        await self.__task
+        self.__task = None
+
+    async def dispatch_pending(self) -> int:
+        """
+        Dispatches batches until no message is available, returns how many messages
+        were handled successfully.
+        """
+
+        dispatched: int = 0
+
+        while not self.__stopping:
+            messages: Sequence[OutboxMessage] = await self.__claim_batch()
+
+            if not messages:
+                break
+
+            dispatched += await self.__dispatch_batch(messages)
+
+        return dispatched
+
+    async def __run(self) -> None:
+        assert self.__config is not None and self.__wakeup is not None
+
+        while not self.__stopping:
+            try:
+                await self.dispatch_pending()
+            except Exception as e:
+                self.logger.error("Outbox dispatch failed", exc_info=e)
+
+            try:
+                await asyncio.wait_for(
+                    self.__wakeup.wait(), timeout=self.__config.poll_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+
+            self.__wakeup.clear()
+
+    async def __claim_batch(self) -> Sequence[OutboxMessage]:
+        assert self.__sessionmaker is not None and self.__config is not None
+
+        # SKIP LOCKED lets several dispatchers (one per worker process) claim
+        # disjoint batches, the lease hides the claimed messages until they are done
+        pending = (
+            select(OutboxMessage.id)  # type: ignore
+            .where(
+                OutboxMessage.failed_at.is_(None),  # type: ignore
+                OutboxMessage.available_at <= func.now(),  # type: ignore
+            )
+            .order_by(OutboxMessage.available_at, OutboxMessage.id)  # type: ignore
+            .limit(self.__config.batch_size)
+            .with_for_update(skip_locked=True)
+        )
+
+        query = (
+            update(OutboxMessage)
+            .where(OutboxMessage.id.in_(pending.scalar_subquery()))  # type: ignore
+            .values(
+                available_at=func.now() + self.__seconds(self.__config.lease),
+                attempts=OutboxMessage.attempts + 1,  # type: ignore
+            )
+            .returning(OutboxMessage)
+            .execution_options(synchronize_session=False)
+        )
+
+        async with self.__sessionmaker() as session:
+            async with session.begin():
+                result = await session.execute(query)
+                messages: Sequence[OutboxMessage] = result.scalars().all()
+
+        return sorted(messages, key=lambda message: message.id or 0)
+
+    async def __dispatch_batch(self, messages: Sequence[OutboxMessage]) -> int:
+        assert self.__sessionmaker is not None and self.__config is not None
+        config: OutboxConfig = self.__config
+
+        # Created per batch, semaphores are bound to the event loop using them
+        limits: dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(config.default_concurrency)
+        )
+
+        for event_type, limit in config.concurrency.items():
+            limits[event_type] = asyncio.Semaphore(limit)
+
+        results: dict[int, DispatchResult] = {}
+        events: list[tuple[OutboxMessage, Event]] = []
+
+        for message in messages:
+            try:
+                events.append(
+                    (message, deserialize_event(message.event_type, message.payload))
+                )
+            except Exception as e:
+                results[message.id or 0] = DispatchResult(
+                    handled=frozenset(message.handled_by), errors={"outbox": e}
+                )
+
+        async def dispatch_in_order(
+            aggregate_events: Sequence[tuple[OutboxMessage, Event]]
+        ) -> None:
+            # Messages of one aggregate one after the other, in emission order
+            for message, event in aggregate_events:
+                async with limits[message.event_type]:
+                    results[message.id or 0] = await self.event_bus.dispatch(
+                        event=event, skip_handlers=frozenset(message.handled_by)
+                    )
+
+        async with anyio.create_task_group() as task_group:
+            for aggregate_events in group_by_aggregate(events, lambda item: item[1]):
+                task_group.start_soon(dispatch_in_order, aggregate_events)
+
+        succeeded: list[int] = [
+            message_id for message_id, result in results.items() if result.succeeded
+        ]
+
+        async with self.__sessionmaker() as session:
+            async with session.begin():
+                if succeeded:
+                    await session.execute(
+                        delete(OutboxMessage)
+                        .where(OutboxMessage.id.in_(succeeded))  # type: ignore
+                        .execution_options(synchronize_session=False)
+                    )
+
+                for message in messages:
+                    result: DispatchResult = results[message.id or 0]
+
+                    if not result.succeeded:
+                        await session.execute(self.__failure_update(message, result))
+
+        return len(succeeded)
+
+    def __failure_update(self, message: OutboxMessage, result: DispatchResult):
+        assert self.__config is not None
+
+        # Handlers that succeeded are skipped on the next attempts
+        values: dict = {
+            "handled_by": sorted(result.handled),
+            "last_error": str(EventHandlingError(errors=result.errors)),
+        }
+
+        if message.attempts >= self.__config.max_attempts:
+            values["failed_at"] = func.now()
+            self.logger.error(
+                f"Giving up on {message.event_type} (outbox message {message.id}) "
+                f"after {message.attempts} attempts"
+            )
+        else:
+            delay: float = min(
+                self.__config.retry_base_delay * 2 ** (message.attempts - 1),
+                MAX_RETRY_DELAY_SECONDS,
+            )
+            values["available_at"] = func.now() + self.__seconds(delay)
+
+        return (
+            update(OutboxMessage)
+            .where(OutboxMessage.id == message.id)  # type: ignore
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+
+    @staticmethod
+    def __seconds(seconds: float):
+        return literal_column("interval '1 second'") * seconds
+
+
+app_outbox_dispatcher = OutboxDispatcher(event_bus=app_event_bus)
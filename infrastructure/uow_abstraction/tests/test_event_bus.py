@@ -0,0 +1,98 @@
+import asyncio
+
+import asynctest
+
+from infrastructure.uow_abstraction import Event, EventBus
+from infrastructure.uow_abstraction.event_bus_utils import EventHandlingError
+
+
+class AggregateTestEvent(Event):
+    def __init__(self, aggregate: str, number: int, delay: float = 0) -> None:
+        super().__init__(actor_account_id=Event.EXTERNAL_ACTOR_ACCOUNT_ID, issued=0)
+        self.aggregate = aggregate
+        self.number = number
+        self.delay = delay
+
+    def aggregate_id(self) -> str | None:
+        return self.aggregate
+
+
+class TestEventBus(asynctest.TestCase):
+    async def setUp(self) -> None:
+        self.event_bus: EventBus = EventBus()
+        self.handled: list[tuple[str, int]] = []
+
+    async def record(self, event: AggregateTestEvent) -> None:
+        await asyncio.sleep(event.delay)
+        self.handled.append((event.aggregate, event.number))
+
+    async def fail(self, event: AggregateTestEvent) -> None:
+        raise ValueError("handler failed")
+
+    async def hang(self, event: AggregateTestEvent) -> None:
+        await asyncio.sleep(10)
+
+    async def test_events_of_an_aggregate_are_handled_in_order(self) -> None:
+        self.event_bus.on(AggregateTestEvent, self.record)
+
+        await self.event_bus.post_events(
+            [
+                AggregateTestEvent("a", 1, delay=0.05),
+                AggregateTestEvent("b", 1, delay=0.01),
+                AggregateTestEvent("a", 2),
+                AggregateTestEvent("b", 2),
+            ]
+        )
+
+        self.assertEqual(
+            [number for aggregate, number in self.handled if aggregate == "a"], [1, 2]
+        )
+        self.assertEqual(
+            [number for aggregate, number in self.handled if aggregate == "b"], [1, 2]
+        )
+        # Aggregates run concurrently: b finished while a was still on its first event
+        self.assertEqual(self.handled[0], ("b", 1))
+
+    async def test_failing_handler_does_not_stop_the_others(self) -> None:
+        self.event_bus.on(AggregateTestEvent, self.fail)
+        self.event_bus.on(AggregateTestEvent, self.record)
+
+        with self.assertRaises(EventHandlingError) as context:
+            await self.event_bus.post_events([AggregateTestEvent("a", 1)])
+
+        self.assertEqual(self.handled, [("a", 1)])
+        self.assertEqual(len(context.exception.errors), 1)
+
+        metrics = self.event_bus.handler_metrics()
+        failed = next(name for name in metrics if name.endswith("fail"))
+        recorded = next(name for name in metrics if name.endswith("record"))
+
+        self.assertEqual((metrics[failed].calls, metrics[failed].errors), (1, 1))
+        self.assertEqual((metrics[recorded].calls, metrics[recorded].errors), (1, 0))
+
+    async def test_handler_past_its_timeout_is_cancelled(self) -> None:
+        self.event_bus.on(AggregateTestEvent, self.hang, timeout=0.05)
+        self.event_bus.on(AggregateTestEvent, self.record)
+
+        result = await asyncio.wait_for(
+            self.event_bus.dispatch(AggregateTestEvent("a", 1)), timeout=1
+        )
+
+        self.assertFalse(result.succeeded)
+        self.assertEqual(self.handled, [("a", 1)])
+
+        metrics = self.event_bus.handler_metrics()
+        hung = next(name for name in metrics if name.endswith("hang"))
+
+        self.assertEqual((metrics[hung].timeouts, metrics[hung].errors), (1, 1))
+
+    async def test_failed_handlers_are_retried_alone(self) -> None:
+        self.event_bus.on(AggregateTestEvent, self.fail)
+        self.event_bus.on(AggregateTestEvent, self.record)
+
+        first = await self.event_bus.dispatch(AggregateTestEvent("a", 1))
+        await self.event_bus.dispatch(
+            AggregateTestEvent("a", 1), skip_handlers=first.handled
+        )
+
+        self.assertEqual(self.handled, [("a", 1)])
@@ -1,16 +1,25 @@
 from contextlib import asynccontextmanager
 from functools import wraps
-from typing import AsyncGenerator, Callable, Coroutine
-from infrastructure.uow_abstraction import Event, EventBus, app_event_bus
+from typing import AsyncGenerator, Awaitable, Callable, Coroutine
+from infrastructure.uow_abstraction import Event
+from infrastructure.uow_abstraction.entity_cache import EntityCache
+from infrastructure.uow_abstraction.outbox import OutboxMessage
+from infrastructure.uow_abstraction.outbox_dispatcher import (
+    OutboxDispatcher,
+    app_outbox_dispatcher,
+)
 from sqlalchemy.ext.asyncio import AsyncSession as Session
 from sqlalchemy.ext.asyncio import async_sessionmaker
 
 
 class UnitOfWork:
     def __init__(self, session: Session) -> None:
-        self.__event_bus: EventBus = app_event_bus
+        self.__outbox_dispatcher: OutboxDispatcher = app_outbox_dispatcher
         self.__events: list[Event] = list()
+        self.__staged_events: int = 0
+        self.__commit_callbacks: list[Callable[[], Awaitable[None]]] = []
         self.__session = session
+        self.__entity_cache = EntityCache()
         self._closed = False
 
     @property
@@ -24,27 +33,73 @@ class UnitOfWork:
 
         return self.__session
 
+    @property
+    def entity_cache(self) -> EntityCache:
+        return self.__entity_cache
+
     async def flush(self) -> None:
+        self.__entity_cache.clear()
         await self.__session.flush()
 
     async def commit(self) -> None:
         self._closed = True
+        await self.stage_events()
         await self.__session.commit()
         await self.__publish_events()
+        await self.__run_commit_callbacks()
+
+    async def stage_events(self) -> None:
+        """
+        Writes the emitted events to the outbox, must run in the transaction of the
+        changes that emitted them so both are committed (or lost) together.
+        """
+
+        if not self.__events:
+            return
+
+        self.__session.add_all(
+            [OutboxMessage.from_event(event) for event in self.__events]
+        )
+        await self.__session.flush()
+
+        self.__staged_events += len(self.__events)
+        self.__events.clear()
 
     async def rollback(self, close_session: bool = True) -> None:
         if close_session:
             self._closed = True
 
         await self.__session.rollback()
+        self.__entity_cache.clear()
         self.__events.clear()
+        self.__staged_events = 0
+        self.__commit_callbacks.clear()
+
+    def on_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        """
+        Runs `callback` once the transaction is committed, and not at all if it is
+        rolled back. A callback registered several times runs once.
+        """
+
+        if callback not in self.__commit_callbacks:
+            self.__commit_callbacks.append(callback)
 
     def emit_event(self, event: Event) -> None:
         self.__events.append(event)
 
     async def __publish_events(self) -> None:
-        await self.__event_bus.post_events(self.__events)
-        self.__events.clear()
+        # Handlers run out of the committed transaction, from the outbox
+        if not self.__staged_events:
+            return
+
+        self.__staged_events = 0
+        await self.__outbox_dispatcher.on_commit()
+
+    async def __run_commit_callbacks(self) -> None:
+        callbacks, self.__commit_callbacks = self.__commit_callbacks, []
+
+        for callback in callbacks:
+            await callback()
 
 
 @asynccontextmanager
@@ -61,6 +116,7 @@ async def make_unit_of_work(
 
             async with session.begin():
                 yield uow
+                await uow.stage_events()
 
             await uow.commit()
 
@@ -3,9 +3,17 @@ from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 
 from bounded_contexts import initialize_contexts
+from bounded_contexts.pets_domain.event_handlers import PetSightDigestSender
+from common.background import drain_executors
 from common.dependencies import DependencyContainer
+from common.pagination import NEXT_CURSOR_HEADER
 from config import ProjectConfig, YamlConfigFileName
+from infrastructure.crypto import HashUtils
 from infrastructure.database import RepositoryUtils
+from infrastructure.email import EmailQueue
+from infrastructure.payment_gateway import PaymentGateway
+from infrastructure.qr.qr_code import QRCodeGenerator
+from infrastructure.uow_abstraction import OutboxDispatcher
 from rest import APIManager
 
 app: FastAPI = FastAPI()
@@ -25,6 +33,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 
@@ -37,10 +46,9 @@ async def start_app() -> None:
     dependencies: DependencyContainer = DependencyContainer()
 
     # Register project config
-    dependencies.register(
-        ProjectConfig,
-        ProjectConfig(YamlConfigFileName.APP_CONFIG),
-    )
+    project_config: ProjectConfig = ProjectConfig(YamlConfigFileName.APP_CONFIG)
+    dependencies.register(ProjectConfig, project_config)
+    app.state.project_config = project_config
 
     # Initialize bounded contexts
     initialize_contexts(dependencies)
@@ -49,9 +57,51 @@ async def start_app() -> None:
     repository_utils: RepositoryUtils = dependencies.resolve(RepositoryUtils)
     await repository_utils.create_metadata()
 
+    # Starts the hashing processes and calibrates the bcrypt cost factor
+    hash_utils: HashUtils = dependencies.resolve(HashUtils)
+    await hash_utils.start()
+    app.state.hash_utils = hash_utils
+
+    # Handles the events committed to the outbox, out of the requests
+    outbox_dispatcher: OutboxDispatcher = dependencies.resolve(OutboxDispatcher)
+    outbox_dispatcher.start()
+    app.state.outbox_dispatcher = outbox_dispatcher
+
+    # Sends the queued emails, out of the requests
+    email_queue: EmailQueue = dependencies.resolve(EmailQueue)
+    email_queue.start()
+    app.state.email_queue = email_queue
+
+    # Emails the pet sightings digests once their window is over
+    pet_sight_digest_sender: PetSightDigestSender = dependencies.resolve(
+        PetSightDigestSender
+    )
+    pet_sight_digest_sender.start()
+    app.state.pet_sight_digest_sender = pet_sight_digest_sender
+
+    # Closes its pooled connections to MercadoPago with the app
+    app.state.payment_gateway = dependencies.resolve(PaymentGateway)
+
+    # Stopped with the app, renders QR codes on its own processes in process mode
+    app.state.qr_code_generator = dependencies.resolve(QRCodeGenerator)
+
     # Register FastAPI routes
     api_manager: APIManager = APIManager(
         dependencies=dependencies,
     )
 
     api_manager.initialize_api(app=app)
+
+
+@app.on_event("shutdown")
+async def stop_app() -> None:
+    # Finishes the batch being dispatched, the rest stays in the outbox
+    await app.state.outbox_dispatcher.stop()
+    await app.state.pet_sight_digest_sender.stop()
+    await app.state.email_queue.stop()
+
+    # Lets the scheduled background calls (emails) finish before exiting
+    await drain_executors(timeout=app.state.project_config.executors.drain_timeout)
+    await app.state.hash_utils.stop()
+    await app.state.qr_code_generator.stop()
+    await app.state.payment_gateway.stop()
@@ -0,0 +1,59 @@
+"""
+Runs the schema migrations against the configured database.
+
+Usage:
+    python -m migrations status
+    python -m migrations upgrade [--version N]
+    python -m migrations downgrade --version N
+    python -m migrations upgrade --config testing
+"""
+
+import argparse
+import asyncio
+import logging
+
+from bounded_contexts import initialize_contexts
+from common.dependencies import DependencyContainer
+from config import ProjectConfig, YamlConfigFileName
+from infrastructure.database import RepositoryUtils
+from infrastructure.database.migrations import MigrationRunner
+
+CONFIG_FILES: dict[str, YamlConfigFileName] = {
+    "app": YamlConfigFileName.APP_CONFIG,
+    "testing": YamlConfigFileName.TESTING,
+}
+
+
+async def main(command: str, version: int | None, config_name: str) -> None:
+    dependencies: DependencyContainer = DependencyContainer()
+    dependencies.register(ProjectConfig, ProjectConfig(CONFIG_FILES[config_name]))
+    initialize_contexts(dependencies)
+
+    repository_utils: RepositoryUtils = dependencies.resolve(RepositoryUtils)
+    runner: MigrationRunner = MigrationRunner(engine=repository_utils.engine)
+
+    try:
+        if command == "upgrade":
+            await runner.upgrade(target_version=version)
+        elif command == "downgrade":
+            await runner.downgrade(target_version=version or 0)
+
+        applied_versions: set[int] = await runner.get_applied_versions()
+
+        for migration in runner.migrations:
+            state = "applied" if migration.version in applied_versions else "pending"
+            print(f"{migration.version:>4}  {state:<8} {migration.description}")
+    finally:
+        await repository_utils.dispose_engine()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(prog="python -m migrations")
+    parser.add_argument("command", choices=["status", "upgrade", "downgrade"])
+    parser.add_argument("--version", type=int, default=None)
+    parser.add_argument("--config", choices=list(CONFIG_FILES), default="app")
+    arguments = parser.parse_args()
+
+    asyncio.run(main(arguments.command, arguments.version, arguments.config))
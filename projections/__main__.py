@@ -0,0 +1,68 @@
+"""
+Rebuilds the read-model projections from their source tables.
+
+PetEventHandler and ReportsEventHandler keep them current as events arrive, a
+rebuild is only needed to backfill them or to repair them after events were lost
+(e.g. a crash between the commit and the event handlers).
+
+Usage:
+    python -m projections rebuild
+    python -m projections rebuild --config testing
+"""
+
+import argparse
+import asyncio
+import logging
+
+from bounded_contexts import initialize_contexts
+from bounded_contexts.pets_domain.services import PetSightService
+from bounded_contexts.reports_domain.services import ReportService
+from common.dependencies import DependencyContainer
+from config import ProjectConfig, YamlConfigFileName
+from infrastructure.database import RepositoryUtils
+from infrastructure.uow_abstraction import make_unit_of_work
+
+CONFIG_FILES: dict[str, YamlConfigFileName] = {
+    "app": YamlConfigFileName.APP_CONFIG,
+    "testing": YamlConfigFileName.TESTING,
+}
+
+
+async def main(config_name: str) -> None:
+    dependencies: DependencyContainer = DependencyContainer()
+    dependencies.register(ProjectConfig, ProjectConfig(CONFIG_FILES[config_name]))
+    initialize_contexts(dependencies)
+
+    repository_utils: RepositoryUtils = dependencies.resolve(RepositoryUtils)
+    pet_sight_service: PetSightService = dependencies.resolve(PetSightService)
+    reports_service: ReportService = dependencies.resolve(ReportService)
+
+    try:
+        await repository_utils.create_metadata()
+
+        async with make_unit_of_work(repository_utils.sessionmaker) as uow:
+            last_sights: int = await pet_sight_service.rebuild_last_sights(uow=uow)
+
+        print(f"pets_last_sight: {last_sights} pets")
+
+        async with make_unit_of_work(repository_utils.sessionmaker) as uow:
+            summaries: dict[str, int] = await reports_service.rebuild_summaries(uow=uow)
+
+        for table, rows in summaries.items():
+            print(f"{table}: {rows} rows")
+
+        # Reports cached from the previous rows, in the shared cache
+        await reports_service.report_cache.clear()
+    finally:
+        await repository_utils.dispose_engine()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    parser = argparse.ArgumentParser(prog="python -m projections")
+    parser.add_argument("command", choices=["rebuild"])
+    parser.add_argument("--config", choices=list(CONFIG_FILES), default="app")
+    arguments = parser.parse_args()
+
+    asyncio.run(main(arguments.config))
@@ -132,6 +132,7 @@ class AdoptionAnimalController(BaseAPIController):
         species: list[AnimalSpecies] | None = Query(None),
         limit: int | None = None,
         offset: int | None = 0,
+        cursor: str | None = None,
     ) -> AdoptionAnimalListView:
         get_adoption_animals_use_case: GetAdoptionAnimalsUseCase = (
             self.dependencies.resolve(GetAdoptionAnimalsUseCase)
@@ -145,6 +146,7 @@ class AdoptionAnimalController(BaseAPIController):
                 limit=limit,
                 offset=offset,
                 state=AdoptionAnimalStates.FOR_ADOPTION,
+                cursor=cursor,
             )
         )
 
@@ -154,6 +156,7 @@ class AdoptionAnimalController(BaseAPIController):
         species: list[AnimalSpecies] | None = Query(None),
         limit: int | None = None,
         offset: int | None = 0,
+        cursor: str | None = None,
     ) -> AdoptionAnimalListView:
         token_data: TokenData = await self._get_token_data(token=token)
         get_adoption_animals_use_case: GetAdoptionAnimalsUseCase = (
@@ -166,6 +169,7 @@ class AdoptionAnimalController(BaseAPIController):
                 limit=limit,
                 offset=offset,
                 account_id=token_data.account_id,
+                cursor=cursor,
             )
         )
 
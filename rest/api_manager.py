@@ -4,12 +4,14 @@ from rest.adoptions_domain.adoptions_route_manager import AdoptionsRouteManager
 from rest.auth import AuthRouteManager
 from rest.donations_domain import DonationsRouteManager
 from rest.error_manager.adoptions_error_manager import AdoptionsErrorManager
+from rest.error_manager.common_error_manager import CommonErrorManager
 from rest.error_manager.donations_error_manager import DonationsErrorManager
 from rest.error_manager.pets_error_manager import PetsErrorManager
 from rest.files.files_route_manager import FilesRouteManager
 from rest.pets_domain.pets_route_manager import PetsRouteManager
 from rest.reports_domain.reports_route_manager import ReportsRouteManager
 from rest.social_domain import SocialRouteManager
+from rest.stats.stats_route_manager import StatsRouteManager
 from rest.error_manager import AuthErrorManager, ErrorContainer, SocialErrorManager
 from rest.error_messages import MessagesConfig
 
@@ -51,6 +53,9 @@ class APIManager:
         donations_error_manager: DonationsErrorManager = DonationsErrorManager(
             messages_config=messages_config
         )
+        common_error_manager: CommonErrorManager = CommonErrorManager(
+            messages_config=messages_config
+        )
 
         errors: ErrorContainer = {
             **auth_error_manager.create_error_dictionary(),
@@ -58,6 +63,7 @@ class APIManager:
             **pets_error_manager.create_error_dictionary(),
             **adoptions_error_manager.create_error_dictionary(),
             **donations_error_manager.create_error_dictionary(),
+            **common_error_manager.create_error_dictionary(),
         }
 
         self.dependencies.register(ErrorContainer, errors)
@@ -70,6 +76,7 @@ class APIManager:
         self.__register_adoptions_routes()
         self.__register_donation_routes()
         self.__register_reports_routes()
+        self.__register_stats_routes()
 
     def __register_auth_routes(self) -> None:
         auth_route_manager: AuthRouteManager = AuthRouteManager(
@@ -119,3 +126,10 @@ class APIManager:
         )
 
         reports_route_manager.register_routes()
+
+    def __register_stats_routes(self) -> None:
+        stats_route_manager: StatsRouteManager = StatsRouteManager(
+            dependencies=self.dependencies
+        )
+
+        stats_route_manager.register_routes()
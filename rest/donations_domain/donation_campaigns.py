@@ -1,3 +1,4 @@
+from fastapi import Response
 from pydantic import BaseModel
 from bounded_contexts.auth.value_objects import TokenData
 from bounded_contexts.donations_domain.services.donations_service import (
@@ -21,6 +22,7 @@ from bounded_contexts.donations_domain.views import (
 from bounded_contexts.donations_domain.views.donations_view_factory import (
     FullDonationCampaignView,
 )
+from common.pagination import get_next_cursor, NEXT_CURSOR_HEADER
 from infrastructure.rest import BaseAPIController, TokenDependency
 
 
@@ -99,19 +101,40 @@ class DonationCampaignsController(BaseAPIController):
         )
 
     async def index_donation_campaigns(
-        self, active: bool, organization_id: str | None = None
+        self,
+        response: Response,
+        active: bool,
+        organization_id: str | None = None,
+        limit: int | None = None,
+        offset: int | None = 0,
+        cursor: str | None = None,
     ) -> list[DonationCampaignView]:
         use_case: GetDonationCampaignsUseCase = self.dependencies.resolve(
             GetDonationCampaignsUseCase
         )
 
-        return await use_case.execute(
+        donation_campaigns: list[DonationCampaignView] = await use_case.execute(
             GetDonationCampaignsUseCase.Request(
                 active=active,
+                limit=limit,
+                offset=offset,
                 organization_id=organization_id,
+                cursor=cursor,
             )
         )
 
+        # The body stays a plain list for existing clients, the cursor goes in a header
+        next_cursor: str | None = get_next_cursor(
+            items=donation_campaigns,
+            limit=limit,
+            sort_key=lambda donation_campaign: donation_campaign.campaign_name,
+        )
+
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+        return donation_campaigns
+
     async def get(self, donation_campaign_id: str) -> FullDonationCampaignView:
         use_case: GetDonationCampaignUseCase = self.dependencies.resolve(
             GetDonationCampaignUseCase
@@ -0,0 +1,47 @@
+from fastapi import HTTPException
+
+from common.exceptions import (
+    BucketExportNotSupportedException,
+    ExecutorRejectedException,
+    InvalidCursorException,
+    InvalidDateRangeException,
+    InvalidGeoAreaException,
+    PaymentGatewayUnavailableException,
+)
+from rest.error_manager import BaseErrorManager, ErrorContainer
+from rest.error_messages import MessagesConfig
+
+
+class CommonErrorManager(BaseErrorManager):
+    def __init__(self, messages_config: MessagesConfig) -> None:
+        self.messages_config = messages_config
+
+    def create_error_dictionary(self) -> ErrorContainer:
+        return {
+            InvalidCursorException: HTTPException(
+                status_code=400,
+                detail=self.messages_config.common_messages.invalid_cursor,
+            ),
+            InvalidGeoAreaException: HTTPException(
+                status_code=400,
+                detail=self.messages_config.common_messages.invalid_geo_area,
+            ),
+            InvalidDateRangeException: HTTPException(
+                status_code=400,
+                detail=self.messages_config.common_messages.invalid_date_range,
+            ),
+            BucketExportNotSupportedException: HTTPException(
+                status_code=422,
+                detail=self.messages_config.common_messages.bucket_export_not_supported,
+            ),
+            ExecutorRejectedException: HTTPException(
+                status_code=503,
+                detail=self.messages_config.common_messages.server_busy,
+                headers={"Retry-After": "5"},
+            ),
+            PaymentGatewayUnavailableException: HTTPException(
+                status_code=503,
+                detail=self.messages_config.common_messages.payment_gateway_unavailable,
+                headers={"Retry-After": "5"},
+            ),
+        }
@@ -179,6 +179,27 @@ def parse_donations_messages(yaml_data: dict) -> DonationsMessage:
     )
 
 
+@dataclass
+class CommonMessage:
+    invalid_cursor: str
+    invalid_geo_area: str
+    invalid_date_range: str
+    bucket_export_not_supported: str
+    server_busy: str
+    payment_gateway_unavailable: str
+
+
+def parse_common_messages(yaml_data: dict) -> CommonMessage:
+    return CommonMessage(
+        invalid_cursor=yaml_data["common"]["invalid_cursor"],
+        invalid_geo_area=yaml_data["common"]["invalid_geo_area"],
+        invalid_date_range=yaml_data["common"]["invalid_date_range"],
+        bucket_export_not_supported=yaml_data["common"]["bucket_export_not_supported"],
+        server_busy=yaml_data["common"]["server_busy"],
+        payment_gateway_unavailable=yaml_data["common"]["payment_gateway_unavailable"],
+    )
+
+
 def get_file_name() -> str:
     return "error_messages.yaml"
 
@@ -215,6 +236,11 @@ def get_donations_messages() -> DonationsMessage:
     return parse_donations_messages(donations_messages_dict)
 
 
+def get_common_messages() -> CommonMessage:
+    common_messages_dict: dict = parse_config(get_file_name())
+    return parse_common_messages(common_messages_dict)
+
+
 class MessagesConfig:
     def __init__(self) -> None:
         self.auth_messages: AuthMessage = get_auth_messages()
@@ -222,3 +248,4 @@ class MessagesConfig:
         self.pets_messages: PetsMessage = get_pets_messages()
         self.adoptions_messages: AdoptionsMessage = get_adoptions_messages()
         self.donations_messages: DonationsMessage = get_donations_messages()
+        self.common_messages: CommonMessage = get_common_messages()
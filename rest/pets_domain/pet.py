@@ -124,12 +124,17 @@ class PetController(BaseAPIController):
         offset: int | None = 0,
         lost: bool | None = None,
         profile_id: str | None = None,
+        cursor: str | None = None,
     ) -> PetListView:
         get_pets_use_case: GetPetsUseCase = self.dependencies.resolve(GetPetsUseCase)
 
         return await get_pets_use_case.execute(
             GetPetsUseCase.Request(
-                limit=limit, offset=offset, lost=lost, profile_id=profile_id
+                limit=limit,
+                offset=offset,
+                lost=lost,
+                profile_id=profile_id,
+                cursor=cursor,
             )
         )
 
@@ -144,12 +149,12 @@ class PetController(BaseAPIController):
             )
         )
 
-    async def post_regenerate_qr_codes(self) -> None:
+    async def post_regenerate_qr_codes(self) -> RegenerateQrCodesUseCase.Response:
         regenerate_qr_codes: RegenerateQrCodesUseCase = self.dependencies.resolve(
             RegenerateQrCodesUseCase
         )
 
-        await regenerate_qr_codes.execute()
+        return await regenerate_qr_codes.execute()
 
     def register_routes(self) -> None:
         PREFIX: str = "/pets/pet"
@@ -5,8 +5,14 @@ from bounded_contexts.pets_domain.use_cases.get_most_recent_lost_pet_sights impo
     GetMostRecentLostPetSightsUseCase,
 )
 from bounded_contexts.pets_domain.use_cases.get_pet_sights import GetPetSightsUseCase
+from bounded_contexts.pets_domain.use_cases.get_pet_sight_clusters import (
+    GetPetSightClustersUseCase,
+)
 from bounded_contexts.pets_domain.views import PetSightView
-from bounded_contexts.pets_domain.views.pet_sight_view import PetSightListView
+from bounded_contexts.pets_domain.views.pet_sight_view import (
+    PetSightListView,
+    PetSightClusterListView,
+)
 from infrastructure.rest import BaseAPIController, OptionalTokenDependency
 
 
@@ -44,6 +50,11 @@ class PetSightController(BaseAPIController):
         offset: int | None = 0,
         pet_id: str | None = None,
         lost: bool | None = None,
+        cursor: str | None = None,
+        estimated_count: bool = False,
+        bbox: str | None = None,
+        near: str | None = None,
+        radius_km: float | None = None,
     ) -> PetSightListView:
         get_pet_sights_use_case: GetPetSightsUseCase = self.dependencies.resolve(
             GetPetSightsUseCase
@@ -51,19 +62,43 @@ class PetSightController(BaseAPIController):
 
         return await get_pet_sights_use_case.execute(
             GetPetSightsUseCase.Request(
-                limit=limit, offset=offset, pet_id=pet_id, lost=lost
+                limit=limit,
+                offset=offset,
+                pet_id=pet_id,
+                lost=lost,
+                cursor=cursor,
+                estimated_count=estimated_count,
+                bbox=bbox,
+                near=near,
+                radius_km=radius_km,
             )
         )
 
+    async def index_pet_sight_clusters(
+        self, zoom: int, bbox: str | None = None
+    ) -> PetSightClusterListView:
+        get_pet_sight_clusters_use_case: GetPetSightClustersUseCase = (
+            self.dependencies.resolve(GetPetSightClustersUseCase)
+        )
+
+        return await get_pet_sight_clusters_use_case.execute(
+            GetPetSightClustersUseCase.Request(zoom=zoom, bbox=bbox)
+        )
+
     async def index_most_recent_lost_pet_sights(
-        self, limit: int | None = None, offset: int | None = 0
+        self,
+        limit: int | None = None,
+        offset: int | None = 0,
+        cursor: str | None = None,
     ) -> PetSightListView:
         get_most_recent_lost_pet_sights_use_case: GetMostRecentLostPetSightsUseCase = (
             self.dependencies.resolve(GetMostRecentLostPetSightsUseCase)
         )
 
         return await get_most_recent_lost_pet_sights_use_case.execute(
-            GetMostRecentLostPetSightsUseCase.Request(limit=limit, offset=offset)
+            GetMostRecentLostPetSightsUseCase.Request(
+                limit=limit, offset=offset, cursor=cursor
+            )
         )
 
     def register_routes(self) -> None:
@@ -71,6 +106,9 @@ class PetSightController(BaseAPIController):
 
         self._register_post_route(f"{PREFIX}", method=self.post)
         self._register_get_route(f"{PREFIX}/all", method=self.index_pet_sights)
+        self._register_get_route(
+            f"{PREFIX}/clusters", method=self.index_pet_sight_clusters
+        )
         self._register_get_route(
             f"{PREFIX}/all_recent_sights", method=self.index_most_recent_lost_pet_sights
         )
@@ -1,3 +1,11 @@
+from datetime import date
+from typing import Annotated, AsyncIterator
+
+from fastapi import Query
+from fastapi.responses import StreamingResponse
+
+from bounded_contexts.reports_domain.dataclasses import ReportPeriod
+from bounded_contexts.reports_domain.enum import ReportBucket
 from bounded_contexts.reports_domain.use_cases.get_adopted_animals import (
     GetAdoptedAnimalsUseCase,
 )
@@ -7,6 +15,9 @@ from bounded_contexts.reports_domain.use_cases.get_collected_money import (
 from bounded_contexts.reports_domain.use_cases.get_lost_and_found_pets import (
     GetLostAndFoundPetsUseCase,
 )
+from bounded_contexts.reports_domain.use_cases.get_report_cache_stats import (
+    GetReportCacheStatsUseCase,
+)
 from bounded_contexts.reports_domain.views.adopted_animals_view import (
     AdoptedAnimalsListView,
 )
@@ -16,48 +27,179 @@ from bounded_contexts.reports_domain.views.collected_money_view import (
 from bounded_contexts.reports_domain.views.lost_and_found_pets_view import (
     LostAndFoundPetsListView,
 )
+from bounded_contexts.reports_domain.views.report_buckets_view import (
+    ReportBucketsListView,
+)
+from bounded_contexts.reports_domain.views.report_cache_stats_view import (
+    ReportCacheStatsView,
+)
+from common.exceptions import BucketExportNotSupportedException
+from common.export import ExportFormat
 from infrastructure.rest import BaseAPIController
 
+# ?format=csv|ndjson streams the report as a file instead of the JSON view
+ExportFormatQuery = Annotated[ExportFormat | None, Query(alias="format")]
+
+# ?from=&to= filter the report by date (UTC days, both included)
+DateFromQuery = Annotated[date | None, Query(alias="from")]
+DateToQuery = Annotated[date | None, Query(alias="to")]
+
+# ?bucket=day|week|month returns the totals per bucket of the period instead, as
+# JSON only
+BucketQuery = Annotated[ReportBucket | None, Query()]
+
 
 class ReportsController(BaseAPIController):
     async def get_adopted_animals(
-        self, organization_id: str | None = None
-    ) -> AdoptedAnimalsListView:
+        self,
+        organization_id: str | None = None,
+        date_from: DateFromQuery = None,
+        date_to: DateToQuery = None,
+        bucket: BucketQuery = None,
+        export_format: ExportFormatQuery = None,
+    ) -> AdoptedAnimalsListView | ReportBucketsListView | StreamingResponse:
         get_adopted_animals_use_case: GetAdoptedAnimalsUseCase = (
             self.dependencies.resolve(GetAdoptedAnimalsUseCase)
         )
 
-        return await get_adopted_animals_use_case.execute(
-            GetAdoptedAnimalsUseCase.Request(organization_id=organization_id)
+        request: GetAdoptedAnimalsUseCase.Request = GetAdoptedAnimalsUseCase.Request(
+            organization_id=organization_id,
+            period=ReportPeriod(date_from=date_from, date_to=date_to),
         )
 
+        self.__check_bucket_export(bucket=bucket, export_format=export_format)
+
+        if bucket is not None:
+            return await get_adopted_animals_use_case.execute_buckets(
+                request=request, bucket=bucket
+            )
+
+        if export_format is not None:
+            return self.__export_response(
+                content=get_adopted_animals_use_case.export(
+                    request=request, export_format=export_format
+                ),
+                export_format=export_format,
+                filename="adopted_animals",
+            )
+
+        return await get_adopted_animals_use_case.execute(request)
+
     async def get_collected_money(
-        self, organization_id: str | None = None
-    ) -> CollectedMoneyListView:
+        self,
+        organization_id: str | None = None,
+        date_from: DateFromQuery = None,
+        date_to: DateToQuery = None,
+        bucket: BucketQuery = None,
+        export_format: ExportFormatQuery = None,
+    ) -> CollectedMoneyListView | ReportBucketsListView | StreamingResponse:
         get_collected_money_use_case: GetCollectedMoneyUseCase = (
             self.dependencies.resolve(GetCollectedMoneyUseCase)
         )
 
+        period: ReportPeriod = ReportPeriod(date_from=date_from, date_to=date_to)
+
+        self.__check_bucket_export(bucket=bucket, export_format=export_format)
+
+        if bucket is not None:
+            return await get_collected_money_use_case.execute_buckets(
+                organization_id=organization_id, period=period, bucket=bucket
+            )
+
+        if export_format is not None:
+            return self.__export_response(
+                content=get_collected_money_use_case.export(
+                    organization_id=organization_id,
+                    export_format=export_format,
+                    period=period,
+                ),
+                export_format=export_format,
+                filename="collected_money",
+            )
+
         return await get_collected_money_use_case.execute(
-            organization_id=organization_id
+            organization_id=organization_id, period=period
         )
 
-    async def get_lost_and_found_pets(self) -> LostAndFoundPetsListView:
+    async def get_lost_and_found_pets(
+        self,
+        date_from: DateFromQuery = None,
+        date_to: DateToQuery = None,
+        bucket: BucketQuery = None,
+        export_format: ExportFormatQuery = None,
+    ) -> LostAndFoundPetsListView | ReportBucketsListView | StreamingResponse:
         get_lost_and_found_pets_use_case: GetLostAndFoundPetsUseCase = (
             self.dependencies.resolve(GetLostAndFoundPetsUseCase)
         )
 
-        return await get_lost_and_found_pets_use_case.execute()
+        period: ReportPeriod = ReportPeriod(date_from=date_from, date_to=date_to)
+
+        self.__check_bucket_export(bucket=bucket, export_format=export_format)
+
+        if bucket is not None:
+            return await get_lost_and_found_pets_use_case.execute_buckets(
+                period=period, bucket=bucket
+            )
+
+        if export_format is not None:
+            return self.__export_response(
+                content=get_lost_and_found_pets_use_case.export(
+                    export_format=export_format, period=period
+                ),
+                export_format=export_format,
+                filename="lost_and_found_pets",
+            )
+
+        return await get_lost_and_found_pets_use_case.execute(period=period)
+
+    async def get_report_cache_stats(self) -> ReportCacheStatsView:
+        get_report_cache_stats_use_case: GetReportCacheStatsUseCase = (
+            self.dependencies.resolve(GetReportCacheStatsUseCase)
+        )
+
+        return await get_report_cache_stats_use_case.execute()
+
+    @staticmethod
+    def __check_bucket_export(
+        bucket: ReportBucket | None, export_format: ExportFormat | None
+    ) -> None:
+        if bucket is not None and export_format is not None:
+            raise BucketExportNotSupportedException(
+                bucket=bucket.value, export_format=export_format.value
+            )
+
+    @staticmethod
+    def __export_response(
+        content: AsyncIterator[bytes], export_format: ExportFormat, filename: str
+    ) -> StreamingResponse:
+        return StreamingResponse(
+            content,
+            media_type=export_format.media_type,
+            headers={
+                "Content-Disposition": (
+                    f'attachment; filename="{filename}.{export_format.value}"'
+                )
+            },
+        )
 
     def register_routes(self) -> None:
         PREFIX: str = "/reports"
 
         self._register_get_route(
-            f"{PREFIX}/adopted_animals", method=self.get_adopted_animals
+            f"{PREFIX}/adopted_animals",
+            method=self.get_adopted_animals,
+            response_model=AdoptedAnimalsListView | ReportBucketsListView,
+        )
+        self._register_get_route(
+            f"{PREFIX}/collected_money",
+            method=self.get_collected_money,
+            response_model=CollectedMoneyListView | ReportBucketsListView,
         )
         self._register_get_route(
-            f"{PREFIX}/collected_money", method=self.get_collected_money
+            f"{PREFIX}/lost_and_found_pets",
+            method=self.get_lost_and_found_pets,
+            response_model=LostAndFoundPetsListView | ReportBucketsListView,
         )
         self._register_get_route(
-            f"{PREFIX}/lost_and_found_pets", method=self.get_lost_and_found_pets
+            f"{PREFIX}/cache_stats", method=self.get_report_cache_stats
         )
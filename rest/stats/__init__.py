@@ -0,0 +1 @@
+from .stats_controller import StatsController
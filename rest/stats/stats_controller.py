@@ -0,0 +1,68 @@
+from pydantic import BaseModel
+
+from common.background import executor_metrics
+from infrastructure.rest import BaseAPIController
+from infrastructure.uow_abstraction import EventBus
+
+
+class EventHandlerStatsResponse(BaseModel):
+    handler: str
+    calls: int
+    errors: int
+    timeouts: int
+    average_seconds: float
+    max_seconds: float
+
+
+class ExecutorStatsResponse(BaseModel):
+    executor: str
+    submitted: int
+    completed: int
+    failed: int
+    rejected: int
+    in_flight: int
+    max_in_flight: int
+    waiting: int
+    average_wait_seconds: float
+
+
+class StatsController(BaseAPIController):
+    async def get_event_handler_stats(self) -> list[EventHandlerStatsResponse]:
+        # Stats of the worker answering, each one keeps its own
+        event_bus: EventBus = self.dependencies.resolve(EventBus)
+
+        return [
+            EventHandlerStatsResponse(
+                handler=handler,
+                calls=metrics.calls,
+                errors=metrics.errors,
+                timeouts=metrics.timeouts,
+                average_seconds=metrics.average_seconds,
+                max_seconds=metrics.max_seconds,
+            )
+            for handler, metrics in sorted(event_bus.handler_metrics().items())
+        ]
+
+    async def get_executor_stats(self) -> list[ExecutorStatsResponse]:
+        return [
+            ExecutorStatsResponse(
+                executor=executor,
+                submitted=metrics.submitted,
+                completed=metrics.completed,
+                failed=metrics.failed,
+                rejected=metrics.rejected,
+                in_flight=metrics.in_flight,
+                max_in_flight=metrics.max_in_flight,
+                waiting=metrics.waiting,
+                average_wait_seconds=metrics.average_wait_seconds,
+            )
+            for executor, metrics in executor_metrics().items()
+        ]
+
+    def register_routes(self) -> None:
+        PREFIX: str = "/stats"
+
+        self._register_get_route(
+            f"{PREFIX}/event_handlers", method=self.get_event_handler_stats
+        )
+        self._register_get_route(f"{PREFIX}/executors", method=self.get_executor_stats)
@@ -0,0 +1,12 @@
+from infrastructure.rest import BaseAPIController
+from rest import RouteManager
+from rest.stats import StatsController
+
+
+class StatsRouteManager(RouteManager):
+    def _create_controllers(self) -> list[BaseAPIController]:
+        stats_controller: StatsController = StatsController(
+            dependencies=self.dependencies,
+        )
+
+        return [stats_controller]